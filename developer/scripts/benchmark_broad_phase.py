@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the broad phases against the set-based SpatialGrid.
+
+Builds N random boxes, finds all overlapping pairs once with SpatialGrid
+(insert every box, query every box) and once with each array broad phase,
+then moves a fraction of the boxes a little and times update() plus
+all_pairs(), and reports the timings.
+
+Usage:
+    python benchmark_broad_phase.py [--count N] [--moving F]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.math3d import Vector3D, AABB, SpatialGrid, HashedGrid, SweepAndPrune, BVH
+
+
+def timed(func):
+    """Return the result and duration of a call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def spatial_grid_pairs(mins: np.ndarray, maxs: np.ndarray, cell_size: float) -> int:
+    """Count overlapping pairs with SpatialGrid inserts and queries."""
+    boxes = [AABB(Vector3D(*low), Vector3D(*high)) for low, high in zip(mins.tolist(), maxs.tolist())]
+    bounds = AABB(Vector3D(*mins.min(axis=0)), Vector3D(*maxs.max(axis=0)))
+    grid = SpatialGrid(cell_size, bounds)
+    for index, box in enumerate(boxes):
+        grid.insert(index, box)
+    return sum(1 for index, box in enumerate(boxes)
+               for other in grid.query(box) if other > index and box.intersects(boxes[other]))
+
+
+def main():
+    """Main entry point for the broad-phase benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark broad-phase collision detection")
+    parser.add_argument('--count', type=int, default=20000, help='number of boxes')
+    parser.add_argument('--moving', type=float, default=0.2, help='fraction of boxes moved per update')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    extent = 2 * args.count ** (1 / 3)
+    mins = rng.uniform(0, extent, size=(args.count, 3))
+    maxs = mins + rng.uniform(0.5, 2.0, size=(args.count, 3))
+    moved = rng.choice(args.count, size=int(args.count * args.moving), replace=False)
+    shift = rng.normal(scale=0.1, size=(len(moved), 3))
+
+    count, grid_time = timed(lambda: spatial_grid_pairs(mins, maxs, 2.0))
+    print(f"{args.count} boxes, {count} overlapping pairs")
+    print(f"{'broad phase':<16}{'build+pairs s':>15}{'update+pairs s':>16}{'speedup':>10}")
+    print(f"{'SpatialGrid':<16}{grid_time:>15.3f}{'':>16}{'':>10}")
+
+    for name, broad in [('HashedGrid', HashedGrid(2.0)), ('SweepAndPrune', SweepAndPrune()), ('BVH', BVH())]:
+        pairs, build_time = timed(lambda: broad.build(mins, maxs).all_pairs())
+        assert len(pairs) == count
+        _, update_time = timed(lambda: (broad.update(moved, mins[moved] + shift, maxs[moved] + shift),
+                                        broad.all_pairs()))
+        print(f"{name:<16}{build_time:>15.3f}{update_time:>16.3f}{grid_time / build_time:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
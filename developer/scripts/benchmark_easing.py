@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark scalar easing functions against their NumPy array kernels.
+
+For every EasingFunction, evaluates a batch of t values once through the
+scalar function in a Python loop and once through the array kernel, and
+reports both timings, the speedup and the largest difference between them.
+
+Usage:
+    python benchmark_easing.py [--samples N] [--repeat R]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.timeline.easing import EasingFunction, EasingLibrary
+
+
+def best_time(func, repeat: int) -> float:
+    """Return the fastest of several timed calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Main entry point for the easing benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs array easing functions")
+    parser.add_argument('--samples', type=int, default=10000, help='t values per evaluation')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per function')
+    args = parser.parse_args()
+
+    t = np.linspace(0.0, 1.0, args.samples)
+    t_list = t.tolist()
+
+    print(f"{'easing':<28}{'scalar ms':>12}{'array ms':>12}{'speedup':>10}{'max diff':>12}")
+    for easing_type in EasingFunction:
+        scalar = EasingLibrary.get_easing_function(easing_type)
+        kernel = EasingLibrary.get_array_easing_function(easing_type)
+
+        scalar_time = best_time(lambda: [scalar(x) for x in t_list], args.repeat)
+        array_time = best_time(lambda: kernel(t), args.repeat)
+        max_diff = np.max(np.abs(kernel(t) - np.array([scalar(x) for x in t_list], dtype=float)))
+
+        print(f"{easing_type.name:<28}{scalar_time * 1000:>12.3f}{array_time * 1000:>12.3f}"
+              f"{scalar_time / array_time:>9.1f}x{max_diff:>12.2e}")
+
+
+if __name__ == '__main__':
+    main()
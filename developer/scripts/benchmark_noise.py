@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark scalar noise loops against the array noise methods.
+
+Times a size×size 2D field for Perlin, Simplex, 6-octave Perlin fBm and
+Voronoi noise, once with the array grid methods and once with the scalar
+methods on a sample of the field (scaled up to the full size), and reports
+the timings and speedups.
+
+Usage:
+    python benchmark_noise.py [--size N] [--sample S]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.math3d import PerlinNoise, SimplexNoise, FractalNoise, VoronoiNoise
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    """Main entry point for the noise benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs array noise")
+    parser.add_argument('--size', type=int, default=512, help='field width and height')
+    parser.add_argument('--sample', type=int, default=5000, help='scalar samples to time')
+    args = parser.parse_args()
+
+    axis = np.linspace(0.5, 16.5, args.size)
+    rng = np.random.default_rng(0)
+    sample = rng.uniform(0.5, 16.5, size=(args.sample, 2)).tolist()
+    scale = args.size * args.size / args.sample
+
+    perlin, simplex, voronoi = PerlinNoise(0), SimplexNoise(0), VoronoiNoise(0)
+    fractal = FractalNoise(perlin.noise2d, octaves=6)
+    generators = {
+        'perlin': (perlin.noise2d, perlin.noise2d_grid),
+        'simplex': (simplex.noise2d, simplex.noise2d_grid),
+        'fbm': (fractal.fbm, fractal.fbm_grid),
+        'voronoi': (voronoi.noise2d, voronoi.noise2d_grid),
+    }
+
+    print(f"{args.size}x{args.size} field")
+    print(f"{'noise':<10}{'scalar s':>12}{'array s':>12}{'speedup':>10}")
+    for name, (scalar, grid) in generators.items():
+        scalar_time = timed(lambda: [scalar(x, y) for x, y in sample]) * scale
+        array_time = timed(lambda: grid(axis, axis))
+        print(f"{name:<10}{scalar_time:>12.2f}{array_time:>12.3f}{scalar_time / array_time:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON and binary (.npz) timeline serialization.
+
+Builds timelines with the requested keyframe counts, split across number,
+vector and color properties, and reports save time, load time, the time
+to materialize every lazily loaded track, and file size for both formats.
+
+Usage:
+    python benchmark_timeline_io.py [--sizes 10000 100000 1000000] [--tracks T]
+"""
+
+import sys
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.timeline.composer_timeline import (
+    ComposerTimeline, InterpolationType, Keyframe, TimelineTrack, TrackType
+)
+
+
+def build_timeline(keyframes: int, tracks: int) -> ComposerTimeline:
+    """Create a timeline with keyframes spread over several tracks."""
+    timeline = ComposerTimeline(duration=keyframes / 100)
+    layer = timeline.get_layer("Main")
+    rng = np.random.default_rng(0)
+    interpolations = list(InterpolationType)
+
+    per_property = keyframes // (tracks * 3)
+    times = np.arange(per_property) / 100
+    for t in range(tracks):
+        track = TimelineTrack(f"generated_{t}", TrackType.ANIMATION)
+        values = rng.random((per_property, 3))
+        easings = rng.integers(len(interpolations), size=per_property)
+        track.keyframes["x"] = [
+            Keyframe(time, value, interpolations[e])
+            for time, value, e in zip(times.tolist(), values[:, 0].tolist(), easings)
+        ]
+        track.keyframes["position"] = [
+            Keyframe(time, value, interpolations[e])
+            for time, value, e in zip(times.tolist(), values.tolist(), easings)
+        ]
+        track.keyframes["color"] = [
+            Keyframe(time, '#%02X%02X%02X' % tuple(int(c * 255) for c in value), interpolations[e])
+            for time, value, e in zip(times.tolist(), values.tolist(), easings)
+        ]
+        layer.add_track(track)
+    return timeline
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    """Main entry point for the serialization benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs binary timeline serialization")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='total keyframe counts')
+    parser.add_argument('--tracks', type=int, default=10, help='generated tracks')
+    args = parser.parse_args()
+
+    print(f"{'keyframes':>10}{'format':>8}{'save s':>10}{'load s':>10}{'touch s':>10}{'size MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            timeline = build_timeline(size, args.tracks)
+            json_path = Path(tmp) / "timeline.json"
+            npz_path = Path(tmp) / "timeline.npz"
+
+            def touch(loaded):
+                for layer in loaded.layers:
+                    for track in layer.tracks:
+                        track.keyframes
+
+            rows = []
+            loaded = ComposerTimeline()
+            save = timed(lambda: timeline.export_to_json(json_path))
+            load = timed(lambda: loaded.import_from_json(json_path))
+            rows.append(("json", save, load, 0.0, json_path.stat().st_size))
+
+            loaded = ComposerTimeline()
+            save = timed(lambda: timeline.export_to_npz(npz_path))
+            load = timed(lambda: loaded.import_from_npz(npz_path))
+            rows.append(("npz", save, load, timed(lambda: touch(loaded)), npz_path.stat().st_size))
+
+            for name, save, load, touch_time, file_size in rows:
+                print(f"{size:>10}{name:>8}{save:>10.3f}{load:>10.3f}{touch_time:>10.3f}"
+                      f"{file_size / 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark Vector3D object loops against Vector3DArray.
+
+Runs a typical point workload (normalize, dot, cross, lerp, transform) on
+N vectors once as a Python loop over Vector3D objects and once as
+Vector3DArray operations, in float64 and float32, and reports the
+timings and speedups.
+
+Usage:
+    python benchmark_vector3d.py [--count N] [--repeat R]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.math3d import Vector3D, Vector3DArray, create_transform_matrix
+
+
+def best_time(func, repeat: int) -> float:
+    """Return the fastest of several timed calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Main entry point for the vector benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark Vector3D vs Vector3DArray")
+    parser.add_argument('--count', type=int, default=1000000, help='vectors per operation')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per operation')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a = Vector3DArray(rng.normal(size=(args.count, 3)))
+    b = Vector3DArray(rng.normal(size=(args.count, 3)))
+    a_objects, b_objects = a.to_vectors(), b.to_vectors()
+    single = (a.astype(np.float32), b.astype(np.float32))
+    matrix = create_transform_matrix(Vector3D(1, 2, 3), Vector3D(0.1, 0.2, 0.3), Vector3D(2, 2, 2))
+
+    workloads = {
+        'normalize': (lambda: [v.normalize() for v in a_objects], lambda x, y: x.normalize()),
+        'dot': (lambda: [v.dot(w) for v, w in zip(a_objects, b_objects)], lambda x, y: x.dot(y)),
+        'cross': (lambda: [v.cross(w) for v, w in zip(a_objects, b_objects)], lambda x, y: x.cross(y)),
+        'lerp': (lambda: [v.lerp(w, 0.25) for v, w in zip(a_objects, b_objects)], lambda x, y: x.lerp(y, 0.25)),
+        'transform': (lambda: matrix.transform_points(a_objects), lambda x, y: matrix.transform_points(x)),
+    }
+
+    print(f"{args.count} vectors")
+    print(f"{'operation':<12}{'objects s':>12}{'float64 s':>12}{'float32 s':>12}{'speedup':>10}")
+    for name, (object_loop, array_op) in workloads.items():
+        object_time = best_time(object_loop, args.repeat)
+        double_time = best_time(lambda: array_op(a, b), args.repeat)
+        single_time = best_time(lambda: array_op(*single), args.repeat)
+        print(f"{name:<12}{object_time:>12.3f}{double_time:>12.4f}{single_time:>12.4f}"
+              f"{object_time / double_time:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
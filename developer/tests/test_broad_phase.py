@@ -0,0 +1,119 @@
+"""Tests for the broad phases and batched narrow-phase checks in math3d."""
+
+import pytest
+import numpy as np
+from src.utils.math3d import (
+    Vector3D, Matrix4x4Stack, AABB, OBB, Sphere, CollisionDetection,
+    HashedGrid, SweepAndPrune, BVH, aabb_bounds, sphere_bounds, obb_bounds
+)
+
+
+def brute_force_pairs(mins, maxs):
+    overlap = np.all((mins[:, None] <= maxs[None]) & (maxs[:, None] >= mins[None]), axis=2)
+    return np.argwhere(np.triu(overlap, k=1))
+
+
+def random_boxes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    mins = rng.uniform(0, 20, size=(count, 3))
+    return mins, mins + rng.uniform(0.1, 2.5, size=(count, 3))
+
+
+BROAD_PHASES = [lambda: HashedGrid(2.0), lambda: HashedGrid(0.7), lambda: SweepAndPrune(),
+                lambda: SweepAndPrune(axis=2), lambda: BVH(), lambda: BVH(leaf_size=1)]
+
+
+@pytest.mark.parametrize("make", BROAD_PHASES)
+class TestBroadPhases:
+    """Every broad phase finds exactly the brute-force overlaps."""
+
+    def test_all_pairs(self, make):
+        mins, maxs = random_boxes(300)
+        pairs = make().build(mins, maxs).all_pairs()
+        assert pairs.dtype == np.int64
+        assert np.array_equal(pairs, brute_force_pairs(mins, maxs))
+
+    def test_update(self, make):
+        rng = np.random.default_rng(1)
+        mins, maxs = random_boxes(200)
+        broad = make().build(mins, maxs)
+        for step in range(4):
+            moved = rng.choice(len(mins), size=60, replace=False)
+            shift = rng.normal(scale=0.3 if step < 3 else 5.0, size=(60, 3))
+            mins[moved] += shift
+            maxs[moved] += shift
+            broad.update(moved, mins[moved], maxs[moved])
+            assert np.array_equal(broad.all_pairs(), brute_force_pairs(mins, maxs))
+
+    def test_query(self, make):
+        mins, maxs = random_boxes(200)
+        broad = make().build(mins, maxs)
+        low, high = np.array([4.0, 5.0, 6.0]), np.array([9.0, 8.0, 12.0])
+        expected = np.flatnonzero(np.all((mins <= high) & (maxs >= low), axis=1))
+        assert np.array_equal(broad.query(low, high), expected)
+        assert np.array_equal(broad.query(Vector3D(*low), Vector3D(*high)), expected)
+
+    def test_edge_cases(self, make):
+        broad = make().build(np.empty((0, 3)), np.empty((0, 3)))
+        assert broad.all_pairs().shape == (0, 2)
+        assert len(broad.query((0, 0, 0), (1, 1, 1))) == 0
+
+        # Touching boxes overlap, like AABB.intersects
+        boxes = [AABB(Vector3D(0, 0, 0), Vector3D(1, 1, 1)), AABB(Vector3D(1, 0, 0), Vector3D(2, 1, 1)),
+                 AABB(Vector3D(0, 0, 0), Vector3D(1, 1, 1)), AABB(Vector3D(3, 3, 3), Vector3D(4, 4, 4))]
+        assert make().build(*aabb_bounds(boxes)).all_pairs().tolist() == [[0, 1], [0, 2], [1, 2]]
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        SweepAndPrune().build([[1, 0, 0]], [[0, 1, 1]])
+    with pytest.raises(ValueError):
+        HashedGrid(0)
+    with pytest.raises(ValueError):
+        BVH().build(*random_boxes(10)).update([0, 1], [[0, 0, 0]], [[1, 1, 1]])
+
+
+class TestNarrowPhaseBatch:
+    """Batched narrow-phase checks match the scalar ones."""
+
+    def test_aabb_and_sphere(self):
+        rng = np.random.default_rng(2)
+        centers = rng.uniform(0, 10, size=(80, 3))
+        radii = rng.uniform(0.2, 1.5, size=80)
+        pairs = SweepAndPrune().build(*sphere_bounds(centers, radii)).all_pairs()
+
+        spheres = [Sphere(Vector3D(*c), r) for c, r in zip(centers, radii)]
+        expected = [CollisionDetection.sphere_sphere(spheres[i], spheres[j]) for i, j in pairs]
+        assert CollisionDetection.sphere_sphere_batch(centers, radii, pairs).tolist() == expected
+        assert 0 < sum(expected) < len(pairs)
+
+        mins, maxs = sphere_bounds(centers, radii)
+        boxes = [AABB(Vector3D(*low), Vector3D(*high)) for low, high in zip(mins, maxs)]
+        every_pair = np.argwhere(np.triu(np.ones((80, 80), dtype=bool), k=1))
+        expected = [CollisionDetection.aabb_aabb(boxes[i], boxes[j]) for i, j in every_pair]
+        assert CollisionDetection.aabb_aabb_batch(mins, maxs, every_pair).tolist() == expected
+
+    def test_obb(self):
+        rng = np.random.default_rng(3)
+        count = 60
+        centers = rng.uniform(0, 6, size=(count, 3))
+        half_extents = rng.uniform(0.2, 1.2, size=(count, 3))
+        angles = rng.uniform(-3, 3, size=(count, 3))
+        # Include axis-aligned boxes, whose edge cross products degenerate
+        angles[:5] = 0
+        rotations = Matrix4x4Stack.rotation_euler(angles)
+
+        boxes = [OBB(Vector3D(*c), Vector3D(*h), m) for c, h, m in zip(centers, half_extents, rotations)]
+        pairs = BVH().build(*obb_bounds(centers, half_extents, rotations)).all_pairs()
+        expected = [CollisionDetection.obb_obb(boxes[i], boxes[j]) for i, j in pairs]
+        assert CollisionDetection.obb_obb_batch(centers, half_extents, rotations, pairs).tolist() == expected
+        assert 0 < sum(expected) < len(pairs)
+
+        # Bounds contain every corner
+        mins, maxs = obb_bounds(centers, half_extents, rotations)
+        corners = np.array([[(p.x, p.y, p.z) for p in box.get_corners()] for box in boxes])
+        assert np.all(corners >= mins[:, None] - 1e-9) and np.all(corners <= maxs[:, None] + 1e-9)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,369 @@
+"""Tests for the caching system."""
+
+import json
+import pickle
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from src.core.cache import CacheIndex, CacheManager, PickleSerializer, SceneCache
+from src.core.config import SceneConfig
+from src.core.incremental_render import SegmentFingerprinter
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager backed by a temporary directory."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        yield CacheManager(cache_dir=cache_dir)
+
+
+def make_scene_config(**overrides):
+    """Create a minimal scene configuration."""
+    data = {
+        'name': 'CacheScene',
+        'objects': {
+            'circle': {'type': 'shape', 'shape': 'circle', 'params': {'radius': 1}}
+        },
+        'animations': [{'target': 'circle', 'type': 'create', 'duration': 1}]
+    }
+    data.update(overrides)
+    return SceneConfig.from_dict(data)
+
+
+class TestMemoryCache:
+    """Test the size-bounded LRU memory tier."""
+
+    def test_evicts_least_recently_used(self, cache_manager):
+        """Recently read entries survive eviction."""
+        cache_manager.max_memory_cache_size = 300
+        for i in range(3):
+            cache_manager.set(f"key_{i}", b'x' * 80)
+
+        cache_manager.get("key_0")
+        cache_manager.set("key_3", b'x' * 80)
+
+        assert list(cache_manager.memory_cache) == ["key_2", "key_0", "key_3"]
+        assert cache_manager.get_stats()['memory_evictions'] == 1
+
+    def test_size_accounting_stays_consistent(self, cache_manager):
+        """Deleting and re-setting entries keeps the byte total exact."""
+        cache_manager.set("a", list(range(100)))
+        cache_manager.set("b", list(range(200)))
+        cache_manager.set("a", list(range(50)))
+        cache_manager.delete("b")
+
+        assert cache_manager.memory_cache_size == sum(cache_manager.memory_sizes.values())
+        assert list(cache_manager.memory_cache) == ["a"]
+
+    def test_oversized_overwrite_drops_old_value(self, cache_manager):
+        """A value too large for memory replaces the old one rather than hiding behind it."""
+        cache_manager.max_memory_cache_size = 1000
+        cache_manager.set("key", "small")
+        cache_manager.set("key", np.zeros(300))
+
+        assert "key" not in cache_manager.memory_cache
+        assert cache_manager.memory_cache_size == 0
+        assert np.array_equal(cache_manager.get("key"), np.zeros(300))
+
+    def test_disk_hit_is_promoted_to_memory(self, cache_manager):
+        """Values read from disk are counted and kept in memory."""
+        cache_manager.set("key", {"value": 42})
+        cache_manager.memory_cache.clear()
+        cache_manager.memory_sizes.clear()
+        cache_manager.memory_cache_size = 0
+
+        assert cache_manager.get("key") == {"value": 42}
+        assert cache_manager.get("key") == {"value": 42}
+
+        stats = cache_manager.get_stats()
+        assert stats['memory_misses'] == 1
+        assert stats['memory_hits'] == 1
+
+    def test_values_are_pickled_once(self, cache_manager, monkeypatch):
+        """Sizing the memory tier reuses the serializer's pickle."""
+        calls = []
+        dumps = pickle.dumps
+        monkeypatch.setattr(pickle, "dumps", lambda *args, **kwargs: calls.append(1) or dumps(*args, **kwargs))
+        value = {"points": list(range(1000))}
+
+        cache_manager.set("key", value)
+        cache_manager.memory_cache.clear()
+        cache_manager.memory_sizes.clear()
+        cache_manager.memory_cache_size = 0
+        cache_manager.get("key")
+
+        assert len(calls) == 1
+        assert cache_manager.memory_sizes["key"] == len(dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class TestCacheIndex:
+    """Test the shared SQLite cache index."""
+
+    def test_managers_share_one_cache_dir(self, tmp_path):
+        """Entries written by one manager are visible to another."""
+        writer = CacheManager(cache_dir=tmp_path)
+        reader = CacheManager(cache_dir=tmp_path)
+
+        writer.set("shared", [1, 2, 3])
+
+        assert reader.get("shared") == [1, 2, 3]
+        assert reader.get_stats()['disk_entries'] == 1
+
+        reader.delete("shared")
+        assert writer.index.get("shared") is None
+
+    def test_disk_eviction_removes_oldest_entries(self, tmp_path):
+        """Writes beyond the size budget evict the oldest entries first."""
+        cache_manager = CacheManager(cache_dir=tmp_path, max_size_mb=1000 / (1024 * 1024))
+        for i in range(10):
+            cache_manager.set(f"key_{i}", b'x' * 200)
+
+        remaining = cache_manager.metadata['entries']
+        assert cache_manager.index.total_size() <= cache_manager.max_size_bytes
+        assert "key_9" in remaining
+        assert "key_0" not in remaining
+        assert not cache_manager._get_cache_path("key_0").exists()
+
+    def test_legacy_metadata_is_migrated(self, tmp_path):
+        """Entries from cache_metadata.json are imported into the index."""
+        cache_file = tmp_path / 'ab' / 'abc.pkl'
+        cache_file.parent.mkdir()
+        cache_file.write_bytes(b'data')
+        (tmp_path / 'cache_metadata.json').write_text(json.dumps({
+            'entries': {'abc': {'size': 4, 'timestamp': 1.0, 'path': str(cache_file)}},
+            'total_size': 4
+        }))
+
+        cache_manager = CacheManager(cache_dir=tmp_path)
+
+        assert cache_manager.index.get('abc')['size'] == 4
+        assert not (tmp_path / 'cache_metadata.json').exists()
+
+    def test_total_size_tracks_writes(self, tmp_path):
+        """The running total follows inserts, replacements, pops and clears."""
+        index = CacheIndex(tmp_path / 'index.db')
+        index.put('a', 'a.pkl', 10, 1.0)
+        index.put('b', 'b.pkl', 5, 2.0)
+        index.put('a', 'a.pkl', 3, 3.0)
+        assert index.total_size() == 8
+
+        index.pop('b')
+        assert index.total_size() == 3
+
+        index.clear()
+        assert index.total_size() == 0
+
+    def test_total_size_is_seeded_for_existing_index(self, tmp_path):
+        """Indexes created before the running total start from their entries."""
+        db_path = tmp_path / 'index.db'
+        conn = sqlite3.connect(str(db_path))
+        conn.execute('CREATE TABLE entries (key TEXT PRIMARY KEY, path TEXT NOT NULL, '
+                     'size INTEGER NOT NULL, timestamp REAL NOT NULL)')
+        conn.execute("INSERT INTO entries VALUES ('a', 'a.pkl', 7, 1.0)")
+        conn.commit()
+        conn.close()
+
+        index = CacheIndex(db_path)
+        index.put('b', 'b.pkl', 4, 2.0)
+
+        assert index.total_size() == 11
+
+
+class TestSerializers:
+    """Test format-specific cache serializers."""
+
+    def reload(self, cache_manager, cache_key):
+        """Drop the memory tier so the next get reads from disk."""
+        cache_manager.memory_cache.clear()
+        cache_manager.memory_sizes.clear()
+        cache_manager.memory_cache_size = 0
+        return cache_manager.get(cache_key)
+
+    def test_arrays_load_memory_mapped(self, cache_manager):
+        """ndarrays round-trip through read-only memory-mapped .npy files."""
+        points = np.random.rand(500, 3)
+        cache_manager.set("points", points)
+
+        loaded = self.reload(cache_manager, "points")
+
+        assert cache_manager.index.get("points")['path'].endswith('.npy')
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        assert np.array_equal(loaded, points)
+
+    def test_compressed_media_is_stored_as_is(self, cache_manager):
+        """Already-compressed bytes skip pickling."""
+        png_bytes = b'\x89PNG\r\n\x1a\n' + bytes(range(256))
+        cache_manager.set("thumbnail", png_bytes)
+
+        path = Path(cache_manager.index.get("thumbnail")['path'])
+        assert path.read_bytes() == png_bytes
+        assert self.reload(cache_manager, "thumbnail") == png_bytes
+
+    @pytest.mark.parametrize("codec, module", [("zstd", "zstandard"), ("lz4", "lz4")])
+    def test_compressed_pickles(self, tmp_path, codec, module):
+        """Pickled values round-trip through each compression codec."""
+        pytest.importorskip(module)
+        cache_manager = CacheManager(cache_dir=tmp_path, serializers=[PickleSerializer(codec)])
+        value = {'frames': [[i] * 100 for i in range(50)]}
+
+        cache_manager.set("frames", value)
+
+        path = Path(cache_manager.index.get("frames")['path'])
+        assert path.stat().st_size < len(pickle.dumps(value))
+        assert self.reload(cache_manager, "frames") == value
+
+    def test_memory_tier_counts_loaded_size(self, tmp_path):
+        """Compressed entries are sized by what they load into, not by their file."""
+        pytest.importorskip("zstandard")
+        cache_manager = CacheManager(cache_dir=tmp_path, serializers=[PickleSerializer("zstd")])
+        value = [0] * 100000
+        loaded_size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+        cache_manager.set("zeros", value)
+        assert cache_manager.memory_sizes["zeros"] == loaded_size
+
+        self.reload(cache_manager, "zeros")
+        assert cache_manager.memory_sizes["zeros"] == loaded_size
+        assert Path(cache_manager.index.get("zeros")['path']).stat().st_size < loaded_size / 100
+
+    def test_format_change_replaces_previous_file(self, cache_manager):
+        """Re-setting a key in another format removes the old file."""
+        cache_manager.set("value", np.arange(10))
+        old_path = Path(cache_manager.index.get("value")['path'])
+
+        cache_manager.set("value", [1, 2, 3])
+
+        assert not old_path.exists()
+        assert self.reload(cache_manager, "value") == [1, 2, 3]
+
+
+class TestRenderCacheKey:
+    """Test content-addressed render cache keys."""
+
+    def test_key_is_stable_across_equivalent_configs(self):
+        """Equivalent configs hash to the same key."""
+        config_a = make_scene_config()
+        config_b = make_scene_config(objects={
+            'circle': {'params': {'radius': 1.0}, 'shape': 'circle', 'type': 'shape'}
+        })
+
+        assert SceneCache.compute_render_key(config_a, 'h') == SceneCache.compute_render_key(config_b, 'h')
+
+    def test_key_changes_with_render_settings(self):
+        """Quality, fps and config edits all change the key."""
+        config = make_scene_config()
+        base_key = SceneCache.compute_render_key(config, 'h')
+
+        assert SceneCache.compute_render_key(config, 'l') != base_key
+        assert SceneCache.compute_render_key(config, 'h', fps=30) != base_key
+        assert SceneCache.compute_render_key(make_scene_config(duration=5.0), 'h') != base_key
+
+    def test_key_changes_with_asset_contents(self, tmp_path):
+        """Editing a referenced asset file changes the key."""
+        config = make_scene_config()
+        asset = tmp_path / 'logo.png'
+        asset.write_bytes(b'original')
+        original_key = SceneCache.compute_render_key(config, 'h', asset_paths=[asset])
+
+        asset.write_bytes(b'edited contents')
+
+        assert SceneCache.compute_render_key(config, 'h', asset_paths=[asset]) != original_key
+
+
+class TestRenderCache:
+    """Test storing and retrieving rendered videos."""
+
+    def test_render_round_trip_and_stats(self, cache_manager, tmp_path):
+        """Cached renders are returned and counted as hits."""
+        scene_cache = SceneCache(cache_manager)
+        render_key = SceneCache.compute_render_key(make_scene_config(), 'h')
+
+        assert scene_cache.get_render(render_key) is None
+
+        video = tmp_path / 'CacheScene.mp4'
+        video.write_bytes(b'fake movie data')
+        scene_cache.cache_render(render_key, video)
+
+        cached = scene_cache.get_render(render_key)
+        assert cached is not None
+        assert Path(cached).read_bytes() == b'fake movie data'
+
+        stats = cache_manager.get_stats()
+        assert stats['render_hits'] == 1
+        assert stats['render_misses'] == 1
+
+    def test_videos_count_towards_size_and_are_evicted(self, tmp_path):
+        """Cached videos are indexed, so eviction removes them from disk."""
+        cache_manager = CacheManager(cache_dir=tmp_path / 'cache', max_size_mb=1)
+        scene_cache = SceneCache(cache_manager)
+        video = tmp_path / 'Scene.mp4'
+        video.write_bytes(b'v' * 600 * 1024)
+
+        scene_cache.cache_render('first', video)
+        first = scene_cache.get_render('first')
+        assert cache_manager.get_stats()['disk_size_mb'] > 0.5
+
+        scene_cache.cache_render('second', video)
+        assert not first.exists()
+        assert scene_cache.get_render('first') is None
+        assert scene_cache.get_render('second') is not None
+        assert cache_manager.get_stats()['disk_size_mb'] <= 1
+
+
+class TestSegmentFingerprinter:
+    """Test per-segment fingerprints used for incremental rendering."""
+
+    def segment_fingerprints(self, scene_config, asset_paths=None):
+        fingerprinter = SegmentFingerprinter(scene_config, {'frame_rate': 30}, asset_paths)
+        return [
+            fingerprinter.play(scene_config.animations[:1]),
+            fingerprinter.wait(1.0),
+            fingerprinter.play(scene_config.animations[1:])
+        ]
+
+    def test_editing_last_animation_only_invalidates_last_segment(self):
+        """Earlier segments keep their fingerprints after a late edit."""
+        animations = [
+            {'target': 'circle', 'type': 'create', 'duration': 1},
+            {'target': 'circle', 'type': 'fadeout', 'start_time': 2, 'duration': 1}
+        ]
+        original = self.segment_fingerprints(make_scene_config(animations=animations))
+
+        animations[1]['duration'] = 2
+        edited = self.segment_fingerprints(make_scene_config(animations=animations))
+
+        assert original[:2] == edited[:2]
+        assert original[2] != edited[2]
+
+    def test_editing_object_invalidates_all_segments(self):
+        """Objects are on screen from the start, so every segment changes."""
+        animations = [
+            {'target': 'circle', 'type': 'create', 'duration': 1},
+            {'target': 'circle', 'type': 'fadeout', 'start_time': 2, 'duration': 1}
+        ]
+        original = self.segment_fingerprints(make_scene_config(animations=animations))
+        edited = self.segment_fingerprints(make_scene_config(
+            animations=animations,
+            objects={'circle': {'type': 'shape', 'shape': 'circle', 'params': {'radius': 2}}}
+        ))
+
+        assert all(a != b for a, b in zip(original, edited))
+
+    def test_editing_asset_invalidates_all_segments(self, tmp_path):
+        """Assets can be on screen from the start, so every segment changes."""
+        asset = tmp_path / 'logo.svg'
+        asset.write_text('<svg/>')
+        scene_config = make_scene_config(animations=[
+            {'target': 'circle', 'type': 'create', 'duration': 1},
+            {'target': 'circle', 'type': 'fadeout', 'start_time': 2, 'duration': 1}
+        ])
+        original = self.segment_fingerprints(scene_config, [asset])
+
+        asset.write_text('<svg width="10"/>')
+        edited = self.segment_fingerprints(scene_config, [asset])
+
+        assert all(a != b for a, b in zip(original, edited))
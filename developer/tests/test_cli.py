@@ -0,0 +1,186 @@
+"""Tests for the command-line interface render helpers."""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from manim import Scene, tempconfig
+from src.core import SceneBuilder
+from src.core.cache import CacheManager, SceneCache
+from src.core.config import SceneConfig
+from src.interfaces.cli import cli
+
+
+def make_scene_config(start_times, duration=10.0):
+    """Create a scene with one animation starting at each time."""
+    return SceneConfig.from_dict({
+        'name': 'SliceScene',
+        'duration': duration,
+        'objects': {
+            'circle': {'type': 'shape', 'shape': 'circle', 'params': {'radius': 1}}
+        },
+        'animations': [
+            {'target': 'circle', 'type': 'fadein', 'start_time': t, 'duration': 0.5}
+            for t in start_times
+        ]
+    })
+
+
+class TestPlanTimeWindows:
+    """Test splitting a scene into independently rendered windows."""
+
+    def test_cuts_at_nearest_group_boundaries(self):
+        """Windows start at the animation closest to each even cut."""
+        scene_config = make_scene_config([0.0, 2.0, 4.5, 6.0, 9.0])
+
+        windows = SceneBuilder().plan_time_windows(scene_config, 3)
+
+        assert windows == [(0.0, 4.5), (4.5, 6.0), (6.0, float('inf'))]
+
+    def test_fewer_boundaries_than_windows(self):
+        """Scenes with few animation groups get fewer windows."""
+        scene_config = make_scene_config([0.0, 5.0])
+
+        windows = SceneBuilder().plan_time_windows(scene_config, 4)
+
+        assert windows == [(0.0, 5.0), (5.0, float('inf'))]
+
+    def test_single_window_covers_scene(self):
+        """One window renders the whole scene."""
+        scene_config = make_scene_config([0.0, 5.0])
+
+        assert SceneBuilder().plan_time_windows(scene_config, 1) == [(0.0, float('inf'))]
+
+
+class TestConcatMovies:
+    """Test joining time slices with the ffmpeg concat demuxer."""
+
+    def test_file_list_orders_slices(self, tmp_path, monkeypatch):
+        """The concat list names every slice in order and is removed afterwards."""
+        slices = [tmp_path / f"Scene_slice{i:03d}.mp4" for i in range(3)]
+        output_path = tmp_path / "Scene.mp4"
+        calls = []
+
+        def fake_run(command, check):
+            file_list = command[command.index("-i") + 1]
+            calls.append((command, open(file_list, encoding='utf-8').read()))
+
+        monkeypatch.setattr(cli.subprocess, "run", fake_run)
+        cli._concat_movies([str(path) for path in slices], output_path)
+
+        command, file_list = calls[0]
+        assert file_list.splitlines() == [f"file 'file:{path.resolve().as_posix()}'" for path in slices]
+        assert command[-1] == str(output_path)
+        assert "-c" in command and command[command.index("-c") + 1] == "copy"
+        assert not output_path.with_suffix('.txt').exists()
+
+    def test_file_list_removed_when_ffmpeg_fails(self, tmp_path, monkeypatch):
+        """A failed concat still cleans up its file list."""
+        def fake_run(command, check):
+            raise cli.subprocess.CalledProcessError(1, command)
+
+        monkeypatch.setattr(cli.subprocess, "run", fake_run)
+        with pytest.raises(cli.subprocess.CalledProcessError):
+            cli._concat_movies([str(tmp_path / "a.mp4")], tmp_path / "Scene.mp4")
+
+        assert not (tmp_path / "Scene.txt").exists()
+
+
+class TestRenderAllScenes:
+    """Test rendering every scene of a config across a worker pool."""
+
+    @pytest.fixture
+    def submitted(self, monkeypatch):
+        """Run scene jobs in threads with a fake renderer; collect their calls."""
+        calls = []
+
+        def fake_job(config_path, scene_name, options):
+            calls.append((config_path, scene_name, options))
+            return {
+                'scene': scene_name,
+                'wall_time': 0.5,
+                'frames': 60,
+                'output': f"user-data/{scene_name}.mp4",
+                'cached': scene_name == "Cached",
+                'error': "boom" if scene_name == "Broken" else None
+            }
+
+        monkeypatch.setattr(cli, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(cli, "_render_scene_job", fake_job)
+        return calls
+
+    def make_args(self, **overrides):
+        """Create parsed CLI arguments for --all."""
+        args = dict(quality="low", fps=None, no_cache=False, force_render=False, cache_dir=None, jobs=2)
+        args.update(overrides)
+        return argparse.Namespace(**args)
+
+    def test_one_job_per_scene(self, submitted, capsys):
+        """Every scene is submitted once with the shared render options."""
+        scenes = ["Intro", "Cached", "Outro"]
+
+        exit_code = cli._render_all_scenes(Path("scenes.yaml"), scenes, self.make_args(fps=30))
+
+        assert exit_code == 0
+        assert sorted(name for _, name, _ in submitted) == sorted(scenes)
+        assert {path for path, _, _ in submitted} == {"scenes.yaml"}
+        options = submitted[0][2]
+        assert options['quality'] == "low" and options['fps'] == 30
+        assert options['cache_config'] == {'enabled': True}
+
+        out = capsys.readouterr().out
+        assert "with 2 workers" in out
+        assert "3/3 scenes rendered" in out
+        summary = out[out.index("Batch Render Summary"):]
+        assert [line.split()[0] for line in summary.splitlines()[3:6]] == scenes
+        assert "cached" in summary.splitlines()[4]
+
+    def test_failures_are_reported(self, submitted, capsys):
+        """A failed scene is listed with its error and fails the run."""
+        exit_code = cli._render_all_scenes(Path("scenes.yaml"), ["Intro", "Broken"], self.make_args())
+
+        assert exit_code == 1
+        assert len(submitted) == 2
+        out = capsys.readouterr().out
+        assert "Broken: failed" in out
+        assert "FAILED: boom" in out
+        assert "1/2 scenes rendered" in out
+
+    def test_workers_capped_by_scene_count(self, submitted, capsys):
+        """No more workers are started than there are scenes."""
+        cli._render_all_scenes(Path("scenes.yaml"), ["Intro"], self.make_args(jobs=8, no_cache=True, cache_dir="c"))
+
+        assert "with 1 workers" in capsys.readouterr().out
+        assert submitted[0][2]['cache_config'] == {'enabled': False, 'cache_dir': "c"}
+
+
+class ShortScene(Scene):
+    """A scene that renders in a fraction of a second."""
+
+    def construct(self):
+        self.wait(0.2)
+
+
+class TestRenderCacheOutput:
+    """Test that cached and fresh renders are written to the same path."""
+
+    @pytest.mark.parametrize("output_file, name", [
+        ("", "ShortScene.mp4"), ("clip", "clip.mp4"), ("clip.mp4", "clip.mp4")
+    ])
+    def test_hit_and_miss_write_to_the_same_path(self, tmp_path, output_file, name):
+        """A cache hit copies the render to where the render itself went."""
+        scene_cache = SceneCache(CacheManager(cache_dir=tmp_path / "cache"))
+        render = dict(scene_cache=scene_cache, render_key="key", lookup=True, store=True, metadata={})
+
+        with tempconfig({"media_dir": str(tmp_path / "media"), "quality": "low_quality",
+                         "output_file": output_file, "write_to_movie": True, "preview": False}):
+            rendered, scene = cli._render_or_reuse(ShortScene, **render)
+            rendered.unlink()
+            reused, cached_scene = cli._render_or_reuse(ShortScene, **render)
+
+        assert scene is not None and cached_scene is None
+        assert reused == rendered
+        assert reused.read_bytes() == scene_cache.get_render("key").read_bytes()
+        assert reused.parent == tmp_path / "media" / "videos" / "480p15"
+        assert reused.name == name
@@ -0,0 +1,187 @@
+"""Tests for the composer timeline."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+from src.core.timeline.composer_timeline import (
+    ComposerTimeline, InterpolationType, Keyframe, TimelineTrack, TrackType
+)
+from src.core.timeline.easing import EasingFunction, EasingLibrary
+
+
+@dataclass
+class Lerpable:
+    """A value type that interpolates through its own lerp method."""
+    value: float
+
+    def lerp(self, other, t):
+        return Lerpable(self.value + (other.value - self.value) * t)
+
+
+@pytest.fixture
+def track():
+    """Create a track with an eased and a stepped segment."""
+    track = TimelineTrack("objects", TrackType.ANIMATION)
+    track.add_keyframe("x", Keyframe(2.0, 10.0, InterpolationType.STEP))
+    track.add_keyframe("x", Keyframe(0.0, 0.0, InterpolationType.EASE_IN_OUT))
+    track.add_keyframe("x", Keyframe(3.0, 20.0))
+    return track
+
+
+class TestPropertyCurves:
+    """Test compiled keyframe lookup."""
+
+    def test_keyframes_are_kept_sorted(self, track):
+        """Out-of-order inserts land in time order, after equal times."""
+        track.add_keyframe("x", Keyframe(2.0, 15.0))
+
+        assert [kf.time for kf in track.keyframes["x"]] == [0.0, 2.0, 2.0, 3.0]
+        assert track.keyframes["x"][2].value == 15.0
+
+    def test_values_between_and_outside_keyframes(self, track):
+        """Lookup matches interpolating the surrounding keyframes directly."""
+        keyframes = track.keyframes["x"]
+
+        assert track.get_value_at_time("x", -1.0) == 0.0
+        assert track.get_value_at_time("x", 0.5) == keyframes[0].interpolate_to(keyframes[1], 0.5)
+        assert track.get_value_at_time("x", 2.0) == 10.0
+        assert track.get_value_at_time("x", 2.5) == 10.0
+        assert track.get_value_at_time("x", 5.0) == 20.0
+        assert track.get_value_at_time("missing", 1.0) is None
+
+    def test_curve_is_reused_until_edited(self, track):
+        """Queries share one compiled curve; edits recompile it."""
+        curve = track.get_curve("x")
+        track.get_value_at_time("x", 1.0)
+        assert track.get_curve("x") is curve
+
+        track.add_keyframe("x", Keyframe(4.0, 40.0))
+        assert track.get_curve("x") is not curve
+        assert track.get_value_at_time("x", 5.0) == 40.0
+
+    def test_in_place_edits_need_invalidate(self, track):
+        """Changing a keyframe's easing takes effect after invalidate()."""
+        track.get_value_at_time("x", 2.5)
+        track.keyframes["x"][1].interpolation = InterpolationType.LINEAR
+
+        track.invalidate("x")
+
+        assert track.get_value_at_time("x", 2.5) == pytest.approx(15.0)
+
+    def test_clear_keyframes(self):
+        """Clearing keyframes through the timeline drops the curve."""
+        timeline = ComposerTimeline()
+        timeline.add_keyframe("Main", "objects", "opacity", 0.0, 0.0)
+        timeline.add_keyframe("Main", "objects", "opacity", 1.0, 1.0)
+        assert timeline.get_value_at_time("Main", "objects", "opacity", 0.5) == pytest.approx(0.5)
+
+        timeline.clear_keyframes("Main", "objects", "opacity")
+
+        assert timeline.get_value_at_time("Main", "objects", "opacity", 0.5) is None
+
+
+class TestVectorizedSampling:
+    """Test sampling properties over arrays of times."""
+
+    @pytest.fixture
+    def timeline(self):
+        timeline = ComposerTimeline(duration=4.0)
+        for time, x, color in [(0.0, 0.0, "#000000"), (2.0, 10.0, "#FF8000"), (3.0, 5.0, "#FFFFFF")]:
+            timeline.add_keyframe("Main", "objects", "x", time, x, InterpolationType.EASE_IN_OUT)
+            timeline.add_keyframe("Main", "objects", "position", time, [x, -x, 0.0])
+            timeline.add_keyframe("Main", "objects", "color", time, color)
+        return timeline
+
+    def test_matches_scalar_lookup(self, timeline):
+        """Sampled numbers, vectors and colors match get_value_at_time."""
+        times = np.linspace(-1.0, 4.0, 51)
+        track = timeline.get_layer("Main").get_track("objects")
+
+        for property_name in ("x", "position", "color"):
+            sampled = timeline.sample("Main", "objects", property_name, times)
+            curve = track.get_curve(property_name)
+            for i, time in enumerate(times):
+                expected = timeline.get_value_at_time("Main", "objects", property_name, time)
+                assert curve.value_from_sample(sampled, i) == pytest.approx(expected)
+
+    def test_lerp_objects_and_bools_match_scalar_lookup(self):
+        """Objects with a lerp method interpolate and bools are held."""
+        timeline = ComposerTimeline(duration=4.0)
+        for time, value, flag in [(0.0, 0.0, False), (2.0, 4.0, True), (3.0, 1.0, False)]:
+            timeline.add_keyframe("Main", "objects", "target", time, Lerpable(value),
+                                  InterpolationType.EASE_IN_OUT)
+            timeline.add_keyframe("Main", "objects", "visible", time, flag)
+        track = timeline.get_layer("Main").get_track("objects")
+        times = np.linspace(-1.0, 4.0, 51)
+
+        assert track.get_curve("target").value_kind == "lerp"
+        assert track.get_curve("visible").value_kind == "held"
+        for property_name in ("target", "visible"):
+            sampled = timeline.sample("Main", "objects", property_name, times)
+            curve = track.get_curve(property_name)
+            for i, time in enumerate(times):
+                expected = timeline.get_value_at_time("Main", "objects", property_name, time)
+                value = curve.value_from_sample(sampled, i)
+                assert type(value) is type(expected)
+                if property_name == "target":
+                    assert value.value == pytest.approx(expected.value)
+                else:
+                    assert value is expected
+
+    def test_output_shapes(self, timeline):
+        """Numbers sample to (N,), vectors and colors to (N, D)."""
+        times = np.array([0.5, 1.0, 2.5])
+
+        assert timeline.sample("Main", "objects", "x", times).shape == (3,)
+        assert timeline.sample("Main", "objects", "position", times).shape == (3, 3)
+        color = timeline.sample("Main", "objects", "color", times)
+        assert color.shape == (3, 3)
+        assert color[1] == pytest.approx([0.5, 128 / 255 * 0.5, 0.0])
+        assert timeline.sample("Main", "objects", "missing", times) is None
+
+    def test_camera_state_matches_scalar_lookup(self):
+        """get_camera_at_time returns exactly what direct keyframe lookup does."""
+        timeline = ComposerTimeline(duration=4.0)
+        timeline.add_camera_zoom(0.0, 2.0, 1.0, 3.0)
+        timeline.add_camera_orbit(0.0, 4.0, [0.0, 0.0, 0.0], 3.0)
+        timeline.add_keyframe("Camera", "camera_movement", "dof_enabled", 0.0, False)
+        timeline.add_keyframe("Camera", "camera_movement", "dof_enabled", 4.0, False)
+        timeline.add_keyframe("Camera", "camera_movement", "target", 0.0, Lerpable(0.0))
+        timeline.add_keyframe("Camera", "camera_movement", "target", 2.0, Lerpable(4.0),
+                              interpolation=InterpolationType.LINEAR)
+        track = timeline.get_layer("Camera").get_track("camera_movement")
+
+        for time in (0.0, 1.3, 4.5):
+            state = timeline.get_camera_at_time(time)
+            assert state == {
+                name: track.get_value_at_time(name, time) for name in track.keyframes
+            }
+
+        assert timeline.get_camera_at_time(1.0)["dof_enabled"] is False
+        assert timeline.get_camera_at_time(1.0)["target"] == Lerpable(2.0)
+
+    def test_preview_includes_value_curves(self, timeline):
+        """Preview data carries sampled curves for numeric properties."""
+        preview = timeline.generate_preview_data(width=400, curve_resolution=5)
+        main = next(layer for layer in preview["layers"] if layer["name"] == "Main")
+        objects = next(track for track in main["tracks"] if track["name"] == "objects")
+
+        curves = {curve["property"]: curve for curve in objects["curves"]}
+        assert curves["x"]["x"] == [0.0, 100.0, 200.0, 300.0, 400.0]
+        assert curves["x"]["values"][2] == pytest.approx(10.0)
+
+    def test_easing_lookup_tables(self, timeline):
+        """Timeline-wide LUT easing stays close to exact and is shared."""
+        times = np.linspace(0.0, 3.0, 31)
+        exact = timeline.sample("Main", "objects", "x", times)
+
+        timeline.set_easing_lut(512, "cubic")
+        keyframe = timeline.add_keyframe("Main", "objects", "x", 4.0, 0.0)
+
+        assert keyframe.lut_resolution == 512
+        assert np.allclose(timeline.sample("Main", "objects", "x", times), exact, atol=1e-3)
+        curve = timeline.get_layer("Main").get_track("objects").get_curve("x")
+        assert curve.kernels[0] is EasingLibrary.get_lut_easing_function(
+            EasingFunction.EASE_IN_OUT_CUBIC, {}, 512, "cubic"
+        )
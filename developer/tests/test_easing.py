@@ -0,0 +1,126 @@
+"""Tests for the easing system."""
+
+import numpy as np
+import pytest
+from src.core.timeline.easing import (CubicBezierEasing, EasingFunction, EasingLibrary, EasingPresets,
+                                     _cached_array_easing, _cached_lut_easing)
+from src.core.timeline.rate_function_bridge import UnifiedRateFunction
+
+
+class TestArrayEasing:
+    """Test NumPy easing kernels against the scalar functions."""
+
+    @pytest.mark.parametrize("easing_type", list(EasingFunction), ids=lambda e: e.name)
+    def test_matches_scalar_function(self, easing_type):
+        """Every array kernel agrees with its scalar function on [0, 1]."""
+        t = np.linspace(0.0, 1.0, 1001)
+        scalar = EasingLibrary.get_easing_function(easing_type)
+
+        eased = EasingLibrary.get_array_easing_function(easing_type)(t)
+
+        assert eased.shape == t.shape
+        assert np.allclose(eased, [scalar(x) for x in t], rtol=0, atol=1e-12)
+
+    def test_params_are_applied(self):
+        """Parametric kernels use their params and are memoized per params."""
+        params = {'overshoot': 3.0}
+        t = np.linspace(0.0, 1.0, 11)
+        kernel = EasingLibrary.get_array_easing_function(EasingFunction.EASE_OUT_BACK, params)
+        scalar = EasingLibrary.get_easing_function(EasingFunction.EASE_OUT_BACK, params)
+
+        assert np.allclose(kernel(t), [scalar(x) for x in t])
+        assert EasingLibrary.get_array_easing_function(EasingFunction.EASE_OUT_BACK, dict(params)) is kernel
+
+    def test_memoization_is_bounded(self):
+        """Sweeping a parameter does not grow the kernel and table caches without limit."""
+        for i in range(300):
+            EasingLibrary.get_lut_easing_function(EasingFunction.EASE_OUT_BACK, {'overshoot': 1 + i / 100},
+                                                  resolution=16)
+
+        assert _cached_array_easing.cache_info().currsize <= 256
+        assert _cached_lut_easing.cache_info().currsize <= 256
+
+    @pytest.mark.parametrize("rate_func", sorted(UnifiedRateFunction.MANIM_ARRAY_FUNCTIONS, key=lambda f: f.__name__),
+                             ids=lambda f: f.__name__)
+    def test_manim_rate_functions(self, rate_func):
+        """Array Manim rate functions agree with Manim, including outside [0, 1]."""
+        t = np.linspace(-0.5, 1.5, 401)
+
+        eased = UnifiedRateFunction.get_array(rate_func)(t)
+
+        assert np.allclose(eased, [rate_func(x) for x in t], rtol=0, atol=1e-12)
+
+    def test_bridge_resolves_names(self):
+        """Names, aliases and presets resolve to shared kernels."""
+        assert (UnifiedRateFunction.get_array("ease_in_out_cubic")
+                is EasingLibrary.get_array_easing_function(EasingFunction.EASE_IN_OUT_CUBIC))
+        assert (UnifiedRateFunction.get_array("ease")
+                is UnifiedRateFunction.MANIM_ARRAY_FUNCTIONS[UnifiedRateFunction.MANIM_FUNCTIONS["smooth"]])
+        assert UnifiedRateFunction.get_array("bounce")(np.array([1.0])) == pytest.approx([1.0])
+        assert UnifiedRateFunction.get_array(lambda t: t * t)(np.array([0.5])) == pytest.approx([0.25])
+
+
+class TestCubicBezierEasing:
+    """Test the lookup-table cubic bezier solver."""
+
+    def test_solves_curve_parameter(self):
+        """Eased values lie on the curve at the requested x."""
+        easing = CubicBezierEasing(0.25, 0.1, 0.25, 1.0)
+        s = np.linspace(0.0, 1.0, 201)
+        x = 3 * (1 - s) ** 2 * s * 0.25 + 3 * (1 - s) * s ** 2 * 0.25 + s ** 3
+        y = 3 * (1 - s) ** 2 * s * 0.1 + 3 * (1 - s) * s ** 2 * 1.0 + s ** 3
+
+        assert np.allclose(easing(x), y, atol=1e-9)
+        assert easing(x[50]) == pytest.approx(y[50], abs=1e-9)
+
+    def test_endpoints_and_clamping(self):
+        """The curve runs from (0, 0) to (1, 1) and clamps t."""
+        easing = CubicBezierEasing(0.42, 0.0, 0.58, 1.0)
+
+        assert easing(0.0) == pytest.approx(0.0)
+        assert easing(1.0) == pytest.approx(1.0)
+        assert easing(0.5) == pytest.approx(0.5)
+        assert easing(np.array([-1.0, 2.0])) == pytest.approx([0.0, 1.0])
+
+
+class TestLookupTableEasing:
+    """Test lookup-table easings."""
+
+    @pytest.mark.parametrize("interpolation", ["linear", "cubic"])
+    def test_error_shrinks_with_resolution(self, interpolation):
+        """Reported max error matches measurement and falls with resolution."""
+        errors = EasingLibrary.measure_lut_error(EasingFunction.EASE_OUT_ELASTIC, resolutions=(32, 256),
+                                                 interpolation=interpolation)
+        lut = EasingLibrary.get_easing_function(EasingFunction.EASE_OUT_ELASTIC, lut_resolution=256,
+                                                lut_interpolation=interpolation)
+        t = np.linspace(0.0, 1.0, 5001)
+        exact = EasingLibrary.get_array_easing_function(EasingFunction.EASE_OUT_ELASTIC)(t)
+
+        assert errors[256] < errors[32]
+        assert np.max(np.abs(lut(t) - exact)) <= lut.max_error + 1e-12
+        assert lut(0.3) == pytest.approx(lut(np.array([0.3]))[0])
+
+    def test_cubic_beats_linear(self):
+        """Cubic interpolation is more accurate on smooth easings."""
+        linear = EasingLibrary.get_lut_easing_function(EasingFunction.CUBIC_BEZIER, resolution=64)
+        cubic = EasingLibrary.get_lut_easing_function(EasingFunction.CUBIC_BEZIER, resolution=64,
+                                                      interpolation="cubic")
+
+        assert cubic.max_error < linear.max_error
+
+    def test_presets_share_tables(self):
+        """Every keyframe using a preset samples the same table."""
+        first = EasingPresets.create_easing_from_preset("material_standard", lut_resolution=128)
+        second = EasingLibrary.get_easing_function(
+            EasingFunction.CUBIC_BEZIER, {'control_points': [0.4, 0.0, 0.2, 1.0]}, lut_resolution=128
+        )
+
+        assert first is second
+        assert EasingPresets.create_easing_from_preset("material_standard", lut_resolution=64) is not first
+
+    def test_rejects_bad_settings(self):
+        """Resolutions below two and unknown interpolations are errors."""
+        with pytest.raises(ValueError):
+            EasingLibrary.get_lut_easing_function(EasingFunction.LINEAR, resolution=1)
+        with pytest.raises(ValueError):
+            EasingLibrary.get_lut_easing_function(EasingFunction.LINEAR, interpolation="quadratic")
@@ -0,0 +1,101 @@
+"""Tests for timeline event scheduling."""
+
+import pytest
+from src.core.timeline.composer_timeline import ComposerTimeline, TimelineEvent
+from src.core.timeline.event_index import EventIndex
+
+
+def make_event(time, name="", tags=()):
+    """Create an event that does nothing."""
+    return TimelineEvent(time, lambda scene: None, name=name, tags=list(tags))
+
+
+class TestEventIndex:
+    """Test sorted range queries and tag sub-indexes."""
+
+    @pytest.fixture
+    def index(self):
+        index = EventIndex([make_event(t / 10, f"e{t}", ["burst"] if t % 2 else ["text"]) for t in range(20)])
+        index.add(make_event(0.5, "late", ["text", "burst"]))
+        return index
+
+    def test_range_query(self, index):
+        """Queries return events in time order with inclusive bounds."""
+        events = index.query(0.3, 0.6)
+
+        assert [e.name for e in events] == ["e3", "e4", "e5", "late", "e6"]
+        assert [e.name for e in index.query(0.3, 0.6, include_start=False)] == ["e4", "e5", "late", "e6"]
+
+    def test_tag_queries(self, index):
+        """Tag queries use the sub-indexes and list multi-tagged events once."""
+        assert [e.name for e in index.query(0.0, 0.6, tags=["text"])] == ["e0", "e2", "e4", "late", "e6"]
+        assert [e.name for e in index.query(0.4, 0.5, tags=["text", "burst"])] == ["e4", "e5", "late"]
+        assert index.query(0.0, 2.0, tags=["missing"]) == []
+
+    def test_disabling(self, index):
+        """Disabled events and tags are skipped without reindexing."""
+        index.query(0.4, 0.4)[0].enabled = False
+        index.set_tag_enabled("burst", False)
+
+        assert [e.name for e in index.query(0.0, 0.8)] == ["e0", "e2", "e6", "e8"]
+
+        index.set_tag_enabled("burst", True)
+        assert len(index.query(0.0, 0.8)) == 9
+
+    def test_remove(self, index):
+        """Removed events leave the main and tag indexes."""
+        late = index.query(0.5, 0.5, tags=["text"])[0]
+
+        assert index.remove(late)
+        assert not index.remove(late)
+        assert [e.name for e in index.query(0.5, 0.5)] == ["e5"]
+        assert index.query(0.5, 0.5, tags=["text"]) == []
+
+    def test_cursor_returns_each_event_once(self, index):
+        """Advancing in steps returns every event exactly once."""
+        cursor = index.cursor()
+
+        fired = []
+        for step in range(25):
+            fired.extend(cursor.advance(step / 12))
+
+        assert len(fired) == len(index)
+        assert cursor.advance(1.0) == []
+
+        cursor.reset(1.8)
+        assert [e.name for e in cursor.advance(2.0)] == ["e18", "e19"]
+
+
+class TestTimelinePlayback:
+    """Test event firing from ComposerTimeline.play."""
+
+    def test_play_fires_events_once(self):
+        """Events fire when reached, once, and again after a rewind."""
+        timeline = ComposerTimeline(duration=5.0)
+        fired = []
+        for time in (0.0, 1.0, 2.0):
+            timeline.add_event(time, lambda scene, t=time: fired.append(t), tags=["cue"])
+
+        timeline.play(None)
+        timeline.seek(1.5)
+        timeline.play(None)
+        timeline.play(None)
+        assert fired == [0.0, 1.0]
+
+        timeline.seek(0.5)
+        timeline.seek(2.0)
+        timeline.play(None)
+        assert fired == [0.0, 1.0, 1.0, 2.0]
+
+    def test_get_events_in_range(self):
+        """Range queries respect tags and enabled state."""
+        timeline = ComposerTimeline()
+        keep = timeline.add_event(1.0, print, name="keep", tags=["a"])
+        timeline.add_event(2.0, print, name="other", tags=["b"])
+        timeline.add_event(3.0, print, name="off", tags=["a"], enabled=False)
+
+        assert timeline.get_events_in_range(0.0, 5.0, tags=["a"]) == [keep]
+        assert [e.name for e in timeline.event_queue] == ["keep", "other", "off"]
+
+        timeline.remove_event(keep)
+        assert timeline.get_events_in_range(0.0, 5.0, tags=["a"]) == []
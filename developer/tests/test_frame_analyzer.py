@@ -0,0 +1,63 @@
+"""Tests for frame analysis."""
+
+import cv2
+import numpy as np
+import pytest
+from src.utils.frame_analyzer import FrameAnalyzer
+
+
+@pytest.fixture
+def frames():
+    """Create a batch of noisy, blurred and black frames."""
+    rng = np.random.default_rng(0)
+    batch = (rng.random((12, 48, 64, 3)) * 255).astype(np.uint8)
+    batch[4:8] = cv2.GaussianBlur(batch[0], (5, 5), 0)
+    batch[9] = 3
+    return batch
+
+
+class TestFrameBatchAnalysis:
+    """Test vectorized batch metrics."""
+
+    def test_matches_per_frame_analysis(self, frames):
+        """Batch metrics agree with analyze_array across chunk boundaries."""
+        analyzer = FrameAnalyzer()
+
+        batch = analyzer.analyze_batch(frames, chunk_size=5)
+
+        prev_frame = None
+        for i, frame in enumerate(frames):
+            result = analyzer.analyze_array(frame, prev_frame=prev_frame)
+            prev_frame = frame
+
+            assert batch.brightness[i] == pytest.approx(result.brightness)
+            assert batch.contrast[i] == pytest.approx(result.contrast)
+            assert batch.sharpness[i] == pytest.approx(result.sharpness)
+            assert batch.motion_score[i] == pytest.approx(result.motion_score)
+            assert batch.frame_issues(i) == [
+                issue for issue in result.issues if issue != "Compression artifacts"
+            ]
+
+    def test_columnar_results(self, frames):
+        """Every metric is an array with one entry per frame."""
+        batch = FrameAnalyzer().analyze_batch(frames, timestamps=np.arange(12) / 30)
+
+        assert len(batch) == 12
+        assert batch.quality_score.shape == (12,)
+        assert batch.timestamps[3] == pytest.approx(0.1)
+        assert batch.issues["Black frame"].nonzero()[0].tolist() == [9]
+
+    def test_downscaled_proxies(self, frames):
+        """Proxies keep brightness and the first motion score uses prev_frame."""
+        analyzer = FrameAnalyzer()
+        full = analyzer.analyze_batch(frames)
+
+        proxy = analyzer.analyze_batch(frames, downscale=4, prev_frame=frames[-1])
+
+        assert np.allclose(proxy.brightness, full.brightness, atol=0.01)
+        assert proxy.motion_score[0] > 0
+
+    def test_rejects_single_frame(self, frames):
+        """A lone frame must be given as a batch of one."""
+        with pytest.raises(ValueError):
+            FrameAnalyzer().analyze_batch(frames[0])
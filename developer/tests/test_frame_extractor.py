@@ -0,0 +1,89 @@
+"""Tests for frame extraction."""
+
+import cv2
+import numpy as np
+import pytest
+from src.utils.frame_analyzer import FrameAnalysisPipeline, FrameAnalyzer
+from src.utils.frame_extractor import FrameExtractionConfig, FrameExtractor
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    """Write a 10 second, 30 fps video whose brightness encodes the frame number."""
+    path = tmp_path / 'input.mp4'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), 30, (64, 48))
+    for i in range(300):
+        writer.write(np.full((48, 64, 3), i % 256, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class TestFrameSampling:
+    """Test interval and timestamp sampling."""
+
+    def test_interval_sampling(self, video_path, tmp_path):
+        """Every Nth frame is saved with its frame number and timestamp."""
+        extractor = FrameExtractor(FrameExtractionConfig(frame_interval=30))
+
+        frames = extractor.extract_frames(video_path, tmp_path / 'frames')
+
+        assert [f['frame_number'] for f in frames] == list(range(0, 300, 30))
+        assert frames[1]['timestamp'] == pytest.approx(1.0)
+        assert all((tmp_path / 'frames' / f['filename']).exists() for f in frames)
+
+    def test_timestamps_are_sorted_and_deduplicated(self, video_path):
+        """Unordered timestamps are sampled once each, in stream order."""
+        extractor = FrameExtractor(FrameExtractionConfig(
+            timestamp_list=[8.0, 0.5, 5.0, 5.01],
+            seek_threshold=10
+        ))
+
+        frames = list(extractor.iter_frames(video_path))
+
+        assert [f['frame_number'] for f in frames] == [15, 150, 240]
+        # Seeking lands on the requested frame, within compression error
+        for f in frames:
+            assert abs(float(f['frame'].mean()) - f['frame_number']) < 8
+
+    def test_iter_frames_respects_max_frames(self, video_path, tmp_path):
+        """The generator stops at max_frames and writes nothing."""
+        extractor = FrameExtractor(FrameExtractionConfig(frame_interval=7, max_frames=3))
+
+        frames = list(extractor.iter_frames(video_path))
+
+        assert [f['frame_number'] for f in frames] == [0, 7, 14]
+        assert list(tmp_path.glob('*.jpg')) == []
+
+
+class TestFrameAnalysisPipeline:
+    """Test in-memory parallel frame analysis."""
+
+    def test_matches_sequential_analysis(self, video_path, tmp_path):
+        """Worker results come back in order with sequential motion scores."""
+        extractor = FrameExtractor(FrameExtractionConfig(frame_interval=10))
+        analyzer = FrameAnalyzer()
+
+        sequential = []
+        prev_frame = None
+        for sample in extractor.iter_frames(video_path):
+            sequential.append(analyzer.analyze_array(sample['frame'], sample['timestamp'], prev_frame=prev_frame))
+            prev_frame = sample['frame']
+
+        pipeline = FrameAnalysisPipeline(analyzer, num_workers=4, queue_size=2)
+        results = pipeline.run(extractor.iter_frames(video_path), source=str(video_path))
+
+        assert [r.timestamp for r in results] == [r.timestamp for r in sequential]
+        assert [r.motion_score for r in results] == [r.motion_score for r in sequential]
+        assert results[1].motion_score > 0
+        assert list(tmp_path.rglob('*.jpg')) == []
+
+    def test_thumbnails_are_saved_on_request(self, video_path, tmp_path):
+        """Thumbnails are written and referenced by the results."""
+        extractor = FrameExtractor(FrameExtractionConfig(frame_interval=100))
+        pipeline = FrameAnalysisPipeline(thumbnail_dir=tmp_path / 'thumbs', thumbnail_width=32)
+
+        results = pipeline.run(extractor.iter_frames(video_path))
+
+        assert len(results) == 3
+        for result in results:
+            assert cv2.imread(result.frame_path).shape[1] == 32
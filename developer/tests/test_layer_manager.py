@@ -0,0 +1,157 @@
+"""Tests for layer ordering in scenes."""
+
+import pytest
+from manim import Scene, VMobject
+from src.core.timeline.composer_timeline import ComposerTimeline
+from src.core.timeline.layer_manager import LayerManager
+
+
+class RecordingMobject(VMobject):
+    """VMobject that records the layer properties applied to it."""
+
+    def __init__(self, **kwargs):
+        self.calls = []
+        super().__init__(**kwargs)
+        self.calls.clear()
+
+    def set_opacity(self, opacity, *args, **kwargs):
+        self.calls.append(("opacity", opacity))
+        return super().set_opacity(opacity, *args, **kwargs)
+
+    def shift(self, *vectors):
+        self.calls.append(("shift", tuple(vectors[0])))
+        return super().shift(*vectors)
+
+    def scale(self, scale_factor, *args, **kwargs):
+        self.calls.append(("scale", scale_factor))
+        return super().scale(scale_factor, *args, **kwargs)
+
+
+@pytest.fixture
+def setup():
+    """Create a scene with mobjects registered on three layers."""
+    timeline = ComposerTimeline()
+    manager = LayerManager(timeline)
+    scene = Scene()
+    mobs = {name: RecordingMobject() for name in ("fg", "main_a", "main_b", "bg", "loose")}
+    scene.add(*mobs.values())
+    manager.register_mobject("Foreground", mobs["fg"])
+    manager.register_mobject("Main", mobs["main_a"])
+    manager.register_mobject("Main", mobs["main_b"])
+    manager.register_mobject("Background", mobs["bg"])
+    manager.apply_layer_ordering(scene)
+    return timeline, manager, scene, mobs
+
+
+def names(scene, mobs):
+    lookup = {id(mob): name for name, mob in mobs.items()}
+    return [lookup[id(mob)] for mob in scene.mobjects]
+
+
+class TestLayerOrdering:
+    """Test incremental z-ordering of scene mobjects."""
+
+    def test_orders_by_layer_then_registration(self, setup):
+        """Layers sort by z-index; unregistered mobjects stay on top."""
+        _, _, scene, mobs = setup
+
+        assert names(scene, mobs) == ["bg", "main_a", "main_b", "fg", "loose"]
+
+    def test_unchanged_layers_leave_scene_alone(self, setup):
+        """Without changes, reapplying touches nothing."""
+        _, manager, scene, mobs = setup
+        scene.mobjects.reverse()
+
+        manager.apply_layer_ordering(scene)
+
+        assert names(scene, mobs) == ["loose", "fg", "main_b", "main_a", "bg"]
+
+    def test_z_index_changes_move_layer(self, setup):
+        """Raising a layer moves only its mobjects."""
+        timeline, manager, scene, mobs = setup
+        timeline.move_layer_to_top("Background")
+
+        manager.apply_layer_ordering(scene)
+
+        assert names(scene, mobs) == ["main_a", "main_b", "fg", "bg", "loose"]
+
+    def test_readded_and_moved_mobjects(self, setup):
+        """Re-added and moved mobjects return to their layer's position."""
+        _, manager, scene, mobs = setup
+        scene.add(mobs["bg"])
+        manager.mark_dirty(mobs["bg"])
+        manager.move_mobject_to_layer(mobs["main_a"], "Foreground")
+
+        manager.apply_layer_ordering(scene)
+
+        assert names(scene, mobs) == ["bg", "main_b", "fg", "main_a", "loose"]
+        assert manager.get_layer_mobjects("Main") == [mobs["main_b"]]
+
+    def test_hidden_and_solo_layers(self, setup):
+        """Hidden layers leave the scene and come back in place."""
+        _, manager, scene, mobs = setup
+
+        manager.hide_layer(scene, "Main")
+        assert names(scene, mobs) == ["bg", "fg", "loose"]
+        assert mobs["main_a"].get_fill_opacity() == 0
+
+        manager.solo_layer(scene, "Main")
+        assert names(scene, mobs) == ["loose"]
+
+        manager.show_layer(scene, "Main")
+        assert names(scene, mobs) == ["main_a", "main_b", "loose"]
+        assert mobs["main_a"].get_fill_opacity() == 1
+
+        manager.unsolo_all_layers(scene)
+        assert names(scene, mobs) == ["bg", "main_a", "main_b", "fg", "loose"]
+
+    def test_layer_properties_apply_once(self, setup):
+        """Opacity and transforms apply when they change, not on every call."""
+        timeline, manager, scene, mobs = setup
+        timeline.get_layer("Main").transform["x"] = 1.0
+
+        manager.apply_layer_ordering(scene)
+        manager.apply_layer_ordering(scene)
+
+        assert mobs["main_a"].calls == [("shift", (1.0, 0.0, 0))]
+        assert mobs["bg"].calls == []
+        late = RecordingMobject()
+        manager.register_mobject("Main", late)
+        assert late.calls == [("opacity", 1.0), ("shift", (1.0, 0.0, 0))]
+
+    def test_layer_transform_changes_apply_difference(self, setup):
+        """Changing a layer transform applies only the change."""
+        timeline, manager, scene, mobs = setup
+        transform = timeline.get_layer("Main").transform
+        transform["x"] = 1.0
+        manager.apply_layer_ordering(scene)
+
+        transform["x"] = 2.0
+        transform["scale"] = 3.0
+        manager.apply_layer_ordering(scene)
+        transform["scale"] = 1.5
+        manager.apply_layer_ordering(scene)
+
+        assert mobs["main_a"].calls == [("shift", (1.0, 0.0, 0)), ("shift", (1.0, 0.0, 0)),
+                                        ("scale", 3.0), ("scale", 0.5)]
+
+    def test_moves_happen_in_place(self, setup):
+        """Marked mobjects move within the scene's own list."""
+        timeline, manager, scene, mobs = setup
+        mobjects = scene.mobjects
+        timeline.move_layer_to_top("Background")
+
+        manager.apply_layer_ordering(scene)
+
+        assert scene.mobjects is mobjects
+        assert names(scene, mobs) == ["main_a", "main_b", "fg", "bg", "loose"]
+
+    def test_rearranged_scene_is_resorted(self, setup):
+        """Reordering scene.mobjects outside the manager is repaired on the next change."""
+        _, manager, scene, mobs = setup
+        scene.mobjects.reverse()
+        manager.mark_dirty(mobs["fg"])
+
+        manager.apply_layer_ordering(scene)
+
+        assert names(scene, mobs) == ["bg", "main_a", "main_b", "fg", "loose"]
@@ -3,8 +3,8 @@
 import pytest
 import numpy as np
 from src.utils.math3d import (
-    Vector3D, Matrix4x4, SpatialUtils,
-    lerp_3d, slerp_3d, create_transform_matrix,
+    Vector3D, Vector3DArray, Matrix4x4, Matrix4x4Stack, SpatialUtils,
+    lerp_3d, slerp_3d, create_transform_matrix, create_trs_matrix,
     euler_to_quaternion, quaternion_to_euler
 )
 
@@ -123,6 +123,18 @@ class TestVector3D:
         projection = v1.project_onto(v2)
         assert projection == Vector3D(3, 0, 0)
 
+    def test_division_by_zero(self):
+        """Dividing by zero gives inf/nan with a warning, as numpy arrays do."""
+        with pytest.warns(RuntimeWarning):
+            result = Vector3D(1, -1, 0) / 0
+        assert result.x == np.inf
+        assert result.y == -np.inf
+        assert np.isnan(result.z)
+
+        with pytest.warns(RuntimeWarning):
+            projection = Vector3D(1, 2, 3).project_onto(Vector3D.zero())
+        assert np.isnan(projection.x)
+
     def test_equality(self):
         """Test vector equality."""
         v1 = Vector3D(1, 2, 3)
@@ -416,5 +428,156 @@ class TestUtilityFunctions:
         assert abs(result.z - expected.z) < 1e-10
 
 
+class TestVector3DArray:
+    """Test cases for the vectorized Vector3DArray."""
+
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(50, 3))
+        b = rng.normal(size=(50, 3))
+        # Include zero, parallel and antiparallel pairs
+        a[0] = 0
+        b[1] = a[1] * 2
+        b[2] = -a[2]
+        return Vector3DArray(a), Vector3DArray(b)
+
+    def test_slots_and_lazy_array(self):
+        """Vector3D has no instance dict and builds its array on demand."""
+        v = Vector3D(1, 2, 3)
+        assert not hasattr(v, '__dict__')
+        assert v.array is v.array
+        assert np.array_equal(v.array, [1, 2, 3])
+
+    def test_matches_vector3d(self, vectors):
+        """Every operation agrees with Vector3D applied per vector."""
+        a, b = vectors
+        t = np.linspace(0, 1, len(a))
+        ua, ub = a.normalize(), b.normalize()
+        normal = Vector3D(0, 1, 1).normalize()
+        checks = [
+            (a.dot(b), lambda va, vb, i: va.dot(vb)),
+            (a.magnitude(), lambda va, vb, i: va.magnitude()),
+            (a.angle_between(b), lambda va, vb, i: va.angle_between(vb)),
+            (a.distance_to(b).tolist(), lambda va, vb, i: va.distance_to(vb)),
+            (a.cross(b), lambda va, vb, i: va.cross(vb)),
+            (a.normalize(), lambda va, vb, i: va.normalize()),
+            (a.lerp(b, t), lambda va, vb, i: va.lerp(vb, t[i])),
+            (ua.slerp(ub, t), lambda va, vb, i: va.normalize().slerp(vb.normalize(), t[i])),
+            (a.reflect(normal), lambda va, vb, i: va.reflect(normal)),
+            (a.project_onto(b), lambda va, vb, i: va.project_onto(vb)),
+        ]
+        for result, scalar in checks:
+            for i, (va, vb) in enumerate(zip(a, b)):
+                expected = scalar(va, vb, i)
+                if isinstance(expected, Vector3D):
+                    assert result[i] == expected
+                else:
+                    assert result[i] == pytest.approx(expected, abs=1e-9)
+
+    def test_arithmetic_and_broadcasting(self, vectors):
+        """Operators accept arrays, single vectors and per-vector scalars."""
+        a, b = vectors
+        scale = np.arange(len(a))
+
+        assert (a + b).allclose(a.data + b.data)
+        assert (a - Vector3D(1, 2, 3)).allclose(a.data - [1, 2, 3])
+        assert (a * scale).allclose(a.data * scale[:, None])
+        assert (2 * a / 4).allclose(a.data / 2)
+        assert (-a)[3] == -a[3]
+        assert len(a[a.x > 0]) == int((a.data[:, 0] > 0).sum())
+
+    def test_float32_and_matrix_interop(self, vectors):
+        """float32 arrays stay float32 and transform like Matrix4x4.transform_point."""
+        a, _ = vectors
+        matrix = create_transform_matrix(Vector3D(1, 2, 3), Vector3D(0.1, 0.2, 0.3), Vector3D(2, 2, 2))
+        projection = Matrix4x4.perspective(np.pi / 3, 1.5, 0.1, 100) * matrix
+
+        single = a.astype(np.float32)
+        assert (single + Vector3D(1, 1, 1)).dtype == np.float32
+        assert single.normalize().dtype == np.float32
+
+        for m in (matrix, projection):
+            transformed = m.transform_points(a)
+            assert isinstance(transformed, Vector3DArray)
+            for i in range(len(a)):
+                assert transformed[i] == m.transform_point(a[i])
+        with pytest.raises(ValueError):
+            Vector3DArray(np.zeros((4, 2)))
+
+
+class TestMatrix4x4Stack:
+    """Test cases for batched Matrix4x4Stack operations and raw-array transforms."""
+
+    @pytest.fixture
+    def trs(self):
+        rng = np.random.default_rng(1)
+        return rng.normal(size=(8, 3)), rng.uniform(-3, 3, size=(8, 3)), rng.uniform(0.5, 2, size=(8, 3))
+
+    def test_construction_matches_matrix4x4(self, trs):
+        """TRS and Euler stacks equal the per-matrix constructions."""
+        translations, rotations, scales = trs
+        stack = Matrix4x4Stack.trs(translations, rotations, scales)
+        assert len(stack) == 8
+        for i in range(8):
+            expected = create_trs_matrix(Vector3D.from_array(translations[i]),
+                                         Vector3D.from_array(rotations[i]),
+                                         Vector3D.from_array(scales[i]))
+            assert stack[i] == expected
+
+        for order in ("XYZ", "ZXY", "YZX"):
+            rotation = Matrix4x4Stack.rotation_euler(rotations, order)
+            assert rotation[2] == Matrix4x4.rotation_euler(*rotations[2], order=order)
+        with pytest.raises(ValueError):
+            Matrix4x4Stack.rotation_euler(rotations, "XXY")
+
+    def test_multiply_inverse_decompose(self, trs):
+        """Batched algebra agrees with Matrix4x4 per element."""
+        translations, rotations, scales = trs
+        stack = Matrix4x4Stack.trs(translations, rotations * 0.3, scales)
+        view = Matrix4x4.look_at(Vector3D(0, 0, 5), Vector3D(0, 0, 0), Vector3D(0, 1, 0))
+
+        assert (view * stack)[3] == view * stack[3]
+        assert (stack * view)[3] == stack[3] * view
+        assert (stack * stack.inverse()) == Matrix4x4Stack.identity(8)
+        assert stack.combine() == stack[0] * stack[1] * stack[2] * stack[3] * stack[4] * stack[5] * stack[6] * stack[7]
+
+        decomposed = stack.decompose()
+        for i in range(8):
+            for batched, single in zip(decomposed, stack[i].decompose()):
+                assert Vector3D.from_array(batched[i]) == single
+
+        with pytest.raises(ValueError):
+            Matrix4x4Stack(np.zeros((2, 4, 4))).inverse()
+
+    def test_raw_point_transforms(self, trs):
+        """Raw (N, 3) transforms match transform_point, keep float32 and fill out buffers."""
+        rng = np.random.default_rng(2)
+        points = rng.normal(size=(20, 3))
+        projection = Matrix4x4.perspective(np.pi / 3, 1.5, 0.1, 100) * Matrix4x4.translation(0, 0, -5)
+
+        result = projection.transform_points_array(points)
+        for i in range(len(points)):
+            assert Vector3D.from_array(result[i]) == projection.transform_point(Vector3D.from_array(points[i]))
+
+        out = np.empty_like(points)
+        assert projection.transform_points_array(points, out=out) is out
+        assert np.allclose(out, result)
+        in_place = points.copy()
+        projection.transform_points_array(in_place, out=in_place)
+        assert np.allclose(in_place, result)
+
+        assert projection.transform_points_array(points.astype(np.float32)).dtype == np.float32
+        assert np.allclose(Matrix4x4.translation(1, 2, 3).transform_directions_array(points), points)
+
+        stack = Matrix4x4Stack.trs(*trs)
+        batched = stack.transform_points(points)
+        assert batched.shape == (8, 20, 3)
+        for i in range(8):
+            assert np.allclose(batched[i], stack[i].transform_points_array(points))
+        per_matrix = stack.transform_points(batched)
+        assert np.allclose(per_matrix[5], stack[5].transform_points_array(batched[5]))
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""Tests for the array noise generators and noise textures in math3d."""
+
+import pytest
+import numpy as np
+from src.utils.math3d import (
+    PerlinNoise, SimplexNoise, FractalNoise, VoronoiNoise,
+    NoiseTextureCache, build_noise_texture
+)
+
+
+@pytest.fixture
+def coords():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-20, 300, size=(2, 200))
+    # Keep z off the z == 0 cell layer, which scalar 3D Voronoi cannot handle
+    z = rng.uniform(2, 40, size=200)
+    return x, y, z
+
+
+class TestNoiseArrays:
+    """Array methods return exactly the scalar values."""
+
+    def test_perlin(self, coords):
+        x, y, z = coords
+        noise = PerlinNoise(3)
+        assert np.array_equal(noise.noise1d_array(x), [noise.noise1d(a) for a in x])
+        assert np.array_equal(noise.noise2d_array(x, y), [noise.noise2d(a, b) for a, b in zip(x, y)])
+        assert np.array_equal(noise.noise3d_array(x, y, z),
+                              [noise.noise3d(a, b, c) for a, b, c in zip(x, y, z)])
+
+    def test_simplex(self, coords):
+        x, y, z = coords
+        noise = SimplexNoise(4)
+        assert np.array_equal(noise.noise2d_array(x, y), [noise.noise2d(a, b) for a, b in zip(x, y)])
+        assert np.array_equal(noise.noise3d_array(x, y, z),
+                              [noise.noise3d(a, b, c) for a, b, c in zip(x, y, z)])
+
+    def test_fractal(self, coords):
+        x, y, z = coords
+        perlin = PerlinNoise(5)
+        fractal = FractalNoise(perlin.noise3d, octaves=5, persistence=0.6, lacunarity=2.1)
+        assert fractal.array_func == perlin.noise3d_array
+        points = list(zip(x, y, z))
+        assert np.array_equal(fractal.fbm_array(x, y, z), [fractal.fbm(*p) for p in points])
+        assert np.array_equal(fractal.turbulence_array(x, y, z), [fractal.turbulence(*p) for p in points])
+        assert np.array_equal(fractal.ridged_array(x, y, z), [fractal.ridged(*p) for p in points])
+
+        # Functions without an array counterpart are vectorized
+        custom = FractalNoise(lambda a, b: np.sin(a) * np.cos(b), octaves=3)
+        assert np.array_equal(custom.fbm_array(x, y), [custom.fbm(a, b) for a, b in zip(x, y)])
+
+    @pytest.mark.parametrize("distance_func", ["euclidean", "manhattan", "chebyshev"])
+    def test_voronoi(self, coords, distance_func):
+        x, y, z = coords
+        noise = VoronoiNoise(6)
+        f1, f2 = noise.noise2d_array(x, y, distance_func)
+        expected = np.array([noise.noise2d(a, b, distance_func) for a, b in zip(x, y)])
+        assert np.array_equal(f1, expected[:, 0])
+        assert np.array_equal(f2, expected[:, 1])
+
+        f1, f2 = noise.noise3d_array(x[:40], y[:40], z[:40], distance_func)
+        expected = np.array([noise.noise3d(a, b, c, distance_func) for a, b, c in zip(x, y, z)][:40])
+        assert np.array_equal(f1, expected[:, 0])
+        assert np.array_equal(f2, expected[:, 1])
+
+    def test_voronoi_far_apart(self):
+        """Samples spread over a huge range are handled like nearby ones."""
+        noise = VoronoiNoise(6)
+        x = np.array([-1e7, 0.5, 1e7 + 0.25])
+        y = np.array([1e7, -3.5, -1e7 + 0.75])
+        z = np.array([-1e7 + 0.5, 2.5, 1e7])
+        f1, f2 = noise.noise3d_array(x, y, z)
+        expected = np.array([noise.noise3d(a, b, c) for a, b, c in zip(x, y, z)])
+        assert np.array_equal(f1, expected[:, 0])
+        assert np.array_equal(f2, expected[:, 1])
+
+    def test_grids(self):
+        xs = np.linspace(-2, 5, 7)
+        ys = np.linspace(0, 3, 4)
+        zs = np.linspace(1, 2, 3)
+        perlin = PerlinNoise(1)
+        simplex = SimplexNoise(1)
+        fractal = FractalNoise(perlin.noise2d)
+
+        grid = perlin.noise2d_grid(xs, ys)
+        assert grid.shape == (4, 7)
+        assert grid[2, 5] == perlin.noise2d(xs[5], ys[2])
+        assert simplex.noise3d_grid(xs, ys, zs)[1, 3, 6] == simplex.noise3d(xs[6], ys[3], zs[1])
+        assert fractal.fbm_grid(xs, ys)[3, 1] == fractal.fbm(xs[1], ys[3])
+        f1, _ = VoronoiNoise(2).noise2d_grid(xs, ys)
+        assert f1[1, 4] == VoronoiNoise(2).noise2d(xs[4], ys[1])[0]
+
+
+class TestNoiseTextures:
+    """Tileable textures, mip levels and the LRU texture cache."""
+
+    def test_periodic_noise(self, coords):
+        x, y, _ = coords
+        perlin, voronoi = PerlinNoise(1), VoronoiNoise(1)
+        assert np.allclose(perlin.noise2d_array(x, y, period=8), perlin.noise2d_array(x + 8, y - 16, period=8))
+        assert np.allclose(voronoi.noise2d_array(x, y, period=4)[0],
+                           voronoi.noise2d_array(x - 4, y + 12, period=4)[0])
+
+    @pytest.mark.parametrize("noise_type", ["perlin", "simplex", "voronoi"])
+    def test_texture_tiles(self, noise_type):
+        texture = build_noise_texture(noise_type, seed=1, octaves=3, resolution=32, period=4)
+        assert len(texture.levels) == 6
+        assert [level.shape for level in texture.levels][-2:] == [(2, 2), (1, 1)]
+
+        xs = np.linspace(0, 4, 23)
+        assert np.allclose(texture.sample(xs[None, :], xs[:, None]),
+                           texture.sample(xs[None, :] + 4, xs[:, None] - 8), atol=1e-6)
+        # The wrap-around seam is no larger than steps inside the texture
+        level = texture.levels[0]
+        assert np.abs(level[:, 0] - level[:, -1]).max() <= np.abs(np.diff(level, axis=1)).max() + 1e-6
+
+    def test_texture_sampling(self):
+        texture = build_noise_texture("perlin", seed=2, resolution=32, period=4, dtype=np.float64)
+        texels = np.arange(32) * 4 / 32
+        expected = PerlinNoise(2).noise2d_array(texels[None, :], texels[:, None], period=4)
+        assert np.allclose(texture.sample(texels[None, :], texels[:, None]), expected)
+
+        # Bilinear between texels, mip blending and clamping
+        assert texture.sample(texels[3] / 2 + texels[4] / 2, 0) == pytest.approx((expected[0, 3] + expected[0, 4]) / 2)
+        assert texture.sample(1.0, 2.0, lod=99) == pytest.approx(texture.levels[-1][0, 0])
+        halfway = texture.sample(1.0, 2.0, lod=0.5)
+        assert halfway == pytest.approx((texture.sample(1.0, 2.0) + texture.sample(1.0, 2.0, lod=1)) / 2)
+
+        volume = build_noise_texture("perlin", seed=2, dims=3, resolution=16, period=2)
+        assert volume.sample(np.zeros(5), 0.5, 1.0).shape == (5,)
+        with pytest.raises(ValueError):
+            volume.sample(0, 0)
+        with pytest.raises(ValueError):
+            build_noise_texture("perlin", resolution=30)
+
+    def test_cache_lru(self):
+        texture_bytes = build_noise_texture(resolution=32).nbytes
+        cache = NoiseTextureCache(max_size_mb=2.5 * texture_bytes / (1024 * 1024), resolution=32)
+
+        first = cache.get_texture(seed=0)
+        assert cache.get_texture(seed=0) is first
+        cache.get_texture(seed=1)
+        cache.get_texture(seed=0)
+        cache.get_texture(seed=2)  # Evicts seed 1, the least recently used
+
+        assert len(cache) == 2
+        assert [key[1] for key in cache.textures] == [0, 2]
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (2, 3, 1)
+
+        # Textures over the budget are returned without being cached
+        assert cache.get_texture(seed=3, resolution=128).resolution == 128
+        assert len(cache) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
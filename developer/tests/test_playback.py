@@ -0,0 +1,191 @@
+"""Tests for timeline playback onto mobjects."""
+
+import numpy as np
+import pytest
+from src.core.timeline.composer_timeline import ComposerTimeline
+from src.core.timeline.playback import TimelinePlayer
+from src.utils.math3d import Vector3D
+
+
+class FakeMobject:
+    """Records the calls a TimelinePlayer makes."""
+
+    def __init__(self):
+        self.position = np.zeros(3)
+        self.opacity = 1.0
+        self.scale_factor = 1.0
+
+    def move_to(self, point):
+        self.position = np.asarray(point, dtype=float)
+
+    def set_x(self, x):
+        self.position[0] = x
+
+    def set_opacity(self, opacity):
+        self.opacity = opacity
+
+    def scale(self, factor):
+        self.scale_factor *= factor
+
+
+class FakeScene:
+    """Holds scene updaters and calls them like Scene.update_self."""
+
+    def __init__(self):
+        self.updaters = []
+
+    def add_updater(self, func):
+        self.updaters.append(func)
+
+    def remove_updater(self, func):
+        self.updaters = [f for f in self.updaters if f != func]
+
+    def advance(self, dt, frames=1):
+        for _ in range(frames):
+            for updater in self.updaters:
+                updater(dt)
+
+
+@pytest.fixture
+def timeline():
+    timeline = ComposerTimeline(duration=2.0, fps=10)
+    timeline.add_keyframe("Main", "objects", "x", 0.0, 0.0)
+    timeline.add_keyframe("Main", "objects", "x", 2.0, 4.0)
+    timeline.add_keyframe("Main", "objects", "position", 0.0, [0.0, 0.0, 0.0])
+    timeline.add_keyframe("Main", "objects", "position", 1.0, [1.0, 2.0, 0.0])
+    timeline.add_keyframe("Main", "objects", "scale", 0.0, 1.0)
+    timeline.add_keyframe("Main", "objects", "scale", 2.0, 3.0)
+    return timeline
+
+
+class TestTimelinePlayer:
+    """Test the single scene-level updater."""
+
+    def test_one_updater_drives_all_bindings(self, timeline):
+        """Bound properties follow the timeline frame by frame."""
+        scene = FakeScene()
+        player = TimelinePlayer(timeline)
+        mobjects = [FakeMobject() for _ in range(3)]
+        for mob in mobjects:
+            player.bind("Main", "objects", "position", mob)
+            player.bind("Main", "objects", "scale", mob)
+
+        player.attach(scene)
+        scene.advance(0.1, frames=5)
+
+        assert len(scene.updaters) == 1
+        for mob in mobjects:
+            assert mob.position == pytest.approx([0.5, 1.0, 0.0])
+            assert mob.scale_factor == pytest.approx(timeline.get_value_at_time("Main", "objects", "scale", 0.5))
+
+    def test_off_grid_times_match_direct_lookup(self, timeline):
+        """Times between frames use exact curve lookup."""
+        player = TimelinePlayer(timeline)
+        mob = FakeMobject()
+        player.bind("Main", "objects", "x", mob)
+
+        player.seek(0.123)
+
+        assert mob.position[0] == pytest.approx(timeline.get_value_at_time("Main", "objects", "x", 0.123))
+
+    def test_scale_grows_back_from_zero(self, timeline):
+        """A scale track starting at 0 does not collapse the mobject for good."""
+        timeline.add_keyframe("Main", "text", "scale", 0.0, 0.0)
+        timeline.add_keyframe("Main", "text", "scale", 1.0, 1.0)
+        player = TimelinePlayer(timeline)
+        mob = FakeMobject()
+        player.bind("Main", "text", "scale", mob)
+
+        player.seek(0.0)
+        assert mob.scale_factor == pytest.approx(0.0, abs=1e-5)
+
+        player.seek(0.5)
+        assert mob.scale_factor == pytest.approx(timeline.get_value_at_time("Main", "text", "scale", 0.5))
+
+        player.seek(1.0)
+        assert mob.scale_factor == pytest.approx(1.0)
+
+    def test_lerp_values_interpolate_on_and_off_grid(self, timeline):
+        """Values that interpolate through .lerp agree between grid and exact lookup."""
+        timeline.add_keyframe("Main", "text", "target", 0.0, Vector3D(0, 0, 0))
+        timeline.add_keyframe("Main", "text", "target", 1.0, Vector3D(1, 0, 0))
+        player = TimelinePlayer(timeline)
+        values = []
+        player.bind("Main", "text", "target", FakeMobject(), apply=lambda mob, value, state: values.append(value))
+
+        player.seek(0.5)
+        player.seek(0.55)
+
+        assert values[0].x == pytest.approx(0.5)
+        assert values[1].x == pytest.approx(0.55)
+
+    def test_edits_are_resampled(self, timeline):
+        """Keyframes added after attaching take effect."""
+        player = TimelinePlayer(timeline)
+        mob = FakeMobject()
+        player.bind("Main", "objects", "x", mob)
+        player.attach(FakeScene())
+
+        timeline.add_keyframe("Main", "objects", "x", 1.0, 10.0)
+        player.seek(1.0)
+
+        assert mob.position[0] == pytest.approx(10.0)
+
+    def test_duration_change_is_resampled(self, timeline):
+        """Frames past the old duration use samples over the new one."""
+        player = TimelinePlayer(timeline)
+        mob = FakeMobject()
+        player.bind("Main", "objects", "x", mob)
+        player.attach(FakeScene())
+
+        timeline.duration = 5.0
+        player.seek(4.0)
+
+        assert mob.position[0] == pytest.approx(timeline.get_value_at_time("Main", "objects", "x", 4.0))
+
+    def test_layer_visibility_solo_and_opacity(self, timeline):
+        """Hidden or non-solo layers are transparent and layer opacity applies."""
+        player = TimelinePlayer(timeline)
+        mob = FakeMobject()
+        player.bind("Main", "objects", "x", mob)
+        layer = timeline.get_layer("Main")
+
+        layer.opacity = 0.5
+        player.seek(1.0)
+        assert mob.opacity == 0.5
+
+        timeline.get_layer("Effects").solo = True
+        player.seek(2.0)
+        assert mob.opacity == 0.0
+        assert mob.position[0] == pytest.approx(2.0)
+
+        timeline.get_layer("Effects").solo = False
+        player.seek(2.0)
+        assert mob.opacity == 0.5
+        assert mob.position[0] == pytest.approx(4.0)
+
+    def test_events_fire_once_and_loop(self, timeline):
+        """Events fire as playback passes them, again after looping."""
+        fired = []
+        timeline.add_event(0.5, lambda scene: fired.append(0.5))
+        timeline.loop_enabled = True
+        timeline.loop_end = 1.0
+        scene = FakeScene()
+        player = TimelinePlayer(timeline)
+        player.attach(scene)
+
+        scene.advance(0.1, frames=16)
+
+        assert fired == [0.5, 0.5]
+        assert player.time == pytest.approx(0.6)
+
+    def test_unknown_property_needs_applier(self, timeline):
+        """Properties without a registered applier need an explicit one."""
+        player = TimelinePlayer(timeline)
+        with pytest.raises(ValueError):
+            player.bind("Main", "objects", "glow", FakeMobject())
+
+        values = []
+        player.bind("Main", "objects", "x", FakeMobject(), apply=lambda mob, value, state: values.append(value))
+        player.seek(1.0)
+        assert values == [pytest.approx(2.0)]
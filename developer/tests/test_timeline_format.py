@@ -0,0 +1,91 @@
+"""Tests for the binary timeline format."""
+
+import numpy as np
+import pytest
+from src.core.timeline.composer_timeline import ComposerTimeline, InterpolationType, Keyframe
+from src.core.timeline.timeline_format import LazyTimelineTrack
+
+
+@pytest.fixture
+def timeline():
+    """Create a timeline with number, vector, color and dict keyframes."""
+    timeline = ComposerTimeline(duration=5.0, fps=30.0)
+    for time, x in [(0.0, 0), (1.5, 2), (3.0, -1)]:
+        timeline.add_keyframe("Main", "objects", "x", time, x)
+    for time, y in [(0.0, 0.25), (2.0, 1.5)]:
+        timeline.add_keyframe("Main", "objects", "y", time, y, InterpolationType.EASE_IN_OUT)
+    timeline.add_keyframe("Main", "shapes", "position", 0.0, [0.0, 1.0, 0.0])
+    timeline.add_keyframe("Main", "shapes", "position", 2.0, [1.5, -1.0, 0.5], InterpolationType.BOUNCE)
+    timeline.add_keyframe("Effects", "particles", "color", 1.0, "#FF0000", InterpolationType.STEP)
+    timeline.add_keyframe("Effects", "particles", "color", 2.0, "#00FF00")
+    timeline.add_keyframe("Effects", "particles", "settings", 1.0, {"rate": 3, "on": True})
+    timeline.set_layer_z_index("Effects", 50)
+    timeline.get_layer("Main").visible = False
+    timeline.add_marker(2.0, "drop")
+    return timeline
+
+
+class TestBinaryFormat:
+    """Test saving and loading .npz timelines."""
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_matches_json_round_trip(self, timeline, tmp_path, lazy):
+        """The binary format restores what the JSON format does."""
+        timeline.export_to_json(tmp_path / "timeline.json")
+        timeline.export_to_npz(tmp_path / "timeline.npz")
+
+        from_json = ComposerTimeline()
+        from_json.import_from_json(tmp_path / "timeline.json")
+        from_npz = ComposerTimeline()
+        from_npz.import_from_npz(tmp_path / "timeline.npz", lazy=lazy)
+
+        assert from_npz.to_dict() == from_json.to_dict()
+        assert [layer.name for layer in from_npz.layers][:3] == ["Background", "Effects", "Main"]
+        times = np.linspace(0.0, 3.0, 13)
+        for prop in ("x", "y"):
+            assert np.array_equal(from_npz.sample("Main", "objects", prop, times),
+                                  timeline.sample("Main", "objects", prop, times))
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_duplicate_layer_names(self, tmp_path, lazy):
+        """Layers sharing a name keep their own tracks."""
+        timeline = ComposerTimeline()
+        for z_index, value in [(90, 1.0), (5, 2.0)]:
+            layer = timeline.add_layer("A", ["objects"], z_index=z_index)
+            layer.tracks[0].add_keyframe("x", Keyframe(0.0, value))
+        timeline.export_to_json(tmp_path / "timeline.json")
+        timeline.export_to_npz(tmp_path / "timeline.npz")
+
+        from_json = ComposerTimeline()
+        from_json.import_from_json(tmp_path / "timeline.json")
+        from_npz = ComposerTimeline()
+        from_npz.import_from_npz(tmp_path / "timeline.npz", lazy=lazy)
+
+        assert from_npz.to_dict() == from_json.to_dict()
+        values = [layer.tracks[0].get_value_at_time("x", 0.0) for layer in from_npz.layers if layer.name == "A"]
+        assert values == [2.0, 1.0]
+
+    def test_tracks_load_on_first_access(self, timeline, tmp_path):
+        """Lazy tracks read their keyframes only when used."""
+        timeline.export_to_npz(tmp_path / "timeline.npz")
+        loaded = ComposerTimeline()
+        loaded.import_from_npz(tmp_path / "timeline.npz")
+
+        track = loaded.get_layer("Main").get_track("objects")
+        other = loaded.get_layer("Main").get_track("shapes")
+        assert isinstance(track, LazyTimelineTrack) and not track.loaded
+
+        assert loaded.get_value_at_time("Main", "objects", "x", 1.5) == 2
+        assert track.loaded and not other.loaded
+        assert isinstance(track.keyframes["x"][0].value, int)
+
+        loaded.add_keyframe("Main", "shapes", "position", 3.0, [0.0, 0.0, 0.0])
+        assert len(other.keyframes["position"]) == 3
+
+    def test_rejects_unknown_version(self, tmp_path):
+        """Files from another format version are refused."""
+        header = np.frombuffer(b'{"format_version": 99}', dtype=np.uint8)
+        np.savez(tmp_path / "future.npz", header=header)
+
+        with pytest.raises(ValueError):
+            ComposerTimeline().import_from_npz(tmp_path / "future.npz")
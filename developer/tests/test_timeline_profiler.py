@@ -0,0 +1,97 @@
+"""Tests for the timeline profiler."""
+
+import json
+import time
+
+import pytest
+from src.core.timeline.composer_timeline import ComposerTimeline
+from src.utils.timeline_profiler import TimelineProfiler
+
+
+class FakeScene:
+    def __init__(self):
+        self.played = []
+
+    def play(self, *animations, **kwargs):
+        self.played.append(animations)
+
+
+class SlowEffect:
+    def animate(self, scene):
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def timeline():
+    """Create a timeline with tagged events on two tracks."""
+    timeline = ComposerTimeline(duration=2.0)
+    timeline.add_event(0.5, lambda scene: time.sleep(0.003), name="burst",
+                       layer_name="Effects", track_name="particles", tags=["intro", "fx"])
+    timeline.add_event(1.0, lambda scene: scene.play("fade"), name="title",
+                       layer_name="Main", track_name="text", tags=["intro"])
+    return timeline
+
+
+class TestTimelineProfiler:
+    """Test wrapping, aggregation and export."""
+
+    def test_records_events_play_and_effects(self, timeline):
+        """Wrapped calls are timed with their layer, track and tags."""
+        scene = FakeScene()
+        effect = SlowEffect()
+        with TimelineProfiler(timeline) as profiler:
+            assert profiler.wrap_timeline() == 2
+            assert profiler.wrap_timeline() == 0
+            profiler.wrap_scene(scene)
+            profiler.wrap_effect(effect, layer="Effects", track="particles")
+            timeline.advance(scene, 2.0)
+            effect.animate(scene)
+
+        names = [record.name for record in profiler.records]
+        assert names == ["burst", "play(str)", "title", "SlowEffect"]
+        assert scene.played == [("fade",)]
+        assert profiler.records[0].duration >= 0.003
+        assert profiler.records[0].timeline_time == 2.0
+
+        by_track = profiler.summary("track")
+        assert by_track["Effects/particles"].count == 2
+        assert by_track["(none)"].count == 1
+        by_tag = profiler.summary("tag")
+        assert by_tag["intro"].count == 2 and by_tag["fx"].count == 1
+        assert "over budget" in profiler.report("layer", frame_budget=0.001)
+
+    def test_unwrap_restores_callables(self, timeline):
+        """Leaving the context restores callbacks and methods."""
+        scene = FakeScene()
+        effect = SlowEffect()
+        callbacks = [event.callback for event in timeline.events]
+        with TimelineProfiler(timeline) as profiler:
+            profiler.wrap_timeline()
+            profiler.wrap_scene(scene)
+            profiler.wrap_effect(effect)
+
+        assert [event.callback for event in timeline.events] == callbacks
+        assert "play" not in vars(scene) and "animate" not in vars(effect)
+
+        scene.play("again")
+        assert profiler.records == []
+
+    def test_chrome_trace_and_allocations(self, timeline, tmp_path):
+        """Traces hold complete events in microseconds with allocation args."""
+        profiler = TimelineProfiler(timeline, track_allocations=True)
+        profiler.start()
+        with profiler.span("build", tags=["setup"]):
+            data = [bytearray(1000) for _ in range(100)]
+        profiler.stop()
+
+        profiler.export_chrome_trace(tmp_path / "trace.json")
+        profiler.export_report(tmp_path / "report.txt")
+
+        trace = json.loads((tmp_path / "trace.json").read_text())
+        event = trace["traceEvents"][0]
+        assert event["ph"] == "X" and event["name"] == "build"
+        assert event["dur"] == pytest.approx(profiler.records[0].duration * 1e6)
+        assert event["args"]["allocated"] >= 100000
+        assert event["args"]["tags"] == ["setup"]
+        assert "build" in (tmp_path / "report.txt").read_text()
+        assert len(data) == 100
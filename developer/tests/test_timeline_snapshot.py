@@ -0,0 +1,75 @@
+"""Tests for structurally shared timeline snapshots."""
+
+import pytest
+from src.core.timeline.composer_timeline import ComposerTimeline, InterpolationType
+from src.utils.timeline_snapshot import TimelineSnapshotter, diff_snapshots
+
+
+@pytest.fixture
+def timeline():
+    """Create a timeline with one animated and one held track."""
+    timeline = ComposerTimeline(duration=4.0)
+    timeline.add_keyframe("Main", "objects", "x", 0.0, 0.0)
+    timeline.add_keyframe("Main", "objects", "x", 2.0, 10.0)
+    timeline.add_keyframe("Effects", "particles", "color", 0.0, "#FF0000", InterpolationType.STEP)
+    timeline.add_keyframe("Effects", "particles", "color", 3.0, "#00FF00")
+    timeline.add_event(1.5, lambda scene: None, name="pop")
+    timeline.add_event(3.5, lambda scene: None, name="end")
+    return timeline
+
+
+class TestSnapshots:
+    """Test sharing and diffing."""
+
+    def test_unchanged_tracks_are_shared(self, timeline):
+        """Only the animated track is re-evaluated between frames."""
+        snapshotter = TimelineSnapshotter(timeline)
+        first = snapshotter.take(time=0.5)
+        second = snapshotter.take(time=1.0)
+
+        assert second.layers["Effects"] is first.layers["Effects"]
+        assert second.layers["Background"] is first.layers["Background"]
+        assert second.layers["Main"] is not first.layers["Main"]
+        assert second.layers["Main"].tracks["objects"].values["x"] == pytest.approx(5.0)
+
+        # Past the last keyframe every layer is static
+        third = snapshotter.take(time=3.2)
+        assert snapshotter.take(time=3.9).layers is third.layers
+
+    def test_edits_and_flags_invalidate_sharing(self, timeline):
+        """Keyframe edits and layer flags produce new snapshots."""
+        snapshotter = TimelineSnapshotter(timeline)
+        first = snapshotter.take(time=3.5)
+
+        timeline.add_keyframe("Effects", "particles", "color", 5.0, "#0000FF")
+        timeline.get_layer("Background").visible = False
+        second = snapshotter.take(time=3.5)
+
+        assert second.layers["Effects"] is not first.layers["Effects"]
+        assert second.layers["Background"] is not first.layers["Background"]
+        assert second.layers["Main"] is first.layers["Main"]
+
+    def test_diff_reports_changed_parts(self, timeline):
+        """Diffs list property, layer and pending event changes."""
+        snapshotter = TimelineSnapshotter(timeline)
+        before = snapshotter.take(time=1.0)
+        after = snapshotter.take(time=3.2)
+
+        diff = diff_snapshots(before, after)
+
+        assert set(diff["layer_changes"]) == {"Main", "Effects"}
+        assert diff["property_changes"]["Main/objects"]["x"] == pytest.approx((5.0, 10.0))
+        assert diff["property_changes"]["Effects/particles"]["color"] == ("#FF0000", "#00FF00")
+        assert diff["event_changes"] == {"added": [], "removed": ["pop"]}
+        assert diff_snapshots(after, snapshotter.take(time=3.3))["layer_changes"] == {}
+
+    def test_to_dict_matches_report_format(self, timeline):
+        """Snapshots convert to the nested dicts used in debug reports."""
+        snapshot = TimelineSnapshotter(timeline).take("start", time=2.0, performance={"frame_time": [0.01]})
+
+        data = snapshot.to_dict()
+
+        assert data["label"] == "start"
+        assert data["layers"]["Main"]["tracks"]["objects"] == {"enabled": True, "keyframe_values": {"x": 10.0}}
+        assert [event["name"] for event in data["events"]] == ["end"]
+        assert data["performance"] == {"frame_time": [0.01]}
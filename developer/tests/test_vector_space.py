@@ -321,6 +321,33 @@ class TestTransformPipeline:
         position = transform.transform_point(Vector3D(0, 0, 0))
         assert position.x == pytest.approx(2)
 
+    def test_module_import(self):
+        """Test the module imports cleanly despite the manim star import."""
+        import importlib
+        import typing
+        import src.core.transform_pipeline as transform_pipeline
+
+        module = importlib.reload(transform_pipeline)
+        assert module.Union is typing.Union
+
+    def test_transform_points_batch_array(self):
+        """Test batch transformation of a raw (N, 3) array."""
+        vs = VectorSpace()
+        pipeline = TransformPipeline(vs)
+
+        node = pipeline.create_node("test")
+        node.set_local_transform(Matrix4x4.translation(1, 2, 3))
+
+        points = np.arange(12, dtype=float).reshape(4, 3)
+        result = pipeline.transform_points_batch(
+            points, "test", TransformStage.MODEL, TransformStage.VIEW)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (4, 3)
+        for point, row in zip(points, result):
+            expected = pipeline.transform_point(
+                Vector3D(*point), "test", TransformStage.MODEL, TransformStage.VIEW)
+            assert np.allclose(row, [expected.x, expected.y, expected.z])
+
 
 def test_integration():
     """Test integration of all vector space components."""
@@ -45,6 +45,10 @@ setup(
             'isort>=5.0',
             'flake8>=3.9'
         ],
+        'cache': [
+            'zstandard>=0.18.0',
+            'lz4>=4.0.0'
+        ],
         'latex': [
             'latexmk>=4.0',
             'texlive-core>=2021',
@@ -348,6 +348,7 @@ class KeyframeEditor(VGroup):
             keyframes = self.track.keyframes.get(self.selected_property, [])
             if self.selected_keyframe in keyframes:
                 keyframes.remove(self.selected_keyframe)
+                self.track.invalidate(self.selected_property)
                 self.selected_keyframe = None
                 self._update_display()
     
@@ -355,6 +356,8 @@ class KeyframeEditor(VGroup):
         """Change interpolation type of selected keyframe."""
         if self.selected_keyframe:
             self.selected_keyframe.interpolation = interpolation
+            # Edited in place, so the track's compiled curve must be rebuilt
+            self.track.invalidate(self.selected_property)
             self._update_display()
     
     def _update_display(self):
@@ -2,13 +2,374 @@
 
 import os
 import json
+import logging
 import pickle
 import hashlib
+import numbers
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, Callable, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Union, Callable, Tuple
 from functools import wraps
 import shutil
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python < 3.8
+    import importlib_metadata
+
+# Optional compression codecs for pickled values
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class CacheIndex:
+    """SQLite index of on-disk cache entries.
+    
+    The index runs in WAL mode so several processes (CLI, API, MCP) can share
+    one cache directory: each write touches a single row instead of rewriting
+    a metadata file, SQLite serializes concurrent writers, and eviction walks
+    the timestamp index instead of sorting every entry. The total size is
+    kept in a one-row table by triggers, so checking it does not scan the
+    entries.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (or create) the index.
+        
+        Args:
+            db_path: Database file, or None for a private in-memory index
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connect()
+    
+    def _connect(self) -> None:
+        """Open the database connection and create the schema."""
+        target = str(self.db_path) if self.db_path else ':memory:'
+        self.conn = sqlite3.connect(
+            target, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        if self.db_path:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, path TEXT NOT NULL, '
+            'size INTEGER NOT NULL, timestamp REAL NOT NULL)'
+        )
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS entries_timestamp ON entries (timestamp)'
+        )
+        # Running total of entry sizes, kept by triggers in the same
+        # transaction as each write; seeded once for indexes created without it
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS totals ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)'
+            )
+            self.conn.execute(
+                'INSERT OR IGNORE INTO totals (id, size) '
+                'SELECT 0, COALESCE(SUM(size), 0) FROM entries'
+            )
+            # INSERT OR REPLACE does not fire delete triggers, so the insert
+            # trigger also subtracts the entry it replaces
+            self.conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_insert_size '
+                'BEFORE INSERT ON entries BEGIN '
+                'UPDATE totals SET size = size + NEW.size - COALESCE('
+                '(SELECT size FROM entries WHERE key = NEW.key), 0); END'
+            )
+            self.conn.execute(
+                'CREATE TRIGGER IF NOT EXISTS entries_delete_size '
+                'AFTER DELETE ON entries BEGIN '
+                'UPDATE totals SET size = size - OLD.size; END'
+            )
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+    
+    def reopen(self) -> None:
+        """Reconnect, recreating the database if its file was removed."""
+        with self._lock:
+            self._connect()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry's path, size and timestamp."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT path, size, timestamp FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'path': row[0], 'size': row[1], 'timestamp': row[2]}
+    
+    def put(self, key: str, path: str, size: int, timestamp: float) -> None:
+        """Insert or replace an entry."""
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO entries (key, path, size, timestamp) '
+                'VALUES (?, ?, ?, ?)',
+                (key, path, size, timestamp)
+            )
+    
+    def pop(self, key: str) -> Optional[Dict[str, Any]]:
+        """Remove an entry and return it, or None if it was not indexed."""
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self.conn.execute(
+                    'SELECT path, size, timestamp FROM entries WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    self.conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                self.conn.execute('COMMIT')
+            except sqlite3.Error:
+                self.conn.execute('ROLLBACK')
+                raise
+        if row is None:
+            return None
+        return {'path': row[0], 'size': row[1], 'timestamp': row[2]}
+    
+    def oldest(self, limit: int) -> List[Tuple[str, int]]:
+        """Get the (key, size) of the least recently written entries."""
+        with self._lock:
+            return self.conn.execute(
+                'SELECT key, size FROM entries ORDER BY timestamp LIMIT ?', (limit,)
+            ).fetchall()
+    
+    def count(self) -> int:
+        """Get the number of indexed entries."""
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+    
+    def total_size(self) -> int:
+        """Get the total size in bytes of all indexed entries."""
+        with self._lock:
+            return self.conn.execute('SELECT size FROM totals').fetchone()[0]
+    
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get every entry keyed by cache key."""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT key, path, size, timestamp FROM entries'
+            ).fetchall()
+        return {
+            key: {'path': path, 'size': size, 'timestamp': timestamp}
+            for key, path, size, timestamp in rows
+        }
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self.conn.execute('DELETE FROM entries')
+
+
+def _atomic_write(path: Path, write: Callable[[Any], Any]) -> Any:
+    """Write a file via a temporary file and rename so readers never see partial data.
+    
+    Returns:
+        Whatever write returned
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            result = write(f)
+        os.replace(tmp_path, path)
+        return result
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class CacheSerializer(ABC):
+    """Abstract base class for cache value serializers.
+    
+    Each serializer owns a file suffix, so the format of an entry is known
+    from its path alone.
+    """
+    
+    name = 'base'
+    suffix = '.bin'
+    
+    @abstractmethod
+    def can_serialize(self, value: Any) -> bool:
+        """Check whether this serializer should store the value."""
+        pass
+    
+    @abstractmethod
+    def write(self, value: Any, f) -> Optional[int]:
+        """Write the value to a binary file object.
+        
+        Returns:
+            Size of the encoded value before compression, used to size the
+            memory tier, or None to leave that to a cheap estimate
+        """
+        pass
+    
+    @abstractmethod
+    def read(self, path: Path) -> Any:
+        """Read a value back from a cache file."""
+        pass
+    
+    def read_sized(self, path: Path) -> Tuple[Any, Optional[int]]:
+        """Read a value back along with its size as returned by write."""
+        return self.read(path), None
+
+
+class NumpySerializer(CacheSerializer):
+    """Stores ndarrays as raw .npy files and loads them memory-mapped.
+    
+    Loaded arrays are read-only views of the cache file, so large point and
+    frame arrays are not copied into memory until they are used.
+    """
+    
+    name = 'npy'
+    suffix = '.npy'
+    
+    def can_serialize(self, value: Any) -> bool:
+        # Empty files cannot be memory-mapped
+        return isinstance(value, np.ndarray) and not value.dtype.hasobject and value.size > 0
+    
+    def write(self, value: Any, f) -> Optional[int]:
+        np.save(f, value, allow_pickle=False)
+        return value.nbytes
+    
+    def read(self, path: Path) -> Any:
+        return np.load(path, mmap_mode='r', allow_pickle=False)
+
+
+class MediaSerializer(CacheSerializer):
+    """Stores already-compressed media bytes (PNG, JPEG, MP4, ...) as-is."""
+    
+    name = 'media'
+    suffix = '.media'
+    
+    MAGIC_PREFIXES = (
+        b'\x89PNG', b'\xff\xd8\xff', b'GIF8', b'RIFF', b'PK\x03\x04',
+        b'\x1f\x8b', b'\x28\xb5\x2f\xfd', b'\x1aE\xdf\xa3'
+    )
+    
+    def can_serialize(self, value: Any) -> bool:
+        if not isinstance(value, (bytes, bytearray)):
+            return False
+        # MP4/MOV files carry their 'ftyp' box after a 4-byte size
+        return value.startswith(self.MAGIC_PREFIXES) or value[4:8] == b'ftyp'
+    
+    def write(self, value: Any, f) -> Optional[int]:
+        f.write(value)
+        return len(value)
+    
+    def read(self, path: Path) -> Any:
+        return path.read_bytes()
+
+
+class PickleSerializer(CacheSerializer):
+    """Pickles any value, compressing it with zstd or lz4 when available.
+    
+    Compressed files start with a small header naming the codec; files
+    without it are plain pickles, as written by earlier versions.
+    """
+    
+    name = 'pickle'
+    suffix = '.pkl'
+    
+    HEADER_ZSTD = b'MSCz'
+    HEADER_LZ4 = b'MSCl'
+    
+    # Whether the missing-codec warning has been logged in this process
+    _warned_no_codec = False
+    
+    def __init__(self, codec: Optional[str] = 'auto', min_compress_size: int = 1024):
+        """
+        Initialize the serializer.
+        
+        Args:
+            codec: 'zstd', 'lz4', None for no compression, or 'auto' for the
+                best installed codec
+            min_compress_size: Pickles smaller than this are stored uncompressed
+        """
+        if codec == 'auto':
+            codec = 'zstd' if ZSTD_AVAILABLE else 'lz4' if LZ4_AVAILABLE else None
+            if codec is None and not PickleSerializer._warned_no_codec:
+                PickleSerializer._warned_no_codec = True
+                logger.warning(
+                    "Neither zstandard nor lz4 is installed; cached pickles are stored "
+                    "uncompressed. Install with: pip install manim_studio[cache]"
+                )
+        if codec == 'zstd' and not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires zstandard. Install with: pip install zstandard")
+        if codec == 'lz4' and not LZ4_AVAILABLE:
+            raise ImportError("lz4 compression requires lz4. Install with: pip install lz4")
+        
+        self.codec = codec
+        self.min_compress_size = min_compress_size
+    
+    def can_serialize(self, value: Any) -> bool:
+        return True
+    
+    def write(self, value: Any, f) -> Optional[int]:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.codec is None or len(data) < self.min_compress_size:
+            f.write(data)
+        elif self.codec == 'zstd':
+            f.write(self.HEADER_ZSTD)
+            f.write(zstandard.ZstdCompressor(level=3).compress(data))
+        else:
+            f.write(self.HEADER_LZ4)
+            f.write(lz4.frame.compress(data))
+        return len(data)
+    
+    def read(self, path: Path) -> Any:
+        return self.read_sized(path)[0]
+    
+    def read_sized(self, path: Path) -> Tuple[Any, Optional[int]]:
+        data = path.read_bytes()
+        header = data[:4]
+        if header == self.HEADER_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise IOError(f"Cache entry {path.name} needs zstandard to decompress")
+            data = zstandard.ZstdDecompressor().decompress(data[4:])
+        elif header == self.HEADER_LZ4:
+            if not LZ4_AVAILABLE:
+                raise IOError(f"Cache entry {path.name} needs lz4 to decompress")
+            data = lz4.frame.decompress(data[4:])
+        return pickle.loads(data), len(data)
+
+
+def default_serializers() -> List[CacheSerializer]:
+    """Get the default serializers, in order of preference."""
+    return [NumpySerializer(), MediaSerializer(), PickleSerializer()]
 
 
 class CacheManager:
@@ -19,7 +380,8 @@ class CacheManager:
         cache_dir: Optional[Union[str, Path]] = None,
         max_size_mb: float = 500,
         ttl_seconds: Optional[int] = None,
-        enabled: bool = True
+        enabled: bool = True,
+        serializers: Optional[List[CacheSerializer]] = None
     ):
         """
         Initialize the cache manager.
@@ -29,8 +391,11 @@ class CacheManager:
             max_size_mb: Maximum cache size in MB
             ttl_seconds: Time-to-live for cache entries in seconds
             enabled: Whether caching is enabled
+            serializers: Serializers tried in order for each value; the last
+                should accept anything (defaults to default_serializers())
         """
         self.enabled = enabled
+        self.serializers = serializers if serializers is not None else default_serializers()
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.ttl_seconds = ttl_seconds
         
@@ -43,29 +408,53 @@ class CacheManager:
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             
-        # Cache metadata file
+        # Cache index (legacy JSON metadata is imported once, then removed)
         self.metadata_file = self.cache_dir / 'cache_metadata.json'
-        self.metadata = self._load_metadata()
+        self.index_file = self.cache_dir / 'cache_index.db'
+        self.index = CacheIndex(self.index_file if self.enabled else None)
+        if self.enabled:
+            self._migrate_metadata()
         
-        # In-memory cache for quick access
-        self.memory_cache: Dict[str, Any] = {}
+        # In-memory LRU cache for quick access, least recently used first.
+        # Entry sizes are recorded once at insert time.
+        self.memory_cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self.memory_sizes: Dict[str, int] = {}
         self.memory_cache_size = 0
         self.max_memory_cache_size = 50 * 1024 * 1024  # 50MB
+        
+        # Lookup statistics
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.memory_evictions = 0
+        self.render_hits = 0
+        self.render_misses = 0
     
-    def _load_metadata(self) -> Dict[str, Any]:
-        """Load cache metadata from disk."""
-        if self.metadata_file.exists():
-            try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {'entries': {}, 'total_size': 0}
-        return {'entries': {}, 'total_size': 0}
+    def _migrate_metadata(self) -> None:
+        """Import entries from a legacy cache_metadata.json into the index."""
+        if not self.metadata_file.exists():
+            return
+        
+        try:
+            with open(self.metadata_file, 'r') as f:
+                legacy = json.load(f)
+            for cache_key, entry in legacy.get('entries', {}).items():
+                if Path(entry['path']).exists():
+                    self.index.put(cache_key, entry['path'], entry['size'], entry['timestamp'])
+            self.metadata_file.unlink()
+        except (IOError, OSError, ValueError, KeyError, sqlite3.Error):
+            # Unreadable legacy metadata, its files will be evicted as strays
+            pass
     
-    def _save_metadata(self) -> None:
-        """Save cache metadata to disk."""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Snapshot of the cache index in the legacy metadata layout."""
+        entries = self.index.entries()
+        return {
+            'entries': entries,
+            'total_size': sum(entry['size'] for entry in entries.values())
+        }
     
     def _generate_cache_key(self, *args, **kwargs) -> str:
         """Generate a unique cache key from arguments."""
@@ -76,21 +465,39 @@ class CacheManager:
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.sha256(key_str.encode()).hexdigest()
     
-    def _get_cache_path(self, cache_key: str) -> Path:
+    def register_serializer(self, serializer: CacheSerializer) -> None:
+        """Register a serializer to be tried before the existing ones."""
+        self.serializers.insert(0, serializer)
+    
+    def _serializer_for_value(self, value: Any) -> CacheSerializer:
+        """Get the first serializer that accepts a value."""
+        for serializer in self.serializers:
+            if serializer.can_serialize(value):
+                return serializer
+        raise pickle.PicklingError(f"No cache serializer accepts {type(value).__name__}")
+    
+    def _serializer_for_path(self, cache_path: Path) -> CacheSerializer:
+        """Get the serializer that wrote a cache file."""
+        for serializer in self.serializers:
+            if serializer.suffix == cache_path.suffix:
+                return serializer
+        return PickleSerializer(codec=None)
+    
+    def _get_cache_path(self, cache_key: str, suffix: str = '.pkl') -> Path:
         """Get the file path for a cache key."""
         # Use subdirectories to avoid too many files in one directory
         subdir = cache_key[:2]
-        return self.cache_dir / subdir / f"{cache_key}.pkl"
+        return self.cache_dir / subdir / f"{cache_key}{suffix}"
     
     def _is_expired(self, cache_key: str) -> bool:
         """Check if a cache entry has expired."""
         if not self.ttl_seconds:
             return False
-            
-        if cache_key not in self.metadata['entries']:
+        
+        entry = self.index.get(cache_key)
+        if entry is None:
             return True
             
-        entry = self.metadata['entries'][cache_key]
         age = time.time() - entry['timestamp']
         return age > self.ttl_seconds
     
@@ -102,33 +509,31 @@ class CacheManager:
         # Check memory cache first
         if cache_key in self.memory_cache:
             if not self._is_expired(cache_key):
+                self.memory_cache.move_to_end(cache_key)
+                self.memory_hits += 1
+                self.hits += 1
                 return self.memory_cache[cache_key]
             else:
-                del self.memory_cache[cache_key]
+                self._remove_from_memory(cache_key)
+        self.memory_misses += 1
         
         # Check disk cache
-        cache_path = self._get_cache_path(cache_key)
+        entry = self.index.get(cache_key)
+        cache_path = Path(entry['path']) if entry else self._get_cache_path(cache_key)
         if cache_path.exists() and not self._is_expired(cache_key):
             try:
-                with open(cache_path, 'rb') as f:
-                    value = pickle.load(f)
+                value, size = self._serializer_for_path(cache_path).read_sized(cache_path)
                 
-                # Add to memory cache if it fits
-                try:
-                    value_size = len(pickle.dumps(value))
-                    if value_size < self.max_memory_cache_size:
-                        self.memory_cache[cache_key] = value
-                        self.memory_cache_size += value_size
-                        self._evict_memory_cache()
-                except (pickle.PicklingError, MemoryError) as e:
-                    # Skip memory caching if serialization fails
-                    pass
+                # Promote to memory cache
+                self._add_to_memory(cache_key, value, size)
                 
+                self.hits += 1
                 return value
-            except (pickle.UnpicklingError, IOError, EOFError) as e:
+            except (pickle.UnpicklingError, IOError, EOFError, ValueError) as e:
                 # Invalid cache file, remove it
                 self.delete(cache_key)
-                
+        
+        self.misses += 1
         return None
     
     def set(self, cache_key: str, value: Any) -> None:
@@ -137,159 +542,203 @@ class CacheManager:
             return
             
         try:
-            # Serialize the value
-            serialized = pickle.dumps(value)
-            size = len(serialized)
-            
-            # Check if we need to make room
-            self._evict_disk_cache(size)
-            
-            # Save to disk
-            cache_path = self._get_cache_path(cache_key)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            serializer = self._serializer_for_value(value)
+            cache_path = self._get_cache_path(cache_key, serializer.suffix)
             
+            # Serialize to disk
             try:
-                with open(cache_path, 'wb') as f:
-                    f.write(serialized)
-            except IOError as e:
+                encoded_size = _atomic_write(cache_path, lambda f: serializer.write(value, f))
+            except (IOError, OSError) as e:
                 # Failed to write to disk, skip caching
                 return
-            
-            # Update metadata
-            self.metadata['entries'][cache_key] = {
-                'size': size,
-                'timestamp': time.time(),
-                'path': str(cache_path)
-            }
-            self.metadata['total_size'] = self.metadata.get('total_size', 0) + size
-            
-            try:
-                self._save_metadata()
-            except IOError:
-                # Failed to save metadata, clean up the cache file
-                if cache_path.exists():
-                    cache_path.unlink()
+            if self._index_file(cache_key, cache_path) is None:
                 return
             
             # Add to memory cache if it fits
-            if size < self.max_memory_cache_size:
-                try:
-                    self.memory_cache[cache_key] = value
-                    self.memory_cache_size += size
-                    self._evict_memory_cache()
-                except MemoryError:
-                    # Skip memory caching if we're out of memory
-                    pass
+            self._add_to_memory(cache_key, value, encoded_size)
                     
-        except (pickle.PicklingError, AttributeError, MemoryError) as e:
+        except (pickle.PicklingError, AttributeError, TypeError, MemoryError) as e:
             # Cannot serialize the value, skip caching
             return
     
+    def set_file(self, cache_key: str, source_path: Union[str, Path]) -> Optional[Path]:
+        """Copy a file into the cache as an entry of its own.
+        
+        The copy counts towards max_size_mb and is removed when the entry is
+        evicted or deleted. It is not read back by get().
+        
+        Returns:
+            Path of the cached copy, or None if it could not be stored
+        """
+        if not self.enabled:
+            return None
+        
+        source_path = Path(source_path)
+        cache_path = self._get_cache_path(cache_key, source_path.suffix)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".tmp_{os.getpid()}_{cache_path.name}")
+            shutil.copy2(source_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except (IOError, OSError):
+            return None
+        
+        if self._index_file(cache_key, cache_path) is None:
+            return None
+        return cache_path
+    
+    def _index_file(self, cache_key: str, cache_path: Path) -> Optional[int]:
+        """Index a written cache file, evicting older entries to make room.
+        
+        Returns:
+            The file size, or None if the entry could not be indexed (the
+            file is then removed)
+        """
+        size = cache_path.stat().st_size
+        
+        # Unindex the previous version so eviction can't remove the new file
+        previous = self.index.pop(cache_key)
+        if previous and previous['path'] != str(cache_path):
+            try:
+                Path(previous['path']).unlink()
+            except OSError:
+                pass
+        
+        # Check if we need to make room
+        self._evict_disk_cache(size)
+        
+        # Update the index
+        try:
+            self.index.put(cache_key, str(cache_path), size, time.time())
+        except sqlite3.Error:
+            # Failed to index the entry, clean up the cache file
+            if cache_path.exists():
+                cache_path.unlink()
+            return None
+        return size
+    
     def delete(self, cache_key: str) -> None:
         """Delete a cache entry with proper error handling."""
+        self._remove_from_memory(cache_key)
+        
+        try:
+            entry = self.index.pop(cache_key)
+        except sqlite3.Error:
+            entry = None
+        
+        # Unindexed files (e.g. left by a crashed writer) are removed too
+        cache_path = Path(entry['path']) if entry else self._get_cache_path(cache_key)
+        try:
+            if cache_path.exists():
+                cache_path.unlink()
+        except (IOError, OSError) as e:
+            # The entry is already unindexed
+            pass
+    
+    @staticmethod
+    def _memory_size(value: Any, encoded_size: Optional[int] = None) -> int:
+        """Estimate how many bytes a value occupies in memory.
+        
+        The file size is no guide here: compressed pickles are far smaller
+        than the values they load into. The uncompressed size reported by
+        the serializer is used when known.
+        """
+        if encoded_size is not None:
+            return encoded_size
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        return sys.getsizeof(value)
+    
+    def _add_to_memory(self, cache_key: str, value: Any, encoded_size: Optional[int] = None) -> None:
+        """Insert a value as most recently used, recording its size once."""
+        # Drop any older value first so an oversized overwrite can't leave it behind
+        self._remove_from_memory(cache_key)
+        size = self._memory_size(value, encoded_size)
+        if size >= self.max_memory_cache_size:
+            return
+        
+        self.memory_cache[cache_key] = value
+        self.memory_sizes[cache_key] = size
+        self.memory_cache_size += size
+        self._evict_memory_cache()
+    
+    def _remove_from_memory(self, cache_key: str) -> None:
+        """Remove a value from the memory cache if present."""
         if cache_key in self.memory_cache:
             del self.memory_cache[cache_key]
-            
-        if cache_key in self.metadata['entries']:
-            entry = self.metadata['entries'][cache_key]
-            cache_path = Path(entry['path'])
-            
-            try:
-                if cache_path.exists():
-                    cache_path.unlink()
-            except (IOError, OSError) as e:
-                # Log but continue with metadata cleanup
-                pass
-                
-            self.metadata['total_size'] -= entry['size']
-            del self.metadata['entries'][cache_key]
-            
-            try:
-                self._save_metadata()
-            except IOError:
-                # Failed to save metadata, but entry is already removed
-                pass
+            self.memory_cache_size -= self.memory_sizes.pop(cache_key, 0)
     
     def _evict_memory_cache(self) -> None:
-        """Evict entries from memory cache if it's too large."""
-        if self.memory_cache_size <= self.max_memory_cache_size:
-            return
-            
-        # Sort by access time (simple LRU)
-        # In a real implementation, we'd track access times
-        keys = list(self.memory_cache.keys())
-        
-        # Track size reduction as we remove items
-        size_removed = 0
-        for key in keys[:len(keys)//2]:  # Remove half
-            value = self.memory_cache[key]
-            try:
-                # Calculate size before removing
-                size_removed += len(pickle.dumps(value))
-            except (pickle.PicklingError, TypeError, MemoryError):
-                # If we can't serialize, estimate size as 0 for safety
-                # This prevents the cache size from becoming negative
-                pass
-            del self.memory_cache[key]
-            
-        # Update size incrementally instead of recalculating
-        self.memory_cache_size = max(0, self.memory_cache_size - size_removed)
+        """Evict least recently used entries until the memory cache fits."""
+        while self.memory_cache_size > self.max_memory_cache_size and self.memory_cache:
+            cache_key, _ = self.memory_cache.popitem(last=False)
+            self.memory_cache_size -= self.memory_sizes.pop(cache_key, 0)
+            self.memory_evictions += 1
     
     def _evict_disk_cache(self, needed_size: int) -> None:
         """Evict entries from disk cache to make room."""
-        current_size = self.metadata.get('total_size', 0)
-        
-        if current_size + needed_size <= self.max_size_bytes:
-            return
-            
-        # Sort entries by timestamp (oldest first)
-        entries = sorted(
-            self.metadata['entries'].items(),
-            key=lambda x: x[1]['timestamp']
-        )
+        current_size = self.index.total_size()
         
         # Remove oldest entries until we have enough space
-        for cache_key, entry in entries:
-            if current_size + needed_size <= self.max_size_bytes:
+        while current_size + needed_size > self.max_size_bytes:
+            oldest = self.index.oldest(64)
+            if not oldest:
                 break
-                
-            self.delete(cache_key)
-            current_size -= entry['size']
+            for cache_key, size in oldest:
+                if current_size + needed_size <= self.max_size_bytes:
+                    break
+                self.delete(cache_key)
+                current_size -= size
     
     def clear(self) -> None:
         """Clear all cache entries with proper error handling."""
         try:
             if self.cache_dir.exists():
-                shutil.rmtree(self.cache_dir)
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self.index.close()
+                try:
+                    shutil.rmtree(self.cache_dir)
+                finally:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    self.index.reopen()
         except (IOError, OSError) as e:
             # If we can't remove the directory, try to clean individual files
             try:
-                for cache_key in list(self.metadata.get('entries', {}).keys()):
+                for cache_key in self.index.entries():
                     self.delete(cache_key)
             except Exception:
                 pass
             
         self.memory_cache.clear()
+        self.memory_sizes.clear()
         self.memory_cache_size = 0
-        self.metadata = {'entries': {}, 'total_size': 0}
         
         try:
-            self._save_metadata()
-        except IOError:
-            # Can't save metadata, but cache is cleared
+            self.index.clear()
+        except sqlite3.Error:
+            # Can't reach the index, but the files are gone
             pass
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        lookups = self.hits + self.misses
         return {
             'enabled': self.enabled,
-            'disk_entries': len(self.metadata['entries']),
-            'disk_size_mb': self.metadata.get('total_size', 0) / (1024 * 1024),
+            'disk_entries': self.index.count(),
+            'disk_size_mb': self.index.total_size() / (1024 * 1024),
             'memory_entries': len(self.memory_cache),
             'memory_size_mb': self.memory_cache_size / (1024 * 1024),
             'max_size_mb': self.max_size_bytes / (1024 * 1024),
-            'cache_dir': str(self.cache_dir)
+            'cache_dir': str(self.cache_dir),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'memory_hits': self.memory_hits,
+            'memory_misses': self.memory_misses,
+            'memory_evictions': self.memory_evictions,
+            'render_hits': self.render_hits,
+            'render_misses': self.render_misses
         }
     
     def cached(self, prefix: str = "") -> Callable:
@@ -319,11 +768,101 @@ class CacheManager:
         return decorator
 
 
+def _canonicalize(value: Any) -> Any:
+    """Convert a config value into a JSON-stable form for hashing."""
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, numbers.Real):
+        # 1 and 1.0 render identically, so they must hash identically
+        return float(value)
+    if hasattr(value, 'tolist'):
+        return _canonicalize(value.tolist())
+    return str(value)
+
+
+# Asset digests keyed by (path, size, mtime) so unchanged files are hashed once
+_file_digest_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def _file_digest(path: Union[str, Path]) -> Optional[str]:
+    """Get the SHA-256 digest of a file, or None if it does not exist."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    digest = _file_digest_cache.get(memo_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        _file_digest_cache[memo_key] = digest
+    return digest
+
+
+def _package_versions() -> Dict[str, Optional[str]]:
+    """Get the installed versions of the packages that affect render output."""
+    versions = {}
+    for dist in ('manim_studio', 'manim'):
+        try:
+            versions[dist] = importlib_metadata.version(dist)
+        except importlib_metadata.PackageNotFoundError:
+            versions[dist] = None
+    return versions
+
+
 class SceneCache:
     """Specialized cache for Manim scenes and animations."""
     
     def __init__(self, cache_manager: CacheManager):
         self.cache_manager = cache_manager
+    
+    @staticmethod
+    def compute_render_key(
+        scene_config: Any,
+        quality: str,
+        fps: Optional[int] = None,
+        asset_paths: Optional[Iterable[Union[str, Path]]] = None
+    ) -> str:
+        """
+        Compute a content-addressed key for a scene render.
+        
+        The key covers the fully resolved scene configuration, the digests of
+        every referenced asset file, the render quality and frame rate, and
+        the installed package versions.
+        
+        Args:
+            scene_config: SceneConfig (or its dict form) to render
+            quality: Manim quality flag (l, m, h, p, k)
+            fps: Effective frame rate (defaults to the config's fps)
+            asset_paths: Paths of asset files the scene depends on
+        """
+        config_dict = scene_config.to_dict() if hasattr(scene_config, 'to_dict') else scene_config
+        if fps is None:
+            fps = config_dict.get('fps')
+        
+        assets = {
+            str(Path(path)): _file_digest(path)
+            for path in (asset_paths or [])
+        }
+        
+        key_data = {
+            'scene': _canonicalize(config_dict),
+            'assets': assets,
+            'quality': quality,
+            'fps': _canonicalize(fps),
+            'versions': _package_versions()
+        }
+        key_str = json.dumps(key_data, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(key_str.encode()).hexdigest()
         
     def cache_animation(
         self,
@@ -360,13 +899,17 @@ class SceneCache:
         output_path: Path,
         metadata: Optional[Dict] = None
     ) -> None:
-        """Cache a rendered video file."""
+        """Cache a rendered video file.
+        
+        The video is indexed as its own entry, so it counts towards the
+        cache size and is removed on eviction.
+        """
         cache_key = f"render_{config_hash}"
         
         # Copy the file to cache
-        cache_path = self.cache_manager._get_cache_path(cache_key).with_suffix('.mp4')
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(output_path, cache_path)
+        cache_path = self.cache_manager.set_file(f"{cache_key}_video", output_path)
+        if cache_path is None:
+            return
         
         # Store metadata
         cache_data = {
@@ -385,8 +928,12 @@ class SceneCache:
         if cache_data:
             cache_path = Path(cache_data['cache_path'])
             if cache_path.exists():
+                self.cache_manager.render_hits += 1
                 return cache_path
-                
+            # The video was evicted before its metadata
+            self.cache_manager.delete(cache_key)
+        
+        self.cache_manager.render_misses += 1
         return None
 
 
@@ -0,0 +1,155 @@
+"""Segment-level incremental rendering for configured scenes.
+
+A configured scene is played as a sequence of segments: the animation group
+that starts at a given time, plus the waits between groups. Each segment is
+fingerprinted from the scene configuration going into it and the animation
+configs it plays, chained onto the fingerprint of the previous segment. The
+renderer names partial movie files by these fingerprints, so after an edit
+only the segments whose fingerprint changed are rendered again and the final
+video is stitched from the cached partial movie files.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from manim import config
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .cache import _canonicalize, _file_digest, _package_versions
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentFingerprinter:
+    """Computes chained fingerprints for the segments of a configured scene."""
+
+    def __init__(
+        self,
+        scene_config: Any,
+        render_settings: Optional[Dict[str, Any]] = None,
+        asset_paths: Optional[Iterable[Union[str, Path]]] = None
+    ):
+        """
+        Initialize the fingerprinter with the initial scene state.
+
+        Args:
+            scene_config: SceneConfig being rendered
+            render_settings: Settings that affect every frame (resolution, fps, ...)
+            asset_paths: Paths of asset files the scene depends on
+        """
+        config_dict = scene_config.to_dict()
+
+        # Everything except the animations determines the state before the first segment
+        initial_state = {
+            key: value for key, value in config_dict.items()
+            if key not in ('animations', 'duration', 'description', 'frame_extraction')
+        }
+        self.object_configs = config_dict.get('objects', {})
+        self.current = self._digest('', {
+            'state': initial_state,
+            'render': render_settings or {},
+            'assets': {
+                str(Path(path)): _file_digest(path)
+                for path in (asset_paths or [])
+            },
+            'versions': _package_versions()
+        })
+
+    @staticmethod
+    def _digest(previous: str, payload: Dict[str, Any]) -> str:
+        """Hash a payload onto the previous fingerprint."""
+        payload_str = json.dumps(_canonicalize(payload), sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256((previous + payload_str).encode()).hexdigest()
+
+    def wait(self, duration: float) -> str:
+        """Advance past a wait and return its fingerprint."""
+        self.current = self._digest(self.current, {'wait': duration})
+        return self.current
+
+    def play(self, animation_configs: Iterable[Any]) -> str:
+        """Advance past an animation group and return its fingerprint."""
+        animations = [anim.to_dict() for anim in animation_configs]
+        targets = sorted({anim['target'] for anim in animations})
+
+        self.current = self._digest(self.current, {
+            'animations': animations,
+            'targets': {
+                name: self.object_configs.get(name) for name in targets
+            }
+        })
+        return self.current
+
+
+class SegmentCachingRenderer(CairoRenderer):
+    """Cairo renderer that caches partial movie files by segment fingerprint.
+
+    When the scene sets ``segment_fingerprint`` before a ``play``/``wait``
+    call, that fingerprint replaces Manim's mobject-state hash for the call.
+    Calls without a fingerprint fall back to the default behaviour.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.segment_hits = 0
+        self.segment_misses = 0
+
+    def play(self, scene, *args, **kwargs):
+        """Play animations, reusing the partial movie file of an unchanged segment."""
+        fingerprint = getattr(scene, 'segment_fingerprint', None)
+        if fingerprint is None:
+            return super().play(scene, *args, **kwargs)
+
+        # A fingerprint covers exactly one play call
+        scene.segment_fingerprint = None
+
+        # Follows CairoRenderer.play with the segment fingerprint as the hash
+        self.skip_animations = self._original_skipping_status
+        self.update_skipping_status()
+
+        scene.compile_animation_data(*args, **kwargs)
+
+        if self.skip_animations:
+            hash_current_animation = None
+            self.time += scene.duration
+        else:
+            hash_current_animation = f"segment_{fingerprint}"
+            if self.file_writer.is_already_cached(hash_current_animation):
+                logger.info(f"Segment {self.num_plays}: using cached partial movie")
+                self.segment_hits += 1
+                self.skip_animations = True
+                self.time += scene.duration
+            else:
+                self.segment_misses += 1
+
+        self.file_writer.add_partial_movie_file(hash_current_animation)
+        self.animations_hashes.append(hash_current_animation)
+
+        self.file_writer.begin_animation(not self.skip_animations)
+        scene.begin_animations()
+
+        # Save a static image, to avoid rendering non moving objects
+        self.save_static_frame_data(scene, scene.static_mobjects)
+
+        if scene.is_current_animation_frozen_frame():
+            self.update_frame(scene, mobjects=scene.moving_mobjects)
+            self.freeze_current_frame(scene.duration)
+        else:
+            scene.play_internal()
+        self.file_writer.end_animation(not self.skip_animations)
+
+        self.num_plays += 1
+
+
+def get_render_settings() -> Dict[str, Any]:
+    """Get the global Manim settings that affect every rendered frame."""
+    return {
+        'pixel_width': config.pixel_width,
+        'pixel_height': config.pixel_height,
+        'frame_rate': config.frame_rate,
+        'frame_width': config.frame_width,
+        'frame_height': config.frame_height,
+        'renderer': str(config.renderer)
+    }
\ No newline at end of file
@@ -14,7 +14,7 @@ import shutil
 from datetime import datetime
 
 from src.utils.frame_extractor import FrameExtractor, FrameExtractionConfig
-from src.utils.frame_analyzer import FrameAnalyzer
+from src.utils.frame_analyzer import FrameAnalyzer, FrameAnalysisPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +32,10 @@ class RenderHookConfig:
     report_format: str = "pdf"
     cleanup_temp_files: bool = True
     max_frames: Optional[int] = None
+    pipeline_analysis: bool = False  # Analyze decoded frames in memory instead of via JPEGs
+    analysis_workers: int = 4
+    analysis_queue_size: int = 16
+    save_thumbnails: bool = False  # Write thumbnails in pipeline mode
 
 
 class RenderHooks:
@@ -87,6 +91,28 @@ class RenderHooks:
                 video_path_obj = Path(video_path)
                 output_dir = video_path_obj.parent / f"{video_path_obj.stem}_frames"
                 
+            if self._use_pipeline():
+                analysis_results = self._run_analysis_pipeline(scene_name, video_path, output_dir)
+                results['extracted_frames'] = len(self.extracted_frames)
+                results['analysis_count'] = len(analysis_results)
+                if self.config.save_thumbnails:
+                    results['frames_dir'] = str(output_dir)
+                    
+                if self.config.generate_report and analysis_results:
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    report_path = output_dir / f"{scene_name}_analysis.{self.config.report_format}"
+                    logger.info(f"Generating analysis report: {report_path}")
+                    
+                    self.analyzer.generate_analysis_report(
+                        analysis_results,
+                        report_path,
+                        include_thumbnails=self.config.save_thumbnails
+                    )
+                    results['report_path'] = str(report_path)
+                    
+                self._print_summary(results)
+                return results
+                
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Extract frames
@@ -157,6 +183,54 @@ class RenderHooks:
             
         return results
         
+    def _use_pipeline(self) -> bool:
+        """Check whether frames should be analyzed in memory.
+        
+        Keyframe extraction needs every decoded frame and still goes
+        through the extractor's on-disk path.
+        """
+        return (
+            self.config.pipeline_analysis
+            and self.analyzer is not None
+            and not self.config.keyframe_extraction
+        )
+        
+    def _run_analysis_pipeline(
+        self,
+        scene_name: str,
+        video_path: str,
+        output_dir: Path
+    ) -> List[Any]:
+        """Stream decoded frames from the extractor into the analysis workers.
+        
+        Args:
+            scene_name: Name of the rendered scene
+            video_path: Path to the rendered video
+            output_dir: Directory for thumbnails, if they are saved
+            
+        Returns:
+            Frame analysis results in stream order
+        """
+        logger.info(f"Analyzing frames from {video_path} in memory")
+        
+        pipeline = FrameAnalysisPipeline(
+            self.analyzer,
+            num_workers=self.config.analysis_workers,
+            queue_size=self.config.analysis_queue_size,
+            thumbnail_dir=output_dir if self.config.save_thumbnails else None,
+            prefix=f"{scene_name}_frame"
+        )
+        analysis_results = pipeline.run(self.extractor.iter_frames(video_path), source=video_path)
+        
+        self.extracted_frames = [
+            {
+                'filepath': result.frame_path,
+                'timestamp': result.timestamp
+            }
+            for result in analysis_results
+        ]
+        return analysis_results
+        
     def _print_summary(self, results: Dict[str, Any]) -> None:
         """Print a summary of the extraction/analysis results."""
         print("\n" + "="*60)
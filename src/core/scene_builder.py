@@ -2,7 +2,8 @@
 
 import logging
 import numpy as np
-from typing import Any, Dict, List, Optional, Type, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from manim import *
 from .config import Config, SceneConfig, AnimationConfig, EffectConfig, Camera2DConfig, Camera3DConfig
 from .timeline import Timeline
@@ -10,6 +11,8 @@ from .asset_manager import AssetManager
 from .layer_manager import LayerManager
 from .render_hooks import RenderHooks, RenderHookConfig, FrameExtractionMixin
 from .camera_controller import Camera2DController, Camera3DController
+from .cache import SceneCache
+from .incremental_render import SegmentCachingRenderer, SegmentFingerprinter, get_render_settings
 from src.components.effects import EffectRegistry
 # Avoid circular import - StudioScene will be imported when needed
 
@@ -20,16 +23,29 @@ class SceneBuilder:
     def __init__(
         self,
         config: Optional[Config] = None,
-        asset_manager: Optional[AssetManager] = None
+        asset_manager: Optional[AssetManager] = None,
+        incremental: bool = True
     ):
         self.config = config
         self.asset_manager = asset_manager or AssetManager()
+        self.incremental = incremental
         self.effect_registry = EffectRegistry()
         self.object_cache: Dict[str, Mobject] = {}
         self.layer_manager = LayerManager()
     
-    def build_scene(self, scene_config: SceneConfig) -> Type[Scene]:
-        """Build a Scene class from configuration."""
+    def build_scene(
+        self,
+        scene_config: SceneConfig,
+        render_window: Optional[Tuple[float, float]] = None
+    ) -> Type[Scene]:
+        """Build a Scene class from configuration.
+        
+        Args:
+            scene_config: Configuration of the scene to build
+            render_window: Optional (start, end) time window; segments before
+                the window are fast-forwarded without rendering and the scene
+                stops at the window end (see plan_time_windows)
+        """
         
         # Capture builder instance for use in scene
         builder = self
@@ -66,7 +82,19 @@ class SceneBuilder:
                 if is_3d and scene_config.camera:
                     kwargs['camera_config'] = scene_config.camera
                 
+                # Render unchanged segments from cached partial movie files
+                renderer_type = getattr(config.renderer, 'value', config.renderer)
+                if (builder.incremental and 'renderer' not in kwargs
+                        and not config.disable_caching and renderer_type == 'cairo'):
+                    kwargs['renderer'] = SegmentCachingRenderer(
+                        camera_class=ThreeDCamera if is_3d else Camera,
+                        skip_animations=kwargs.get('skip_animations', False)
+                    )
+                
                 super().__init__(**kwargs)
+                self.segment_fingerprint = None
+                self.render_window = render_window
+                self._skipping_window = False
                 self.scene_config = scene_config
                 self.timeline = Timeline()
                 self.objects = {}
@@ -90,6 +118,22 @@ class SceneBuilder:
                         generate_report=extraction_config.get('generate_report', True)
                     )
             
+            def _enter_segment(self, start_time: float) -> bool:
+                """Skip segments before the render window; return False past its end."""
+                if self.render_window is None:
+                    return True
+                
+                window_start, window_end = self.render_window
+                if start_time >= window_end:
+                    return False
+                
+                skipping = start_time < window_start
+                if skipping != self._skipping_window:
+                    # Skipped sections still update scene state, just without frames
+                    self.next_section(skip_animations=skipping)
+                    self._skipping_window = skipping
+                return True
+            
             def construct(self):
                 logging.getLogger(__name__).debug(f"construct() called for scene: {self.scene_config.name}")
                 logging.getLogger(__name__).debug(f"Number of objects: {len(self.scene_config.objects) if hasattr(self.scene_config, 'objects') else 'No objects'}")
@@ -136,17 +180,32 @@ class SceneBuilder:
                 # Group animations by start time
                 from collections import defaultdict
                 animations_by_time = defaultdict(list)
+                configs_by_time = defaultdict(list)
                 
                 for anim_config in self.scene_config.animations:
                     animation = self.builder.create_animation(anim_config, self.objects)
                     if animation:
                         animations_by_time[anim_config.start_time].append((animation, anim_config.duration))
+                        configs_by_time[anim_config.start_time].append(anim_config)
+                
+                # Fingerprint each segment so unchanged ones reuse cached partial movies
+                fingerprinter = None
+                if isinstance(self.renderer, SegmentCachingRenderer):
+                    fingerprinter = SegmentFingerprinter(
+                        self.scene_config,
+                        get_render_settings(),
+                        self.builder.get_asset_paths(self.scene_config)
+                    )
                 
                 # Play animations in chronological order
                 current_time = 0.0
                 for start_time in sorted(animations_by_time.keys()):
                     # Wait until the next animation group
                     if start_time > current_time:
+                        if not self._enter_segment(current_time):
+                            return
+                        if fingerprinter:
+                            self.segment_fingerprint = fingerprinter.wait(start_time - current_time)
                         self.wait(start_time - current_time)
                         current_time = start_time
                     
@@ -156,6 +215,10 @@ class SceneBuilder:
                     
                     # Only play if we have valid animations
                     if anims:
+                        if not self._enter_segment(start_time):
+                            return
+                        if fingerprinter:
+                            self.segment_fingerprint = fingerprinter.play(configs_by_time[start_time])
                         if len(anims) == 1:
                             self.play(anims[0])
                         else:
@@ -167,6 +230,10 @@ class SceneBuilder:
                 
                 # Wait for remaining scene duration
                 if current_time < self.scene_config.duration:
+                    if not self._enter_segment(current_time):
+                        return
+                    if fingerprinter:
+                        self.segment_fingerprint = fingerprinter.wait(self.scene_config.duration - current_time)
                     self.wait(self.scene_config.duration - current_time)
         
         # Set scene metadata
@@ -175,6 +242,80 @@ class SceneBuilder:
         
         return ConfiguredScene
     
+    def plan_time_windows(
+        self,
+        scene_config: SceneConfig,
+        num_windows: int
+    ) -> List[Tuple[float, float]]:
+        """Split a scene's timeline into time windows at animation-group boundaries.
+        
+        Windows are balanced by scene time and can be rendered independently
+        with build_scene(render_window=...), then concatenated in order.
+        """
+        boundaries = sorted({
+            anim.start_time for anim in scene_config.animations
+            if anim.start_time > 0
+        })
+        
+        # Pick the group boundary closest to each evenly spaced cut point
+        cuts = []
+        for i in range(1, num_windows):
+            target = scene_config.duration * i / num_windows
+            candidates = [b for b in boundaries if not cuts or b > cuts[-1]]
+            if not candidates:
+                break
+            cuts.append(min(candidates, key=lambda b: abs(b - target)))
+        
+        edges = [0.0] + cuts + [float('inf')]
+        return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+    
+    def get_asset_paths(self, scene_config: SceneConfig) -> List[Path]:
+        """Resolve the files of every asset referenced by a scene."""
+        names = set(scene_config.assets.keys())
+        
+        def collect(obj_config: Dict[str, Any]) -> None:
+            if obj_config.get('asset'):
+                names.add(obj_config['asset'])
+            for child_config in obj_config.get('children', []):
+                collect(child_config)
+        
+        object_configs = (
+            scene_config.objects.values()
+            if isinstance(scene_config.objects, dict)
+            else scene_config.objects
+        )
+        for obj_config in object_configs:
+            collect(obj_config)
+        
+        paths = []
+        for name in sorted(names):
+            if name in scene_config.assets:
+                path = Path(scene_config.assets[name])
+                if not path.is_absolute():
+                    path = self.asset_manager.base_path / path
+                paths.append(path)
+                continue
+            try:
+                paths.append(self.asset_manager.get_asset_path(name))
+            except (ValueError, FileNotFoundError):
+                # Missing assets render as placeholders, which the config hash covers
+                pass
+        return paths
+    
+    def get_render_cache_key(
+        self,
+        scene_config: SceneConfig,
+        quality: str,
+        fps: Optional[int] = None
+    ) -> str:
+        """Get the render cache key for a scene at a given quality and frame rate."""
+        return SceneCache.compute_render_key(
+            scene_config,
+            quality=quality,
+            fps=fps if fps is not None else scene_config.fps,
+            asset_paths=self.get_asset_paths(scene_config)
+        )
+    
     def configure_camera(self, camera, camera_config, scene_config=None):
         """Configure camera from CameraConfig (2D or 3D)."""
         if isinstance(camera_config, Camera3DConfig):
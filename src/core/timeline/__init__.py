@@ -5,6 +5,9 @@ from .composer_timeline import (
     ComposerTimeline, TimelineLayer, TimelineTrack,
     Keyframe, InterpolationType, TrackType
 )
+from .event_index import EventIndex, EventCursor
+from .playback import TimelinePlayer, PropertyBinding
+from .timeline_format import LazyTimelineTrack, save_timeline, load_timeline
 from .timeline_presets import TimelinePresets, PresetCategory, TimelinePreset
 from .layer_manager import LayerManager, create_layered_scene
 
@@ -12,6 +15,9 @@ __all__ = [
     'Timeline', 'TimelineEvent',
     'ComposerTimeline', 'TimelineLayer', 'TimelineTrack',
     'Keyframe', 'InterpolationType', 'TrackType',
+    'EventIndex', 'EventCursor',
+    'TimelinePlayer', 'PropertyBinding',
+    'LazyTimelineTrack', 'save_timeline', 'load_timeline',
     'TimelinePresets', 'PresetCategory', 'TimelinePreset',
     'LayerManager', 'create_layered_scene'
 ]
\ No newline at end of file
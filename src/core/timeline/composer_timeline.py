@@ -3,16 +3,21 @@
 from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import heapq
+from bisect import bisect_right
 import json
+import re
 import numpy as np
 from pathlib import Path
 from ..config import Camera3DConfig, Camera2DConfig
 
 # Import our enhanced easing system
-from .easing import EasingFunction, EasingLibrary, EasingPresets, interpolate_with_easing
+from .easing import (
+    EasingFunction, EasingLibrary, EasingPresets, interpolate_with_easing
+)
 # Import the unified rate function bridge
-from .rate_function_bridge import UnifiedRateFunction, get_rate_function
+from .rate_function_bridge import UnifiedRateFunction, get_array_rate_function, get_rate_function
+# Sorted event index for range queries and playback
+from .event_index import EventIndex
 
 # Keep InterpolationType for backward compatibility but map to EasingFunction
 class InterpolationType(Enum):
@@ -46,6 +51,27 @@ class TrackType(Enum):
     SUBTITLE = "subtitle"
     MARKER = "marker"
 
+# Map InterpolationType to EasingFunction
+_INTERPOLATION_EASINGS = {
+    InterpolationType.LINEAR: EasingFunction.LINEAR,
+    InterpolationType.EASE_IN: EasingFunction.EASE_IN_CUBIC,
+    InterpolationType.EASE_OUT: EasingFunction.EASE_OUT_CUBIC,
+    InterpolationType.EASE_IN_OUT: EasingFunction.EASE_IN_OUT_CUBIC,
+    InterpolationType.CUBIC_BEZIER: EasingFunction.CUBIC_BEZIER,
+    InterpolationType.SPRING: EasingFunction.SPRING,
+    InterpolationType.SMOOTH_STEP: EasingFunction.SMOOTH_STEP,
+    InterpolationType.BOUNCE: EasingFunction.EASE_OUT_BOUNCE,
+    InterpolationType.ELASTIC: EasingFunction.EASE_OUT_ELASTIC,
+    InterpolationType.BACK: EasingFunction.EASE_OUT_BACK,
+    # Manim rate functions
+    InterpolationType.THERE_AND_BACK: EasingFunction.THERE_AND_BACK,
+    InterpolationType.RUSH_INTO: EasingFunction.RUSH_INTO,
+    InterpolationType.RUSH_FROM: EasingFunction.RUSH_FROM,
+    InterpolationType.MANIM_SMOOTH: EasingFunction.MANIM_SMOOTH,
+    InterpolationType.WIGGLE: EasingFunction.WIGGLE,
+    InterpolationType.LINGERING: EasingFunction.LINGERING,
+}
+
 @dataclass
 class Keyframe:
     """Represents a keyframe in the timeline with enhanced easing support."""
@@ -56,10 +82,17 @@ class Keyframe:
     spring_params: Optional[Dict[str, float]] = None
     easing_params: Optional[Dict[str, Any]] = None  # Additional easing parameters
     rate_function: Optional[Union[str, Callable[[float], float]]] = None  # Direct rate function override
+    lut_resolution: Optional[int] = None  # Sample the easing into a shared lookup table
+    lut_interpolation: str = "linear"
     
     def interpolate_to(self, next_keyframe: 'Keyframe', t: float) -> Any:
         """Interpolate between this keyframe and the next using enhanced easing."""
-        if self.interpolation == InterpolationType.STEP:
+        return self.interpolate_with(next_keyframe, t, self.resolve_easing())
+    
+    def interpolate_with(self, next_keyframe: 'Keyframe', t: float,
+                         easing_func: Optional[Callable[[float], float]]) -> Any:
+        """Interpolate to the next keyframe with an already resolved easing function."""
+        if easing_func is None:
             return self.value
         
         # Normalize t between keyframes
@@ -69,55 +102,70 @@ class Keyframe:
         
         normalized_t = (t - self.time) / duration
         normalized_t = max(0, min(1, normalized_t))
+        eased_t = easing_func(normalized_t)
+        
+        # Interpolate the actual values
+        return self._interpolate_values(self.value, next_keyframe.value, eased_t)
+    
+    def resolve_easing(self) -> Optional[Callable[[float], float]]:
+        """Get the easing function for the segment starting at this keyframe.
+        
+        Returns:
+            The easing callable, or None for step interpolation
+        """
+        if self.interpolation == InterpolationType.STEP:
+            return None
         
         # Use rate_function if provided, otherwise use interpolation type
         if self.rate_function:
             # Use the unified rate function interface
-            easing_func = get_rate_function(self.rate_function, self.easing_params)
-            eased_t = easing_func(normalized_t)
-        else:
-            # Map InterpolationType to EasingFunction
-            easing_map = {
-                InterpolationType.LINEAR: EasingFunction.LINEAR,
-                InterpolationType.EASE_IN: EasingFunction.EASE_IN_CUBIC,
-                InterpolationType.EASE_OUT: EasingFunction.EASE_OUT_CUBIC,
-                InterpolationType.EASE_IN_OUT: EasingFunction.EASE_IN_OUT_CUBIC,
-                InterpolationType.CUBIC_BEZIER: EasingFunction.CUBIC_BEZIER,
-                InterpolationType.SPRING: EasingFunction.SPRING,
-                InterpolationType.SMOOTH_STEP: EasingFunction.SMOOTH_STEP,
-                InterpolationType.BOUNCE: EasingFunction.EASE_OUT_BOUNCE,
-                InterpolationType.ELASTIC: EasingFunction.EASE_OUT_ELASTIC,
-                InterpolationType.BACK: EasingFunction.EASE_OUT_BACK,
-                # Manim rate functions
-                InterpolationType.THERE_AND_BACK: EasingFunction.THERE_AND_BACK,
-                InterpolationType.RUSH_INTO: EasingFunction.RUSH_INTO,
-                InterpolationType.RUSH_FROM: EasingFunction.RUSH_FROM,
-                InterpolationType.MANIM_SMOOTH: EasingFunction.MANIM_SMOOTH,
-                InterpolationType.WIGGLE: EasingFunction.WIGGLE,
-                InterpolationType.LINGERING: EasingFunction.LINGERING,
-            }
-            
-            # Get the easing function
-            easing_type = easing_map.get(self.interpolation, EasingFunction.LINEAR)
-            
-            # Prepare parameters
-            params = self.easing_params or {}
-            if self.interpolation == InterpolationType.CUBIC_BEZIER and self.bezier_points:
-                params['control_points'] = self.bezier_points
-            elif self.interpolation == InterpolationType.SPRING and self.spring_params:
-                params.update(self.spring_params)
-            
-            # Get easing function
-            easing_func = EasingLibrary.get_easing_function(easing_type, params)
-            eased_t = easing_func(normalized_t)
+            return get_rate_function(self.rate_function, self.easing_params)
         
-        # Interpolate the actual values
-        return self._interpolate_values(self.value, next_keyframe.value, eased_t)
+        return EasingLibrary.get_easing_function(*self._easing_spec(), self.lut_resolution, self.lut_interpolation)
+    
+    def resolve_array_easing(self) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """Get the array easing function for the segment starting at this keyframe.
+        
+        Returns:
+            A callable mapping an array of t values to eased values, or None
+            for step interpolation
+        """
+        if self.interpolation == InterpolationType.STEP:
+            return None
+        
+        if self.rate_function:
+            return get_array_rate_function(self.rate_function, self.easing_params)
+        
+        if self.lut_resolution is not None:
+            return EasingLibrary.get_lut_easing_function(*self._easing_spec(), self.lut_resolution,
+                                                         self.lut_interpolation)
+        
+        return EasingLibrary.get_array_easing_function(*self._easing_spec())
+    
+    def _easing_spec(self) -> Tuple[EasingFunction, Dict[str, Any]]:
+        """Get the easing type and params for this keyframe's interpolation."""
+        easing_type = _INTERPOLATION_EASINGS.get(self.interpolation, EasingFunction.LINEAR)
+        
+        # Prepare parameters
+        params = dict(self.easing_params or {})
+        if self.interpolation == InterpolationType.CUBIC_BEZIER and self.bezier_points:
+            params['control_points'] = self.bezier_points
+        elif self.interpolation == InterpolationType.SPRING and self.spring_params:
+            params.update(self.spring_params)
+        
+        return easing_type, params
     
     def _interpolate_values(self, start: Any, end: Any, t: float) -> Any:
         """Interpolate between values of various types."""
-        if isinstance(start, (int, float)):
+        if isinstance(start, (bool, np.bool_)):
+            return start
+        if isinstance(start, (int, float, np.ndarray)):
             return start + (end - start) * t
+        elif _is_color(start) and _is_color(end):
+            if isinstance(start, str):
+                start_rgb = _color_to_rgb(start)
+                return _rgb_to_hex(start_rgb + (_color_to_rgb(end) - start_rgb) * t)
+            return start.interpolate(end, t)
         elif isinstance(start, (list, tuple)):
             return [self._interpolate_values(s, e, t) for s, e in zip(start, end)]
         elif isinstance(start, dict):
@@ -126,9 +174,241 @@ class Keyframe:
             return start.lerp(end, t)
         return start
 
+_HEX_COLOR = re.compile(r'^#[0-9a-fA-F]{6}$')
+
+def _is_number(value: Any) -> bool:
+    # Bools are flags, held like step interpolation rather than blended
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+def _is_color(value: Any) -> bool:
+    """Check for a hex color string or a color object such as ManimColor."""
+    if isinstance(value, str):
+        return _HEX_COLOR.match(value) is not None
+    return hasattr(value, 'to_rgb') and hasattr(value, 'interpolate')
+
+def _color_to_rgb(value: Any) -> np.ndarray:
+    """Convert a color to RGB floats in [0, 1]."""
+    if isinstance(value, str):
+        return np.array([int(value[i:i + 2], 16) for i in (1, 3, 5)], dtype=float) / 255
+    return np.asarray(value.to_rgb(), dtype=float)[:3]
+
+def _rgb_to_hex(rgb: np.ndarray) -> str:
+    return '#' + ''.join(f'{int(round(c * 255)):02X}' for c in np.clip(rgb, 0, 1))
+
+def _compile_layout(values: List[Any]) -> Tuple[str, Any, Any]:
+    """Describe how keyframe values are sampled as arrays.
+    
+    Returns:
+        (kind, data, extra): numbers, vectors and colors stack into a float
+        array; dicts and lists recurse per key or index; objects with a lerp
+        method interpolate through it; anything else (including bools) is
+        held at the previous keyframe's value like step interpolation.
+    """
+    first = values[0]
+    if all(_is_number(v) for v in values):
+        return ('number', np.array(values, dtype=float), None)
+    
+    if all(_is_color(v) for v in values):
+        if all(isinstance(v, str) for v in values):
+            to_value = _rgb_to_hex
+        else:
+            color_type = type(next(v for v in values if not isinstance(v, str)))
+            to_value = color_type
+        return ('color', np.array([_color_to_rgb(v) for v in values]), to_value)
+    
+    sequence_types = (list, tuple, np.ndarray)
+    if all(isinstance(v, sequence_types) for v in values) and len({len(v) for v in values}) == 1:
+        if all(_is_number(x) for v in values for x in v):
+            return ('vector', np.array([list(v) for v in values], dtype=float), None)
+        return ('list', [_compile_layout([v[i] for v in values]) for i in range(len(first))], None)
+    
+    if all(isinstance(v, dict) and v.keys() == first.keys() for v in values):
+        return ('dict', {key: _compile_layout([v[key] for v in values]) for key in first}, None)
+    
+    held = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        held[i] = value
+    if all(hasattr(v, 'lerp') for v in values):
+        return ('lerp', held, None)
+    return ('held', held, None)
+
+def _evaluate_layout(layout: Tuple[str, Any, Any], prev: np.ndarray,
+                     nxt: np.ndarray, eased: np.ndarray) -> Any:
+    """Interpolate a compiled layout between keyframe indices."""
+    kind, data, _ = layout
+    if kind == 'number':
+        return data[prev] + (data[nxt] - data[prev]) * eased
+    if kind in ('vector', 'color'):
+        return data[prev] + (data[nxt] - data[prev]) * eased[:, None]
+    if kind == 'list':
+        return [_evaluate_layout(child, prev, nxt, eased) for child in data]
+    if kind == 'dict':
+        return {key: _evaluate_layout(child, prev, nxt, eased) for key, child in data.items()}
+    if kind == 'lerp':
+        # Arbitrary lerp objects interpolate one sample at a time
+        values = data[prev]
+        for i in np.flatnonzero(eased):
+            values[i] = data[prev[i]].lerp(data[nxt[i]], eased[i])
+        return values
+    return data[prev]
+
+def _layout_value(layout: Tuple[str, Any, Any], sampled: Any, index: int) -> Any:
+    """Convert one sample of an evaluated layout back to a keyframe-style value."""
+    kind, data, to_value = layout
+    if kind == 'number':
+        return float(sampled[index])
+    if kind == 'vector':
+        return sampled[index].tolist()
+    if kind == 'color':
+        return to_value(sampled[index])
+    if kind == 'list':
+        return [_layout_value(child, values, index) for child, values in zip(data, sampled)]
+    if kind == 'dict':
+        return {key: _layout_value(child, sampled[key], index) for key, child in data.items()}
+    return sampled[index]
+
+class PropertyCurve:
+    """Compiled keyframes of one property for fast sampling.
+    
+    Keyframe times are kept in a sorted list for bisect lookup and the easing
+    function of every segment is resolved once, so a query is O(log k) and
+    allocates nothing beyond the interpolated value.
+    """
+    
+    __slots__ = ('source', 'size', 'keyframes', 'times', 'easings',
+                 'time_array', 'kernels', 'kernel_ids', 'layout')
+    
+    def __init__(self, keyframes: List[Keyframe]):
+        self.source = keyframes
+        self.size = len(keyframes)
+        self.keyframes = list(keyframes)
+        self.times = [kf.time for kf in keyframes]
+        self.easings = [kf.resolve_easing() for kf in keyframes[:-1]]
+        
+        # Array sampling state, compiled on the first call to sample()
+        self.time_array = None
+        self.kernels = None
+        self.kernel_ids = None
+        self.layout = None
+    
+    def is_current(self, keyframes: List[Keyframe]) -> bool:
+        """Check whether the curve was compiled from this keyframe list as it is now."""
+        return keyframes is self.source and len(keyframes) == self.size
+    
+    def value_at(self, time: float) -> Any:
+        """Get the interpolated value at a specific time."""
+        # Index of the first keyframe after time
+        index = bisect_right(self.times, time)
+        if index == 0:
+            return self.keyframes[0].value
+        if index == self.size:
+            return self.keyframes[-1].value
+        
+        prev_kf = self.keyframes[index - 1]
+        return prev_kf.interpolate_with(self.keyframes[index], time, self.easings[index - 1])
+    
+    def constant_span(self, time: float) -> Tuple[float, float]:
+        """Get the interval [start, end) around time over which value_at is constant.
+        
+        Holds before the first and after the last keyframe, step segments,
+        segments starting at a bool and segments between equal numbers are
+        constant; inside any other segment the span is empty (time, time).
+        """
+        index = bisect_right(self.times, time)
+        if index == 0:
+            return (float('-inf'), self.times[0])
+        if index == self.size:
+            return (self.times[-1], float('inf'))
+        
+        start, end = self.keyframes[index - 1], self.keyframes[index]
+        if self.easings[index - 1] is None or isinstance(start.value, (bool, np.bool_)) or (
+                _is_number(start.value) and _is_number(end.value) and start.value == end.value):
+            return (start.time, end.time)
+        return (time, time)
+
+    @property
+    def value_kind(self) -> str:
+        """Get how values are sampled: number, vector, color, list, dict, lerp or held."""
+        self._compile_arrays()
+        return self.layout[0]
+    
+    def sample(self, times: np.ndarray) -> Any:
+        """Evaluate the curve at an array of times.
+        
+        Args:
+            times: 1-D array of times
+            
+        Returns:
+            An array of shape (N,) for numbers and (N, D) for vectors and
+            colors (RGB in [0, 1]). Dict and list values give a dict or list
+            of such arrays; objects with a lerp method give an object array
+            of interpolated values and other values an object array of held
+            values.
+        """
+        self._compile_arrays()
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if times.ndim != 1:
+            raise ValueError(f"Expected a 1-D array of times, got shape {times.shape}")
+        
+        # Index of the first keyframe after each time
+        index = np.searchsorted(self.time_array, times, side='right')
+        prev = np.clip(index - 1, 0, self.size - 1)
+        nxt = np.minimum(index, self.size - 1)
+        eased = np.zeros(len(times))
+        
+        inside = (index > 0) & (index < self.size)
+        if inside.any():
+            segments = prev[inside]
+            start = self.time_array[segments]
+            u = np.clip((times[inside] - start) / (self.time_array[segments + 1] - start), 0, 1)
+            
+            # One call per distinct easing kernel rather than per segment
+            segment_eased = np.zeros(len(segments))
+            segment_kernels = self.kernel_ids[segments]
+            for kernel_id in np.unique(segment_kernels):
+                kernel = self.kernels[kernel_id]
+                if kernel is not None:
+                    mask = segment_kernels == kernel_id
+                    segment_eased[mask] = kernel(u[mask])
+            eased[inside] = segment_eased
+        
+        return _evaluate_layout(self.layout, prev, nxt, eased)
+    
+    def value_from_sample(self, sampled: Any, index: int) -> Any:
+        """Get one sampled value in the same form get_value_at_time returns."""
+        self._compile_arrays()
+        return _layout_value(self.layout, sampled, index)
+    
+    def _compile_arrays(self):
+        """Build the arrays used by sample()."""
+        if self.layout is not None:
+            return
+        
+        self.time_array = np.array(self.times, dtype=float)
+        
+        # Segments with the same memoized kernel share an id
+        self.kernels = []
+        kernel_index = {}
+        kernel_ids = []
+        for kf in self.keyframes[:-1]:
+            kernel = kf.resolve_array_easing()
+            if id(kernel) not in kernel_index:
+                kernel_index[id(kernel)] = len(self.kernels)
+                self.kernels.append(kernel)
+            kernel_ids.append(kernel_index[id(kernel)])
+        self.kernel_ids = np.array(kernel_ids, dtype=int)
+        
+        self.layout = _compile_layout([kf.value for kf in self.keyframes])
+
 @dataclass
 class TimelineTrack:
-    """Represents a track in the timeline."""
+    """Represents a track in the timeline.
+    
+    Keyframes are sampled through compiled PropertyCurves. Adding or clearing
+    keyframes through the track or timeline recompiles the affected curve;
+    after editing a keyframe's time, value or easing in place, call
+    invalidate(). Each change bumps version.
+    """
     name: str
     track_type: TrackType
     enabled: bool = True
@@ -138,40 +418,54 @@ class TimelineTrack:
     events: List['TimelineEvent'] = field(default_factory=list)
     keyframes: Dict[str, List[Keyframe]] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _curves: Dict[str, PropertyCurve] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Bumped on every keyframe change made through the track (see invalidate)
+    version: int = field(default=0, init=False, repr=False, compare=False)
     
     def add_keyframe(self, property_name: str, keyframe: Keyframe):
         """Add a keyframe for a property."""
         if property_name not in self.keyframes:
             self.keyframes[property_name] = []
-        self.keyframes[property_name].append(keyframe)
-        self.keyframes[property_name].sort(key=lambda k: k.time)
+        keyframes = self.keyframes[property_name]
+        
+        # Insert after any keyframes at the same time; appends in time order are O(1)
+        index = len(keyframes)
+        while index > 0 and keyframes[index - 1].time > keyframe.time:
+            index -= 1
+        keyframes.insert(index, keyframe)
+        self.invalidate(property_name)
     
-    def get_value_at_time(self, property_name: str, time: float) -> Any:
-        """Get interpolated value for a property at a specific time."""
-        if property_name not in self.keyframes:
-            return None
+    def invalidate(self, property_name: Optional[str] = None):
+        """Drop compiled curves so they are rebuilt on the next query.
         
-        keyframes = self.keyframes[property_name]
+        Args:
+            property_name: Property to invalidate, or None for all properties
+        """
+        self.version += 1
+        if property_name is None:
+            self._curves.clear()
+        else:
+            self._curves.pop(property_name, None)
+    
+    def get_curve(self, property_name: str) -> Optional[PropertyCurve]:
+        """Get the compiled curve for a property, compiling it if needed."""
+        keyframes = self.keyframes.get(property_name)
         if not keyframes:
             return None
         
-        # Find surrounding keyframes
-        prev_kf = None
-        next_kf = None
-        
-        for kf in keyframes:
-            if kf.time <= time:
-                prev_kf = kf
-            elif kf.time > time and next_kf is None:
-                next_kf = kf
-                break
-        
-        if prev_kf is None:
-            return keyframes[0].value
-        if next_kf is None:
-            return prev_kf.value
+        curve = self._curves.get(property_name)
+        if curve is None or not curve.is_current(keyframes):
+            curve = PropertyCurve(keyframes)
+            self._curves[property_name] = curve
+        return curve
+    
+    def get_value_at_time(self, property_name: str, time: float) -> Any:
+        """Get interpolated value for a property at a specific time."""
+        curve = self.get_curve(property_name)
+        if curve is None:
+            return None
         
-        return prev_kf.interpolate_to(next_kf, time)
+        return curve.value_at(time)
 
 @dataclass
 class TimelineLayer:
@@ -241,7 +535,8 @@ class ComposerTimeline:
         self.master_track = TimelineTrack("Master", TrackType.ANIMATION)
         
         # Events and markers
-        self.event_queue: List[TimelineEvent] = []
+        self.events = EventIndex()
+        self._event_cursor = self.events.cursor()
         self.markers: List[TimelineMarker] = []
         self.regions: List[Dict[str, Any]] = []
         
@@ -249,6 +544,10 @@ class ComposerTimeline:
         self.playback_callbacks: List[Callable] = []
         self.time_callbacks: Dict[float, List[Callable]] = {}
         
+        # Lookup-table easing applied to keyframes (None uses exact easings)
+        self.easing_lut_resolution: Optional[int] = None
+        self.easing_lut_interpolation = "linear"
+        
         # Create default layers
         self._create_default_layers()
     
@@ -276,8 +575,7 @@ class ComposerTimeline:
                 track = TimelineTrack(track_name, track_type)
                 layer.add_track(track)
         
-        self.layers.append(layer)
-        self._sort_layers_by_z_index()
+        self._insert_layer_by_z_index(layer)
         return layer
     
     def _infer_track_type(self, track_name: str) -> TrackType:
@@ -298,7 +596,7 @@ class ComposerTimeline:
     def add_event(self, time: float, callback: Callable, **kwargs) -> TimelineEvent:
         """Add an event to the timeline."""
         event = TimelineEvent(time, callback, **kwargs)
-        heapq.heappush(self.event_queue, event)
+        self.events.add(event)
         
         # Add to specific track if specified
         if event.track_name and event.layer_name:
@@ -370,6 +668,9 @@ class ComposerTimeline:
         if rate_function:
             kwargs['rate_function'] = rate_function
         
+        kwargs.setdefault('lut_resolution', self.easing_lut_resolution)
+        kwargs.setdefault('lut_interpolation', self.easing_lut_interpolation)
+        
         keyframe = Keyframe(time, value, interpolation, **kwargs)
         track.add_keyframe(property_name, keyframe)
         return keyframe
@@ -433,6 +734,34 @@ class ComposerTimeline:
         
         return track.get_value_at_time(property_name, time)
     
+    def sample(self, layer_name: str, track_name: str, property_name: str,
+               times: np.ndarray) -> Any:
+        """Evaluate a property at an array of times in one call.
+        
+        Args:
+            layer_name: Name of the layer
+            track_name: Name of the track
+            property_name: Name of the property
+            times: 1-D array of times
+            
+        Returns:
+            Sampled values as described in PropertyCurve.sample, or None if
+            the property has no keyframes
+        """
+        layer = self.get_layer(layer_name)
+        if not layer:
+            return None
+        
+        track = layer.get_track(track_name)
+        if not track:
+            return None
+        
+        curve = track.get_curve(property_name)
+        if curve is None:
+            return None
+        
+        return curve.sample(times)
+    
     def clear_keyframes(self, layer_name: str, track_name: str, property_name: str):
         """Clear all keyframes for a specific property."""
         layer = self.get_layer(layer_name)
@@ -445,6 +774,28 @@ class ComposerTimeline:
         
         if property_name in track.keyframes:
             track.keyframes[property_name].clear()
+            track.invalidate(property_name)
+    
+    def set_easing_lut(self, resolution: Optional[int], interpolation: str = "linear"):
+        """Sample keyframe easings from lookup tables, e.g. per render quality.
+        
+        Applies to keyframes already on the timeline and to keyframes added
+        later through add_keyframe. Keyframes with the same easing and params
+        share one table; pass None to use exact easings.
+        
+        Args:
+            resolution: Number of samples per table, or None
+            interpolation: 'linear' or 'cubic'
+        """
+        self.easing_lut_resolution = resolution
+        self.easing_lut_interpolation = interpolation
+        
+        for track in [self.master_track] + [track for layer in self.layers for track in layer.tracks]:
+            for keyframes in track.keyframes.values():
+                for keyframe in keyframes:
+                    keyframe.lut_resolution = resolution
+                    keyframe.lut_interpolation = interpolation
+            track.invalidate()
     
     def add_track(self, layer_name: str, track_name: str, track_type: Union[str, TrackType]):
         """Add a track to a specific layer."""
@@ -460,48 +811,62 @@ class ComposerTimeline:
         layer.add_track(track)
         return track
     
+    @property
+    def event_queue(self) -> List[TimelineEvent]:
+        """All events in time order."""
+        return list(self.events)
+    
+    def remove_event(self, event: TimelineEvent) -> bool:
+        """Remove an event from the timeline."""
+        removed = self.events.remove(event)
+        if removed and event.track_name and event.layer_name:
+            layer = self.get_layer(event.layer_name)
+            track = layer.get_track(event.track_name) if layer else None
+            if track and event in track.events:
+                track.events.remove(event)
+        return removed
+    
+    def set_event_tag_enabled(self, tag: str, enabled: bool):
+        """Enable or disable all events with a tag."""
+        self.events.set_tag_enabled(tag, enabled)
+    
     def get_events_in_range(self, start: float, end: float, 
                            tags: Optional[List[str]] = None) -> List[TimelineEvent]:
         """Get all events within a time range."""
-        events = []
-        
-        for event in self.event_queue:
-            if start <= event.time <= end and event.enabled:
-                if tags is None or any(tag in event.tags for tag in tags):
-                    events.append(event)
-        
-        return sorted(events, key=lambda e: e.time)
+        return self.events.query(start, end, tags)
     
     def seek(self, time: float):
         """Seek to a specific time."""
         self.current_time = max(0, min(time, self.duration))
+        # Seeking back re-arms the events after the new time
+        if self.current_time < self._event_cursor.time:
+            self._event_cursor.reset(self.current_time)
         self._trigger_time_callbacks()
     
     def play(self, scene):
-        """Play the timeline on a scene."""
+        """Play the timeline on a scene, firing each event up to the current time once."""
         # Reset current time if at end
         if self.current_time >= self.duration:
             self.current_time = 0.0
+            self._event_cursor.reset()
         
         self.is_playing = True
+        self._fire_events(scene)
+    
+    def advance(self, scene, time: float):
+        """Move playback to a time, firing the events passed since the last advance once.
         
-        # Process events up to current time
-        events_to_process = []
-        temp_queue = []
-        
-        while self.event_queue:
-            event = heapq.heappop(self.event_queue)
-            if event.time <= self.current_time and event.enabled:
-                events_to_process.append(event)
-            else:
-                temp_queue.append(event)
-        
-        # Restore unprocessed events
-        for event in temp_queue:
-            heapq.heappush(self.event_queue, event)
-        
-        # Process events
-        for event in sorted(events_to_process, key=lambda e: e.time):
+        Unlike play, this does not restart at the end of the timeline. Moving
+        back re-arms the events after the new time.
+        """
+        if time < self._event_cursor.time:
+            self._event_cursor.reset(time)
+        self.current_time = time
+        self._fire_events(scene)
+    
+    def _fire_events(self, scene):
+        """Fire events up to the current time and the playback callbacks."""
+        for event in self._event_cursor.advance(self.current_time):
             try:
                 event.callback(scene)
             except Exception as e:
@@ -517,9 +882,14 @@ class ComposerTimeline:
         """Stop timeline and reset to beginning."""
         self.is_playing = False
         self.current_time = 0.0
+        self._event_cursor.reset()
     
-    def export_to_json(self, filepath: Union[str, Path]):
-        """Export timeline to JSON format."""
+    def to_dict(self, include_keyframes: bool = True) -> Dict[str, Any]:
+        """Get the timeline in the JSON interchange schema.
+        
+        Args:
+            include_keyframes: Whether tracks carry their keyframes
+        """
         data = {
             "duration": self.duration,
             "fps": self.fps,
@@ -545,11 +915,14 @@ class ComposerTimeline:
                 track_data = {
                     "name": track.name,
                     "type": track.track_type.value,
-                    "enabled": track.enabled,
-                    "keyframes": {}
+                    "enabled": track.enabled
                 }
+                if not include_keyframes:
+                    layer_data["tracks"].append(track_data)
+                    continue
                 
                 # Export keyframes
+                track_data["keyframes"] = {}
                 for prop_name, keyframes in track.keyframes.items():
                     track_data["keyframes"][prop_name] = [
                         {
@@ -574,15 +947,15 @@ class ComposerTimeline:
             }
             for marker in self.markers
         ]
-        
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        return data
     
-    def import_from_json(self, filepath: Union[str, Path]):
-        """Import timeline from JSON format."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    def from_dict(self, data: Dict[str, Any]) -> List[TimelineLayer]:
+        """Replace the timeline's contents with data in the JSON interchange schema.
         
+        Returns:
+            The imported layers in the order of data["layers"], which can
+            differ from self.layers (sorted by z-index) and may repeat names
+        """
         self.duration = data.get("duration", 10.0)
         self.fps = data.get("fps", 60.0)
         self.layers.clear()
@@ -590,6 +963,7 @@ class ComposerTimeline:
         self.regions = data.get("regions", [])
         
         # Import layers and tracks
+        imported = []
         for layer_data in data.get("layers", []):
             layer = TimelineLayer(
                 name=layer_data["name"],
@@ -620,7 +994,8 @@ class ComposerTimeline:
                 
                 layer.add_track(track)
             
-            self.layers.append(layer)
+            self._insert_layer_by_z_index(layer)
+            imported.append(layer)
         
         # Import markers
         for marker_data in data.get("markers", []):
@@ -630,6 +1005,34 @@ class ComposerTimeline:
                 color=marker_data.get("color", "#FFFF00"),
                 duration=marker_data.get("duration", 0.0)
             )
+        
+        return imported
+    
+    def export_to_json(self, filepath: Union[str, Path]):
+        """Export timeline to JSON format."""
+        with open(filepath, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+    
+    def import_from_json(self, filepath: Union[str, Path]):
+        """Import timeline from JSON format."""
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        self.from_dict(data)
+    
+    def export_to_npz(self, filepath: Union[str, Path]):
+        """Export timeline to the columnar binary format (see timeline_format)."""
+        from .timeline_format import save_timeline
+        save_timeline(self, filepath)
+    
+    def import_from_npz(self, filepath: Union[str, Path], lazy: bool = True):
+        """Import timeline from the columnar binary format.
+        
+        Args:
+            filepath: Path of an .npz file written by export_to_npz
+            lazy: Load each track's keyframes on first access instead of now
+        """
+        from .timeline_format import load_timeline
+        load_timeline(self, filepath, lazy=lazy)
     
     def add_playback_callback(self, callback: Callable):
         """Add a callback that's called during playback."""
@@ -657,12 +1060,32 @@ class ComposerTimeline:
         """Sort layers by z-index for proper rendering order."""
         self.layers.sort(key=lambda layer: layer.z_index)
     
+    def _insert_layer_by_z_index(self, layer: TimelineLayer):
+        """Insert a layer after the layers with a lower or equal z-index.
+        
+        The other layers must already be sorted; a binary search finds the
+        position instead of re-sorting the whole list.
+        """
+        lo, hi = 0, len(self.layers)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.layers[mid].z_index <= layer.z_index:
+                lo = mid + 1
+            else:
+                hi = mid
+        self.layers.insert(lo, layer)
+    
+    def _reposition_layer(self, layer: TimelineLayer):
+        """Move a layer whose z-index changed to its sorted position."""
+        self.layers.remove(layer)
+        self._insert_layer_by_z_index(layer)
+    
     def set_layer_z_index(self, layer_name: str, z_index: int):
         """Set z-index for a specific layer."""
         layer = self.get_layer(layer_name)
         if layer:
             layer.z_index = z_index
-            self._sort_layers_by_z_index()
+            self._reposition_layer(layer)
     
     def move_layer_forward(self, layer_name: str):
         """Move layer one position forward (higher z-index)."""
@@ -675,7 +1098,7 @@ class ComposerTimeline:
             # Swap z-indices
             next_layer = self.layers[current_idx + 1]
             layer.z_index, next_layer.z_index = next_layer.z_index, layer.z_index
-            self._sort_layers_by_z_index()
+            self.layers[current_idx], self.layers[current_idx + 1] = next_layer, layer
     
     def move_layer_backward(self, layer_name: str):
         """Move layer one position backward (lower z-index)."""
@@ -688,7 +1111,7 @@ class ComposerTimeline:
             # Swap z-indices
             prev_layer = self.layers[current_idx - 1]
             layer.z_index, prev_layer.z_index = prev_layer.z_index, layer.z_index
-            self._sort_layers_by_z_index()
+            self.layers[current_idx], self.layers[current_idx - 1] = prev_layer, layer
     
     def move_layer_to_top(self, layer_name: str):
         """Move layer to the top (highest z-index)."""
@@ -696,7 +1119,7 @@ class ComposerTimeline:
         if layer:
             max_z = max((l.z_index for l in self.layers), default=0)
             layer.z_index = max_z + 10
-            self._sort_layers_by_z_index()
+            self._reposition_layer(layer)
     
     def move_layer_to_bottom(self, layer_name: str):
         """Move layer to the bottom (lowest z-index)."""
@@ -704,7 +1127,7 @@ class ComposerTimeline:
         if layer:
             min_z = min((l.z_index for l in self.layers), default=0)
             layer.z_index = min_z - 10
-            self._sort_layers_by_z_index()
+            self._reposition_layer(layer)
     
     def get_layers_ordered(self) -> List[TimelineLayer]:
         """Get layers in proper rendering order (by z-index)."""
@@ -730,8 +1153,16 @@ class ComposerTimeline:
         for mob in all_mobjects:
             scene.add(mob)
     
-    def generate_preview_data(self, width: int = 800, height: int = 200) -> Dict[str, Any]:
-        """Generate preview data for timeline visualization."""
+    def generate_preview_data(self, width: int = 800, height: int = 200,
+                              curve_resolution: int = 100) -> Dict[str, Any]:
+        """Generate preview data for timeline visualization.
+        
+        Numeric, vector and color properties also get a value curve sampled
+        at curve_resolution evenly spaced times.
+        """
+        curve_times = np.linspace(0, self.duration, curve_resolution)
+        curve_x = (curve_times / self.duration * width).tolist() if self.duration else []
+
         preview = {
             "duration": self.duration,
             "fps": self.fps,
@@ -776,7 +1207,8 @@ class ComposerTimeline:
                     "y": i * layer_height + j * track_height,
                     "height": track_height,
                     "events": [],
-                    "keyframes": []
+                    "keyframes": [],
+                    "curves": []
                 }
                 
                 # Add events
@@ -796,6 +1228,15 @@ class ComposerTimeline:
                             "property": prop_name,
                             "value": str(kf.value)[:20]  # Truncate long values
                         })
+                    
+                    # Add sampled value curves
+                    curve = track.get_curve(prop_name)
+                    if curve_x and curve and curve.value_kind in ('number', 'vector', 'color'):
+                        track_preview["curves"].append({
+                            "property": prop_name,
+                            "x": curve_x,
+                            "values": curve.sample(curve_times).tolist()
+                        })
                 
                 layer_preview["tracks"].append(track_preview)
             
@@ -949,6 +1390,24 @@ class ComposerTimeline:
         Returns:
             Dictionary containing camera state
         """
+        camera_path = self.sample_camera(np.array([time]))
+        camera_track = self.get_layer("Camera").get_track("camera_movement") if camera_path else None
+        
+        return {
+            property_name: camera_track.get_curve(property_name).value_from_sample(sampled, 0)
+            for property_name, sampled in camera_path.items()
+        }
+    
+    def sample_camera(self, times: np.ndarray) -> Dict[str, Any]:
+        """Sample every camera property at an array of times.
+        
+        Args:
+            times: 1-D array of times
+            
+        Returns:
+            Dictionary mapping camera properties to sampled values, as
+            described in PropertyCurve.sample
+        """
         camera_layer = self.get_layer("Camera")
         if not camera_layer:
             return {}
@@ -957,12 +1416,12 @@ class ComposerTimeline:
         if not camera_track:
             return {}
         
-        camera_state = {}
+        camera_path = {}
         
         # Get all camera properties
         for property_name in camera_track.keyframes:
-            value = camera_track.get_value_at_time(property_name, time)
-            if value is not None:
-                camera_state[property_name] = value
+            curve = camera_track.get_curve(property_name)
+            if curve is not None:
+                camera_path[property_name] = curve.sample(times)
         
-        return camera_state
\ No newline at end of file
+        return camera_path
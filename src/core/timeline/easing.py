@@ -6,14 +6,16 @@ rich easing functions for smooth, professional animations.
 """
 
 from typing import Callable, Dict, Optional, Tuple, Union
+from bisect import bisect_left
 from enum import Enum
+from functools import lru_cache
 import numpy as np
 
 # Import our interpolation utilities
 from src.utils.math3d.interpolation import (
     smooth_step, smoother_step, smoothest_step,
     ease_in_out, bounce_ease_out, elastic_ease_out,
-    circular_ease_in_out, BezierCurve, Vector3D
+    circular_ease_in_out
 )
 
 
@@ -88,13 +90,179 @@ class EasingFunction(Enum):
     MANIM_SMOOTH = "manim_smooth"
 
 
+class CubicBezierEasing:
+    """CSS-style cubic-bezier easing from (0, 0) to (1, 1).
+    
+    Easing needs the curve parameter s where x(s) equals t. x(s) is sampled
+    once into a lookup table; each query interpolates an initial s from the
+    table and refines it with a few Newton steps, instead of bisecting the
+    curve on every call. Accepts scalars or arrays of t.
+    """
+    
+    def __init__(self, x1: float, y1: float, x2: float, y2: float,
+                 table_size: int = 32, newton_iterations: int = 4):
+        """
+        Initialize the easing and its lookup table.
+        
+        Args:
+            x1, y1, x2, y2: The two inner control points
+            table_size: Number of samples of x(s) in the lookup table
+            newton_iterations: Newton steps applied after the table lookup
+        """
+        self.control_points = (x1, y1, x2, y2)
+        self.newton_iterations = newton_iterations
+        
+        # Power-basis coefficients: B(s) = ((a * s + b) * s + c) * s
+        self._cx = 3 * x1
+        self._bx = 3 * (x2 - x1) - self._cx
+        self._ax = 1 - self._cx - self._bx
+        self._cy = 3 * y1
+        self._by = 3 * (y2 - y1) - self._cy
+        self._ay = 1 - self._cy - self._by
+        
+        self._s_table = np.linspace(0, 1, table_size)
+        # x(s) is only monotonic for x1, x2 in [0, 1]; keep the table sorted for lookups
+        self._x_table = np.maximum.accumulate(self._x(self._s_table))
+        self._s_list = self._s_table.tolist()
+        self._x_list = self._x_table.tolist()
+    
+    def _x(self, s):
+        return ((self._ax * s + self._bx) * s + self._cx) * s
+    
+    def _y(self, s):
+        return ((self._ay * s + self._by) * s + self._cy) * s
+    
+    def _dx(self, s):
+        return (3 * self._ax * s + 2 * self._bx) * s + self._cx
+    
+    def __call__(self, t):
+        if np.ndim(t) == 0:
+            return self._evaluate_scalar(float(t))
+        
+        t = np.clip(np.asarray(t, dtype=float), 0, 1)
+        s = np.interp(t, self._x_table, self._s_table)
+        for _ in range(self.newton_iterations):
+            dx = self._dx(s)
+            safe_dx = np.where(np.abs(dx) > 1e-9, dx, 1.0)
+            s = np.clip(s - np.where(np.abs(dx) > 1e-9, (self._x(s) - t) / safe_dx, 0.0), 0, 1)
+        return self._y(s)
+    
+    def _evaluate_scalar(self, t: float) -> float:
+        """Solve a single t with plain floats, which is faster than NumPy scalars."""
+        t = min(max(t, 0.0), 1.0)
+        index = min(max(bisect_left(self._x_list, t), 1), len(self._x_list) - 1)
+        x0, x1 = self._x_list[index - 1], self._x_list[index]
+        s0, s1 = self._s_list[index - 1], self._s_list[index]
+        s = s0 + (s1 - s0) * (t - x0) / (x1 - x0) if x1 > x0 else s0
+        
+        for _ in range(self.newton_iterations):
+            dx = self._dx(s)
+            if abs(dx) <= 1e-9:
+                break
+            s = min(max(s - (self._x(s) - t) / dx, 0.0), 1.0)
+        return self._y(s)
+
+
+@lru_cache(maxsize=256)
+def _cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> CubicBezierEasing:
+    """Get a shared CubicBezierEasing for a set of control points."""
+    return CubicBezierEasing(x1, y1, x2, y2)
+
+
+class LookupTableEasing:
+    """Easing sampled once into a lookup table.
+    
+    The exact easing is evaluated at `resolution` evenly spaced t values in
+    [0, 1]; calls interpolate the table linearly or with a cubic
+    (Catmull-Rom) spline. t is clamped to [0, 1]. Accepts scalars or arrays
+    of t.
+    """
+    
+    INTERPOLATIONS = ('linear', 'cubic')
+    
+    def __init__(self, exact: Callable[[np.ndarray], np.ndarray],
+                 resolution: int = 256, interpolation: str = 'linear'):
+        """
+        Initialize the lookup table.
+        
+        Args:
+            exact: Array easing function to sample
+            resolution: Number of samples in the table
+            interpolation: 'linear' or 'cubic'
+        """
+        if resolution < 2:
+            raise ValueError(f"LUT resolution must be at least 2, got {resolution}")
+        if interpolation not in self.INTERPOLATIONS:
+            raise ValueError(f"Unknown LUT interpolation '{interpolation}', "
+                             f"expected one of {self.INTERPOLATIONS}")
+        
+        self.exact = exact
+        self.resolution = resolution
+        self.interpolation = interpolation
+        self.table = np.asarray(exact(np.linspace(0, 1, resolution)), dtype=float)
+        self._values = self.table.tolist()
+        self._max_error: Optional[float] = None
+    
+    @property
+    def max_error(self) -> float:
+        """Largest absolute difference from the exact easing, measured between samples."""
+        if self._max_error is None:
+            t = np.linspace(0, 1, (self.resolution - 1) * 16 + 1)
+            self._max_error = float(np.max(np.abs(self(t) - self.exact(t))))
+        return self._max_error
+    
+    def __call__(self, t):
+        if np.ndim(t) == 0:
+            return self._evaluate_scalar(float(t))
+        
+        x = np.clip(np.asarray(t, dtype=float), 0, 1) * (self.resolution - 1)
+        i = np.minimum(x.astype(int), self.resolution - 2)
+        f = x - i
+        p1 = self.table[i]
+        p2 = self.table[i + 1]
+        if self.interpolation == 'linear':
+            return p1 + (p2 - p1) * f
+        
+        p0 = self.table[np.maximum(i - 1, 0)]
+        p3 = self.table[np.minimum(i + 2, self.resolution - 1)]
+        return self._catmull_rom(p0, p1, p2, p3, f)
+    
+    def _evaluate_scalar(self, t: float) -> float:
+        """Evaluate a single t with plain floats, which is faster than NumPy scalars."""
+        x = min(max(t, 0.0), 1.0) * (self.resolution - 1)
+        i = min(int(x), self.resolution - 2)
+        f = x - i
+        values = self._values
+        p1, p2 = values[i], values[i + 1]
+        if self.interpolation == 'linear':
+            return p1 + (p2 - p1) * f
+        
+        p0 = values[max(i - 1, 0)]
+        p3 = values[min(i + 2, self.resolution - 1)]
+        return self._catmull_rom(p0, p1, p2, p3, f)
+    
+    @staticmethod
+    def _catmull_rom(p0, p1, p2, p3, f):
+        """Catmull-Rom spline through p1 and p2."""
+        return p1 + 0.5 * f * (p2 - p0 + f * (2 * p0 - 5 * p1 + 4 * p2 - p3
+                                              + f * (3 * (p1 - p2) + p3 - p0)))
+
+
 class EasingLibrary:
     """Library of easing functions for timeline animations."""
     
     @staticmethod
     def get_easing_function(easing_type: EasingFunction, 
-                          params: Optional[Dict] = None) -> Callable[[float], float]:
-        """Get an easing function by type with optional parameters."""
+                          params: Optional[Dict] = None,
+                          lut_resolution: Optional[int] = None,
+                          lut_interpolation: str = 'linear') -> Callable[[float], float]:
+        """Get an easing function by type with optional parameters.
+        
+        With lut_resolution set, returns a shared LookupTableEasing instead of
+        the exact function (see get_lut_easing_function).
+        """
+        if lut_resolution is not None:
+            return EasingLibrary.get_lut_easing_function(easing_type, params, lut_resolution, lut_interpolation)
         
         # Basic functions
         if easing_type == EasingFunction.LINEAR:
@@ -212,11 +380,10 @@ class EasingLibrary:
         # Custom Bezier
         elif easing_type == EasingFunction.CUBIC_BEZIER:
             if params and 'control_points' in params:
-                x1, y1, x2, y2 = params['control_points']
-                return lambda t: EasingLibrary._cubic_bezier_easing(t, x1, y1, x2, y2)
+                return _cubic_bezier(*params['control_points'])
             else:
                 # Default to ease-in-out
-                return lambda t: EasingLibrary._cubic_bezier_easing(t, 0.42, 0, 0.58, 1)
+                return _cubic_bezier(0.42, 0, 0.58, 1)
         
         # Spring
         elif easing_type == EasingFunction.SPRING:
@@ -274,6 +441,337 @@ class EasingLibrary:
         # Default to linear
         return lambda t: t
     
+    @staticmethod
+    def get_array_easing_function(easing_type: EasingFunction,
+                                  params: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        """Get an easing function that maps an array of t values to eased values.
+        
+        Every EasingFunction has a NumPy kernel that agrees with the scalar
+        function from get_easing_function; anything else falls back to
+        applying the scalar function element by element.
+        """
+        key = _easing_cache_key(easing_type, params)
+        if key is None:
+            return EasingLibrary._build_array_easing(easing_type, params)
+        return _cached_array_easing(key)
+    
+    @staticmethod
+    def _build_array_easing(easing_type: EasingFunction,
+                            params: Optional[Dict] = None) -> Callable[[np.ndarray], np.ndarray]:
+        """Build the array easing function for an easing type and params."""
+        kernel = EasingLibrary._array_kernel(easing_type, params)
+        if kernel is None:
+            kernel = vectorize_easing(EasingLibrary.get_easing_function(easing_type, params))
+        return kernel
+    
+    @staticmethod
+    def get_lut_easing_function(easing_type: EasingFunction,
+                                params: Optional[Dict] = None,
+                                resolution: int = 256,
+                                interpolation: str = 'linear') -> LookupTableEasing:
+        """Get a lookup-table version of an easing function.
+        
+        Tables are shared by every caller asking for the same easing type,
+        params and resolution, so keyframes using the same preset sample
+        one table. The returned object works on scalars and arrays and
+        reports its max_error against the exact easing.
+        """
+        key = _easing_cache_key(easing_type, params)
+        if key is None:
+            exact = EasingLibrary.get_array_easing_function(easing_type, params)
+            return LookupTableEasing(exact, resolution, interpolation)
+        return _cached_lut_easing(key, resolution, interpolation)
+    
+    @staticmethod
+    def measure_lut_error(easing_type: EasingFunction,
+                          params: Optional[Dict] = None,
+                          resolutions: Tuple[int, ...] = (16, 32, 64, 128, 256, 512),
+                          interpolation: str = 'linear') -> Dict[int, float]:
+        """Get the max error of lookup-table easings at several resolutions.
+        
+        Returns:
+            Dictionary mapping each resolution to its maximum absolute error
+        """
+        return {
+            resolution: EasingLibrary.get_lut_easing_function(
+                easing_type, params, resolution, interpolation
+            ).max_error
+            for resolution in resolutions
+        }
+    
+    @staticmethod
+    def _array_kernel(easing_type: EasingFunction,
+                      params: Optional[Dict] = None) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """Get the NumPy implementation of an easing function.
+        
+        Each kernel follows the same formulas and branches as the scalar
+        function returned by get_easing_function.
+        """
+        params = params or {}
+        powers = {
+            EasingFunction.EASE_IN_QUAD: ('in', 2), EasingFunction.EASE_OUT_QUAD: ('out', 2),
+            EasingFunction.EASE_IN_OUT_QUAD: ('in_out', 2),
+            EasingFunction.EASE_IN_CUBIC: ('in', 3), EasingFunction.EASE_OUT_CUBIC: ('out', 3),
+            EasingFunction.EASE_IN_OUT_CUBIC: ('in_out', 3),
+            EasingFunction.EASE_IN_QUART: ('in', 4), EasingFunction.EASE_OUT_QUART: ('out', 4),
+            EasingFunction.EASE_IN_OUT_QUART: ('in_out', 4),
+            EasingFunction.EASE_IN_QUINT: ('in', 5), EasingFunction.EASE_OUT_QUINT: ('out', 5),
+            EasingFunction.EASE_IN_OUT_QUINT: ('in_out', 5),
+        }
+        smooth = EasingLibrary._manim_smooth
+        
+        def kernel(func):
+            """Convert the input to a float array before applying func."""
+            return lambda t: func(np.asarray(t, dtype=float))
+        
+        if easing_type == EasingFunction.LINEAR:
+            return kernel(lambda t: t)
+        
+        elif easing_type == EasingFunction.STEP:
+            return kernel(lambda t: np.where(t < 0.5, 0.0, 1.0))
+        
+        elif easing_type in (EasingFunction.SMOOTH_STEP, EasingFunction.SMOOTHER_STEP,
+                             EasingFunction.SMOOTHEST_STEP):
+            # These clip and use arithmetic only
+            return kernel(EasingLibrary.get_easing_function(easing_type))
+        
+        elif easing_type in powers:
+            mode, power = powers[easing_type]
+            if mode == 'in':
+                return kernel(lambda t: t ** power)
+            elif mode == 'out':
+                return kernel(lambda t: 1 - (1 - t) ** power)
+            return kernel(lambda t: EasingLibrary._ease_in_out_array(t, power))
+        
+        elif easing_type == EasingFunction.EASE_IN_EXPO:
+            return kernel(lambda t: np.where(t == 0, 0.0, 2 ** (10 * (t - 1))))
+        
+        elif easing_type == EasingFunction.EASE_OUT_EXPO:
+            return kernel(lambda t: np.where(t == 1, 1.0, 1 - 2 ** (-10 * t)))
+        
+        elif easing_type == EasingFunction.EASE_IN_OUT_EXPO:
+            return kernel(EasingLibrary._ease_in_out_expo_array)
+        
+        elif easing_type == EasingFunction.EASE_IN_CIRC:
+            return kernel(lambda t: 1 - np.sqrt(1 - t * t))
+        
+        elif easing_type == EasingFunction.EASE_OUT_CIRC:
+            return kernel(lambda t: np.sqrt(1 - (t - 1) ** 2))
+        
+        elif easing_type == EasingFunction.EASE_IN_OUT_CIRC:
+            return kernel(EasingLibrary._circular_ease_in_out_array)
+        
+        elif easing_type in (EasingFunction.EASE_IN_ELASTIC, EasingFunction.EASE_OUT_ELASTIC,
+                             EasingFunction.EASE_IN_OUT_ELASTIC):
+            amplitude = params.get('amplitude', 1)
+            period = params.get('period', 0.3)
+            elastic = {
+                EasingFunction.EASE_IN_ELASTIC: EasingLibrary._ease_in_elastic_array,
+                EasingFunction.EASE_OUT_ELASTIC: EasingLibrary._ease_out_elastic_array,
+                EasingFunction.EASE_IN_OUT_ELASTIC: EasingLibrary._ease_in_out_elastic_array,
+            }[easing_type]
+            return kernel(lambda t: elastic(t, amplitude, period))
+        
+        elif easing_type == EasingFunction.EASE_IN_BOUNCE:
+            return kernel(lambda t: 1 - EasingLibrary._bounce_ease_out_array(1 - t))
+        
+        elif easing_type == EasingFunction.EASE_OUT_BOUNCE:
+            return kernel(EasingLibrary._bounce_ease_out_array)
+        
+        elif easing_type == EasingFunction.EASE_IN_OUT_BOUNCE:
+            bounce = EasingLibrary._bounce_ease_out_array
+            return kernel(lambda t: np.where(t < 0.5, (1 - bounce(1 - 2 * t)) / 2, (1 + bounce(2 * t - 1)) / 2))
+        
+        elif easing_type == EasingFunction.EASE_IN_BACK:
+            overshoot = params.get('overshoot', 1.70158)
+            return kernel(lambda t: t * t * ((overshoot + 1) * t - overshoot))
+        
+        elif easing_type == EasingFunction.EASE_OUT_BACK:
+            overshoot = params.get('overshoot', 1.70158)
+            return kernel(lambda t: 1 + (t - 1) ** 3 + (t - 1) ** 2 * (overshoot + 1))
+        
+        elif easing_type == EasingFunction.EASE_IN_OUT_BACK:
+            overshoot = params.get('overshoot', 1.70158)
+            return kernel(lambda t: EasingLibrary._ease_in_out_back_array(t, overshoot))
+        
+        elif easing_type == EasingFunction.CUBIC_BEZIER:
+            # CubicBezierEasing handles scalars and arrays alike
+            return EasingLibrary.get_easing_function(easing_type, params)
+        
+        elif easing_type == EasingFunction.SPRING:
+            stiffness = params.get('stiffness', 100)
+            damping = params.get('damping', 10)
+            mass = params.get('mass', 1)
+            return kernel(lambda t: EasingLibrary._spring_easing_array(t, stiffness, damping, mass))
+        
+        elif easing_type == EasingFunction.THERE_AND_BACK:
+            return kernel(EasingLibrary._there_and_back_array)
+        
+        elif easing_type == EasingFunction.THERE_AND_BACK_WITH_PAUSE:
+            pause_ratio = params.get('pause_ratio', 1/3)
+            return kernel(lambda t: EasingLibrary._there_and_back_with_pause_array(t, pause_ratio))
+        
+        elif easing_type == EasingFunction.RUSH_INTO:
+            return kernel(lambda t: 2 * smooth(0.5 * t))
+        
+        elif easing_type == EasingFunction.RUSH_FROM:
+            return kernel(lambda t: 2 * smooth(0.5 * (t + 1)) - 1)
+        
+        elif easing_type == EasingFunction.SLOW_INTO:
+            return kernel(lambda t: np.where(t < 0.5, smooth(2 * t) / 2, (1 + smooth(2 * (t - 0.5))) / 2))
+        
+        elif easing_type == EasingFunction.DOUBLE_SMOOTH:
+            return kernel(lambda t: smooth(smooth(t)))
+        
+        elif easing_type == EasingFunction.TRIPLE_SMOOTH:
+            return kernel(lambda t: smooth(smooth(smooth(t))))
+        
+        elif easing_type == EasingFunction.NOT_QUITE_THERE:
+            cutoff = params.get('cutoff', 0.9)
+            return kernel(lambda t: cutoff * smooth(t))
+        
+        elif easing_type == EasingFunction.WIGGLE:
+            wiggles = params.get('wiggles', 4)
+            return kernel(lambda t: np.sin(wiggles * np.pi * t) * EasingLibrary._there_and_back_array(t))
+        
+        elif easing_type == EasingFunction.SQUISH_RATE_FUNC:
+            squish_start = params.get('squish_start', 0.25)
+            squish_end = params.get('squish_end', 0.75)
+            return kernel(lambda t: EasingLibrary._squish_rate_func_array(t, squish_start, squish_end))
+        
+        elif easing_type == EasingFunction.LINGERING:
+            return kernel(EasingLibrary._lingering_array)
+        
+        elif easing_type == EasingFunction.EXPONENTIAL_DECAY:
+            decay_rate = params.get('decay_rate', 3)
+            return kernel(lambda t: 1 - np.exp(-decay_rate * t))
+        
+        elif easing_type == EasingFunction.MANIM_SMOOTH:
+            return kernel(smooth)
+        
+        return None
+    
+    # Array versions of the scalar helpers below. Both sides of every branch
+    # are evaluated, so out-of-domain warnings are silenced and masked out.
+    
+    @staticmethod
+    def _ease_in_out_array(t: np.ndarray, power: float) -> np.ndarray:
+        t = np.clip(t, 0, 1)
+        return np.where(t < 0.5, 0.5 * (2 * t) ** power, 1 - 0.5 * (2 * (1 - t)) ** power)
+    
+    @staticmethod
+    def _ease_in_out_expo_array(t: np.ndarray) -> np.ndarray:
+        with np.errstate(over='ignore'):
+            eased = np.where(t < 0.5, 2 ** (20 * t - 10) / 2, (2 - 2 ** (-20 * t + 10)) / 2)
+        return np.where(t == 0, 0.0, np.where(t == 1, 1.0, eased))
+    
+    @staticmethod
+    def _circular_ease_in_out_array(t: np.ndarray) -> np.ndarray:
+        t = np.clip(t, 0, 1)
+        with np.errstate(invalid='ignore'):
+            return np.where(
+                t < 0.5,
+                0.5 * (1 - np.sqrt(1 - 4 * t * t)),
+                0.5 * (np.sqrt(1 - (2 * t - 2) ** 2) + 1)
+            )
+    
+    @staticmethod
+    def _elastic_phase(amplitude: float, period: float) -> float:
+        return period / (2 * np.pi) * np.arcsin(1 / amplitude) if amplitude >= 1 else period / 4
+    
+    @staticmethod
+    def _ease_in_elastic_array(t: np.ndarray, amplitude: float = 1, period: float = 0.3) -> np.ndarray:
+        s = EasingLibrary._elastic_phase(amplitude, period)
+        eased = -(amplitude * np.power(2, 10 * (t - 1)) * np.sin((t - 1 - s) * 2 * np.pi / period))
+        return np.where(t == 0, 0.0, np.where(t == 1, 1.0, eased))
+    
+    @staticmethod
+    def _ease_out_elastic_array(t: np.ndarray, amplitude: float = 1, period: float = 0.3) -> np.ndarray:
+        t = np.clip(t, 0, 1)
+        s = EasingLibrary._elastic_phase(amplitude, period)
+        eased = amplitude * np.power(2, -10 * t) * np.sin((t - s) * 2 * np.pi / period) + 1
+        return np.where((t == 0) | (t == 1), t, eased)
+    
+    @staticmethod
+    def _ease_in_out_elastic_array(t: np.ndarray, amplitude: float = 1, period: float = 0.3) -> np.ndarray:
+        s = EasingLibrary._elastic_phase(amplitude, period)
+        t2 = t * 2
+        with np.errstate(over='ignore'):
+            first = -0.5 * (amplitude * np.power(2, 10 * (t2 - 1)) * np.sin((t2 - 1 - s) * 2 * np.pi / period))
+            second = amplitude * np.power(2, -10 * (t2 - 1)) * np.sin((t2 - 1 - s) * 2 * np.pi / period) * 0.5 + 1
+        eased = np.where(t2 < 1, first, second)
+        return np.where(t == 0, 0.0, np.where(t == 1, 1.0, eased))
+    
+    @staticmethod
+    def _bounce_ease_out_array(t: np.ndarray) -> np.ndarray:
+        t = np.clip(t, 0, 1)
+        return np.select(
+            [t < 1 / 2.75, t < 2 / 2.75, t < 2.5 / 2.75],
+            [
+                7.5625 * t * t,
+                7.5625 * (t - 1.5 / 2.75) ** 2 + 0.75,
+                7.5625 * (t - 2.25 / 2.75) ** 2 + 0.9375,
+            ],
+            7.5625 * (t - 2.625 / 2.75) ** 2 + 0.984375
+        )
+    
+    @staticmethod
+    def _ease_in_out_back_array(t: np.ndarray, overshoot: float = 1.70158) -> np.ndarray:
+        s = overshoot * 1.525
+        t2 = t * 2
+        u = t2 - 2
+        return np.where(
+            t2 < 1,
+            0.5 * (t2 * t2 * ((s + 1) * t2 - s)),
+            0.5 * (u * u * ((s + 1) * u + s) + 2)
+        )
+    
+    @staticmethod
+    def _spring_easing_array(t: np.ndarray, stiffness: float = 100,
+                             damping: float = 10, mass: float = 1) -> np.ndarray:
+        omega = np.sqrt(stiffness / mass)
+        zeta = damping / (2 * np.sqrt(stiffness * mass))
+        
+        if zeta < 1:  # Underdamped
+            wd = omega * np.sqrt(1 - zeta**2)
+            eased = 1 - np.exp(-zeta * omega * t) * (
+                np.cos(wd * t) + (zeta * omega / wd) * np.sin(wd * t)
+            )
+        else:  # Critically damped or overdamped
+            eased = 1 - np.exp(-omega * t) * (1 + omega * t)
+        return np.where(t == 0, 0.0, np.where(t == 1, 1.0, eased))
+    
+    @staticmethod
+    def _there_and_back_array(t: np.ndarray) -> np.ndarray:
+        return EasingLibrary._manim_smooth(np.where(t < 0.5, 2 * t, 2 * (1 - t)))
+    
+    @staticmethod
+    def _there_and_back_with_pause_array(t: np.ndarray, pause_ratio: float = 1/3) -> np.ndarray:
+        smooth = EasingLibrary._manim_smooth
+        pause_start = (1 - pause_ratio) / 2
+        pause_end = (1 + pause_ratio) / 2
+        return np.where(
+            t < pause_start,
+            smooth(t / pause_start),
+            np.where(t < pause_end, 1.0, smooth((1 - t) / (1 - pause_end)))
+        )
+    
+    @staticmethod
+    def _squish_rate_func_array(t: np.ndarray, squish_start: float = 0.25,
+                                squish_end: float = 0.75) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            squished = EasingLibrary._manim_smooth((t - squish_start) / (squish_end - squish_start))
+        return np.where(t < squish_start, 0.0, np.where(t > squish_end, 1.0, squished))
+    
+    @staticmethod
+    def _lingering_array(t: np.ndarray) -> np.ndarray:
+        smooth = EasingLibrary._manim_smooth
+        return np.where(
+            t < 0.2,
+            smooth(t * 2.5) * 0.2,
+            np.where(t < 0.8, 0.2 + 0.6 * ((t - 0.2) / 0.6), 0.8 + 0.2 * smooth((t - 0.8) * 5))
+        )
+    
     @staticmethod
     def _ease_in_out_expo(t: float) -> float:
         """Exponential ease in-out."""
@@ -339,38 +837,8 @@ class EasingLibrary:
     
     @staticmethod
     def _cubic_bezier_easing(t: float, x1: float, y1: float, x2: float, y2: float) -> float:
-        """Calculate cubic bezier easing using our BezierCurve class."""
-        # Create bezier curve with control points
-        # Start at (0, 0), control points at (x1, y1) and (x2, y2), end at (1, 1)
-        control_points = [
-            Vector3D(0, 0, 0),
-            Vector3D(x1, y1, 0),
-            Vector3D(x2, y2, 0),
-            Vector3D(1, 1, 0)
-        ]
-        
-        bezier = BezierCurve(control_points)
-        
-        # For easing, we need to solve for t given x
-        # This is an approximation using binary search
-        epsilon = 0.0001
-        lower = 0.0
-        upper = 1.0
-        
-        for _ in range(10):  # 10 iterations should be enough
-            mid = (lower + upper) / 2
-            point = bezier.evaluate(mid)
-            x = point.x
-            
-            if abs(x - t) < epsilon:
-                return point.y
-            elif x < t:
-                lower = mid
-            else:
-                upper = mid
-        
-        # Return the y value at the found t
-        return bezier.evaluate((lower + upper) / 2).y
+        """Calculate cubic bezier easing with a cached lookup-table solver."""
+        return _cubic_bezier(x1, y1, x2, y2)(t)
     
     @staticmethod
     def _spring_easing(t: float, stiffness: float = 100, 
@@ -449,6 +917,42 @@ class EasingLibrary:
             return 0.8 + 0.2 * EasingLibrary._manim_smooth((t - 0.8) * 5)
 
 
+def _easing_cache_key(easing_type: EasingFunction, params: Optional[Dict]) -> Optional[Tuple]:
+    """Build a hashable key for an easing type and its params, or None if params are unhashable."""
+    if not params:
+        return (easing_type,)
+    try:
+        items = tuple(sorted(
+            (name, tuple(value) if isinstance(value, (list, np.ndarray)) else value)
+            for name, value in params.items()
+        ))
+        hash(items)
+    except TypeError:
+        return None
+    return (easing_type, items)
+
+
+@lru_cache(maxsize=256)
+def _cached_array_easing(key: Tuple) -> Callable[[np.ndarray], np.ndarray]:
+    """Get a shared array easing for a key from _easing_cache_key."""
+    params = dict(key[1]) if len(key) > 1 else None
+    return EasingLibrary._build_array_easing(key[0], params)
+
+
+@lru_cache(maxsize=256)
+def _cached_lut_easing(key: Tuple, resolution: int, interpolation: str) -> LookupTableEasing:
+    """Get a shared lookup-table easing for a key from _easing_cache_key."""
+    return LookupTableEasing(_cached_array_easing(key), resolution, interpolation)
+
+
+def vectorize_easing(func: Callable[[float], float]) -> Callable[[np.ndarray], np.ndarray]:
+    """Wrap a scalar easing function so it accepts an array of t values."""
+    def array_func(t):
+        t = np.asarray(t, dtype=float)
+        return np.fromiter((func(x) for x in t.flat), dtype=float, count=t.size).reshape(t.shape)
+    return array_func
+
+
 class EasingPresets:
     """Predefined easing configurations for common animation patterns."""
     
@@ -563,10 +1067,13 @@ class EasingPresets:
         return getattr(cls, preset_name.upper(), cls.MATERIAL_STANDARD)
     
     @classmethod
-    def create_easing_from_preset(cls, preset_name: str) -> Callable[[float], float]:
-        """Create an easing function from a preset name."""
+    def create_easing_from_preset(cls, preset_name: str,
+                                  lut_resolution: Optional[int] = None,
+                                  lut_interpolation: str = 'linear') -> Callable[[float], float]:
+        """Create an easing function from a preset name, optionally as a shared lookup table."""
         preset = cls.get_preset(preset_name)
-        return EasingLibrary.get_easing_function(preset['type'], preset.get('params'))
+        return EasingLibrary.get_easing_function(preset['type'], preset.get('params'),
+                                                 lut_resolution, lut_interpolation)
 
 
 def interpolate_with_easing(start: float, end: float, t: float, 
@@ -0,0 +1,205 @@
+"""Time-ordered event index for timelines.
+
+Events are kept in a list sorted by time, with a parallel list of times
+for binary search, plus one sorted sub-index per tag. Range queries and
+cursor advances cost O(log n + k) for k matching events. Events can be
+disabled individually through their ``enabled`` flag, or per tag without
+touching the events themselves.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+
+class _SortedEvents:
+    """Events sorted by time; equal times keep insertion order."""
+
+    __slots__ = ('times', 'events')
+
+    def __init__(self):
+        self.times: List[float] = []
+        self.events: List[Any] = []
+
+    def insert(self, event: Any):
+        index = bisect_right(self.times, event.time)
+        self.times.insert(index, event.time)
+        self.events.insert(index, event)
+
+    def extend(self, events: List[Any]):
+        if self.times and events and events[0].time < self.times[-1]:
+            merged = sorted(self.events + events, key=lambda e: e.time)
+            self.events = merged
+            self.times = [event.time for event in merged]
+        else:
+            self.events.extend(events)
+            self.times.extend(event.time for event in events)
+
+    def remove(self, event: Any) -> bool:
+        start = bisect_left(self.times, event.time)
+        end = bisect_right(self.times, event.time)
+        for index in range(start, end):
+            if self.events[index] is event:
+                del self.times[index]
+                del self.events[index]
+                return True
+        return False
+
+    def slice(self, start: float, end: float, include_start: bool = True) -> List[Any]:
+        lo = bisect_left(self.times, start) if include_start else bisect_right(self.times, start)
+        return self.events[lo:bisect_right(self.times, end)]
+
+
+class EventIndex:
+    """Sorted index of timeline events with tag sub-indexes.
+
+    Events must not change time while indexed; remove and re-add them to
+    move them.
+    """
+
+    def __init__(self, events: Optional[Iterable[Any]] = None):
+        self._all = _SortedEvents()
+        self._by_tag: Dict[str, _SortedEvents] = {}
+        # Insertion order, used to order equal-time events merged from several tags
+        self._order: Dict[int, int] = {}
+        self._next_order = 0
+        self.disabled_tags: Set[str] = set()
+        # Bumped whenever the indexed events or disabled tags change
+        self.version = 0
+        if events is not None:
+            self.add_many(events)
+
+    def __len__(self) -> int:
+        return len(self._all.events)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._all.events)
+
+    def add(self, event: Any):
+        """Add an event."""
+        self.version += 1
+        self._all.insert(event)
+        self._order[id(event)] = self._next_order
+        self._next_order += 1
+        for tag in set(event.tags):
+            self._by_tag.setdefault(tag, _SortedEvents()).insert(event)
+
+    def add_many(self, events: Iterable[Any]):
+        """Add many events at once, sorting once instead of per event."""
+        events = sorted(events, key=lambda e: e.time)
+        self.version += 1
+        self._all.extend(events)
+        for event in events:
+            self._order[id(event)] = self._next_order
+            self._next_order += 1
+
+        tagged: Dict[str, List[Any]] = {}
+        for event in events:
+            for tag in set(event.tags):
+                tagged.setdefault(tag, []).append(event)
+        for tag, tag_events in tagged.items():
+            self._by_tag.setdefault(tag, _SortedEvents()).extend(tag_events)
+
+    def remove(self, event: Any) -> bool:
+        """Remove an event, returning whether it was indexed."""
+        if not self._all.remove(event):
+            return False
+        self.version += 1
+        del self._order[id(event)]
+        for tag in set(event.tags):
+            index = self._by_tag.get(tag)
+            if index is not None:
+                index.remove(event)
+                if not index.events:
+                    del self._by_tag[tag]
+        return True
+
+    def clear(self):
+        """Remove all events."""
+        self.version += 1
+        self._all = _SortedEvents()
+        self._by_tag.clear()
+        self._order.clear()
+
+    def set_tag_enabled(self, tag: str, enabled: bool):
+        """Enable or disable every event carrying a tag."""
+        self.version += 1
+        if enabled:
+            self.disabled_tags.discard(tag)
+        else:
+            self.disabled_tags.add(tag)
+
+    def is_active(self, event: Any) -> bool:
+        """Check whether an event is enabled and none of its tags are disabled."""
+        if not event.enabled:
+            return False
+        return not (self.disabled_tags and self.disabled_tags.intersection(event.tags))
+
+    def tags(self) -> List[str]:
+        """Get all tags with at least one event."""
+        return list(self._by_tag)
+
+    def query(self, start: float, end: float, tags: Optional[Iterable[str]] = None,
+              include_start: bool = True, include_disabled: bool = False) -> List[Any]:
+        """Get events with start <= time <= end in time order.
+
+        Args:
+            start: Range start
+            end: Range end (inclusive)
+            tags: Only return events carrying any of these tags
+            include_start: Whether events exactly at start are included
+            include_disabled: Whether to include inactive events
+        """
+        if tags is None:
+            events = self._all.slice(start, end, include_start)
+        else:
+            tag_indexes = [self._by_tag[tag] for tag in set(tags) if tag in self._by_tag]
+            if len(tag_indexes) == 1:
+                events = tag_indexes[0].slice(start, end, include_start)
+            else:
+                # Merge per-tag slices, dropping events found under several tags
+                seen = set()
+                events = []
+                for index in tag_indexes:
+                    for event in index.slice(start, end, include_start):
+                        if id(event) not in seen:
+                            seen.add(id(event))
+                            events.append(event)
+                events.sort(key=lambda e: (e.time, self._order[id(e)]))
+
+        if include_disabled:
+            return list(events)
+        return [event for event in events if self.is_active(event)]
+
+    def cursor(self, start: Optional[float] = None) -> 'EventCursor':
+        """Create a cursor positioned before the events at start (or before all events)."""
+        return EventCursor(self, start)
+
+
+class EventCursor:
+    """Advances through an EventIndex, returning each event once.
+
+    advance(t) returns the active events between the previous position and
+    t. Events added behind the cursor are not returned until it is reset
+    to an earlier time.
+    """
+
+    def __init__(self, index: EventIndex, start: Optional[float] = None):
+        self.index = index
+        self.reset(start)
+
+    def reset(self, time: Optional[float] = None):
+        """Move the cursor so the next advance starts with the events at time."""
+        self.time = float('-inf') if time is None else time
+        self._include_time = True
+
+    def advance(self, time: float) -> List[Any]:
+        """Move the cursor forward to time and return the events passed.
+
+        Moving backwards returns nothing; use reset to rewind.
+        """
+        if time < self.time:
+            return []
+        events = self.index.query(self.time, time, include_start=self._include_time)
+        self.time = time
+        self._include_time = False
+        return events
@@ -1,12 +1,25 @@
 """Layer management utilities for integrating timeline layers with Manim scenes."""
 
-from typing import Dict, List, Any, Optional, Callable
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from manim import Scene, Mobject, VGroup
 from .composer_timeline import ComposerTimeline, TimelineLayer
 
 
 class LayerManager:
-    """Manages the integration between timeline layers and Manim scene rendering."""
+    """Manages the integration between timeline layers and Manim scene rendering.
+    
+    Registered mobjects are ordered by (layer z-index, layer name,
+    registration order). Registering, moving and unregistering mobjects,
+    and changing a layer's z-index, visibility or opacity, only mark the
+    affected mobjects. apply_layer_ordering then moves just those within
+    scene.mobjects and returns immediately when nothing changed.
+    
+    The manager keeps the sorted keys of the mobjects it placed, which
+    sit in that order at the front of scene.mobjects, so a marked
+    mobject is found and reinserted by bisecting those keys. If the scene
+    list was rearranged outside the manager, it is re-sorted once.
+    """
     
     def __init__(self, timeline: ComposerTimeline):
         self.timeline = timeline
@@ -14,10 +27,25 @@ class LayerManager:
         self.layer_groups: Dict[str, VGroup] = {}
         self.update_callbacks: Dict[str, List[Callable]] = {}
         
+        # id(mobject) -> (layer z-index, layer name, registration order)
+        self._order_keys: Dict[int, Tuple[float, str, int]] = {}
+        self._next_order = 0
+        # Mobjects whose place in scene.mobjects must be updated
+        self._dirty: Dict[int, Mobject] = {}
+        # Layer name -> (shown, z_index, opacity, transform) last applied to the scene
+        self._applied_layers: Dict[str, Tuple] = {}
+        # Sorted keys of the mobjects at the front of scene.mobjects, and
+        # id(mobject) -> the key it was placed with
+        self._placed_keys: List[Tuple[float, str, int]] = []
+        self._placed: Dict[int, Tuple[float, str, int]] = {}
+        
     def register_mobject(self, layer_name: str, mobject: Mobject, 
                         tag: Optional[str] = None) -> bool:
         """Register a mobject with a specific layer.
         
+        Registering a mobject again marks it for reordering; registering it
+        with another layer moves it there.
+        
         Args:
             layer_name: Name of the layer
             mobject: The Manim mobject to register
@@ -30,6 +58,12 @@ class LayerManager:
         if not layer:
             return False
         
+        if getattr(mobject, 'layer_name', None) == layer_name and id(mobject) in self._order_keys:
+            mobject.layer_tag = tag
+            self._dirty[id(mobject)] = mobject
+            return True
+        self.unregister_mobject(mobject)
+        
         if layer_name not in self.layer_mobjects:
             self.layer_mobjects[layer_name] = []
             self.layer_groups[layer_name] = VGroup()
@@ -41,6 +75,15 @@ class LayerManager:
         mobject.layer_name = layer_name
         mobject.layer_tag = tag
         
+        self._order_keys[id(mobject)] = (layer.z_index, layer_name, self._next_order)
+        self._next_order += 1
+        self._dirty[id(mobject)] = mobject
+        
+        # Mobjects joining a hidden, faded or transformed layer take on its properties
+        shown = self._is_shown(layer)
+        if not shown or layer.opacity != 1 or self._has_transform(layer):
+            self._apply_layer_properties(layer, [mobject], shown)
+        
         return True
     
     def unregister_mobject(self, mobject: Mobject) -> bool:
@@ -58,52 +101,192 @@ class LayerManager:
                 if mobject in self.layer_mobjects[layer_name]:
                     self.layer_mobjects[layer_name].remove(mobject)
                     self.layer_groups[layer_name].remove(mobject)
+                    self._order_keys.pop(id(mobject), None)
+                    self._dirty[id(mobject)] = mobject
                     return True
         return False
     
+    def mark_dirty(self, *mobjects: Mobject):
+        """Mark mobjects whose place in scene.mobjects changed outside the manager.
+        
+        For example, Scene.add moves an already added mobject to the end.
+        """
+        for mob in mobjects:
+            self._dirty[id(mob)] = mob
+    
     def apply_layer_ordering(self, scene: Scene):
         """Apply layer z-ordering to all registered mobjects in the scene.
         
-        This method removes all mobjects and re-adds them in the proper
-        z-order based on their layer's z_index.
+        Only mobjects marked since the last call are moved: each is deleted
+        from scene.mobjects and inserted at the position found by binary
+        search over the placed keys. Registered mobjects of hidden layers
+        are left out, and unregistered mobjects stay after all registered ones.
         
         Args:
             scene: The Manim scene to reorder
         """
-        # Get all current mobjects
-        all_mobjects = list(scene.mobjects)
+        self._sync_layers()
+        if not self._dirty:
+            return
         
-        # Build ordered list based on layers
-        ordered_mobjects = []
+        dirty, self._dirty = self._dirty, {}
+        if not self._move_dirty(scene.mobjects, dirty):
+            self._reorder_all(scene, dirty)
+    
+    def _placed_at(self, mobjects: List[Mobject], index: int) -> bool:
+        """Check that scene.mobjects[index] is the mobject placed with the index-th key."""
+        return (index < len(mobjects)
+                and self._placed.get(id(mobjects[index])) == self._placed_keys[index])
+    
+    def _move_dirty(self, mobjects: List[Mobject], dirty: Dict[int, Mobject]) -> bool:
+        """Move the dirty mobjects within scene.mobjects in place.
         
-        for layer in self.timeline.get_layers_ordered():
-            if layer.name in self.layer_mobjects:
-                # Apply layer properties
-                for mob in self.layer_mobjects[layer.name]:
-                    # Apply visibility
+        Returns:
+            bool: False, without changing anything, if scene.mobjects no
+                longer starts with the placed mobjects in order
+        """
+        count = len(self._placed_keys)
+        if count and not (self._placed_at(mobjects, 0) and self._placed_at(mobjects, count - 1)):
+            return False
+        removals = []
+        for mob_id, mob in dirty.items():
+            key = self._placed.get(mob_id)
+            if key is not None:
+                index = bisect_left(self._placed_keys, key)
+                if index >= len(mobjects) or mobjects[index] is not mob:
+                    return False
+                removals.append(index)
+        
+        # Delete from the back so earlier indices stay valid
+        in_scene = set()
+        for index in sorted(removals, reverse=True):
+            mob = mobjects.pop(index)
+            del self._placed_keys[index]
+            del self._placed[id(mob)]
+            in_scene.add(id(mob))
+        
+        shown = {layer.name for layer in self.timeline.layers if self._is_shown(layer)}
+        placed = []
+        unregistered = []
+        for mob_id, mob in dirty.items():
+            if mob_id not in in_scene:
+                # Mobjects the manager did not place can only be after the placed ones
+                try:
+                    del mobjects[mobjects.index(mob, len(self._placed_keys))]
+                    in_scene.add(mob_id)
+                except ValueError:
+                    pass
+            key = self._order_keys.get(mob_id)
+            if key is not None:
+                if key[1] in shown:
+                    placed.append((key, mob))
+            elif mob_id in in_scene:
+                unregistered.append(mob)
+        
+        placed.sort(key=lambda item: item[0])
+        for key, mob in placed:
+            index = bisect_left(self._placed_keys, key)
+            mobjects.insert(index, mob)
+            self._placed_keys.insert(index, key)
+            self._placed[id(mob)] = key
+        mobjects.extend(unregistered)
+        return True
+    
+    def _reorder_all(self, scene: Scene, dirty: Dict[int, Mobject]):
+        """Sort all registered mobjects in the scene and rebuild the placed keys."""
+        shown = {layer.name for layer in self.timeline.layers if self._is_shown(layer)}
+        in_scene = set()
+        placed = []
+        others = []
+        for mob in scene.mobjects:
+            in_scene.add(id(mob))
+            key = self._order_keys.get(id(mob))
+            if key is None:
+                others.append(mob)
+            elif key[1] in shown:
+                placed.append((key, mob))
+        for mob_id, mob in dirty.items():
+            key = self._order_keys.get(mob_id)
+            if mob_id not in in_scene and key is not None and key[1] in shown:
+                placed.append((key, mob))
+        
+        placed.sort(key=lambda item: item[0])
+        scene.mobjects[:] = [mob for _, mob in placed] + others
+        self._placed_keys = [key for key, _ in placed]
+        self._placed = {id(mob): key for key, mob in placed}
+    
+    def _is_shown(self, layer: TimelineLayer) -> bool:
+        """Check whether a layer is visible and not hidden by another layer's solo."""
+        if not layer.visible:
+            return False
+        return layer.solo or not any(other.solo for other in self.timeline.layers)
+    
+    @staticmethod
+    def _has_transform(layer: TimelineLayer) -> bool:
+        transform = layer.transform or {}
+        return (transform.get('x', 0) != 0 or transform.get('y', 0) != 0
+                or transform.get('scale', 1) != 1 or transform.get('rotation', 0) != 0)
+    
+    def _sync_layers(self):
+        """Mark the mobjects of layers whose z-index, visibility or properties changed."""
+        solo = any(layer.solo for layer in self.timeline.layers)
+        for layer in self.timeline.layers:
+            shown = layer.visible and (layer.solo or not solo)
+            transform = tuple(sorted((layer.transform or {}).items()))
+            state = (shown, layer.z_index, layer.opacity, transform)
+            previous = self._applied_layers.get(layer.name)
+            if previous == state:
+                continue
+            self._applied_layers[layer.name] = state
+            
+            mobjects = self.layer_mobjects.get(layer.name, [])
+            if previous is None or not mobjects:
+                continue
+            
+            if previous[1] != layer.z_index:
+                for mob in mobjects:
+                    _, name, order = self._order_keys[id(mob)]
+                    self._order_keys[id(mob)] = (layer.z_index, name, order)
+            if previous[:2] != state[:2]:
+                self.mark_dirty(*mobjects)
+            if previous[0] != shown or previous[2] != layer.opacity:
+                for mob in mobjects:
                     if hasattr(mob, 'set_opacity'):
-                        mob.set_opacity(layer.opacity if layer.visible else 0)
-                    
-                    # Apply transform if supported
-                    if layer.transform and hasattr(mob, 'shift') and hasattr(mob, 'scale'):
-                        if layer.transform.get('x', 0) != 0 or layer.transform.get('y', 0) != 0:
-                            mob.shift([layer.transform['x'], layer.transform['y'], 0])
-                        if layer.transform.get('scale', 1) != 1:
-                            mob.scale(layer.transform['scale'])
-                        if layer.transform.get('rotation', 0) != 0:
-                            mob.rotate(layer.transform['rotation'])
-                
-                if layer.visible:
-                    ordered_mobjects.extend(self.layer_mobjects[layer.name])
-        
-        # Add any unregistered mobjects at the end
-        for mob in all_mobjects:
-            if not hasattr(mob, 'layer_name'):
-                ordered_mobjects.append(mob)
+                        mob.set_opacity(layer.opacity if shown else 0)
+            if previous[3] != transform:
+                self._apply_layer_properties(layer, mobjects, shown, opacity=False,
+                                            applied=dict(previous[3]))
+    
+    def _apply_layer_properties(self, layer: TimelineLayer, mobjects: List[Mobject],
+                                shown: bool, opacity: bool = True,
+                                applied: Optional[Dict[str, float]] = None):
+        """Apply a layer's opacity and transform to mobjects.
         
-        # Clear and re-add in order
-        scene.remove(*all_mobjects)
-        scene.add(*ordered_mobjects)
+        Args:
+            applied: Layer transform already applied to the mobjects; only
+                the difference from it is applied
+        """
+        transform = layer.transform or {}
+        applied = applied or {}
+        dx = transform.get('x', 0) - applied.get('x', 0)
+        dy = transform.get('y', 0) - applied.get('y', 0)
+        applied_scale = applied.get('scale', 1)
+        scale = transform.get('scale', 1) / applied_scale if applied_scale else transform.get('scale', 1)
+        rotation = transform.get('rotation', 0) - applied.get('rotation', 0)
+        
+        for mob in mobjects:
+            # Apply visibility
+            if opacity and hasattr(mob, 'set_opacity'):
+                mob.set_opacity(layer.opacity if shown else 0)
+            
+            # Apply transform if supported
+            if hasattr(mob, 'shift') and hasattr(mob, 'scale'):
+                if dx != 0 or dy != 0:
+                    mob.shift([dx, dy, 0])
+                if scale != 1:
+                    mob.scale(scale)
+                if rotation != 0:
+                    mob.rotate(rotation)
     
     def create_layer_scene_wrapper(self, scene_class):
         """Create a scene wrapper that automatically handles layer ordering.
@@ -128,7 +311,10 @@ class LayerManager:
                 if layer:
                     for mob in mobjects:
                         self.layer_manager.register_mobject(layer, mob)
-                    self.layer_manager.apply_layer_ordering(self)
+                else:
+                    # Scene.add moves mobjects that were already added to the end
+                    self.layer_manager.mark_dirty(*mobjects)
+                self.layer_manager.apply_layer_ordering(self)
             
             def remove(self, *mobjects):
                 """Override remove to unregister from layers."""
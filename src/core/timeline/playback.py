@@ -0,0 +1,268 @@
+"""Frame-accurate playback of ComposerTimeline keyframes onto mobjects.
+
+A TimelinePlayer binds track properties to mobjects and registers a single
+scene-level updater. Each frame it advances the timeline, fires events and
+applies every bound property in one pass. Bound curves are sampled once
+over the whole frame grid, so frames that land on the grid only index
+into precomputed arrays; other times fall back to per-curve lookup.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .composer_timeline import ComposerTimeline, PropertyCurve, TimelineTrack
+
+PropertyApplier = Callable[[Any, Any, Dict[str, Any]], None]
+
+
+def _apply_position(mobject: Any, value: Any, state: Dict[str, Any]):
+    mobject.move_to(np.asarray(value, dtype=float))
+
+
+def _apply_axis(axis: int) -> PropertyApplier:
+    setters = ('set_x', 'set_y', 'set_z')
+
+    def apply(mobject: Any, value: Any, state: Dict[str, Any]):
+        getattr(mobject, setters[axis])(value)
+    return apply
+
+
+def _apply_opacity(mobject: Any, value: Any, state: Dict[str, Any]):
+    mobject.set_opacity(value * state.get('layer_opacity', 1.0))
+
+
+def _apply_color(mobject: Any, value: Any, state: Dict[str, Any]):
+    mobject.set_color(value)
+
+
+# Smallest scale applied; scaling by 0 collapses a mobject's points for good
+_MIN_SCALE = 1e-6
+
+
+def _apply_scale(mobject: Any, value: Any, state: Dict[str, Any]):
+    # Mobjects only scale relatively; the scale at bind time counts as 1
+    value = max(value, _MIN_SCALE)
+    previous = state.get('scale', 1.0)
+    if value != previous:
+        mobject.scale(value / previous)
+        state['scale'] = value
+
+
+def _apply_rotation(mobject: Any, value: Any, state: Dict[str, Any]):
+    previous = state.get('rotation', 0.0)
+    if value != previous:
+        mobject.rotate(value - previous)
+        state['rotation'] = value
+
+
+@dataclass
+class PropertyBinding:
+    """A track property driving one mobject."""
+    layer_name: str
+    track_name: str
+    property_name: str
+    mobject: Any
+    apply: PropertyApplier
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+class TimelinePlayer:
+    """Plays a ComposerTimeline onto bound mobjects from one scene updater.
+
+    Layer visibility and solo hide a layer's bound mobjects (opacity 0)
+    and skip evaluating its properties; layer opacity scales each
+    mobject's opacity. Disabled tracks are skipped.
+    """
+
+    # Appliers by property name, called as apply(mobject, value, state)
+    PROPERTY_APPLIERS: Dict[str, PropertyApplier] = {
+        'position': _apply_position,
+        'x': _apply_axis(0),
+        'y': _apply_axis(1),
+        'z': _apply_axis(2),
+        'opacity': _apply_opacity,
+        'color': _apply_color,
+        'scale': _apply_scale,
+        'rotation': _apply_rotation,
+    }
+
+    def __init__(self, timeline: ComposerTimeline, fps: Optional[float] = None):
+        """
+        Initialize the player.
+
+        Args:
+            timeline: Timeline to play
+            fps: Frame rate of the sample grid (defaults to the timeline's fps)
+        """
+        self.timeline = timeline
+        self.fps = fps or timeline.fps
+        self.time = 0.0
+        self.bindings: List[PropertyBinding] = []
+        self.scene = None
+
+        # (layer, track, property) -> (curve the samples came from, samples)
+        self._frame_samples: Dict[Tuple[str, str, str], Tuple[PropertyCurve, int, Any]] = {}
+        # id(mobject) -> layer opacity last applied to a mobject
+        self._layer_opacity: Dict[int, float] = {}
+
+    def bind(self, layer_name: str, track_name: str, property_name: str, mobject: Any,
+             apply: Optional[PropertyApplier] = None) -> PropertyBinding:
+        """Drive a mobject from a track property.
+
+        Args:
+            layer_name: Name of the layer
+            track_name: Name of the track
+            property_name: Keyframed property to read
+            mobject: Mobject to update
+            apply: Callable (mobject, value, state); defaults to the applier
+                registered for property_name
+
+        Returns:
+            The created binding
+        """
+        if apply is None:
+            if property_name not in self.PROPERTY_APPLIERS:
+                raise ValueError(f"No applier for property '{property_name}'; pass apply=")
+            apply = self.PROPERTY_APPLIERS[property_name]
+
+        binding = PropertyBinding(layer_name, track_name, property_name, mobject, apply)
+        self.bindings.append(binding)
+        return binding
+
+    def unbind(self, mobject: Any) -> int:
+        """Remove every binding of a mobject, returning how many were removed."""
+        count = len(self.bindings)
+        self.bindings = [b for b in self.bindings if b.mobject is not mobject]
+        self._layer_opacity.pop(id(mobject), None)
+        return count - len(self.bindings)
+
+    def attach(self, scene):
+        """Register the player as a scene updater and apply the current frame."""
+        self.detach()
+        self.scene = scene
+        self.prepare()
+        self.apply(self.time)
+        scene.add_updater(self.update)
+
+    def detach(self):
+        """Remove the scene updater."""
+        if self.scene is not None:
+            self.scene.remove_updater(self.update)
+            self.scene = None
+
+    def prepare(self):
+        """Sample every bound curve over the frame grid.
+
+        Called on attach; curves edited later are resampled on the next frame.
+        """
+        for binding in self.bindings:
+            self._get_samples(binding)
+
+    def update(self, dt: float):
+        """Scene updater: advance by dt and apply the new frame."""
+        self.seek(self.time + dt * self.timeline.playback_speed)
+
+    def seek(self, time: float):
+        """Move to a time, firing events and applying properties."""
+        timeline = self.timeline
+        if timeline.loop_enabled and timeline.loop_end > timeline.loop_start and time >= timeline.loop_end:
+            time = timeline.loop_start + (time - timeline.loop_start) % (timeline.loop_end - timeline.loop_start)
+        time = max(0.0, min(time, timeline.duration))
+
+        self.time = time
+        timeline.advance(self.scene, time)
+        self.apply(time)
+
+    def apply(self, time: float):
+        """Evaluate all bound properties at a time and apply them."""
+        layer_states = self._layer_states()
+        frame = time * self.fps
+        frame_index = int(round(frame))
+        on_grid = abs(frame - frame_index) < 1e-6
+
+        values: Dict[Tuple[str, str, str], Any] = {}
+        opacity_bound = set()
+        for binding in self.bindings:
+            layer_opacity, track = layer_states.get((binding.layer_name, binding.track_name), (1.0, None))
+            binding.state['layer_opacity'] = layer_opacity
+            if binding.property_name == 'opacity':
+                opacity_bound.add(id(binding.mobject))
+            if track is None:
+                continue
+
+            key = (binding.layer_name, binding.track_name, binding.property_name)
+            if key not in values:
+                values[key] = self._value_at(binding, track, time, frame_index if on_grid else None)
+            if values[key] is not None:
+                binding.apply(binding.mobject, values[key], binding.state)
+
+        self._apply_layer_opacity(opacity_bound)
+
+    def _layer_states(self) -> Dict[Tuple[str, str], Tuple[float, Optional[TimelineTrack]]]:
+        """Get (layer opacity, track or None if muted) for every track."""
+        layers = self.timeline.layers
+        solo = any(layer.solo for layer in layers)
+        states = {}
+        for layer in layers:
+            active = layer.visible and (layer.solo or not solo)
+            opacity = layer.opacity if active else 0.0
+            for track in layer.tracks:
+                states[(layer.name, track.name)] = (opacity, track if active and track.enabled else None)
+        return states
+
+    def _apply_layer_opacity(self, opacity_bound: set):
+        """Apply layer opacity to mobjects whose opacity is not keyframed."""
+        seen = set()
+        for binding in self.bindings:
+            mobject_id = id(binding.mobject)
+            if mobject_id in seen:
+                continue
+            seen.add(mobject_id)
+
+            layer_opacity = binding.state['layer_opacity']
+            if self._layer_opacity.get(mobject_id, 1.0) != layer_opacity:
+                # Keyframed opacity already includes the layer opacity unless hidden
+                if mobject_id not in opacity_bound or layer_opacity == 0.0:
+                    binding.mobject.set_opacity(layer_opacity)
+                self._layer_opacity[mobject_id] = layer_opacity
+
+    def _value_at(self, binding: PropertyBinding, track: TimelineTrack,
+                  time: float, frame_index: Optional[int]) -> Any:
+        """Get a property value, from the frame samples when the time is on the grid."""
+        samples = self._get_samples(binding, track)
+        if samples is None:
+            return None
+        curve, frame_count, sampled = samples
+        if frame_index is not None and frame_index < frame_count:
+            return curve.value_from_sample(sampled, frame_index)
+        return curve.value_at(time)
+
+    def _frame_count(self) -> int:
+        return int(round(self.timeline.duration * self.fps)) + 1
+
+    def _get_samples(self, binding: PropertyBinding,
+                     track: Optional[TimelineTrack] = None) -> Optional[Tuple[PropertyCurve, int, Any]]:
+        """Get (curve, frame count, samples) for a bound property.
+
+        Edited curves and a changed timeline duration are resampled.
+        """
+        if track is None:
+            layer = self.timeline.get_layer(binding.layer_name)
+            track = layer.get_track(binding.track_name) if layer else None
+            if track is None:
+                return None
+
+        curve = track.get_curve(binding.property_name)
+        if curve is None:
+            return None
+
+        key = (binding.layer_name, binding.track_name, binding.property_name)
+        frame_count = self._frame_count()
+        cached = self._frame_samples.get(key)
+        if cached is None or cached[0] is not curve or cached[1] != frame_count:
+            times = np.arange(frame_count) / self.fps
+            cached = (curve, frame_count, curve.sample(times))
+            self._frame_samples[key] = cached
+        return cached
@@ -20,7 +20,88 @@ from manim import (
 )
 
 # Import our custom easing system
-from .easing import EasingFunction, EasingLibrary, EasingPresets
+from .easing import EasingFunction, EasingLibrary, EasingPresets, vectorize_easing
+
+
+# Array versions of the Manim rate functions above, following Manim's
+# formulas including the unit_interval (clamp outside [0, 1]) and zero
+# (0 outside [0, 1]) decorators.
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1 + np.exp(-x))
+
+
+def _unit_interval(t: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return np.where(t < 0, 0.0, np.where(t > 1, 1.0, values))
+
+
+def _zero(t: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return np.where((t >= 0) & (t <= 1), values, 0.0)
+
+
+def _smooth_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    error = _sigmoid(-inflection / 2)
+    values = np.clip((_sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+    return _unit_interval(t, values)
+
+
+def _linear_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _unit_interval(t, t)
+
+
+def _double_smooth_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    values = np.where(t < 0.5, 0.5 * _smooth_array(2 * t), 0.5 * (1 + _smooth_array(2 * t - 1)))
+    return _unit_interval(t, values)
+
+
+def _there_and_back_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _zero(t, _smooth_array(np.where(t < 0.5, 2 * t, 2 * (1 - t)), inflection))
+
+
+def _there_and_back_with_pause_array(t: np.ndarray, pause_ratio: float = 1.0 / 3) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    a = 1.0 / pause_ratio
+    values = np.where(
+        t < 0.5 - pause_ratio / 2,
+        _smooth_array(a * t),
+        np.where(t < 0.5 + pause_ratio / 2, 1.0, _smooth_array(a - a * t))
+    )
+    return _zero(t, values)
+
+
+def _rush_into_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _unit_interval(t, 2 * _smooth_array(t / 2.0, inflection))
+
+
+def _rush_from_array(t: np.ndarray, inflection: float = 10.0) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _unit_interval(t, 2 * _smooth_array(t / 2.0 + 0.5, inflection) - 1)
+
+
+def _slow_into_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    u = np.clip(t, 0, 1)
+    return _unit_interval(t, np.sqrt(1 - (1 - u) * (1 - u)))
+
+
+def _wiggle_array(t: np.ndarray, wiggles: float = 2) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _zero(t, _there_and_back_array(t) * np.sin(wiggles * np.pi * t))
+
+
+def _lingering_array(t: np.ndarray) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return np.clip(t / 0.8, 0, 1)
+
+
+def _exponential_decay_array(t: np.ndarray, half_life: float = 0.1) -> np.ndarray:
+    t = np.asarray(t, dtype=float)
+    return _unit_interval(t, 1 - np.exp(-t / half_life))
 
 
 class RateFunctionSource(Enum):
@@ -66,6 +147,23 @@ class UnifiedRateFunction:
         'exponential_decay': exponential_decay,
     }
     
+    # Array versions of Manim functions, keyed by the Manim function.
+    # not_quite_there and squish_rate_func are factories, so they and any
+    # other callables are applied element by element.
+    MANIM_ARRAY_FUNCTIONS: Dict[Callable[[float], float], Callable[[np.ndarray], np.ndarray]] = {
+        linear: _linear_array,
+        smooth: _smooth_array,
+        double_smooth: _double_smooth_array,
+        there_and_back: _there_and_back_array,
+        there_and_back_with_pause: _there_and_back_with_pause_array,
+        rush_into: _rush_into_array,
+        rush_from: _rush_from_array,
+        slow_into: _slow_into_array,
+        wiggle: _wiggle_array,
+        lingering: _lingering_array,
+        exponential_decay: _exponential_decay_array,
+    }
+    
     # Aliases for common alternative names
     ALIASES: Dict[str, str] = {
         'ease': 'smooth',
@@ -129,6 +227,33 @@ class UnifiedRateFunction:
         # Default to linear
         return linear
     
+    @classmethod
+    def get_array(cls,
+                  rate_func: Union[str, EasingFunction, Callable[[float], float]],
+                  params: Optional[Dict[str, Any]] = None) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Get a rate function that maps an array of t values to eased values.
+        
+        Accepts the same inputs as get(). Manim functions, EasingFunction
+        values and presets use NumPy kernels; other callables are applied
+        element by element.
+        """
+        if isinstance(rate_func, str):
+            rate_func_name = cls.ALIASES.get(rate_func.lower(), rate_func)
+            if rate_func_name not in cls.MANIM_FUNCTIONS:
+                if rate_func_name.upper() in EasingFunction.__members__:
+                    rate_func = EasingFunction[rate_func_name.upper()]
+                elif isinstance(getattr(EasingPresets, rate_func_name.upper(), None), dict):
+                    preset = EasingPresets.get_preset(rate_func_name)
+                    return EasingLibrary.get_array_easing_function(preset['type'], preset.get('params'))
+        
+        if isinstance(rate_func, EasingFunction):
+            return EasingLibrary.get_array_easing_function(rate_func, params)
+        
+        func = cls.get(rate_func, params)
+        array_func = cls.MANIM_ARRAY_FUNCTIONS.get(func)
+        return array_func if array_func is not None else vectorize_easing(func)
+    
     @classmethod
     def get_source(cls, rate_func: Union[str, EasingFunction, Callable]) -> RateFunctionSource:
         """Identify the source of a rate function."""
@@ -246,6 +371,12 @@ def get_rate_function(rate_func: Union[str, EasingFunction, Callable],
     return UnifiedRateFunction.get(rate_func, params)
 
 
+def get_array_rate_function(rate_func: Union[str, EasingFunction, Callable],
+                            params: Optional[Dict[str, Any]] = None) -> Callable[[np.ndarray], np.ndarray]:
+    """Convenience function to get an array rate function."""
+    return UnifiedRateFunction.get_array(rate_func, params)
+
+
 def compose_rate_functions(*rate_funcs, weights=None) -> Callable[[float], float]:
     """Convenience function to compose rate functions."""
     return UnifiedRateFunction.create_composed_rate_function(*rate_funcs, weights=weights)
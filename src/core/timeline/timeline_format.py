@@ -0,0 +1,198 @@
+"""Columnar binary storage for ComposerTimeline.
+
+A timeline is saved as an uncompressed ``.npz`` archive. The ``header``
+entry holds the JSON interchange schema without keyframes (see
+ComposerTimeline.to_dict), extended with a ``properties`` list per track.
+Each keyframed property is stored as columns:
+
+- ``<key>_time``: float64 keyframe times
+- ``<key>_easing``: uint8 index into the header's ``interpolations`` list
+- ``<key>_value``: int64 or float64 values of shape (N,) for numbers and
+  (N, D) for equal-length numeric vectors, or UTF-8 JSON bytes of the value
+  list for anything else (colors, dicts, strings)
+
+Only keyframe time, value and interpolation are stored, matching the JSON
+format. Archive members are read on demand, so loading lazily only parses
+the header; each track reads its columns the first time its keyframes are
+accessed.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from .composer_timeline import ComposerTimeline, InterpolationType, Keyframe, TimelineTrack
+
+FORMAT_VERSION = 1
+
+_INTERPOLATIONS = list(InterpolationType)
+_INTERPOLATION_CODES = {interpolation: code for code, interpolation in enumerate(_INTERPOLATIONS)}
+
+
+class LazyTimelineTrack(TimelineTrack):
+    """A track whose keyframes are read from storage on first access."""
+
+    def __init__(self, name: str, track_type, enabled: bool,
+                 loader: Callable[[], Dict[str, List[Keyframe]]]):
+        super().__init__(name, track_type, enabled)
+        self._loader = loader
+
+    @property
+    def keyframes(self) -> Dict[str, List[Keyframe]]:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            self._keyframes = loader()
+        return self._keyframes
+
+    @keyframes.setter
+    def keyframes(self, value: Dict[str, List[Keyframe]]):
+        self._loader = None
+        self._keyframes = value
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the keyframes have been read."""
+        return self._loader is None
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
+
+
+def _is_real(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+
+
+def _encode_values(values: List[Any]) -> Tuple[str, np.ndarray]:
+    """Pack keyframe values into an array, returning (kind, array)."""
+    if all(_is_real(v) for v in values):
+        dtype = np.int64 if all(_is_int(v) for v in values) else np.float64
+        return 'scalar', np.array(values, dtype=dtype)
+
+    sequence_types = (list, tuple, np.ndarray)
+    if (all(isinstance(v, sequence_types) for v in values)
+            and len({len(v) for v in values}) == 1 and len(values[0]) > 0
+            and all(_is_real(x) for v in values for x in v)):
+        dtype = np.int64 if all(_is_int(x) for v in values for x in v) else np.float64
+        return 'vector', np.array([list(v) for v in values], dtype=dtype)
+
+    encoded = json.dumps(values).encode('utf-8')
+    return 'json', np.frombuffer(encoded, dtype=np.uint8)
+
+
+def _decode_values(kind: str, array: np.ndarray) -> List[Any]:
+    """Unpack keyframe values written by _encode_values."""
+    if kind == 'json':
+        return json.loads(array.tobytes().decode('utf-8'))
+    return array.tolist()
+
+
+def save_timeline(timeline: ComposerTimeline, filepath: Union[str, Path]):
+    """Save a timeline in the columnar binary format.
+
+    Args:
+        timeline: Timeline to save
+        filepath: Destination path; numpy appends ``.npz`` if missing
+    """
+    header = timeline.to_dict(include_keyframes=False)
+    header['format_version'] = FORMAT_VERSION
+    header['interpolations'] = [interpolation.value for interpolation in _INTERPOLATIONS]
+
+    columns: Dict[str, np.ndarray] = {}
+    for layer_index, (layer, layer_data) in enumerate(zip(timeline.layers, header['layers'])):
+        for track_index, (track, track_data) in enumerate(zip(layer.tracks, layer_data['tracks'])):
+            track_data['properties'] = []
+            for property_index, (property_name, keyframes) in enumerate(track.keyframes.items()):
+                if not keyframes:
+                    continue
+                key = f"l{layer_index}_t{track_index}_p{property_index}"
+                kind, values = _encode_values([kf.value for kf in keyframes])
+                columns[f"{key}_time"] = np.array([kf.time for kf in keyframes], dtype=np.float64)
+                columns[f"{key}_easing"] = np.array(
+                    [_INTERPOLATION_CODES[kf.interpolation] for kf in keyframes], dtype=np.uint8
+                )
+                columns[f"{key}_value"] = values
+                track_data['properties'].append({
+                    "name": property_name,
+                    "key": key,
+                    "kind": kind,
+                    "count": len(keyframes)
+                })
+
+    columns['header'] = np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8)
+    np.savez(filepath, **columns)
+
+
+def _read_keyframes(archive, properties: List[Dict[str, Any]],
+                    interpolations: List[InterpolationType]) -> Dict[str, List[Keyframe]]:
+    """Build a track's keyframe lists from its stored columns."""
+    keyframes = {}
+    for prop in properties:
+        key = prop['key']
+        times = archive[f"{key}_time"].tolist()
+        easings = [interpolations[code] for code in archive[f"{key}_easing"].tolist()]
+        values = _decode_values(prop['kind'], archive[f"{key}_value"])
+        # Columns were written in time order, so no insertion search is needed
+        keyframes[prop['name']] = [
+            Keyframe(time, value, interpolation)
+            for time, value, interpolation in zip(times, values, easings)
+        ]
+    return keyframes
+
+
+def load_timeline(timeline: ComposerTimeline, filepath: Union[str, Path],
+                  lazy: bool = True) -> ComposerTimeline:
+    """Replace a timeline's contents with a file saved by save_timeline.
+
+    Args:
+        timeline: Timeline to load into
+        filepath: Path of the ``.npz`` file
+        lazy: Read each track's keyframes on first access. The file stays
+            open until every track has been read.
+
+    Returns:
+        The timeline
+    """
+    archive = np.load(filepath, allow_pickle=False)
+
+    header = json.loads(archive['header'].tobytes().decode('utf-8'))
+    version = header.get('format_version')
+    if version != FORMAT_VERSION:
+        archive.close()
+        raise ValueError(f"Unsupported timeline format version: {version}")
+    interpolations = [InterpolationType(value) for value in header['interpolations']]
+
+    # from_dict inserts layers by z-index but returns them in header order;
+    # names are not unique, so pair them with the header by position
+    layers = timeline.from_dict(header)
+    # Tracks still to be read; the last one closes the archive
+    pending = [0]
+    for layer_data, layer in zip(header['layers'], layers):
+        for track_index, track_data in enumerate(layer_data['tracks']):
+            track = layer.tracks[track_index]
+            properties = track_data.get('properties', [])
+            if lazy:
+                track = LazyTimelineTrack(track.name, track.track_type, track.enabled,
+                                          _track_loader(archive, properties, interpolations, pending))
+                layer.tracks[track_index] = track
+                pending[0] += 1
+            else:
+                track.keyframes = _read_keyframes(archive, properties, interpolations)
+
+    if not pending[0]:
+        archive.close()
+    return timeline
+
+
+def _track_loader(archive, properties: List[Dict[str, Any]], interpolations: List[InterpolationType],
+                  pending: List[int]) -> Callable[[], Dict[str, List[Keyframe]]]:
+    """Create a loader that closes the archive once the last pending track is read."""
+    def load() -> Dict[str, List[Keyframe]]:
+        keyframes = _read_keyframes(archive, properties, interpolations)
+        pending[0] -= 1
+        if not pending[0]:
+            archive.close()
+        return keyframes
+    return load
@@ -5,13 +5,13 @@ This module provides a comprehensive transformation pipeline that manages
 the flow of coordinates through various transformation stages.
 """
 
-from typing import List, Optional, Dict, Any, Callable, Tuple
+from manim import *
+from typing import List, Optional, Dict, Any, Callable, Tuple, Union
 import numpy as np
 from dataclasses import dataclass, field
 from enum import Enum
-from manim import *
 from .vector_space import VectorSpace, CoordinateSystem, Vector3D
-from ..utils.math3d import Matrix4x4
+from ..utils.math3d import Matrix4x4, Matrix4x4Stack, Vector3DArray
 
 
 class TransformStage(Enum):
@@ -167,13 +167,14 @@ class TransformPipeline:
         self.transform_cache[cache_key] = matrix
         return matrix
     
-    def transform_point(self, point: Vector3D, node_name: str, 
-                       from_stage: TransformStage, to_stage: TransformStage) -> Vector3D:
-        """Transform a point between pipeline stages for a specific node."""
-        if from_stage == to_stage:
-            return point
+    def get_relative_transform(self, node_name: str, from_stage: TransformStage,
+                               to_stage: TransformStage) -> Matrix4x4:
+        """Get the matrix taking a node's points from one pipeline stage to another."""
+        cache_key = (node_name, from_stage, to_stage)
+        if cache_key in self.transform_cache:
+            self.stats['cache_hits'] += 1
+            return self.transform_cache[cache_key]
         
-        # Get transformation matrices
         from_matrix = self.get_transform_matrix(node_name, from_stage)
         to_matrix = self.get_transform_matrix(node_name, to_stage)
         
@@ -183,26 +184,70 @@ class TransformPipeline:
         else:  # Inverse transform
             transform = from_matrix.inverse() * to_matrix
         
-        return transform.transform_point(point)
+        self.transform_cache[cache_key] = transform
+        return transform
     
-    def transform_points_batch(self, points: List[Vector3D], node_name: str,
-                             from_stage: TransformStage, to_stage: TransformStage) -> List[Vector3D]:
-        """Efficiently transform multiple points."""
+    def transform_point(self, point: Vector3D, node_name: str, 
+                       from_stage: TransformStage, to_stage: TransformStage) -> Vector3D:
+        """Transform a point between pipeline stages for a specific node."""
         if from_stage == to_stage:
-            return points
+            return point
         
-        # Get transformation matrix once
-        from_matrix = self.get_transform_matrix(node_name, from_stage)
-        to_matrix = self.get_transform_matrix(node_name, to_stage)
+        transform = self.get_relative_transform(node_name, from_stage, to_stage)
+        return transform.transform_point(point)
+    
+    def transform_points_batch(self, points: Union[List[Vector3D], Vector3DArray, np.ndarray],
+                             node_name: str, from_stage: TransformStage, to_stage: TransformStage,
+                             out: Optional[np.ndarray] = None
+                             ) -> Union[List[Vector3D], Vector3DArray, np.ndarray]:
+        """Efficiently transform multiple points.
+        
+        Raw (N, 3) arrays are transformed in one pass without creating
+        per-point objects and return an (N, 3) array, written into out if
+        given. Lists of Vector3D and Vector3DArrays return the same type.
+        """
+        if isinstance(points, np.ndarray):
+            if from_stage == to_stage:
+                if out is None:
+                    return points
+                out[...] = points
+                return out
+            transform = self.get_relative_transform(node_name, from_stage, to_stage)
+            return transform.transform_points_array(points, out=out)
         
-        if from_stage.value < to_stage.value:
-            transform = to_matrix * from_matrix.inverse()
-        else:
-            transform = from_matrix.inverse() * to_matrix
+        if from_stage == to_stage:
+            return points
         
         # Use batch transformation
+        transform = self.get_relative_transform(node_name, from_stage, to_stage)
         return transform.transform_points(points)
     
+    def transform_points_nodes(self, points: np.ndarray, node_names: List[str],
+                               from_stage: TransformStage, to_stage: TransformStage,
+                               out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform one (N, 3) point cloud for several nodes at once.
+        
+        Args:
+            points: (N, 3) points shared by all nodes, or (K, N, 3) with one
+                point set per node
+            node_names: K node names
+            out: Optional (K, N, 3) result buffer
+        
+        Returns:
+            (K, N, 3) array of transformed points, in node order
+        """
+        stack = self.get_transform_stack(node_names, from_stage, to_stage)
+        return stack.transform_points(points, out=out)
+    
+    def get_transform_stack(self, node_names: List[str], from_stage: TransformStage,
+                            to_stage: TransformStage) -> Matrix4x4Stack:
+        """Get the relative stage transforms of several nodes as a Matrix4x4Stack."""
+        if from_stage == to_stage:
+            return Matrix4x4Stack.identity(len(node_names))
+        return Matrix4x4Stack([
+            self.get_relative_transform(name, from_stage, to_stage) for name in node_names
+        ])
+    
     def _clear_cache(self):
         """Clear the transformation cache."""
         self.transform_cache.clear()
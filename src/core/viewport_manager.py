@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from enum import Enum
 from manim import *
 from .vector_space import VectorSpace, CoordinateSystem, ViewportConfig, Vector3D
-from ..utils.math3d import Matrix4x4
+from ..utils.math3d import Matrix4x4, Matrix4x4Stack
 
 
 class ViewportMode(Enum):
@@ -59,6 +59,8 @@ class Frustum:
     
     def __init__(self, projection_matrix: Matrix4x4, view_matrix: Matrix4x4):
         self.planes = self._extract_frustum_planes(projection_matrix * view_matrix)
+        # (6, 4) plane coefficients for the batched tests
+        self.plane_array = np.array([[n.x, n.y, n.z, d] for n, d in self.planes])
     
     def _extract_frustum_planes(self, mvp: Matrix4x4) -> List[Tuple[Vector3D, float]]:
         """Extract frustum planes from MVP matrix."""
@@ -151,6 +153,22 @@ class Frustum:
             if normal.dot(p) + d < 0:
                 return False
         return True
+    
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        """Check which of an (N, 3) array of points are inside the frustum."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        distances = points @ self.plane_array[:, :3].T + self.plane_array[:, 3]
+        return np.all(distances >= 0, axis=1)
+    
+    def contains_boxes(self, min_points: np.ndarray, max_points: np.ndarray) -> np.ndarray:
+        """Check which of N axis-aligned boxes, given as (N, 3) corners, intersect the frustum."""
+        min_points = np.asarray(min_points, dtype=np.float64).reshape(-1, 3)
+        max_points = np.asarray(max_points, dtype=np.float64).reshape(-1, 3)
+        normals = self.plane_array[:, :3]
+        # For every box and plane, the vertex farthest along the plane normal
+        farthest = np.where(normals[None, :, :] > 0, max_points[:, None, :], min_points[:, None, :])
+        distances = np.einsum('npj,pj->np', farthest, normals) + self.plane_array[:, 3]
+        return np.all(distances >= 0, axis=1)
 
 
 class ViewportManager:
@@ -369,20 +387,74 @@ class ViewportManager:
         if not frustum:
             return objects
         
-        visible_objects = []
-        for obj in objects:
-            # Get bounding box
+        if not objects:
+            return []
+        
+        # Objects without a bounding box are tested as a point at their center
+        min_points = np.empty((len(objects), 3))
+        max_points = np.empty((len(objects), 3))
+        for i, obj in enumerate(objects):
             if hasattr(obj, 'get_bounding_box'):
                 bbox = obj.get_bounding_box()
-                min_point = Vector3D(*bbox[0])
-                max_point = Vector3D(*bbox[1])
-                
-                if frustum.contains_box(min_point, max_point):
-                    visible_objects.append(obj)
+                min_points[i], max_points[i] = bbox[0], bbox[1]
             else:
-                # Simple point check for objects without bounding box
-                center = Vector3D(*obj.get_center())
-                if frustum.contains_point(center):
-                    visible_objects.append(obj)
+                min_points[i] = max_points[i] = obj.get_center()
+        
+        visible = frustum.contains_boxes(min_points, max_points)
+        return [obj for obj, shown in zip(objects, visible) if shown]
+    
+    def get_screen_matrix(self, viewport_name: str = None) -> Optional[Matrix4x4]:
+        """Get the matrix taking world points to a viewport's pixel coordinates.
+        
+        NDC x and y map onto the viewport's pixel rectangle (y pointing down)
+        and NDC z is kept as depth.
+        """
+        viewport_name = viewport_name or self.active_viewport
+        viewport = self.viewports.get(viewport_name) if viewport_name else None
+        if viewport is None:
+            return None
+        
+        if viewport.camera_position:
+            self.setup_viewport_camera(viewport_name,
+                                     viewport.camera_position,
+                                     viewport.camera_target or Vector3D(0, 0, 0))
+        context = self.vector_space.transform_context
+        
+        ndc_to_pixels = Matrix4x4(np.array([
+            [viewport.width / 2, 0, 0, viewport.x + viewport.width / 2],
+            [0, -viewport.height / 2, 0, viewport.y + viewport.height / 2],
+            [0, 0, 1, 0],
+            [0, 0, 0, 1]
+        ]))
+        return ndc_to_pixels * context.projection_matrix * context.view_matrix
+    
+    def project_points(self, points: np.ndarray, viewport_name: str = None,
+                       out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Project an (N, 3) array of world points to a viewport's pixels.
+        
+        Args:
+            points: (N, 3) float64 or float32 world points
+            viewport_name: Viewport to project into (defaults to the active one)
+            out: Optional (N, 3) result buffer
+        
+        Returns:
+            (N, 3) array of pixel x, pixel y and NDC depth, or None if the
+            viewport does not exist
+        """
+        matrix = self.get_screen_matrix(viewport_name)
+        if matrix is None:
+            return None
+        return matrix.transform_points_array(points, out=out)
+    
+    def project_points_all(self, points: np.ndarray) -> Dict[str, np.ndarray]:
+        """Project an (N, 3) array of world points into every active viewport at once.
         
-        return visible_objects
\ No newline at end of file
+        Returns:
+            Viewport name -> (N, 3) array of pixel x, pixel y and NDC depth
+        """
+        names = [name for name, viewport in self.viewports.items() if viewport.active]
+        if not names:
+            return {}
+        stack = Matrix4x4Stack([self.get_screen_matrix(name) for name in names])
+        projected = stack.transform_points(points)
+        return dict(zip(names, projected))
@@ -1,12 +1,344 @@
 """Command-line interface for Manim Studio."""
 
 import argparse
+import os
+import shutil
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from manim import *
+from manim.utils.file_ops import add_extension_if_not_present
 from src.core import Config, SceneBuilder
 from src.core.yaml_validator import validate_yaml_file
-from src.core.cache import configure_cache
+from src.core.cache import configure_cache, get_cache, SceneCache
+from src.core.config import SceneConfig
+
+
+def _load_scene_config(scene_config_loader: Config, scene_name: str) -> SceneConfig:
+    """Get a scene's configuration from a multi-scene or single-scene config."""
+    if scene_name in scene_config_loader.list_scenes():
+        return scene_config_loader.get_scene_config(scene_name)
+    
+    # Single scene configuration (entire config is the scene)
+    # Check if config has 'scene' key (single scene format)
+    if 'scene' in scene_config_loader.data:
+        return SceneConfig.from_dict(scene_config_loader.data['scene'])
+    # Assume entire config is the scene
+    return SceneConfig.from_dict(scene_config_loader.data)
+
+
+def _runs_render_hooks(scene_config: SceneConfig) -> bool:
+    """Check whether rendering a scene extracts or analyzes frames.
+    
+    Those hooks run during the render itself, so such scenes bypass the
+    render cache.
+    """
+    extraction = scene_config.frame_extraction
+    return bool(extraction and extraction.get('enabled', False))
+
+
+def _movie_output_path(scene_name: str) -> Path:
+    """Get the path Manim's file writer gives a scene's movie under the current config."""
+    module_name = config.get_dir("input_file").stem if config["input_file"] else ""
+    if config["output_file"] and not config["write_all"]:
+        output_name = config.get_dir("output_file")
+    else:
+        output_name = Path(scene_name)
+    
+    movie_dir = config.get_dir("video_dir", module_name=module_name, scene_name=scene_name)
+    return movie_dir / add_extension_if_not_present(output_name, config["movie_file_extension"])
+
+
+def _render_or_reuse(
+    SceneClass: type,
+    scene_cache: SceneCache,
+    render_key: str,
+    lookup: bool,
+    store: bool,
+    metadata: Dict[str, Any]
+) -> Tuple[Optional[Path], Optional[Scene]]:
+    """Render a scene, or copy an identical cached render to where it would be written.
+    
+    Manim must already be configured for the render.
+    
+    Args:
+        lookup: Whether an earlier render may be reused
+        store: Whether a new render is added to the cache
+    
+    Returns:
+        (movie path, rendered scene); the scene is None on a cache hit
+    """
+    if lookup:
+        cached_path = scene_cache.get_render(render_key)
+        if cached_path:
+            output_path = _movie_output_path(SceneClass.__name__)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(cached_path, output_path)
+            return output_path, None
+    
+    scene = SceneClass()
+    scene.render()
+    
+    # Store the render for identical future runs
+    movie_path = scene.renderer.file_writer.movie_file_path
+    if not movie_path or not Path(movie_path).exists():
+        return None, scene
+    if store:
+        scene_cache.cache_render(render_key, Path(movie_path), metadata=metadata)
+    return Path(movie_path), scene
+
+
+def _render_scene_job(config_path: str, scene_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Render one scene in an isolated Manim config (runs in a worker process)."""
+    result = {
+        'scene': scene_name,
+        'wall_time': 0.0,
+        'frames': None,
+        'output': None,
+        'cached': False,
+        'error': None
+    }
+    start = time.perf_counter()
+    
+    try:
+        configure_cache(**options['cache_config'])
+        scene_config_loader = Config(config_path)
+        scene_config = _load_scene_config(scene_config_loader, scene_name)
+        
+        builder = SceneBuilder.from_config_file(config_path)
+        builder.incremental = not options['no_cache']
+        
+        frame_rate = options['fps'] or scene_config.fps
+        scene_cache = SceneCache(get_cache())
+        render_key = builder.get_render_cache_key(scene_config, options['quality'], frame_rate)
+        
+        cached_path = None
+        if not options['no_cache'] and not options['force_render'] and not _runs_render_hooks(scene_config):
+            cached_path = scene_cache.get_render(render_key)
+        
+        if cached_path:
+            result['output'] = str(cached_path)
+            result['cached'] = True
+        else:
+            # Each scene gets its own media dir so partial movies never collide
+            media_dir = Path(options['media_dir']) / scene_name
+            with tempconfig({
+                "quality": options['quality'] + "_quality",
+                "preview": False,
+                "write_to_movie": True,
+                "save_last_frame": False,
+                "media_dir": str(media_dir),
+                "frame_rate": frame_rate,
+            }):
+                SceneClass = builder.build_scene(scene_config)
+                scene = SceneClass()
+                scene.render()
+                
+                result['frames'] = int(round(scene.renderer.time * config.frame_rate))
+                movie_path = scene.renderer.file_writer.movie_file_path
+            
+            if movie_path and Path(movie_path).exists():
+                result['output'] = str(movie_path)
+                if not options['no_cache']:
+                    scene_cache.cache_render(
+                        render_key,
+                        Path(movie_path),
+                        metadata={'scene': scene_name, 'quality': options['quality']}
+                    )
+    except Exception as e:
+        result['error'] = str(e)
+    
+    result['wall_time'] = time.perf_counter() - start
+    return result
+
+
+def _render_window_job(
+    config_path: str,
+    scene_name: str,
+    index: int,
+    window: Tuple[float, float],
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Render one time window of a scene (runs in a worker process)."""
+    start = time.perf_counter()
+    
+    configure_cache(**options['cache_config'])
+    scene_config = _load_scene_config(Config(config_path), scene_name)
+    builder = SceneBuilder.from_config_file(config_path)
+    builder.incremental = not options['no_cache']
+    
+    # Each slice gets its own media dir so partial movies never collide
+    media_dir = _slice_media_dir(options['media_dir'], scene_name, index)
+    with tempconfig({
+        "quality": options['quality'] + "_quality",
+        "preview": False,
+        "write_to_movie": True,
+        "save_last_frame": False,
+        "media_dir": str(media_dir),
+        "frame_rate": options['fps'] or scene_config.fps,
+        "output_file": f"{scene_name}_slice{index:03d}",
+    }):
+        SceneClass = builder.build_scene(scene_config, render_window=window)
+        scene = SceneClass()
+        scene.render()
+        movie_path = scene.renderer.file_writer.movie_file_path
+    
+    return {
+        'index': index,
+        'output': str(movie_path) if movie_path and Path(movie_path).exists() else None,
+        'media_dir': str(media_dir),
+        'wall_time': time.perf_counter() - start
+    }
+
+
+def _slice_media_dir(media_dir: str, scene_name: str, index: int) -> Path:
+    """Get the media dir of one time slice, removed once the slices are joined."""
+    return Path(media_dir) / "slices" / f"{scene_name}_{index:03d}"
+
+
+def _concat_movies(movie_paths: List[str], output_path: Path) -> None:
+    """Concatenate movies losslessly with the ffmpeg concat demuxer."""
+    file_list = output_path.with_suffix('.txt')
+    with open(file_list, 'w', encoding='utf-8') as f:
+        for movie_path in movie_paths:
+            f.write(f"file 'file:{Path(movie_path).resolve().as_posix()}'\n")
+    
+    try:
+        subprocess.run(
+            [
+                config.ffmpeg_executable, "-y",
+                "-f", "concat", "-safe", "0", "-i", str(file_list),
+                "-loglevel", "error", "-nostdin",
+                "-c", "copy",
+                str(output_path)
+            ],
+            check=True
+        )
+    finally:
+        file_list.unlink()
+
+
+def _render_time_sliced(config_path: Path, scene_name: str, args) -> int:
+    """Render one scene as parallel time windows and return the exit code."""
+    scene_config = _load_scene_config(Config(config_path), scene_name)
+    windows = SceneBuilder().plan_time_windows(scene_config, args.slices)
+    
+    cache_config = {'enabled': not args.no_cache}
+    if args.cache_dir:
+        cache_config['cache_dir'] = args.cache_dir
+    options = {
+        'quality': args.quality,
+        'fps': args.fps,
+        'no_cache': args.no_cache,
+        'cache_config': cache_config,
+        'media_dir': "user-data",
+    }
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(windows)))
+    
+    print(f"Rendering scene {scene_name} as {len(windows)} time slices with {jobs} workers")
+    start = time.perf_counter()
+    
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_render_window_job, str(config_path), scene_name, i, window, options)
+                for i, window in enumerate(windows)
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except Exception as e:
+                print(f"Error rendering time slice: {e}")
+                return 1
+        
+        parts = [r['output'] for r in results if r['output']]
+        if not parts:
+            print("Error: no time slices were rendered")
+            return 1
+        
+        if args.output:
+            output_path = Path(args.output)
+        else:
+            # Mirror the first slice's videos/... layout under the shared media dir
+            first = next(r for r in results if r['output'])
+            relative = Path(first['output']).resolve().parent.relative_to(Path(first['media_dir']).resolve())
+            output_path = Path(options['media_dir']) / relative / f"{scene_name}.mp4"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _concat_movies(parts, output_path)
+    finally:
+        for i in range(len(windows)):
+            shutil.rmtree(_slice_media_dir(options['media_dir'], scene_name, i), ignore_errors=True)
+    
+    for r in results:
+        window_start, window_end = windows[r['index']]
+        end_label = "end" if window_end == float('inf') else f"{window_end:.2f}s"
+        print(f"  slice {r['index']}: {window_start:.2f}s - {end_label} ({r['wall_time']:.1f}s)")
+    print(f"Rendered in {time.perf_counter() - start:.1f}s: {output_path}")
+    return 0
+
+
+def _print_render_summary(results: List[Dict[str, Any]], total_time: float) -> None:
+    """Print a table of per-scene render results."""
+    name_width = max([len("Scene")] + [len(r['scene']) for r in results])
+    
+    print("\n" + "="*60)
+    print("⏺ Batch Render Summary")
+    print("="*60)
+    print(f"  {'Scene':<{name_width}}  {'Time':>8}  {'Frames':>7}  Output")
+    for r in results:
+        if r['error']:
+            frames, output = "-", f"FAILED: {r['error']}"
+        elif r['cached']:
+            frames, output = "cached", r['output']
+        else:
+            frames = str(r['frames']) if r['frames'] is not None else "-"
+            output = r['output'] or "-"
+        print(f"  {r['scene']:<{name_width}}  {r['wall_time']:>7.1f}s  {frames:>7}  {output}")
+    
+    failed = sum(1 for r in results if r['error'])
+    print(f"\n  ⎿ {len(results) - failed}/{len(results)} scenes rendered in {total_time:.1f}s")
+    print("="*60 + "\n")
+
+
+def _render_all_scenes(config_path: Path, scene_names: List[str], args) -> int:
+    """Render every scene across a process pool and return the exit code."""
+    cache_config = {'enabled': not args.no_cache}
+    if args.cache_dir:
+        cache_config['cache_dir'] = args.cache_dir
+    
+    options = {
+        'quality': args.quality,
+        'fps': args.fps,
+        'no_cache': args.no_cache,
+        'force_render': args.force_render,
+        'cache_config': cache_config,
+        'media_dir': "user-data",
+    }
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(scene_names)))
+    
+    print(f"Rendering {len(scene_names)} scenes with {jobs} workers")
+    start = time.perf_counter()
+    results = []
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(_render_scene_job, str(config_path), name, options): name
+            for name in scene_names
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            status = "failed" if result['error'] else "done"
+            print(f"  {result['scene']}: {status} ({result['wall_time']:.1f}s)")
+            results.append(result)
+    
+    # Report in config order rather than completion order
+    order = {name: i for i, name in enumerate(scene_names)}
+    results.sort(key=lambda r: order[r['scene']])
+    _print_render_summary(results, time.perf_counter() - start)
+    
+    return 1 if any(r['error'] for r in results) else 0
 
 
 def main():
@@ -39,6 +371,24 @@ Frame Extraction:
         help="Name of scene to render (if config contains multiple scenes)"
     )
     
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Render every scene in the config file"
+    )
+    
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Number of worker processes for --all and --slices (default: CPU count)"
+    )
+    
+    parser.add_argument(
+        "--slices",
+        type=int,
+        help="Render a single scene as N parallel time slices at animation-group boundaries"
+    )
+    
     parser.add_argument(
         "-q", "--quality",
         choices=["l", "m", "h", "p", "k"],
@@ -80,6 +430,12 @@ Frame Extraction:
         help="Clear cache before rendering"
     )
     
+    parser.add_argument(
+        "--force-render",
+        action="store_true",
+        help="Re-render even if an identical render is cached"
+    )
+    
     parser.add_argument(
         "--validate-only",
         action="store_true",
@@ -168,6 +524,19 @@ Frame Extraction:
         print(f"Error loading configuration: {e}")
         sys.exit(1)
     
+    # Render every scene in parallel
+    if args.all:
+        if args.output or args.preview:
+            print("Error: --output and --preview cannot be combined with --all")
+            sys.exit(1)
+        scene_names = scene_config_loader.list_scenes()
+        if not scene_names:
+            if 'scene' in scene_config_loader.data:
+                scene_names = [scene_config_loader.data['scene'].get('name', 'Scene')]
+            else:
+                scene_names = [scene_config_loader.get('name', 'Scene')]
+        sys.exit(_render_all_scenes(config_path, scene_names, args))
+    
     # Get scene configuration
     if args.scene:
         scene_name = args.scene
@@ -184,23 +553,17 @@ Frame Extraction:
         else:
             scene_name = scenes[0]
     
+    # Render one long scene as parallel time slices
+    if args.slices and args.slices > 1:
+        sys.exit(_render_time_sliced(config_path, scene_name, args))
+    
     # Build the scene
     builder = SceneBuilder.from_config_file(str(config_path))
+    builder.incremental = not args.no_cache
     
     try:
-        if scene_name in scene_config_loader.list_scenes():
-            scene_config = scene_config_loader.get_scene_config(scene_name)
-            SceneClass = builder.build_scene(scene_config)
-        else:
-            # Single scene configuration (entire config is the scene)
-            from src.core.config import SceneConfig
-            # Check if config has 'scene' key (single scene format)
-            if 'scene' in scene_config_loader.data:
-                scene_config = SceneConfig.from_dict(scene_config_loader.data['scene'])
-            else:
-                # Assume entire config is the scene
-                scene_config = SceneConfig.from_dict(scene_config_loader.data)
-            SceneClass = builder.build_scene(scene_config)
+        scene_config = _load_scene_config(scene_config_loader, scene_name)
+        SceneClass = builder.build_scene(scene_config)
     except Exception as e:
         print(f"Error building scene: {e}")
         sys.exit(1)
@@ -227,10 +590,32 @@ Frame Extraction:
     for key, value in manim_config.items():
         setattr(config, key, value)
     
-    # Render the scene
+    # Reuse an identical earlier render, written where a render would go
+    scene_cache = SceneCache(get_cache())
+    render_key = builder.get_render_cache_key(
+        scene_config, args.quality, manim_config.get("frame_rate")
+    )
+    lookup = not args.no_cache and not args.force_render and not _runs_render_hooks(scene_config)
+    
     print(f"Rendering scene: {scene_name}")
-    scene = SceneClass()
-    scene.render()
+    movie_path, scene = _render_or_reuse(
+        SceneClass, scene_cache, render_key, lookup, not args.no_cache,
+        metadata={'scene': scene_name, 'quality': args.quality}
+    )
+    if scene is None:
+        print(f"Using cached render for scene: {scene_name}")
+        print(f"Output: {movie_path}")
+        if args.preview:
+            from manim.utils.file_ops import open_file
+            open_file(movie_path)
+        return
+    
+    if args.verbose:
+        stats = get_cache().get_stats()
+        print(f"Render cache: {stats['render_hits']} hits, {stats['render_misses']} misses")
+        if hasattr(scene.renderer, 'segment_hits'):
+            print(f"Segment cache: {scene.renderer.segment_hits} reused, "
+                  f"{scene.renderer.segment_misses} rendered")
     
     print("Rendering complete!")
 
@@ -7,7 +7,7 @@
 
 # Import 3D math utilities from the math3d package
 from .math3d import (
-    Vector3D, Matrix4x4, SpatialUtils,
+    Vector3D, Vector3DArray, Matrix4x4, Matrix4x4Stack, SpatialUtils,
     lerp_3d, slerp_3d, dot_product, cross_product,
     distance_between, angle_between_vectors, reflect_vector, project_vector,
     create_transform_matrix, create_trs_matrix, create_view_matrix, create_projection_matrix,
@@ -26,7 +26,7 @@ __all__ = [
     # 'FrameAnalyzer', 'FrameAnalysisResult', 'analyze_video_frames',
     
     # 3D Math - Core classes
-    'Vector3D', 'Matrix4x4', 'SpatialUtils',
+    'Vector3D', 'Vector3DArray', 'Matrix4x4', 'Matrix4x4Stack', 'SpatialUtils',
     
     # 3D Math - Vector operations
     'lerp_3d', 'slerp_3d', 'dot_product', 'cross_product',
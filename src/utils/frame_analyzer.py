@@ -7,8 +7,10 @@ visual reports for debugging and quality assessment.
 
 import cv2
 import numpy as np
+import queue
+import threading
 from pathlib import Path
-from typing import List, Dict, Union, Optional, Tuple
+from typing import Any, Iterable, List, Dict, Union, Optional, Tuple
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.backends.backend_pdf import PdfPages
@@ -34,6 +36,25 @@ class FrameAnalysisResult:
     issues: List[str]
 
 
+@dataclass
+class FrameBatchAnalysis:
+    """Columnar results from batch frame analysis, one array entry per frame."""
+    timestamps: np.ndarray
+    brightness: np.ndarray
+    contrast: np.ndarray
+    sharpness: np.ndarray
+    motion_score: np.ndarray
+    quality_score: np.ndarray
+    issues: Dict[str, np.ndarray]  # Issue name -> boolean mask
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+        
+    def frame_issues(self, index: int) -> List[str]:
+        """Get the issue names flagged for one frame."""
+        return [name for name, mask in self.issues.items() if mask[index]]
+
+
 class FrameAnalyzer:
     """Analyze extracted frames for quality and content."""
     
@@ -60,13 +81,44 @@ class FrameAnalyzer:
         if frame is None:
             raise ValueError(f"Failed to read frame: {frame_path}")
             
+        result = self.analyze_array(frame, timestamp, str(frame_path), self.prev_frame)
+        
+        # Store current frame for motion analysis
+        self.prev_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        
+        return result
+        
+    def analyze_array(
+        self,
+        frame: np.ndarray,
+        timestamp: float = 0.0,
+        frame_path: str = "",
+        prev_frame: Optional[np.ndarray] = None
+    ) -> FrameAnalysisResult:
+        """Analyze a decoded frame.
+        
+        Unlike analyze_frame, this does not read or update the analyzer's
+        previous-frame state, so it is safe to call from several threads.
+        
+        Args:
+            frame: BGR frame array
+            timestamp: Timestamp of the frame in the video
+            frame_path: Path or label recorded in the result
+            prev_frame: Previous frame (BGR or grayscale) for motion scoring
+            
+        Returns:
+            Analysis results
+        """
+        if prev_frame is not None and prev_frame.ndim == 3:
+            prev_frame = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
+            
         # Perform analysis
         brightness = self._calculate_brightness(frame)
         contrast = self._calculate_contrast(frame)
         sharpness = self._calculate_sharpness(frame)
         dominant_colors = self._get_dominant_colors(frame)
         objects_detected = self._detect_objects(frame)
-        motion_score = self._calculate_motion_score(frame)
+        motion_score = self._calculate_motion_score(frame, prev_frame)
         
         # Check for issues
         issues = self._detect_issues(frame, brightness, contrast, sharpness)
@@ -76,11 +128,8 @@ class FrameAnalyzer:
             brightness, contrast, sharpness, issues
         )
         
-        # Store current frame for motion analysis
-        self.prev_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
         return FrameAnalysisResult(
-            frame_path=str(frame_path),
+            frame_path=frame_path,
             timestamp=timestamp,
             brightness=brightness,
             contrast=contrast,
@@ -123,6 +172,98 @@ class FrameAnalyzer:
                 
         return results
         
+    def analyze_batch(
+        self,
+        frames: np.ndarray,
+        timestamps: Optional[np.ndarray] = None,
+        downscale: int = 1,
+        prev_frame: Optional[np.ndarray] = None,
+        chunk_size: int = 32
+    ) -> FrameBatchAnalysis:
+        """Compute scalar metrics for a stack of frames with array operations.
+        
+        Brightness, contrast, sharpness and motion scores match
+        analyze_frame. Compression artifact and
+        object detection are per-frame image operations and are skipped, so
+        quality scores only account for the vectorizable issue checks.
+        
+        Args:
+            frames: uint8 BGR frames with shape (N, H, W, 3)
+            timestamps: Timestamps of the frames; defaults to frame indices
+            downscale: Integer factor to block-average frames by before
+                analysis. Proxies are much cheaper, but sharpness is measured
+                at the proxy resolution.
+            prev_frame: Frame preceding the batch, for the first motion score
+            chunk_size: Number of frames processed at a time
+            
+        Returns:
+            Columnar analysis results
+        """
+        frames = np.asarray(frames)
+        if frames.ndim != 4 or frames.shape[-1] != 3 or frames.dtype != np.uint8:
+            raise ValueError(f"Expected uint8 frames with shape (N, H, W, 3), got {frames.dtype} {frames.shape}")
+            
+        num_frames = len(frames)
+        brightness = np.empty(num_frames)
+        contrast = np.empty(num_frames)
+        sharpness = np.empty(num_frames)
+        motion = np.zeros(num_frames)
+        channel_mean = np.empty(num_frames)
+        
+        prev_gray = None
+        if prev_frame is not None:
+            prev_gray = self._batch_grayscale(self._batch_proxy(prev_frame[None], downscale))[0]
+            
+        for start in range(0, num_frames, max(1, chunk_size)):
+            chunk = self._batch_proxy(frames[start:start + chunk_size], downscale)
+            gray = self._batch_grayscale(chunk)
+            end = start + len(chunk)
+            
+            gray_mean, gray_std = self._batch_moments(gray)
+            _, laplacian_std = self._batch_moments(self._batch_laplacian(gray))
+            
+            brightness[start:end] = gray_mean / 255.0
+            contrast[start:end] = gray_std / 255.0
+            sharpness[start:end] = laplacian_std ** 2 / 1000.0
+            channel_mean[start:end] = self._batch_moments(chunk)[0]
+            
+            # Motion against the preceding frame, carried across chunks
+            if prev_gray is not None and prev_gray.shape == gray.shape[1:]:
+                motion[start] = cv2.mean(cv2.absdiff(gray[0], prev_gray))[0] / 255.0
+            if len(gray) > 1:
+                h, w = gray.shape[1:]
+                diff = cv2.absdiff(gray[1:].reshape(-1, w), gray[:-1].reshape(-1, w))
+                motion[start + 1:end] = self._batch_moments(diff.reshape(-1, h, w))[0] / 255.0
+            prev_gray = gray[-1]
+            
+        issues = {
+            "Too dark": brightness < 0.1,
+            "Too bright": brightness > 0.9,
+            "Low contrast": contrast < 0.1,
+            "Blurry": sharpness < 5.0,
+            "Black frame": channel_mean < 10
+        }
+        issue_count = sum(mask.astype(int) for mask in issues.values())
+        
+        # Same scoring as _calculate_quality_score
+        quality = 100.0 - np.abs(brightness - 0.5) * 2 * 20
+        quality -= np.where(contrast < 0.2, (0.2 - contrast) * 100, 0.0)
+        quality -= np.where(sharpness < 10, (10 - sharpness) * 2, 0.0)
+        quality -= issue_count * 10
+        
+        if timestamps is None:
+            timestamps = np.arange(num_frames, dtype=float)
+            
+        return FrameBatchAnalysis(
+            timestamps=np.asarray(timestamps, dtype=float),
+            brightness=brightness,
+            contrast=contrast,
+            sharpness=sharpness,
+            motion_score=motion,
+            quality_score=np.clip(quality, 0, 100),
+            issues=issues
+        )
+        
     def generate_analysis_report(
         self,
         results: List[FrameAnalysisResult],
@@ -170,6 +311,48 @@ class FrameAnalyzer:
         laplacian = cv2.Laplacian(gray, cv2.CV_64F)
         return np.var(laplacian) / 1000.0  # Normalize
         
+    # The batch helpers run OpenCV kernels on a chunk stacked into one tall
+    # image of shape (N*H, W), so each operation is a single native call.
+    # Only the per-frame moments loop in Python, over views of the stack.
+    
+    @staticmethod
+    def _batch_proxy(frames: np.ndarray, downscale: int) -> np.ndarray:
+        """Block-average a stack of frames by an integer factor."""
+        if downscale <= 1:
+            return frames
+        n, h, w, c = frames.shape
+        h, w = h - h % downscale, w - w % downscale
+        stacked = np.ascontiguousarray(frames[:, :h, :w]).reshape(n * h, w, c)
+        # With an integer factor, INTER_AREA averages blocks that never span two frames
+        proxy = cv2.resize(stacked, (w // downscale, n * h // downscale), interpolation=cv2.INTER_AREA)
+        return proxy.reshape(n, h // downscale, w // downscale, c)
+        
+    @staticmethod
+    def _batch_grayscale(frames: np.ndarray) -> np.ndarray:
+        """Convert a stack of BGR frames to uint8 grayscale."""
+        n, h, w, c = frames.shape
+        stacked = np.ascontiguousarray(frames).reshape(n * h, w, c)
+        return cv2.cvtColor(stacked, cv2.COLOR_BGR2GRAY).reshape(n, h, w)
+        
+    @staticmethod
+    def _batch_laplacian(gray: np.ndarray) -> np.ndarray:
+        """Apply cv2.Laplacian to each frame of a grayscale stack."""
+        n, h, w = gray.shape
+        # Exact in int16 for uint8 input, and cheaper than float output
+        laplacian = cv2.Laplacian(gray.reshape(n * h, w), cv2.CV_16S).reshape(n, h, w)
+        if n > 1 and h > 1:
+            # Rows at frame boundaries saw the neighbouring frame instead of
+            # the reflected border row; swap in the reflected row
+            laplacian[1:, 0] += gray[1:, 1].astype(np.int16) - gray[:-1, -1]
+            laplacian[:-1, -1] += gray[:-1, -2].astype(np.int16) - gray[1:, 0]
+        return laplacian
+        
+    @staticmethod
+    def _batch_moments(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the per-frame mean and standard deviation over all pixels and channels."""
+        flat = frames.reshape(len(frames), -1)
+        return flat.mean(axis=1, dtype=np.float64), flat.std(axis=1, dtype=np.float64)
+        
     def _get_dominant_colors(self, frame: np.ndarray, n_colors: int = 5) -> List[Tuple[int, int, int]]:
         """Get dominant colors in frame."""
         # Reshape frame to list of pixels
@@ -221,19 +404,19 @@ class FrameAnalyzer:
         
         return len(significant_contours)
         
-    def _calculate_motion_score(self, frame: np.ndarray) -> float:
-        """Calculate motion score compared to previous frame."""
-        if self.prev_frame is None:
+    def _calculate_motion_score(self, frame: np.ndarray, prev_frame: Optional[np.ndarray]) -> float:
+        """Calculate motion score compared to the previous grayscale frame."""
+        if prev_frame is None:
             return 0.0
             
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         
         # Ensure frames have same dimensions
-        if gray.shape != self.prev_frame.shape:
+        if gray.shape != prev_frame.shape:
             return 0.0
             
         # Calculate difference
-        diff = cv2.absdiff(self.prev_frame, gray)
+        diff = cv2.absdiff(prev_frame, gray)
         motion_score = np.mean(diff) / 255.0
         
         return motion_score
@@ -508,6 +691,144 @@ Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
         plt.close(fig)
 
 
+class FrameAnalysisPipeline:
+    """Analyze a stream of decoded frames on a pool of worker threads.
+    
+    A producer thread pulls frames from the source (typically
+    FrameExtractor.iter_frames) into a bounded work queue, so decoding
+    blocks when the workers fall behind. Each work item carries the
+    previous frame of the stream, which keeps motion scores identical to
+    sequential analysis no matter which worker picks the item up.
+    """
+    
+    def __init__(
+        self,
+        analyzer: Optional[FrameAnalyzer] = None,
+        num_workers: int = 4,
+        queue_size: int = 16,
+        thumbnail_dir: Optional[Union[str, Path]] = None,
+        thumbnail_width: int = 320,
+        prefix: str = "frame"
+    ):
+        """Initialize the pipeline.
+        
+        Args:
+            analyzer: Analyzer used by the workers
+            num_workers: Number of analysis threads
+            queue_size: Maximum number of frames waiting for a worker
+            thumbnail_dir: Directory to save thumbnails in; nothing is
+                written to disk when this is None
+            thumbnail_width: Width of saved thumbnails in pixels
+            prefix: Prefix for thumbnail filenames
+        """
+        self.analyzer = analyzer or FrameAnalyzer()
+        self.num_workers = max(1, num_workers)
+        self.queue_size = max(1, queue_size)
+        self.thumbnail_dir = Path(thumbnail_dir) if thumbnail_dir else None
+        self.thumbnail_width = thumbnail_width
+        self.prefix = prefix
+        
+    def run(
+        self,
+        frames: Iterable[Dict[str, Any]],
+        source: str = ""
+    ) -> List[FrameAnalysisResult]:
+        """Analyze every frame from the source.
+        
+        Args:
+            frames: Iterable of dicts with "frame", "frame_number" and
+                "timestamp", as yielded by FrameExtractor.iter_frames
+            source: Video path used to label results without thumbnails
+            
+        Returns:
+            Analysis results in stream order
+        """
+        if self.thumbnail_dir:
+            self.thumbnail_dir.mkdir(parents=True, exist_ok=True)
+            
+        work_queue = queue.Queue(maxsize=self.queue_size)
+        result_queue = queue.Queue(maxsize=self.queue_size)
+        producer_error = []
+        
+        def produce():
+            prev_frame = None
+            try:
+                for index, sample in enumerate(frames):
+                    work_queue.put((index, sample, prev_frame))
+                    prev_frame = sample["frame"]
+            except Exception as e:
+                producer_error.append(e)
+            finally:
+                for _ in range(self.num_workers):
+                    work_queue.put(None)
+                    
+        def work():
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    result_queue.put(None)
+                    return
+                index, sample, prev_frame = item
+                try:
+                    result = self._analyze_item(index, sample, prev_frame, source)
+                except Exception as e:
+                    logger.error(f"Failed to analyze frame {sample['frame_number']}: {e}")
+                    result = None
+                result_queue.put((index, result))
+                
+        threads = [threading.Thread(target=produce, daemon=True)]
+        threads += [threading.Thread(target=work, daemon=True) for _ in range(self.num_workers)]
+        for thread in threads:
+            thread.start()
+            
+        results = {}
+        finished_workers = 0
+        while finished_workers < self.num_workers:
+            item = result_queue.get()
+            if item is None:
+                finished_workers += 1
+            elif item[1] is not None:
+                results[item[0]] = item[1]
+                
+        for thread in threads:
+            thread.join()
+            
+        if producer_error:
+            raise producer_error[0]
+            
+        return [results[index] for index in sorted(results)]
+        
+    def _analyze_item(
+        self,
+        index: int,
+        sample: Dict[str, Any],
+        prev_frame: Optional[np.ndarray],
+        source: str
+    ) -> FrameAnalysisResult:
+        """Analyze one work item, saving its thumbnail if enabled."""
+        frame = sample["frame"]
+        timestamp = sample["timestamp"]
+        
+        if self.thumbnail_dir:
+            frame_path = str(self.thumbnail_dir / f"{self.prefix}_{index:04d}_at_{timestamp:.2f}s.jpg")
+            self._save_thumbnail(frame, frame_path)
+        else:
+            frame_path = f"{source}#frame={sample['frame_number']}"
+            
+        return self.analyzer.analyze_array(frame, timestamp, frame_path, prev_frame)
+        
+    def _save_thumbnail(self, frame: np.ndarray, path: str) -> None:
+        """Save a downscaled copy of a frame."""
+        height, width = frame.shape[:2]
+        if width > self.thumbnail_width:
+            scale = self.thumbnail_width / width
+            frame = cv2.resize(
+                frame, (self.thumbnail_width, int(height * scale)),
+                interpolation=cv2.INTER_AREA
+            )
+        cv2.imwrite(path, frame)
+
+
 def analyze_video_frames(
     frames_dir: Union[str, Path],
     output_report: Union[str, Path],
@@ -6,10 +6,11 @@ at specified intervals or timestamps for analysis and debugging.
 """
 
 import cv2
+import itertools
 import os
 import numpy as np
 from pathlib import Path
-from typing import List, Optional, Union, Tuple, Dict
+from typing import Iterable, Iterator, List, Optional, Union, Tuple, Dict
 from dataclasses import dataclass
 import logging
 
@@ -25,6 +26,7 @@ class FrameExtractionConfig:
     quality: int = 95  # JPEG quality (0-100)
     resize_factor: Optional[float] = None  # Resize frames by this factor
     max_frames: Optional[int] = None  # Maximum number of frames to extract
+    seek_threshold: int = 120  # Seek instead of grabbing across gaps longer than this
 
 
 class FrameExtractor:
@@ -63,7 +65,51 @@ class FrameExtractor:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Open video
+        extracted_frames = []
+        for sample in self.iter_frames(video_path):
+            frame = sample["frame"]
+            timestamp = sample["timestamp"]
+            
+            # Save frame
+            filename = f"{prefix}_{len(extracted_frames):04d}_at_{timestamp:.2f}s.{self.config.output_format}"
+            filepath = output_dir / filename
+            
+            self._save_frame(frame, filepath)
+            
+            extracted_frames.append({
+                "filename": filename,
+                "filepath": str(filepath),
+                "frame_number": sample["frame_number"],
+                "timestamp": timestamp,
+                "width": frame.shape[1],
+                "height": frame.shape[0]
+            })
+            logger.debug(f"Extracted frame {len(extracted_frames)}: {filename}")
+            
+        logger.info(f"Extracted {len(extracted_frames)} frames from {video_path}")
+        return extracted_frames
+    
+    def iter_frames(
+        self,
+        video_path: Union[str, Path]
+    ) -> Iterator[Dict[str, Union[np.ndarray, float, int]]]:
+        """Yield sampled frames in memory without writing them to disk.
+        
+        Frames between samples are skipped with grab(), which advances the
+        stream without decoding pixels, and gaps longer than
+        config.seek_threshold frames are crossed with a direct seek.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Yields:
+            Dictionaries with "frame" (processed BGR array), "frame_number"
+            and "timestamp"
+        """
+        video_path = Path(video_path)
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video not found: {video_path}")
+        
         cap = cv2.VideoCapture(str(video_path))
         if not cap.isOpened():
             raise ValueError(f"Failed to open video: {video_path}")
@@ -76,64 +122,56 @@ class FrameExtractor:
             
             logger.info(f"Video properties: FPS={fps}, Total frames={total_frames}, Duration={duration:.2f}s")
             
-            # Extract frames
-            extracted_frames = []
-            frame_count = 0
+            position = 0  # Index of the next frame in the stream
             extracted_count = 0
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
+            for target in self._target_frames(fps):
+                # Check max frames limit
+                if self.config.max_frames and extracted_count >= self.config.max_frames:
                     break
-                    
-                # Check if we should extract this frame
-                should_extract = False
-                timestamp = frame_count / fps if fps > 0 else 0
                 
-                if self.config.timestamp_list:
-                    # Extract at specific timestamps
-                    for ts in self.config.timestamp_list:
-                        if abs(timestamp - ts) < (0.5 / fps):  # Within half a frame
-                            should_extract = True
-                            break
+                gap = target - position
+                if gap > self.config.seek_threshold:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
                 else:
-                    # Extract at intervals
-                    if frame_count % self.config.frame_interval == 0:
-                        should_extract = True
-                        
-                if should_extract:
-                    # Check max frames limit
-                    if self.config.max_frames and extracted_count >= self.config.max_frames:
-                        break
+                    for _ in range(gap):
+                        if not cap.grab():
+                            return
                         
-                    # Process frame
-                    processed_frame = self._process_frame(frame)
-                    
-                    # Save frame
-                    filename = f"{prefix}_{extracted_count:04d}_at_{timestamp:.2f}s.{self.config.output_format}"
-                    filepath = output_dir / filename
-                    
-                    self._save_frame(processed_frame, filepath)
-                    
-                    extracted_frames.append({
-                        "filename": filename,
-                        "filepath": str(filepath),
-                        "frame_number": frame_count,
-                        "timestamp": timestamp,
-                        "width": processed_frame.shape[1],
-                        "height": processed_frame.shape[0]
-                    })
-                    
-                    extracted_count += 1
-                    logger.debug(f"Extracted frame {extracted_count}: {filename}")
-                    
-                frame_count += 1
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                position = target + 1
+                
+                yield {
+                    "frame": self._process_frame(frame),
+                    "frame_number": target,
+                    "timestamp": target / fps if fps > 0 else 0
+                }
+                extracted_count += 1
                 
-            logger.info(f"Extracted {extracted_count} frames from {video_path}")
-            return extracted_frames
-            
         finally:
             cap.release()
+    
+    def _target_frames(self, fps: float) -> Iterable[int]:
+        """Get the increasing frame numbers to sample.
+        
+        Args:
+            fps: Frame rate of the video
+            
+        Returns:
+            Sorted frame numbers for timestamp mode, or an unbounded
+            interval sequence otherwise
+        """
+        if self.config.timestamp_list:
+            if fps <= 0:
+                return []
+            # The frame within half a frame of each timestamp
+            return sorted({
+                int(round(ts * fps)) for ts in self.config.timestamp_list if ts >= 0
+            })
+        
+        return itertools.count(0, max(1, self.config.frame_interval))
             
     def extract_keyframes(
         self,
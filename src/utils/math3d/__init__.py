@@ -5,12 +5,16 @@ This package provides comprehensive 3D mathematical operations for spatial compu
 organized into focused modules:
 
 - vector3d: 3D vector operations (magnitude, normalization, dot/cross products, interpolation)
-- matrix4x4: 4x4 matrix transformations (translation, rotation, scaling, projection)
+- vector3d_array: Vector3DArray, the same operations on N×3 arrays of vectors
+- matrix4x4: 4x4 matrix transformations (translation, rotation, scaling, projection),
+  and Matrix4x4Stack for batches of matrices
 - spatial_utils: Spatial utility functions (distances, intersections, geometric queries)
 - interpolation: Advanced interpolation methods (Bezier curves, splines, easing functions)
 - noise: Noise generation algorithms (Perlin, Simplex, fractal noise)
+- noise_texture: Cached tileable noise textures with mip levels
 - curves: Parametric curves and path operations
 - collision: Collision detection for various geometric shapes
+- broad_phase: Array-backed broad phases (hashed grid, sort-and-sweep, BVH)
 - color_math: Color space conversions and operations
 - polygon_ops: Polygon algorithms (winding numbers, area, triangulation, complex conversions)
 
@@ -29,8 +33,12 @@ from .vector3d import (
     project_vector
 )
 
+from .vector3d_array import Vector3DArray
+
 from .matrix4x4 import (
     Matrix4x4,
+    Matrix4x4Stack,
+    transform_points_array,
     create_transform_matrix,
     create_trs_matrix,
     create_view_matrix,
@@ -91,6 +99,12 @@ from .noise import (
     noise_vector_field_3d
 )
 
+from .noise_texture import (
+    NoiseTexture,
+    NoiseTextureCache,
+    build_noise_texture
+)
+
 from .curves import (
     ParametricCurve,
     ArcLengthParameterizedCurve,
@@ -123,6 +137,16 @@ from .collision import (
     create_ray
 )
 
+from .broad_phase import (
+    BroadPhase,
+    HashedGrid,
+    SweepAndPrune,
+    BVH,
+    aabb_bounds,
+    sphere_bounds,
+    obb_bounds
+)
+
 from .color_math import (
     Color,
     ColorSpaceConversions,
@@ -210,9 +234,12 @@ __all__ = [
     'angle_between_vectors',
     'reflect_vector',
     'project_vector',
+    'Vector3DArray',
     
     # Matrix4x4 module
     'Matrix4x4',
+    'Matrix4x4Stack',
+    'transform_points_array',
     'create_transform_matrix',
     'create_trs_matrix',
     'create_view_matrix',
@@ -268,6 +295,9 @@ __all__ = [
     'voronoi_edge_2d',
     'noise_vector_field_2d',
     'noise_vector_field_3d',
+    'NoiseTexture',
+    'NoiseTextureCache',
+    'build_noise_texture',
     
     # Curves module
     'ParametricCurve',
@@ -298,6 +328,13 @@ __all__ = [
     'create_capsule',
     'create_obb',
     'create_ray',
+    'BroadPhase',
+    'HashedGrid',
+    'SweepAndPrune',
+    'BVH',
+    'aabb_bounds',
+    'sphere_bounds',
+    'obb_bounds',
     
     # Color math module
     'Color',
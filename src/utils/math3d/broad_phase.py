@@ -0,0 +1,483 @@
+"""
+Broad-Phase Collision Detection
+
+This module finds overlapping pairs among N axis-aligned bounding boxes
+stored as (N, 3) min and max corner arrays:
+- HashedGrid: uniform grid with hashed cell keys, for objects of similar size
+- SweepAndPrune: sort-and-sweep along one axis, cheap to refit under coherent motion
+- BVH: bounding volume hierarchy with bottom-up refits, for mixed object sizes
+
+All three share the BroadPhase interface: build() from bounds arrays,
+update() to move some objects in place, all_pairs() for the (M, 2) array of
+overlapping index pairs and query() for the objects overlapping a box.
+Pairs are exact AABB overlaps, sorted, with the lower index first, ready for
+the batched narrow-phase tests of CollisionDetection:
+
+    broad = SweepAndPrune().build(*sphere_bounds(centers, radii))
+    pairs = broad.all_pairs()
+    hits = pairs[CollisionDetection.sphere_sphere_batch(centers, radii, pairs)]
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .vector3d import Vector3D
+from .collision import AABB, CollisionDetection, _as_rotations
+
+# Spatial hashing primes, as used for Voronoi cell seeds
+_HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+
+def _as_point(value: Any) -> np.ndarray:
+    """Get a Vector3D or 3-element sequence as a (3,) array."""
+    if isinstance(value, Vector3D):
+        value = (value.x, value.y, value.z)
+    return np.asarray(value, dtype=np.float64).reshape(3)
+
+
+def _as_bounds(mins: Any, maxs: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Copy min and max corners into validated (N, 3) float64 arrays."""
+    mins = np.array(mins, dtype=np.float64).reshape(-1, 3)
+    maxs = np.array(maxs, dtype=np.float64).reshape(-1, 3)
+    if mins.shape != maxs.shape:
+        raise ValueError(f"Got {len(mins)} min corners but {len(maxs)} max corners")
+    if np.any(mins > maxs):
+        raise ValueError("Every min corner must be <= its max corner")
+    return mins, maxs
+
+
+def _concat_ranges(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate arange(start, stop) for every range.
+
+    Returns the values and, for each value, the index of its range.
+    """
+    counts = np.maximum(stops - starts, 0)
+    owner = np.repeat(np.arange(len(counts)), counts)
+    values = np.arange(counts.sum(), dtype=np.int64) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return values, owner
+
+
+def _unique_pairs(first: np.ndarray, second: np.ndarray, count: int) -> np.ndarray:
+    """Sorted, deduplicated (M, 2) pairs with the lower index first, dropping self-pairs."""
+    low = np.minimum(first, second).astype(np.int64)
+    high = np.maximum(first, second).astype(np.int64)
+    distinct = low != high
+    keys = np.unique(low[distinct] * count + high[distinct])
+    return np.stack([keys // count, keys % count], axis=1)
+
+
+def aabb_bounds(aabbs: Sequence[AABB]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get (N, 3) min and max corner arrays from AABB objects."""
+    mins = [(box.min_point.x, box.min_point.y, box.min_point.z) for box in aabbs]
+    maxs = [(box.max_point.x, box.max_point.y, box.max_point.z) for box in aabbs]
+    return _as_bounds(mins, maxs)
+
+
+def sphere_bounds(centers: Any, radii: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the AABBs of spheres given (N, 3) centers and (N,) radii."""
+    centers = np.asarray(centers, dtype=np.float64)
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1, 1)
+    return centers - radii, centers + radii
+
+
+def obb_bounds(centers: Any, half_extents: Any, rotations: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the AABBs of OBBs (see CollisionDetection.obb_obb_batch for arguments)."""
+    centers = np.asarray(centers, dtype=np.float64)
+    extents = np.einsum('nij,nj->ni', np.abs(_as_rotations(rotations)),
+                        np.asarray(half_extents, dtype=np.float64))
+    return centers - extents, centers + extents
+
+
+class BroadPhase(ABC):
+    """Abstract base class for broad phases over arrays of AABBs.
+
+    Subclasses implement _build, _refit, all_pairs and query; the bounds
+    live in self.mins and self.maxs.
+    """
+
+    def __init__(self):
+        self.mins = np.empty((0, 3))
+        self.maxs = np.empty((0, 3))
+
+    def __len__(self) -> int:
+        return len(self.mins)
+
+    def build(self, mins: Any, maxs: Any) -> 'BroadPhase':
+        """Build from (N, 3) min and max corners (copied); returns self."""
+        self.mins, self.maxs = _as_bounds(mins, maxs)
+        self._build()
+        return self
+
+    def update(self, indices: Any, mins: Any, maxs: Any):
+        """Move objects to new bounds, refitting instead of rebuilding.
+
+        Args:
+            indices: Indices of the moved objects
+            mins, maxs: Their new (K, 3) corners
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        mins, maxs = _as_bounds(mins, maxs)
+        if len(mins) != len(indices):
+            raise ValueError(f"Got {len(indices)} indices but {len(mins)} bounds")
+        self.mins[indices] = mins
+        self.maxs[indices] = maxs
+        if len(indices):
+            self._refit(indices)
+
+    @abstractmethod
+    def all_pairs(self) -> np.ndarray:
+        """Get all overlapping pairs as a sorted (M, 2) int64 array with i < j."""
+        pass
+
+    @abstractmethod
+    def query(self, min_point: Any, max_point: Any) -> np.ndarray:
+        """Get the sorted indices of objects overlapping a box."""
+        pass
+
+    @abstractmethod
+    def _build(self):
+        """Build the structure from self.mins and self.maxs."""
+        pass
+
+    @abstractmethod
+    def _refit(self, indices: np.ndarray):
+        """Update the structure after the bounds of some objects moved."""
+        pass
+
+    def _overlapping(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Get the candidate pairs whose AABBs overlap as sorted unique pairs."""
+        keep = CollisionDetection.aabb_aabb_batch(self.mins, self.maxs, np.stack([first, second], axis=1))
+        return _unique_pairs(first[keep], second[keep], len(self))
+
+    def _in_box(self, indices: np.ndarray, min_point: Any, max_point: Any) -> np.ndarray:
+        """Keep the candidate objects overlapping a box, sorted."""
+        low, high = _as_point(min_point), _as_point(max_point)
+        indices = np.unique(indices)
+        inside = np.all((self.mins[indices] <= high) & (self.maxs[indices] >= low), axis=1)
+        return indices[inside]
+
+
+class HashedGrid(BroadPhase):
+    """Uniform grid broad phase with hashed cell keys.
+
+    Every object is entered in each cell its AABB touches, and objects
+    sharing a cell become candidate pairs. The grid is unbounded; hash
+    collisions only add candidates, which the exact AABB test removes. Cell
+    size should be around the typical object size: objects spanning many
+    cells make many entries.
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Initialize the grid.
+
+        Args:
+            cell_size: Edge length of the cubic cells
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        super().__init__()
+        self.cell_size = float(cell_size)
+
+        self._low = np.empty((0, 3), dtype=np.int64)
+        self._high = np.empty((0, 3), dtype=np.int64)
+        # (object, cell) entries sorted by cell key
+        self._keys = np.empty(0, dtype=np.int64)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._candidates: Optional[np.ndarray] = None
+
+    def _cell_ranges(self, mins: np.ndarray, maxs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return (np.floor(mins / self.cell_size).astype(np.int64),
+                np.floor(maxs / self.cell_size).astype(np.int64))
+
+    @staticmethod
+    def _cell_keys(low: np.ndarray, high: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Hash every cell in the (K, 3) inclusive cell ranges.
+
+        Returns the keys and, for each key, the index of its range.
+        """
+        extent = high - low + 1
+        counts = extent.prod(axis=1)
+        local, owner = _concat_ranges(np.zeros_like(counts), counts)
+        extent = extent[owner]
+        offset = np.stack([local % extent[:, 0],
+                           local // extent[:, 0] % extent[:, 1],
+                           local // (extent[:, 0] * extent[:, 1])], axis=1)
+        cells = low[owner] + offset
+        return np.bitwise_xor.reduce(cells * _HASH_PRIMES, axis=1), owner
+
+    def _build(self):
+        self._low, self._high = self._cell_ranges(self.mins, self.maxs)
+        keys, ids = self._cell_keys(self._low, self._high)
+        order = np.argsort(keys, kind='stable')
+        self._keys, self._ids = keys[order], ids[order]
+        self._candidates = None
+
+    def _refit(self, indices: np.ndarray):
+        # Objects that stay within the same cells keep their entries
+        low, high = self._cell_ranges(self.mins[indices], self.maxs[indices])
+        moved = np.any((low != self._low[indices]) | (high != self._high[indices]), axis=1)
+        if not moved.any():
+            return
+
+        changed = np.unique(indices[moved])
+        self._low[changed], self._high[changed] = self._cell_ranges(self.mins[changed], self.maxs[changed])
+        keep = ~np.isin(self._ids, changed)
+        keys, owner = self._cell_keys(self._low[changed], self._high[changed])
+        keys = np.concatenate([self._keys[keep], keys])
+        ids = np.concatenate([self._ids[keep], changed[owner]])
+        order = np.argsort(keys, kind='stable')
+        self._keys, self._ids = keys[order], ids[order]
+        self._candidates = None
+
+    def _candidate_pairs(self) -> np.ndarray:
+        """Pairs of objects sharing a cell key, cached until entries change."""
+        if self._candidates is None:
+            keys, ids = self._keys, self._ids
+            first: List[np.ndarray] = [np.empty(0, dtype=np.int64)]
+            second: List[np.ndarray] = [np.empty(0, dtype=np.int64)]
+            # Entries with equal keys are adjacent, so pair each entry with the
+            # ones 1, 2, ... places later until no run of equal keys is that long
+            offset = 1
+            while offset < len(keys):
+                same = keys[:-offset] == keys[offset:]
+                if not same.any():
+                    break
+                first.append(ids[:-offset][same])
+                second.append(ids[offset:][same])
+                offset += 1
+            self._candidates = _unique_pairs(np.concatenate(first), np.concatenate(second), len(self))
+        return self._candidates
+
+    def all_pairs(self) -> np.ndarray:
+        candidates = self._candidate_pairs()
+        return candidates[CollisionDetection.aabb_aabb_batch(self.mins, self.maxs, candidates)]
+
+    def query(self, min_point: Any, max_point: Any) -> np.ndarray:
+        low, high = self._cell_ranges(_as_point(min_point)[None], _as_point(max_point)[None])
+        keys = np.unique(self._cell_keys(low, high)[0])
+        starts = np.searchsorted(self._keys, keys, side='left')
+        stops = np.searchsorted(self._keys, keys, side='right')
+        return self._in_box(self._ids[_concat_ranges(starts, stops)[0]], min_point, max_point)
+
+
+class SweepAndPrune(BroadPhase):
+    """Sort-and-sweep broad phase.
+
+    Objects are kept sorted by their min corner along one axis; each object
+    is a candidate with the later objects that start before it ends, and
+    the other two axes are checked exactly. Refits re-sort the previous
+    order, which is nearly sorted when objects move a little per step.
+    """
+
+    def __init__(self, axis: Optional[int] = None):
+        """
+        Initialize the sweep.
+
+        Args:
+            axis: Sweep axis (0, 1 or 2); by default chosen at each build as
+                the axis along which object centers vary most
+        """
+        if axis not in (None, 0, 1, 2):
+            raise ValueError(f"axis must be 0, 1, 2 or None, got {axis}")
+        super().__init__()
+        self.axis = axis
+        self.sweep_axis = 0 if axis is None else axis
+        self._order = np.empty(0, dtype=np.int64)
+
+    def _build(self):
+        if self.axis is None and len(self):
+            self.sweep_axis = int(np.argmax((self.mins + self.maxs).var(axis=0)))
+        self._order = np.argsort(self.mins[:, self.sweep_axis], kind='stable')
+
+    def _refit(self, indices: np.ndarray):
+        # The stable sort is a timsort, close to linear on nearly sorted input
+        starts = self.mins[self._order, self.sweep_axis]
+        self._order = self._order[np.argsort(starts, kind='stable')]
+
+    def all_pairs(self) -> np.ndarray:
+        order = self._order
+        mins, maxs = self.mins[order], self.maxs[order]
+        stops = np.searchsorted(mins[:, self.sweep_axis], maxs[:, self.sweep_axis], side='right')
+        later, position = _concat_ranges(np.arange(1, len(order) + 1), stops)
+
+        # Prune on the other axes one at a time, in sorted order for locality
+        for axis in {0, 1, 2} - {self.sweep_axis}:
+            keep = (mins[position, axis] <= maxs[later, axis]) & (maxs[position, axis] >= mins[later, axis])
+            position, later = position[keep], later[keep]
+        return _unique_pairs(order[position], order[later], len(self))
+
+    def query(self, min_point: Any, max_point: Any) -> np.ndarray:
+        starts = self.mins[self._order, self.sweep_axis]
+        stop = np.searchsorted(starts, _as_point(max_point)[self.sweep_axis], side='right')
+        return self._in_box(self._order[:stop], min_point, max_point)
+
+
+class BVH(BroadPhase):
+    """Bounding volume hierarchy broad phase.
+
+    A binary tree built top-down by splitting objects at the median center
+    along the widest axis, stored as flat node arrays. Refits recompute the
+    node boxes bottom-up without changing the tree, which stays efficient
+    while objects keep roughly their relative layout; call build() again
+    after large rearrangements.
+    """
+
+    def __init__(self, leaf_size: int = 4):
+        """
+        Initialize the hierarchy.
+
+        Args:
+            leaf_size: Maximum objects per leaf
+        """
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be at least 1, got {leaf_size}")
+        super().__init__()
+        self.leaf_size = leaf_size
+
+        self.node_mins = np.empty((0, 3))
+        self.node_maxs = np.empty((0, 3))
+        # Children are -1 for leaves; leaves hold objects order[start:start + count]
+        self._left = np.empty(0, dtype=np.int64)
+        self._right = np.empty(0, dtype=np.int64)
+        self._start = np.empty(0, dtype=np.int64)
+        self._count = np.empty(0, dtype=np.int64)
+        self._order = np.empty(0, dtype=np.int64)
+        self._levels: List[np.ndarray] = []
+        self._leaves = np.empty(0, dtype=np.int64)
+        self._leaf_slot = np.empty(0, dtype=np.int64)
+        self._leaf_objects = np.empty((0, leaf_size), dtype=np.int64)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._left)
+
+    def _build(self):
+        centers = (self.mins + self.maxs) * 0.5
+        order = np.arange(len(self), dtype=np.int64)
+        left: List[int] = []
+        right: List[int] = []
+        start: List[int] = []
+        count: List[int] = []
+        depth: List[int] = []
+
+        # Depth-first, so every child has a higher index than its parent
+        stack = [(0, len(order), 0, -1, left)] if len(order) else []
+        while stack:
+            begin, end, level, parent, side = stack.pop()
+            node = len(left)
+            if parent >= 0:
+                side[parent] = node
+            left.append(-1)
+            right.append(-1)
+            start.append(begin)
+            count.append(end - begin)
+            depth.append(level)
+            if end - begin <= self.leaf_size:
+                continue
+
+            segment = order[begin:end]
+            spread = centers[segment].max(axis=0) - centers[segment].min(axis=0)
+            axis = int(np.argmax(spread))
+            half = (end - begin) // 2
+            order[begin:end] = segment[np.argpartition(centers[segment, axis], half)]
+            stack.append((begin + half, end, level + 1, node, right))
+            stack.append((begin, begin + half, level + 1, node, left))
+
+        self._left = np.array(left, dtype=np.int64)
+        self._right = np.array(right, dtype=np.int64)
+        self._start = np.array(start, dtype=np.int64)
+        self._count = np.array(count, dtype=np.int64)
+        self._order = order
+
+        depth = np.array(depth, dtype=np.int64)
+        internal = self._left >= 0
+        self._levels = [np.flatnonzero(internal & (depth == level))
+                        for level in range(int(depth.max(initial=0)) + 1)]
+
+        # Leaves in object order, and a padded table of each leaf's objects
+        self._leaves = np.flatnonzero(~internal)
+        self._leaves = self._leaves[np.argsort(self._start[self._leaves])]
+        self._leaf_slot = np.full(len(left), -1, dtype=np.int64)
+        self._leaf_slot[self._leaves] = np.arange(len(self._leaves))
+        positions, owner = _concat_ranges(self._start[self._leaves],
+                                          self._start[self._leaves] + self._count[self._leaves])
+        self._leaf_objects = np.full((len(self._leaves), self.leaf_size), -1, dtype=np.int64)
+        self._leaf_objects[owner, positions - self._start[self._leaves][owner]] = order[positions]
+
+        self._refit_nodes()
+
+    def _refit(self, indices: np.ndarray):
+        self._refit_nodes()
+
+    def _refit_nodes(self):
+        """Recompute all node boxes, leaves first, then one tree level at a time."""
+        self.node_mins = np.empty((self.node_count, 3))
+        self.node_maxs = np.empty((self.node_count, 3))
+        if not self.node_count:
+            return
+        starts = self._start[self._leaves]
+        self.node_mins[self._leaves] = np.minimum.reduceat(self.mins[self._order], starts, axis=0)
+        self.node_maxs[self._leaves] = np.maximum.reduceat(self.maxs[self._order], starts, axis=0)
+        for nodes in reversed(self._levels):
+            left, right = self._left[nodes], self._right[nodes]
+            self.node_mins[nodes] = np.minimum(self.node_mins[left], self.node_mins[right])
+            self.node_maxs[nodes] = np.maximum(self.node_maxs[left], self.node_maxs[right])
+
+    def all_pairs(self) -> np.ndarray:
+        if not self.node_count:
+            return np.empty((0, 2), dtype=np.int64)
+
+        is_leaf = self._left < 0
+        leaf_a: List[np.ndarray] = []
+        leaf_b: List[np.ndarray] = []
+        # Traverse node pairs breadth-first, starting from the root paired with itself
+        a = np.zeros(1, dtype=np.int64)
+        b = np.zeros(1, dtype=np.int64)
+        while len(a):
+            same = a == b
+            own = a[same & ~is_leaf[a]]
+            leaf_a.append(a[same & is_leaf[a]])
+            leaf_b.append(a[same & is_leaf[a]])
+
+            a, b = a[~same], b[~same]
+            touching = np.all((self.node_mins[a] <= self.node_maxs[b]) &
+                              (self.node_maxs[a] >= self.node_mins[b]), axis=1)
+            a, b = a[touching], b[touching]
+            leaves = is_leaf[a] & is_leaf[b]
+            leaf_a.append(a[leaves])
+            leaf_b.append(b[leaves])
+            a, b = a[~leaves], b[~leaves]
+
+            # Descend into the larger internal node of each pair
+            split_a = ~is_leaf[a] & (is_leaf[b] | (self._count[a] >= self._count[b]))
+            split_b = ~split_a
+            a, b = (np.concatenate([self._left[own], self._right[own], self._left[own],
+                                    self._left[a[split_a]], self._right[a[split_a]],
+                                    a[split_b], a[split_b]]),
+                    np.concatenate([self._left[own], self._right[own], self._right[own],
+                                    b[split_a], b[split_a],
+                                    self._left[b[split_b]], self._right[b[split_b]]]))
+
+        # Every object pairing of the touching leaves
+        objects_a = self._leaf_objects[self._leaf_slot[np.concatenate(leaf_a)]]
+        objects_b = self._leaf_objects[self._leaf_slot[np.concatenate(leaf_b)]]
+        first = np.repeat(objects_a, self.leaf_size, axis=1).ravel()
+        second = np.tile(objects_b, (1, self.leaf_size)).ravel()
+        valid = (first >= 0) & (second >= 0)
+        return self._overlapping(first[valid], second[valid])
+
+    def query(self, min_point: Any, max_point: Any) -> np.ndarray:
+        low, high = _as_point(min_point), _as_point(max_point)
+        found: List[np.ndarray] = [np.empty(0, dtype=np.int64)]
+        nodes = np.zeros(min(self.node_count, 1), dtype=np.int64)
+        while len(nodes):
+            touching = np.all((self.node_mins[nodes] <= high) & (self.node_maxs[nodes] >= low), axis=1)
+            nodes = nodes[touching]
+            leaves = nodes[self._left[nodes] < 0]
+            found.append(self._leaf_objects[self._leaf_slot[leaves]].ravel())
+            nodes = nodes[self._left[nodes] >= 0]
+            nodes = np.concatenate([self._left[nodes], self._right[nodes]])
+        candidates = np.concatenate(found)
+        return self._in_box(candidates[candidates >= 0], min_point, max_point)
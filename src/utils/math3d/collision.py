@@ -9,10 +9,14 @@ This module provides collision detection algorithms for various geometric shapes
 - Ray casting
 - Swept collision detection
 - Spatial partitioning (octree, grid)
+
+Batched narrow-phase tests (the *_batch methods of CollisionDetection) take
+per-object arrays and an (M, 2) array of index pairs, such as the candidate
+pairs from the broad_phase module, and return one boolean per pair.
 """
 
 import numpy as np
-from typing import Tuple, Optional, List, Set
+from typing import Any, Tuple, Optional, List, Set
 from dataclasses import dataclass
 from .vector3d import Vector3D
 from .matrix4x4 import Matrix4x4
@@ -201,6 +205,12 @@ class Ray:
         return self.origin + self.direction * t
 
 
+def _as_rotations(rotations: Any) -> np.ndarray:
+    """Get (N, 3, 3) rotation matrices from a Matrix4x4Stack or (N, 3, 3)/(N, 4, 4) array."""
+    rotations = np.asarray(getattr(rotations, 'matrices', rotations), dtype=np.float64)
+    return rotations[:, :3, :3]
+
+
 class CollisionDetection:
     """Collection of collision detection algorithms."""
     
@@ -247,6 +257,68 @@ class CollisionDetection:
         
         return True
     
+    @staticmethod
+    def aabb_aabb_batch(mins: np.ndarray, maxs: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+        """Check collisions between AABB pairs.
+
+        Args:
+            mins, maxs: (N, 3) corner arrays
+            pairs: (M, 2) object indices
+
+        Returns:
+            (M,) boolean array, matching aabb_aabb for every pair
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        first, second = pairs[:, 0], pairs[:, 1]
+        return np.all((mins[first] <= maxs[second]) & (maxs[first] >= mins[second]), axis=1)
+
+    @staticmethod
+    def sphere_sphere_batch(centers: np.ndarray, radii: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+        """Check collisions between sphere pairs given (N, 3) centers and (N,) radii."""
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        centers = np.asarray(centers, dtype=np.float64)
+        radii = np.asarray(radii, dtype=np.float64)
+        offset = centers[pairs[:, 0]] - centers[pairs[:, 1]]
+        distance = np.sqrt(np.einsum('ij,ij->i', offset, offset))
+        return distance <= radii[pairs[:, 0]] + radii[pairs[:, 1]]
+
+    @staticmethod
+    def obb_obb_batch(centers: np.ndarray, half_extents: np.ndarray, rotations: Any,
+                      pairs: np.ndarray) -> np.ndarray:
+        """Check collisions between OBB pairs using SAT, like obb_obb.
+
+        Args:
+            centers, half_extents: (N, 3) arrays
+            rotations: (N, 3, 3) or (N, 4, 4) matrices, or a Matrix4x4Stack,
+                whose columns are the box axes
+            pairs: (M, 2) object indices
+
+        Returns:
+            (M,) boolean array
+        """
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        centers = np.asarray(centers, dtype=np.float64)
+        half_extents = np.asarray(half_extents, dtype=np.float64)
+        rotations = _as_rotations(rotations)
+        first, second = pairs[:, 0], pairs[:, 1]
+        axes_a, axes_b = rotations[first], rotations[second]
+
+        # 15 candidate axes per pair: 3 + 3 face normals and 9 edge cross products
+        cross = np.cross(axes_a.transpose(0, 2, 1)[:, :, None, :],
+                         axes_b.transpose(0, 2, 1)[:, None, :, :]).reshape(-1, 9, 3)
+        test_axes = np.concatenate([axes_a.transpose(0, 2, 1), axes_b.transpose(0, 2, 1), cross], axis=1)
+        valid = np.ones(test_axes.shape[:2], dtype=bool)
+        valid[:, 6:] = np.linalg.norm(cross, axis=2) > 1e-6
+
+        # Projected radii and center distance; axes need not be normalized since
+        # both sides of the comparison scale alike
+        radius_a = np.einsum('mak,mk->ma', np.abs(test_axes @ axes_a), half_extents[first])
+        radius_b = np.einsum('mak,mk->ma', np.abs(test_axes @ axes_b), half_extents[second])
+        distance = np.abs(np.einsum('mak,mk->ma', test_axes, centers[second] - centers[first]))
+
+        separated = valid & (distance > radius_a + radius_b)
+        return ~separated.any(axis=1)
+
     @staticmethod
     def _project_obb_on_axis(obb: OBB, axis: Vector3D) -> Tuple[float, float]:
         """Project OBB onto axis and return min/max values."""
@@ -429,7 +501,11 @@ class SweepTest:
 
 
 class SpatialGrid:
-    """Spatial grid for broad-phase collision detection."""
+    """Spatial grid for broad-phase collision detection.
+
+    Suited to a few objects inserted one at a time; the broad_phase module
+    handles large sets of moving objects with bulk builds and pair queries.
+    """
     
     def __init__(self, cell_size: float, bounds: AABB):
         """Initialize spatial grid."""
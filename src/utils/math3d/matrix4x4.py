@@ -7,11 +7,66 @@ This module provides comprehensive 4x4 matrix operations for 3D transformations
 - Look-at matrices for camera transformations
 - Matrix operations (multiplication, inverse, transpose)
 - Matrix decomposition into translation, rotation, and scale
+- Matrix4x4Stack: K matrices as one (K, 4, 4) array, for batched composition
+  and for pushing point clouds through many transforms at once
+
+Raw-array transform methods (transform_points_array, transform_directions_array)
+take and return (N, 3) float64 or float32 arrays and accept an optional out=
+buffer, so large point clouds never become per-point objects.
 """
 
 import numpy as np
-from typing import Tuple
+from typing import Any, List, Optional, Tuple, Union
 from .vector3d import Vector3D
+from .vector3d_array import Vector3DArray
+
+_EULER_ORDERS = ("XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX")
+_AFFINE_ROW = np.array([0.0, 0.0, 0.0, 1.0])
+
+
+def _as_points(points: Any) -> np.ndarray:
+    """Get points as a float array whose last axis has 3 components."""
+    if isinstance(points, Vector3DArray):
+        return points.data
+    points = np.asarray(points)
+    if points.dtype != np.float32:
+        points = points.astype(np.float64, copy=False)
+    if points.ndim < 1 or points.shape[-1] != 3:
+        raise ValueError(f"Expected points with 3 components, got shape {points.shape}")
+    return points
+
+
+def transform_points_array(matrix: np.ndarray, points: Any, out: Optional[np.ndarray] = None,
+                           directions: bool = False) -> np.ndarray:
+    """Transform raw (..., 3) points by a (4, 4) or (K, 4, 4) matrix array.
+
+    Points are computed in their own precision (float32 stays float32). A
+    single matrix maps (N, 3) to (N, 3); a stack maps (N, 3) to (K, N, 3),
+    or (K, N, 3) to (K, N, 3) with one point set per matrix. Points get the
+    perspective division of Matrix4x4.transform_point (skipped where w is 0,
+    and entirely for affine matrices); directions ignore translation.
+
+    Args:
+        matrix: Matrix array
+        points: Points as an array-like or Vector3DArray
+        out: Optional result buffer of the output shape, may be points itself
+        directions: Transform as directions instead of points
+    """
+    points = _as_points(points)
+    m = np.asarray(matrix).astype(points.dtype, copy=False)
+    linear = np.swapaxes(m[..., :3, :3], -1, -2)
+
+    if out is points or (out is not None and np.shares_memory(out, points)):
+        points = points.copy()
+    result = np.matmul(points, linear, out=out)
+    if directions:
+        return result
+
+    result += m[..., None, :3, 3]
+    if not np.all(m[..., 3, :] == _AFFINE_ROW):
+        w = np.einsum('...nj,...j->...n', points, m[..., 3, :3]) + m[..., 3, 3][..., None]
+        np.divide(result, w[..., None], out=result, where=(w != 0)[..., None])
+    return result
 
 
 class Matrix4x4:
@@ -213,8 +268,17 @@ class Matrix4x4:
         result = self.matrix @ homogeneous
         return Vector3D(result[0], result[1], result[2])
 
-    def transform_points(self, points: list) -> list:
-        """Transform multiple 3D points efficiently."""
+    def transform_points(self, points: Union[list, Vector3DArray, np.ndarray]
+                         ) -> Union[list, Vector3DArray, np.ndarray]:
+        """Transform multiple 3D points efficiently.
+        
+        A Vector3DArray or raw (N, 3) array is transformed in one pass, with
+        the perspective division of transform_point, and returns the same type.
+        """
+        if isinstance(points, Vector3DArray):
+            return points.transform(self)
+        if isinstance(points, np.ndarray):
+            return self.transform_points_array(points)
         if not points:
             return []
         
@@ -225,6 +289,19 @@ class Matrix4x4:
         # Convert back to Vector3D
         return [Vector3D(r[0], r[1], r[2]) for r in results]
 
+    def transform_points_array(self, points: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform an (N, 3) array of points, with perspective division.
+
+        Args:
+            points: (N, 3) float array-like or Vector3DArray
+            out: Optional (N, 3) result buffer, may be points itself
+        """
+        return transform_points_array(self.matrix, points, out)
+
+    def transform_directions_array(self, directions: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform an (N, 3) array of directions (ignores translation)."""
+        return transform_points_array(self.matrix, directions, out, directions=True)
+
     def inverse(self) -> 'Matrix4x4':
         """Calculate matrix inverse."""
         try:
@@ -276,6 +353,8 @@ class Matrix4x4:
         return translation, rotation, scale
 
     def __mul__(self, other: 'Matrix4x4') -> 'Matrix4x4':
+        if isinstance(other, Matrix4x4Stack):
+            return NotImplemented
         return Matrix4x4(self.matrix @ other.matrix)
 
     def __eq__(self, other: 'Matrix4x4') -> bool:
@@ -290,6 +369,200 @@ class Matrix4x4:
         return self.__str__()
 
 
+class Matrix4x4Stack:
+    """K 4x4 matrices stored as one contiguous (K, 4, 4) float64 array.
+
+    Construction, composition, inversion and decomposition run on the whole
+    stack at once and match the per-matrix Matrix4x4 results. Multiplying
+    by a Matrix4x4 broadcasts it over the stack.
+    """
+
+    __slots__ = ('matrices',)
+
+    def __init__(self, matrices: Any = None):
+        """
+        Initialize from a (K, 4, 4) array-like or a sequence of Matrix4x4.
+
+        Args:
+            matrices: Matrices; a float64 array is used without copying
+        """
+        if matrices is None:
+            matrices = np.empty((0, 4, 4))
+        elif not isinstance(matrices, np.ndarray):
+            matrices = [getattr(m, 'matrix', m) for m in matrices]
+        array = np.ascontiguousarray(matrices, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 4, 4)
+        if array.ndim != 3 or array.shape[1:] != (4, 4):
+            raise ValueError(f"Expected a (K, 4, 4) array, got shape {array.shape}")
+        self.matrices = array
+
+    @classmethod
+    def identity(cls, count: int) -> 'Matrix4x4Stack':
+        """Create a stack of identity matrices."""
+        return cls(np.broadcast_to(np.eye(4), (count, 4, 4)))
+
+    @classmethod
+    def translation(cls, translations: Any) -> 'Matrix4x4Stack':
+        """Create translation matrices from (K, 3) offsets."""
+        translations = np.asarray(translations, dtype=np.float64).reshape(-1, 3)
+        matrices = np.tile(np.eye(4), (len(translations), 1, 1))
+        matrices[:, :3, 3] = translations
+        return cls(matrices)
+
+    @classmethod
+    def scale(cls, scales: Any) -> 'Matrix4x4Stack':
+        """Create scale matrices from (K, 3) factors."""
+        scales = np.asarray(scales, dtype=np.float64).reshape(-1, 3)
+        matrices = np.tile(np.eye(4), (len(scales), 1, 1))
+        matrices[:, [0, 1, 2], [0, 1, 2]] = scales
+        return cls(matrices)
+
+    @classmethod
+    def rotation_euler(cls, angles: Any, order: str = "XYZ") -> 'Matrix4x4Stack':
+        """Create rotation matrices from (K, 3) Euler angles, like Matrix4x4.rotation_euler."""
+        if order not in _EULER_ORDERS:
+            raise ValueError(f"Invalid rotation order: {order}")
+        angles = np.asarray(angles, dtype=np.float64).reshape(-1, 3)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+
+        def axis_rotation(axis: int) -> np.ndarray:
+            i, j = [(1, 2), (2, 0), (0, 1)][axis]
+            matrices = np.tile(np.eye(4), (len(angles), 1, 1))
+            matrices[:, i, i] = cos_a[:, axis]
+            matrices[:, i, j] = -sin_a[:, axis]
+            matrices[:, j, i] = sin_a[:, axis]
+            matrices[:, j, j] = cos_a[:, axis]
+            return matrices
+
+        # Matrix4x4.rotation_euler multiplies the axis rotations in reverse order
+        result = None
+        for axis in reversed(order):
+            rotation = axis_rotation("XYZ".index(axis))
+            result = rotation if result is None else result @ rotation
+        return cls(result)
+
+    @classmethod
+    def trs(cls, translations: Any, rotations: Any, scales: Any,
+            rotation_order: str = "XYZ") -> 'Matrix4x4Stack':
+        """Compose TRS matrices from (K, 3) arrays, matching create_trs_matrix per row.
+
+        Any argument may also be a single 3-vector shared by every matrix.
+        """
+        translations, rotations, scales = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64).reshape(-1, 3) for v in (translations, rotations, scales))
+        )
+        result = cls.rotation_euler(rotations, rotation_order).matrices
+        # create_trs_matrix is scale * rotation * translation
+        result[:, :3, :] *= scales[:, :, None]
+        result[:, :3, 3] = np.einsum('kij,kj->ki', result[:, :3, :3], translations)
+        return cls(result)
+
+    def __len__(self) -> int:
+        return len(self.matrices)
+
+    def __getitem__(self, index: Any) -> Union[Matrix4x4, 'Matrix4x4Stack']:
+        """Get one Matrix4x4 by integer index, or a Matrix4x4Stack for slices and masks."""
+        if isinstance(index, (int, np.integer)):
+            return Matrix4x4(self.matrices[index])
+        return Matrix4x4Stack(self.matrices[index])
+
+    def __setitem__(self, index: Any, value: Any):
+        self.matrices[index] = getattr(value, 'matrices', getattr(value, 'matrix', value))
+
+    def __iter__(self):
+        return iter(self.to_matrices())
+
+    def to_matrices(self) -> List[Matrix4x4]:
+        """Convert to a list of Matrix4x4 objects."""
+        return [Matrix4x4(m) for m in self.matrices]
+
+    def copy(self) -> 'Matrix4x4Stack':
+        return Matrix4x4Stack(self.matrices.copy())
+
+    def multiply(self, other: Union['Matrix4x4Stack', Matrix4x4, np.ndarray],
+                 out: Optional[np.ndarray] = None) -> 'Matrix4x4Stack':
+        """Multiply matrix by matrix, broadcasting a single Matrix4x4.
+
+        Args:
+            other: Stack of the same length, Matrix4x4 or raw matrix array
+            out: Optional (K, 4, 4) float64 result buffer
+        """
+        other = getattr(other, 'matrices', getattr(other, 'matrix', other))
+        return Matrix4x4Stack(np.matmul(self.matrices, other, out=out))
+
+    def __mul__(self, other: Union['Matrix4x4Stack', Matrix4x4]) -> 'Matrix4x4Stack':
+        return self.multiply(other)
+
+    def __rmul__(self, other: Matrix4x4) -> 'Matrix4x4Stack':
+        return Matrix4x4Stack(other.matrix @ self.matrices)
+
+    def combine(self) -> Matrix4x4:
+        """Multiply all matrices in order into one, like combine_transforms."""
+        result = np.eye(4)
+        for matrix in self.matrices:
+            result = result @ matrix
+        return Matrix4x4(result)
+
+    def inverse(self) -> 'Matrix4x4Stack':
+        """Invert every matrix."""
+        try:
+            return Matrix4x4Stack(np.linalg.inv(self.matrices))
+        except np.linalg.LinAlgError:
+            raise ValueError("Matrix stack contains a matrix that is not invertible")
+
+    def transpose(self) -> 'Matrix4x4Stack':
+        """Transpose every matrix."""
+        return Matrix4x4Stack(np.swapaxes(self.matrices, 1, 2))
+
+    def determinant(self) -> np.ndarray:
+        """Calculate every determinant."""
+        return np.linalg.det(self.matrices)
+
+    def decompose(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decompose every matrix like Matrix4x4.decompose.
+
+        Returns:
+            (K, 3) translations, Euler rotations and scales
+        """
+        m = self.matrices
+        translations = m[:, :3, 3].copy()
+        scales = np.linalg.norm(m[:, :3, :3], axis=1)
+        rotation = m[:, :3, :3] / scales[:, None, :]
+
+        sy = np.hypot(rotation[:, 0, 0], rotation[:, 1, 0])
+        singular = sy < 1e-6
+        rotations = np.empty_like(translations)
+        rotations[:, 0] = np.where(singular,
+                                   np.arctan2(-rotation[:, 1, 2], rotation[:, 1, 1]),
+                                   np.arctan2(rotation[:, 2, 1], rotation[:, 2, 2]))
+        rotations[:, 1] = np.arctan2(-rotation[:, 2, 0], sy)
+        rotations[:, 2] = np.where(singular, 0.0, np.arctan2(rotation[:, 1, 0], rotation[:, 0, 0]))
+        return translations, rotations, scales
+
+    def transform_points(self, points: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform points by every matrix, with perspective division.
+
+        Args:
+            points: (N, 3) points shared by all matrices, or (K, N, 3) with
+                one point set per matrix
+            out: Optional (K, N, 3) result buffer
+        """
+        return transform_points_array(self.matrices, points, out)
+
+    def transform_directions(self, directions: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transform directions by every matrix (ignores translation)."""
+        return transform_points_array(self.matrices, directions, out, directions=True)
+
+    def __eq__(self, other: 'Matrix4x4Stack') -> bool:
+        if not isinstance(other, Matrix4x4Stack):
+            return False
+        return self.matrices.shape == other.matrices.shape and np.allclose(self.matrices, other.matrices)
+
+    def __repr__(self) -> str:
+        return f"Matrix4x4Stack({len(self)} matrices)"
+
+
 # Convenience functions for matrix operations
 def create_transform_matrix(translation: Vector3D = None, 
                           rotation: Vector3D = None, 
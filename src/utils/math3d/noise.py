@@ -7,13 +7,50 @@ This module provides various noise generation algorithms including:
 - Fractal noise (fBm, turbulence, ridged)
 - Voronoi/Worley noise
 - Value noise
+
+Every generator also has array methods (noise2d_array, noise3d_array and
+noise2d_grid/noise3d_grid) that evaluate whole coordinate arrays at once and
+return exactly the values of the scalar methods, computed in the same
+order of float operations.
 """
 
+import itertools
 import numpy as np
-from typing import Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable, Any
 from .vector3d import Vector3D
 
 
+def _grid(*axes: Any) -> Tuple[np.ndarray, ...]:
+    """Reshape 1D x, y[, z] axes so they broadcast to an array indexed [z, y, x]."""
+    return tuple(
+        np.asarray(axis, dtype=np.float64).reshape((-1,) + (1,) * i)
+        for i, axis in enumerate(axes)
+    )
+
+
+def _floor_int(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get floor(values) as floats and as int64 lattice coordinates."""
+    floored = np.floor(values)
+    return floored, floored.astype(np.int64)
+
+
+def _lattice(values: Any, period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the fractional part and the permutation indices of the two lattice neighbors.
+    
+    With a period, lattice coordinates wrap so the noise tiles every
+    period units.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    floored, cells = _floor_int(values)
+    if period is None:
+        low = cells & 255
+        high = low + 1
+    else:
+        low = (cells % period) & 255
+        high = ((cells + 1) % period) & 255
+    return values - floored, low, high
+
+
 class PerlinNoise:
     """Perlin noise generator for smooth, natural-looking randomness."""
     
@@ -110,6 +147,92 @@ class PerlinNoise:
         y2 = self._lerp(x1, x2, v)
         
         return self._lerp(y1, y2, w)
+    
+    def _grad_array(self, hash_val: np.ndarray, x: np.ndarray, y: Any = None, z: Any = None) -> np.ndarray:
+        """Calculate gradient dot products for arrays of hashes."""
+        g = self.grad3[hash_val % 12]
+        result = g[..., 0] * x
+        if y is not None:
+            result = result + g[..., 1] * y
+        if z is not None:
+            result = result + g[..., 2] * z
+        return result
+    
+    def noise1d_array(self, x: Any, period: Optional[int] = None) -> np.ndarray:
+        """Generate 1D Perlin noise for an array of coordinates.
+        
+        With an integer period the noise tiles every period units.
+        """
+        xf, x_low, x_high = _lattice(x, period)
+        
+        u = self._fade(xf)
+        
+        a = self.perm[x_low]
+        b = self.perm[x_high]
+        
+        return self._lerp(self._grad_array(a, xf), self._grad_array(b, xf - 1), u)
+    
+    def noise2d_array(self, x: Any, y: Any, period: Optional[int] = None) -> np.ndarray:
+        """Generate 2D Perlin noise for broadcastable coordinate arrays.
+        
+        With an integer period the noise tiles every period units.
+        """
+        xf, x_low, x_high = _lattice(x, period)
+        yf, y_low, y_high = _lattice(y, period)
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        
+        perm = self.perm
+        a, b = perm[x_low], perm[x_high]
+        aa, ab = perm[a + y_low], perm[a + y_high]
+        ba, bb = perm[b + y_low], perm[b + y_high]
+        
+        x1 = self._lerp(self._grad_array(aa, xf, yf), self._grad_array(ba, xf - 1, yf), u)
+        x2 = self._lerp(self._grad_array(ab, xf, yf - 1), self._grad_array(bb, xf - 1, yf - 1), u)
+        
+        return self._lerp(x1, x2, v)
+    
+    def noise3d_array(self, x: Any, y: Any, z: Any, period: Optional[int] = None) -> np.ndarray:
+        """Generate 3D Perlin noise for broadcastable coordinate arrays.
+        
+        With an integer period the noise tiles every period units.
+        """
+        xf, x_low, x_high = _lattice(x, period)
+        yf, y_low, y_high = _lattice(y, period)
+        zf, z_low, z_high = _lattice(z, period)
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        w = self._fade(zf)
+        
+        perm = self.perm
+        a, b = perm[x_low], perm[x_high]
+        aa, ab = perm[a + y_low], perm[a + y_high]
+        ba, bb = perm[b + y_low], perm[b + y_high]
+        aaa, aab = perm[aa + z_low], perm[aa + z_high]
+        aba, abb = perm[ab + z_low], perm[ab + z_high]
+        baa, bab = perm[ba + z_low], perm[ba + z_high]
+        bba, bbb = perm[bb + z_low], perm[bb + z_high]
+        
+        grad = self._grad_array
+        x1 = self._lerp(grad(aaa, xf, yf, zf), grad(baa, xf - 1, yf, zf), u)
+        x2 = self._lerp(grad(aba, xf, yf - 1, zf), grad(bba, xf - 1, yf - 1, zf), u)
+        y1 = self._lerp(x1, x2, v)
+        
+        x1 = self._lerp(grad(aab, xf, yf, zf - 1), grad(bab, xf - 1, yf, zf - 1), u)
+        x2 = self._lerp(grad(abb, xf, yf - 1, zf - 1), grad(bbb, xf - 1, yf - 1, zf - 1), u)
+        y2 = self._lerp(x1, x2, v)
+        
+        return self._lerp(y1, y2, w)
+    
+    def noise2d_grid(self, xs: Any, ys: Any, period: Optional[int] = None) -> np.ndarray:
+        """Generate 2D Perlin noise on the grid of 1D axes, as an array indexed [y, x]."""
+        return self.noise2d_array(*_grid(xs, ys), period=period)
+    
+    def noise3d_grid(self, xs: Any, ys: Any, zs: Any, period: Optional[int] = None) -> np.ndarray:
+        """Generate 3D Perlin noise on the grid of 1D axes, as an array indexed [z, y, x]."""
+        return self.noise3d_array(*_grid(xs, ys, zs), period=period)
 
 
 class SimplexNoise:
@@ -282,18 +405,144 @@ class SimplexNoise:
         
         # Return scaled sum
         return 32 * (n0 + n1 + n2 + n3)
+    
+    # Simplex corner offsets (i1, j1, k1, i2, j2, k2) for the six orderings
+    # of x0, y0 and z0, in the order noise3d tests them
+    _SIMPLEX3_OFFSETS = np.array([
+        [1, 0, 0, 1, 1, 0],
+        [1, 0, 0, 1, 0, 1],
+        [0, 0, 1, 1, 0, 1],
+        [0, 0, 1, 0, 1, 1],
+        [0, 1, 0, 0, 1, 1],
+        [0, 1, 0, 1, 1, 0]
+    ])
+    
+    @staticmethod
+    def _corner_array(t: np.ndarray, gradient_dot: np.ndarray) -> np.ndarray:
+        """Contribution of one simplex corner, zero where t is negative."""
+        t_squared = t * t
+        return np.where(t < 0, 0.0, t_squared * t_squared * gradient_dot)
+    
+    def noise2d_array(self, x: Any, y: Any) -> np.ndarray:
+        """Generate 2D Simplex noise for broadcastable coordinate arrays."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        # Skew the input space
+        s = (x + y) * self.F2
+        i = np.floor(x + s).astype(np.int64)
+        j = np.floor(y + s).astype(np.int64)
+        
+        t = (i + j) * self.G2
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        
+        # Determine which simplex we're in
+        i1 = (x0 > y0).astype(np.int64)
+        j1 = 1 - i1
+        
+        x1 = x0 - i1 + self.G2
+        y1 = y0 - j1 + self.G2
+        x2 = x0 - 1 + 2 * self.G2
+        y2 = y0 - 1 + 2 * self.G2
+        
+        # Hash coordinates of the 3 simplex corners
+        perm = self.perm
+        ii = i & 255
+        jj = j & 255
+        gi0 = perm[ii + perm[jj]] % 8
+        gi1 = perm[ii + i1 + perm[jj + j1]] % 8
+        gi2 = perm[ii + 1 + perm[jj + 1]] % 8
+        
+        gx, gy = self.grad2[:, 0], self.grad2[:, 1]
+        n0 = self._corner_array(0.5 - x0*x0 - y0*y0, gx[gi0] * x0 + gy[gi0] * y0)
+        n1 = self._corner_array(0.5 - x1*x1 - y1*y1, gx[gi1] * x1 + gy[gi1] * y1)
+        n2 = self._corner_array(0.5 - x2*x2 - y2*y2, gx[gi2] * x2 + gy[gi2] * y2)
+        
+        return 70 * (n0 + n1 + n2)
+    
+    def noise3d_array(self, x: Any, y: Any, z: Any) -> np.ndarray:
+        """Generate 3D Simplex noise for broadcastable coordinate arrays."""
+        x, y, z = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in (x, y, z)))
+        
+        # Skew the input space
+        s = (x + y + z) * self.F3
+        i = np.floor(x + s).astype(np.int64)
+        j = np.floor(y + s).astype(np.int64)
+        k = np.floor(z + s).astype(np.int64)
+        
+        t = (i + j + k) * self.G3
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        z0 = z - (k - t)
+        
+        # Determine which simplex we're in
+        x_ge_y, y_ge_z, x_ge_z = x0 >= y0, y0 >= z0, x0 >= z0
+        case = np.select(
+            [x_ge_y & y_ge_z, x_ge_y & x_ge_z, x_ge_y, ~y_ge_z, ~x_ge_z],
+            [0, 1, 2, 3, 4], default=5
+        )
+        i1, j1, k1, i2, j2, k2 = np.moveaxis(self._SIMPLEX3_OFFSETS[case], -1, 0)
+        
+        x1 = x0 - i1 + self.G3
+        y1 = y0 - j1 + self.G3
+        z1 = z0 - k1 + self.G3
+        x2 = x0 - i2 + 2 * self.G3
+        y2 = y0 - j2 + 2 * self.G3
+        z2 = z0 - k2 + 2 * self.G3
+        x3 = x0 - 1 + 3 * self.G3
+        y3 = y0 - 1 + 3 * self.G3
+        z3 = z0 - 1 + 3 * self.G3
+        
+        # Hash coordinates of the 4 simplex corners
+        perm = self.perm
+        ii = i & 255
+        jj = j & 255
+        kk = k & 255
+        gi0 = perm[ii + perm[jj + perm[kk]]] % 12
+        gi1 = perm[ii + i1 + perm[jj + j1 + perm[kk + k1]]] % 12
+        gi2 = perm[ii + i2 + perm[jj + j2 + perm[kk + k2]]] % 12
+        gi3 = perm[ii + 1 + perm[jj + 1 + perm[kk + 1]]] % 12
+        
+        gx, gy, gz = self.grad3[:, 0], self.grad3[:, 1], self.grad3[:, 2]
+        n0 = self._corner_array(0.6 - x0*x0 - y0*y0 - z0*z0, gx[gi0] * x0 + gy[gi0] * y0 + gz[gi0] * z0)
+        n1 = self._corner_array(0.6 - x1*x1 - y1*y1 - z1*z1, gx[gi1] * x1 + gy[gi1] * y1 + gz[gi1] * z1)
+        n2 = self._corner_array(0.6 - x2*x2 - y2*y2 - z2*z2, gx[gi2] * x2 + gy[gi2] * y2 + gz[gi2] * z2)
+        n3 = self._corner_array(0.6 - x3*x3 - y3*y3 - z3*z3, gx[gi3] * x3 + gy[gi3] * y3 + gz[gi3] * z3)
+        
+        return 32 * (n0 + n1 + n2 + n3)
+    
+    def noise2d_grid(self, xs: Any, ys: Any) -> np.ndarray:
+        """Generate 2D Simplex noise on the grid of 1D axes, as an array indexed [y, x]."""
+        return self.noise2d_array(*_grid(xs, ys))
+    
+    def noise3d_grid(self, xs: Any, ys: Any, zs: Any) -> np.ndarray:
+        """Generate 3D Simplex noise on the grid of 1D axes, as an array indexed [z, y, x]."""
+        return self.noise3d_array(*_grid(xs, ys, zs))
 
 
 class FractalNoise:
     """Fractal noise generator for complex, multi-scale patterns."""
     
     def __init__(self, noise_func: Callable, octaves: int = 4, 
-                 persistence: float = 0.5, lacunarity: float = 2.0):
-        """Initialize fractal noise with base noise function."""
+                 persistence: float = 0.5, lacunarity: float = 2.0,
+                 array_func: Optional[Callable] = None):
+        """Initialize fractal noise with base noise function.
+        
+        array_func is the array counterpart of noise_func used by the
+        *_array methods. It defaults to the generator's matching array
+        method when noise_func is one (PerlinNoise.noise2d -> noise2d_array),
+        and to a vectorized noise_func otherwise.
+        """
         self.noise_func = noise_func
         self.octaves = octaves
         self.persistence = persistence
         self.lacunarity = lacunarity
+        
+        if array_func is None:
+            owner = getattr(noise_func, '__self__', None)
+            array_func = getattr(owner, f"{getattr(noise_func, '__name__', '')}_array", None)
+        self.array_func = array_func or np.vectorize(noise_func, otypes=[float])
     
     def fbm(self, x: float, y: float = 0, z: float = 0) -> float:
         """Fractal Brownian Motion - sum of noise at different frequencies."""
@@ -361,6 +610,72 @@ class FractalNoise:
             amplitude *= self.persistence
         
         return value
+    
+    def _octave_samples(self, x: Any, y: Any = None, z: Any = None) -> np.ndarray:
+        """Evaluate every octave in one array_func call.
+        
+        The coordinates passed (x; x, y; or x, y, z) pick the noise
+        dimension, and the result has a leading octave axis.
+        """
+        coords = [np.asarray(c, dtype=np.float64) for c in (x, y, z) if c is not None]
+        frequencies = []
+        frequency = 1
+        for _ in range(self.octaves):
+            frequencies.append(frequency)
+            frequency *= self.lacunarity
+        
+        ndim = max(c.ndim for c in coords)
+        frequencies = np.array(frequencies, dtype=np.float64).reshape((-1,) + (1,) * ndim)
+        return self.array_func(*(frequencies * c for c in coords))
+    
+    def fbm_array(self, x: Any, y: Any = None, z: Any = None) -> np.ndarray:
+        """Fractal Brownian Motion for broadcastable coordinate arrays.
+        
+        Pass the coordinates array_func takes; the scalar fbm instead picks
+        the dimension per point from which coordinates are nonzero.
+        """
+        value = 0
+        amplitude = 1
+        max_value = 0
+        
+        for n in self._octave_samples(x, y, z):
+            value = value + amplitude * n
+            max_value += amplitude
+            amplitude *= self.persistence
+        
+        return value / max_value
+    
+    def turbulence_array(self, x: Any, y: Any = None, z: Any = None) -> np.ndarray:
+        """Turbulence for broadcastable coordinate arrays."""
+        value = 0
+        amplitude = 1
+        max_value = 0
+        
+        for n in self._octave_samples(x, y, z):
+            value = value + amplitude * np.abs(n)
+            max_value += amplitude
+            amplitude *= self.persistence
+        
+        return value / max_value
+    
+    def ridged_array(self, x: Any, y: Any = None, z: Any = None, offset: float = 1.0) -> np.ndarray:
+        """Ridged fractal noise for broadcastable coordinate arrays."""
+        value = 0
+        amplitude = 0.5
+        prev = 1.0
+        
+        for n in self._octave_samples(x, y, z):
+            n = offset - np.abs(n)
+            n = n * n
+            value = value + n * amplitude * prev
+            prev = n
+            amplitude *= self.persistence
+        
+        return value
+    
+    def fbm_grid(self, *axes: Any) -> np.ndarray:
+        """fBm on the grid of 1D x, y[, z] axes, as an array indexed [(z,) y, x]."""
+        return self.fbm_array(*_grid(*axes))
 
 
 class VoronoiNoise:
@@ -406,14 +721,14 @@ class VoronoiNoise:
                 cell_points = self._get_cell_points(xi + i, yi + j)
                 
                 for px, py in cell_points:
-                    if distance_func == 'euclidean':
-                        dist = np.sqrt((x - px)**2 + (y - py)**2)
-                    elif distance_func == 'manhattan':
-                        dist = abs(x - px) + abs(y - py)
+                    dx, dy = x - px, y - py
+                    if distance_func == 'manhattan':
+                        dist = abs(dx) + abs(dy)
                     elif distance_func == 'chebyshev':
-                        dist = max(abs(x - px), abs(y - py))
+                        dist = max(abs(dx), abs(dy))
                     else:
-                        dist = np.sqrt((x - px)**2 + (y - py)**2)
+                        # Euclidean; squares by multiplication (correctly rounded, unlike pow)
+                        dist = np.sqrt(dx * dx + dy * dy)
                     
                     if dist < f1:
                         f2 = f1
@@ -440,14 +755,14 @@ class VoronoiNoise:
                     cell_points = self._get_cell_points(xi + i, yi + j, zi + k)
                     
                     for px, py, pz in cell_points:
-                        if distance_func == 'euclidean':
-                            dist = np.sqrt((x - px)**2 + (y - py)**2 + (z - pz)**2)
-                        elif distance_func == 'manhattan':
-                            dist = abs(x - px) + abs(y - py) + abs(z - pz)
+                        dx, dy, dz = x - px, y - py, z - pz
+                        if distance_func == 'manhattan':
+                            dist = abs(dx) + abs(dy) + abs(dz)
                         elif distance_func == 'chebyshev':
-                            dist = max(abs(x - px), abs(y - py), abs(z - pz))
+                            dist = max(abs(dx), abs(dy), abs(dz))
                         else:
-                            dist = np.sqrt((x - px)**2 + (y - py)**2 + (z - pz)**2)
+                            # Euclidean; squares by multiplication (correctly rounded, unlike pow)
+                            dist = np.sqrt(dx * dx + dy * dy + dz * dz)
                         
                         if dist < f1:
                             f2 = f1
@@ -456,6 +771,96 @@ class VoronoiNoise:
                             f2 = dist
         
         return f1, f2
+    
+    # Samples per chunk when gathering candidate points, to bound memory
+    _ARRAY_CHUNK = 8192
+    
+    def _cell_point_table(self, cells: np.ndarray, period: Optional[int] = None) -> np.ndarray:
+        """Get the points of (C, D) lattice cells as a (C, 4, D) array padded with inf.
+        
+        Each cell draws the same random stream as _get_cell_points. In 3D,
+        cells with z == 0 also get three coordinates. With a period, cells
+        whose coordinates are equal modulo period get the same offsets.
+        """
+        dims = cells.shape[1]
+        table = np.full((len(cells), 4, dims), np.inf)
+        seeds = cells % period if period is not None else cells
+        for c, (cell, seed_cell) in enumerate(zip(cells.tolist(), seeds.tolist())):
+            x, y = seed_cell[0], seed_cell[1]
+            z = seed_cell[2] if dims == 3 else 0
+            hash_val = x * 73856093 ^ y * 19349663 ^ z * 83492791
+            np.random.seed((hash_val + self.seed) & 0x7fffffff)
+            
+            num_points = np.random.randint(1, 5)
+            table[c, :num_points] = np.array(cell, dtype=np.float64) + np.random.random((num_points, dims))
+        return table
+    
+    def _noise_array(self, coords: Tuple[Any, ...], distance_func: str,
+                     period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized F1/F2 search over the 3^D cells around every sample."""
+        coords = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in coords))
+        shape = coords[0].shape
+        points = np.stack([c.ravel() for c in coords], axis=-1)
+        count, dims = points.shape
+        
+        # Samples share few base cells, so neighborhoods are built per base cell
+        base_cells, base_index = np.unique(np.floor(points).astype(np.int64), axis=0,
+                                           return_inverse=True)
+        base_index = base_index.reshape(-1)
+        offsets = np.array(list(itertools.product((-1, 0, 1), repeat=dims)))
+        cells = base_cells[:, None, :] + offsets
+        unique_cells, inverse = np.unique(cells.reshape(-1, dims), axis=0, return_inverse=True)
+        table = self._cell_point_table(unique_cells, period)
+        neighborhoods = inverse.reshape(len(base_cells), len(offsets))
+        
+        f1 = np.empty(count)
+        f2 = np.empty(count)
+        for start in range(0, count, self._ARRAY_CHUNK):
+            chunk = slice(start, start + self._ARRAY_CHUNK)
+            candidates = table[neighborhoods[base_index[chunk]]].reshape(-1, len(offsets) * 4, dims)
+            delta = points[chunk, None, :] - candidates
+            
+            if distance_func == 'manhattan':
+                dist = np.abs(delta[..., 0]) + np.abs(delta[..., 1])
+                if dims == 3:
+                    dist += np.abs(delta[..., 2])
+            elif distance_func == 'chebyshev':
+                dist = np.abs(delta).max(axis=-1)
+            else:
+                squared = delta * delta
+                dist = squared[..., 0] + squared[..., 1]
+                if dims == 3:
+                    dist += squared[..., 2]
+                dist = np.sqrt(dist)
+            
+            nearest = np.partition(dist, 1, axis=1)
+            f1[chunk] = nearest[:, 0]
+            f2[chunk] = nearest[:, 1]
+        
+        return f1.reshape(shape), f2.reshape(shape)
+    
+    def noise2d_array(self, x: Any, y: Any, distance_func: str = 'euclidean',
+                      period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate 2D Voronoi noise for broadcastable coordinate arrays. Returns (F1, F2) arrays.
+        
+        With an integer period the noise tiles every period units.
+        """
+        return self._noise_array((x, y), distance_func, period)
+    
+    def noise3d_array(self, x: Any, y: Any, z: Any, distance_func: str = 'euclidean',
+                      period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate 3D Voronoi noise for broadcastable coordinate arrays. Returns (F1, F2) arrays."""
+        return self._noise_array((x, y, z), distance_func, period)
+    
+    def noise2d_grid(self, xs: Any, ys: Any, distance_func: str = 'euclidean',
+                     period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate 2D Voronoi (F1, F2) arrays indexed [y, x] on the grid of 1D axes."""
+        return self.noise2d_array(*_grid(xs, ys), distance_func=distance_func, period=period)
+    
+    def noise3d_grid(self, xs: Any, ys: Any, zs: Any, distance_func: str = 'euclidean',
+                     period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate 3D Voronoi (F1, F2) arrays indexed [z, y, x] on the grid of 1D axes."""
+        return self.noise3d_array(*_grid(xs, ys, zs), distance_func=distance_func, period=period)
 
 
 # Convenience functions
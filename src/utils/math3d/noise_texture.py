@@ -0,0 +1,281 @@
+"""
+Noise Textures
+
+This module provides precomputed, tileable noise textures:
+- build_noise_texture: one period of 2D or 3D fractal noise sampled on a grid,
+  with a box-filtered mip pyramid
+- NoiseTexture: bilinear (2D) or trilinear (3D) wrapped lookups, optionally
+  blended between mip levels
+- NoiseTextureCache: textures keyed by noise type, seed, octaves and
+  persistence, kept under an LRU byte budget
+
+Effects that sample the same noise field every frame can look values up in
+a cached texture, which costs a gather, instead of evaluating gradients.
+Texture coordinates use the lattice units of the noise generators.
+"""
+
+import itertools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .noise import PerlinNoise, SimplexNoise, VoronoiNoise, _grid
+
+NOISE_TYPES = ("perlin", "simplex", "voronoi")
+
+
+def _octave_function(noise_type: str, seed: int, dims: int) -> Callable:
+    """Get a function evaluating tileable noise at coordinates in [0, period)."""
+    if noise_type == "perlin":
+        noise = PerlinNoise(seed)
+        func = noise.noise2d_array if dims == 2 else noise.noise3d_array
+        return lambda coords, period: func(*coords, period=period)
+
+    if noise_type == "voronoi":
+        noise = VoronoiNoise(seed)
+        func = noise.noise2d_array if dims == 2 else noise.noise3d_array
+        return lambda coords, period: func(*coords, period=period)[0]
+
+    if noise_type == "simplex":
+        noise = SimplexNoise(seed)
+        func = noise.noise2d_array if dims == 2 else noise.noise3d_array
+
+        def blended(coords: Sequence[np.ndarray], period: int) -> np.ndarray:
+            # The skewed simplex lattice cannot wrap, so blend the copies of the
+            # field shifted by one period (this lowers contrast mid-tile)
+            result = 0
+            for corner in itertools.product((0, 1), repeat=dims):
+                weight = 1
+                shifted = []
+                for c, shift in zip(coords, corner):
+                    t = c / period
+                    weight = weight * (t if shift else 1 - t)
+                    shifted.append(c - period if shift else c)
+                result = result + weight * func(*shifted)
+            return result
+
+        return blended
+
+    raise ValueError(f"Unknown noise type: {noise_type} (expected one of {', '.join(NOISE_TYPES)})")
+
+
+class NoiseTexture:
+    """A tileable noise texture and its mip pyramid.
+
+    levels[0] holds resolution samples per axis covering one period of the
+    noise; each following level halves the resolution by averaging 2^dims
+    texels, down to a single texel. Arrays are indexed [y, x] or [z, y, x].
+    """
+
+    def __init__(self, levels: List[np.ndarray], period: int):
+        self.levels = levels
+        self.period = period
+
+    @property
+    def dims(self) -> int:
+        return self.levels[0].ndim
+
+    @property
+    def resolution(self) -> int:
+        return self.levels[0].shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by all mip levels."""
+        return sum(level.nbytes for level in self.levels)
+
+    def sample(self, x: Any, y: Any, z: Any = None, lod: float = 0.0) -> np.ndarray:
+        """Look up noise values with wrapped bilinear/trilinear filtering.
+
+        Args:
+            x, y, z: Broadcastable coordinate arrays (z only for 3D textures)
+            lod: Mip level to sample; fractional values blend the two nearest
+                levels, and values are clamped to the available levels
+
+        Returns:
+            Float64 array of the broadcast coordinate shape
+        """
+        coords = (x, y) if z is None else (x, y, z)
+        if len(coords) != self.dims:
+            raise ValueError(f"{self.dims}D texture sampled with {len(coords)} coordinates")
+
+        lod = min(max(float(lod), 0.0), len(self.levels) - 1)
+        level = int(lod)
+        result = self._sample_level(level, coords)
+        fraction = lod - level
+        if fraction > 0:
+            result = result + fraction * (self._sample_level(level + 1, coords) - result)
+        return result
+
+    def _sample_level(self, level: int, coords: Sequence[Any]) -> np.ndarray:
+        data = self.levels[level]
+        size = data.shape[0]
+        scale = 2 ** level
+        texels_per_unit = self.resolution / self.period
+
+        # Texel j of a level averages level-0 texels scale*j .. scale*j + scale - 1
+        low, fractions = [], []
+        for c in coords:
+            u = (np.asarray(c, dtype=np.float64) * texels_per_unit - (scale - 1) / 2) / scale
+            floored = np.floor(u)
+            low.append(floored.astype(np.int64) % size)
+            fractions.append(u - floored)
+
+        result = 0
+        for corner in itertools.product((0, 1), repeat=len(coords)):
+            weight = 1
+            index = []
+            for i, fraction, shift in zip(low, fractions, corner):
+                weight = weight * (fraction if shift else 1 - fraction)
+                index.append((i + 1) % size if shift else i)
+            result = result + weight * data[tuple(reversed(index))]
+        return result
+
+    def __repr__(self) -> str:
+        return (f"NoiseTexture({self.dims}D, {self.resolution} texels per axis, "
+                f"period={self.period}, {len(self.levels)} mip levels)")
+
+
+def build_noise_texture(noise_type: str = "perlin", seed: int = 0, octaves: int = 1,
+                        persistence: float = 0.5, dims: int = 2, resolution: int = 256,
+                        period: int = 8, dtype: Any = np.float32) -> NoiseTexture:
+    """Precompute one period of tileable fractal noise.
+
+    Octaves double in frequency (lacunarity 2, which keeps every octave
+    tileable) and are normalized like FractalNoise.fbm.
+
+    Args:
+        noise_type: "perlin", "simplex" or "voronoi" (F1 distance)
+        seed: Noise seed
+        octaves: Number of octaves
+        persistence: Amplitude factor per octave
+        dims: 2 or 3
+        resolution: Texels per axis, a power of two
+        period: Lattice units covered by the texture before it repeats
+        dtype: Storage precision
+    """
+    if dims not in (2, 3):
+        raise ValueError(f"dims must be 2 or 3, got {dims}")
+    if resolution < 1 or resolution & (resolution - 1):
+        raise ValueError(f"resolution must be a power of two, got {resolution}")
+    if period < 1 or int(period) != period:
+        raise ValueError(f"period must be a positive integer, got {period}")
+
+    octave_function = _octave_function(noise_type, seed, dims)
+    coords = _grid(*[np.arange(resolution) * (period / resolution)] * dims)
+
+    value = 0
+    amplitude = 1
+    frequency = 1
+    max_value = 0
+    for _ in range(octaves):
+        value = value + amplitude * octave_function([c * frequency for c in coords], period * frequency)
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= 2
+
+    base = np.broadcast_to(value / max_value, (resolution,) * dims).astype(dtype)
+    levels = [base]
+    while levels[-1].shape[0] > 1:
+        half = levels[-1].shape[0] // 2
+        blocks = levels[-1].reshape(sum(((half, 2) for _ in range(dims)), ()))
+        levels.append(blocks.mean(axis=tuple(range(1, 2 * dims, 2)), dtype=np.float64).astype(dtype))
+    return NoiseTexture(levels, int(period))
+
+
+class NoiseTextureCache:
+    """LRU cache of noise textures under a byte budget.
+
+        cache = NoiseTextureCache(max_size_mb=32)
+        heights = cache.sample2d(xs, ys, "perlin", seed=3, octaves=4)
+
+    Textures are built on first use and shared by every lookup with the
+    same noise type, seed, octaves, persistence, dimensions, resolution and
+    period.
+    """
+
+    def __init__(self, max_size_mb: float = 64, resolution: int = 256, resolution_3d: int = 64,
+                 period: int = 8, dtype: Any = np.float32):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size_mb: Memory budget for all textures; a texture larger
+                than the budget is returned without being cached
+            resolution: Default texels per axis of new 2D textures
+            resolution_3d: Default texels per axis of new 3D textures
+            period: Default lattice units covered by new textures
+            dtype: Storage precision of new textures
+        """
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.resolution = resolution
+        self.resolution_3d = resolution_3d
+        self.period = period
+        self.dtype = dtype
+
+        # Least recently used first
+        self.textures: 'OrderedDict[Tuple, NoiseTexture]' = OrderedDict()
+        self.size_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_texture(self, noise_type: str = "perlin", seed: int = 0, octaves: int = 1,
+                    persistence: float = 0.5, dims: int = 2, resolution: Optional[int] = None,
+                    period: Optional[int] = None) -> NoiseTexture:
+        """Get a texture, building it on a miss (see build_noise_texture for arguments)."""
+        default_resolution = self.resolution if dims == 2 else self.resolution_3d
+        key = (noise_type, seed, octaves, persistence, dims,
+               resolution or default_resolution, period or self.period)
+        texture = self.textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            self.textures.move_to_end(key)
+            return texture
+
+        self.misses += 1
+        texture = build_noise_texture(noise_type, seed, octaves, persistence, dims,
+                                      key[5], key[6], self.dtype)
+        if texture.nbytes > self.max_size_bytes:
+            return texture
+
+        self.textures[key] = texture
+        self.size_bytes += texture.nbytes
+        while self.size_bytes > self.max_size_bytes:
+            _, evicted = self.textures.popitem(last=False)
+            self.size_bytes -= evicted.nbytes
+            self.evictions += 1
+        return texture
+
+    def sample2d(self, x: Any, y: Any, noise_type: str = "perlin", seed: int = 0,
+                 octaves: int = 1, persistence: float = 0.5, lod: float = 0.0) -> np.ndarray:
+        """Sample a cached 2D texture with bilinear filtering."""
+        return self.get_texture(noise_type, seed, octaves, persistence, dims=2).sample(x, y, lod=lod)
+
+    def sample3d(self, x: Any, y: Any, z: Any, noise_type: str = "perlin", seed: int = 0,
+                 octaves: int = 1, persistence: float = 0.5, lod: float = 0.0) -> np.ndarray:
+        """Sample a cached 3D texture with trilinear filtering."""
+        return self.get_texture(noise_type, seed, octaves, persistence, dims=3).sample(x, y, z, lod=lod)
+
+    def clear(self):
+        """Drop all textures."""
+        self.textures.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.textures)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'textures': len(self.textures),
+            'size_mb': self.size_bytes / (1024 * 1024),
+            'max_size_mb': self.max_size_bytes / (1024 * 1024),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions
+        }
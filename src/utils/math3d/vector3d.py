@@ -10,6 +10,7 @@ This module provides comprehensive 3D vector operations including:
 - Angle calculations
 """
 
+import math
 import numpy as np
 from typing import Union
 from dataclasses import dataclass
@@ -17,18 +18,26 @@ from dataclasses import dataclass
 
 @dataclass
 class Vector3D:
-    """3D Vector with comprehensive operations."""
+    """3D Vector with comprehensive operations.
+
+    Operations work on the x, y and z floats directly; the numpy array
+    returned by ``array`` is only built when first requested. For many
+    vectors at once use Vector3DArray.
+    """
+    __slots__ = ('x', 'y', 'z', '_array')
+
     x: float
     y: float
     z: float
 
-    def __post_init__(self):
-        self._array = np.array([self.x, self.y, self.z], dtype=np.float64)
-
     @property
     def array(self) -> np.ndarray:
         """Get numpy array representation."""
-        return self._array
+        try:
+            return self._array
+        except AttributeError:
+            self._array = np.array([self.x, self.y, self.z], dtype=np.float64)
+            return self._array
 
     @classmethod
     def from_array(cls, arr: np.ndarray) -> 'Vector3D':
@@ -57,26 +66,28 @@ class Vector3D:
 
     def magnitude(self) -> float:
         """Calculate vector magnitude."""
-        return np.linalg.norm(self._array)
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
     def magnitude_squared(self) -> float:
         """Calculate squared magnitude (faster than magnitude)."""
-        return np.dot(self._array, self._array)
+        return self.x * self.x + self.y * self.y + self.z * self.z
 
     def normalize(self) -> 'Vector3D':
         """Return normalized vector."""
         mag = self.magnitude()
         if mag == 0:
             return Vector3D.zero()
-        return Vector3D.from_array(self._array / mag)
+        return Vector3D(self.x / mag, self.y / mag, self.z / mag)
 
     def dot(self, other: 'Vector3D') -> float:
         """Calculate dot product."""
-        return np.dot(self._array, other._array)
+        return self.x * other.x + self.y * other.y + self.z * other.z
 
     def cross(self, other: 'Vector3D') -> 'Vector3D':
         """Calculate cross product."""
-        return Vector3D.from_array(np.cross(self._array, other._array))
+        return Vector3D(self.y * other.z - self.z * other.y,
+                        self.z * other.x - self.x * other.z,
+                        self.x * other.y - self.y * other.x)
 
     def distance_to(self, other: 'Vector3D') -> float:
         """Calculate distance to another vector."""
@@ -89,18 +100,18 @@ class Vector3D:
     def slerp(self, other: 'Vector3D', t: float) -> 'Vector3D':
         """Spherical linear interpolation between normalized vectors."""
         dot_product = self.dot(other)
-        dot_product = np.clip(dot_product, -1.0, 1.0)
+        dot_product = min(max(dot_product, -1.0), 1.0)
         
         if abs(dot_product) > 0.9995:
             return self.lerp(other, t).normalize()
         
-        theta = np.arccos(abs(dot_product))
-        sin_theta = np.sin(theta)
+        theta = math.acos(abs(dot_product))
+        sin_theta = math.sin(theta)
         
-        a = np.sin((1 - t) * theta) / sin_theta
-        b = np.sin(t * theta) / sin_theta
+        a = math.sin((1 - t) * theta) / sin_theta
+        b = math.sin(t * theta) / sin_theta
         
-        return Vector3D.from_array(a * self._array + b * other._array)
+        return Vector3D(a * self.x + b * other.x, a * self.y + b * other.y, a * self.z + b * other.z)
 
     def reflect(self, normal: 'Vector3D') -> 'Vector3D':
         """Reflect vector across surface normal."""
@@ -108,7 +119,7 @@ class Vector3D:
 
     def project_onto(self, other: 'Vector3D') -> 'Vector3D':
         """Project this vector onto another vector."""
-        return other * (self.dot(other) / other.magnitude_squared())
+        return other * self.dot(other) / other.magnitude_squared()
 
     def angle_between(self, other: 'Vector3D') -> float:
         """Calculate angle between vectors in radians."""
@@ -116,31 +127,36 @@ class Vector3D:
         mags = self.magnitude() * other.magnitude()
         if mags == 0:
             return 0
-        cos_angle = np.clip(dot_product / mags, -1.0, 1.0)
-        return np.arccos(cos_angle)
+        cos_angle = min(max(dot_product / mags, -1.0), 1.0)
+        return math.acos(cos_angle)
 
     def __add__(self, other: 'Vector3D') -> 'Vector3D':
-        return Vector3D.from_array(self._array + other._array)
+        return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def __sub__(self, other: 'Vector3D') -> 'Vector3D':
-        return Vector3D.from_array(self._array - other._array)
+        return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def __mul__(self, scalar: float) -> 'Vector3D':
-        return Vector3D.from_array(self._array * scalar)
+        return Vector3D(self.x * scalar, self.y * scalar, self.z * scalar)
 
     def __rmul__(self, scalar: float) -> 'Vector3D':
         return self.__mul__(scalar)
 
     def __truediv__(self, scalar: float) -> 'Vector3D':
-        return Vector3D.from_array(self._array / scalar)
+        if scalar == 0:
+            # Same as dividing the array: inf/nan with a RuntimeWarning, not ZeroDivisionError
+            return Vector3D.from_array(self.array / scalar)
+        return Vector3D(self.x / scalar, self.y / scalar, self.z / scalar)
 
     def __neg__(self) -> 'Vector3D':
-        return Vector3D.from_array(-self._array)
+        return Vector3D(-self.x, -self.y, -self.z)
 
     def __eq__(self, other: 'Vector3D') -> bool:
         if not isinstance(other, Vector3D):
             return False
-        return np.allclose(self._array, other._array)
+        # Same tolerance as np.allclose
+        return all(abs(a - b) <= 1e-8 + 1e-5 * abs(b)
+                   for a, b in ((self.x, other.x), (self.y, other.y), (self.z, other.z)))
 
     def __str__(self) -> str:
         return f"Vector3D({self.x:.3f}, {self.y:.3f}, {self.z:.3f})"
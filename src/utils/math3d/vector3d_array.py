@@ -0,0 +1,252 @@
+"""
+Arrays of 3D Vectors
+
+This module provides Vector3DArray, a structure-of-arrays companion to
+Vector3D: N vectors stored as one contiguous N×3 float64 (or float32)
+array, with the Vector3D API applied to all of them at once.
+
+Operands can be another Vector3DArray of the same length, a single
+Vector3D or 3-element sequence (broadcast to every vector), or a raw
+(N, 3) array. Scalar parameters such as lerp's t accept a number or one
+value per vector.
+"""
+
+import numpy as np
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .vector3d import Vector3D
+
+
+def _as_components(value: Any, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """Get an operand as an (N, 3) or (3,) array."""
+    if isinstance(value, Vector3DArray):
+        value = value.data
+    elif isinstance(value, Vector3D):
+        value = (value.x, value.y, value.z)
+    return np.asarray(value, dtype=dtype)
+
+
+def _as_column(value: Any) -> Any:
+    """Get a per-vector scalar as an (N, 1) column so it broadcasts over components."""
+    value = np.asarray(value)
+    return value[:, None] if value.ndim == 1 else value
+
+
+class Vector3DArray:
+    """N 3D vectors stored as a contiguous (N, 3) array."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Any, dtype: Optional[Union[type, np.dtype]] = None):
+        """
+        Initialize from an (N, 3) array-like.
+
+        Args:
+            data: Vector components; a float array with matching dtype is
+                used without copying
+            dtype: np.float64 (default) or np.float32
+        """
+        if dtype is None:
+            dtype = data.dtype if isinstance(data, np.ndarray) and data.dtype == np.float32 else np.float64
+        array = np.ascontiguousarray(data, dtype=dtype)
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError(f"Expected an (N, 3) array, got shape {array.shape}")
+        self.data = array
+
+    @classmethod
+    def zeros(cls, count: int, dtype: Union[type, np.dtype] = np.float64) -> 'Vector3DArray':
+        """Create an array of zero vectors."""
+        return cls(np.zeros((count, 3), dtype=dtype))
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector3D],
+                     dtype: Union[type, np.dtype] = np.float64) -> 'Vector3DArray':
+        """Create from Vector3D objects."""
+        return cls(np.array([(v.x, v.y, v.z) for v in vectors], dtype=dtype).reshape(-1, 3))
+
+    @classmethod
+    def from_components(cls, x: Any, y: Any, z: Any,
+                        dtype: Union[type, np.dtype] = np.float64) -> 'Vector3DArray':
+        """Create from separate x, y and z arrays."""
+        return cls(np.stack(np.broadcast_arrays(x, y, z), axis=-1).astype(dtype, copy=False))
+
+    @property
+    def x(self) -> np.ndarray:
+        """View of the x components."""
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """View of the y components."""
+        return self.data[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """View of the z components."""
+        return self.data[:, 2]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    def astype(self, dtype: Union[type, np.dtype]) -> 'Vector3DArray':
+        """Convert to another float precision."""
+        return Vector3DArray(self.data, dtype)
+
+    def copy(self) -> 'Vector3DArray':
+        return self._wrap(self.data.copy())
+
+    def to_vectors(self) -> list:
+        """Convert to a list of Vector3D objects."""
+        return [Vector3D(x, y, z) for x, y, z in self.data.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Vector3D]:
+        return iter(self.to_vectors())
+
+    def __getitem__(self, index: Any) -> Union[Vector3D, 'Vector3DArray']:
+        """Get one Vector3D by integer index, or a Vector3DArray for slices and masks."""
+        if isinstance(index, (int, np.integer)):
+            return Vector3D.from_array(self.data[index])
+        return self._wrap(self.data[index])
+
+    def __setitem__(self, index: Any, value: Any):
+        self.data[index] = _as_components(value)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    def _wrap(self, array: np.ndarray) -> 'Vector3DArray':
+        """Wrap a result, keeping this array's precision."""
+        return Vector3DArray(array, self.dtype)
+
+    # Vector operations
+
+    def magnitude(self) -> np.ndarray:
+        """Calculate the magnitude of every vector."""
+        return np.sqrt(self.magnitude_squared())
+
+    def magnitude_squared(self) -> np.ndarray:
+        """Calculate squared magnitudes (faster than magnitude)."""
+        return np.einsum('ij,ij->i', self.data, self.data)
+
+    def normalize(self) -> 'Vector3DArray':
+        """Return normalized vectors; zero vectors stay zero."""
+        mag = self.magnitude()
+        safe = np.where(mag == 0, 1, mag)
+        return self._wrap(self.data / safe[:, None])
+
+    def dot(self, other: Any) -> np.ndarray:
+        """Calculate dot products."""
+        other = _as_components(other, self.dtype)
+        if other.ndim == 1:
+            return self.data @ other
+        return np.einsum('ij,ij->i', self.data, other)
+
+    def cross(self, other: Any) -> 'Vector3DArray':
+        """Calculate cross products."""
+        a = self.data
+        b = np.broadcast_to(_as_components(other, self.dtype), a.shape)
+        result = np.empty_like(a)
+        result[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+        result[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+        result[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        return self._wrap(result)
+
+    def distance_to(self, other: Any) -> np.ndarray:
+        """Calculate distances to other vectors."""
+        return (self - other).magnitude()
+
+    def lerp(self, other: Any, t: Any) -> 'Vector3DArray':
+        """Linear interpolation between vectors."""
+        other = _as_components(other, self.dtype)
+        return self._wrap(self.data + (other - self.data) * _as_column(t))
+
+    def slerp(self, other: Any, t: Any) -> 'Vector3DArray':
+        """Spherical linear interpolation between normalized vectors.
+
+        Matches Vector3D.slerp per vector, including the normalized lerp
+        fallback for nearly parallel vectors.
+        """
+        other = np.broadcast_to(_as_components(other, self.dtype), self.data.shape)
+        t = np.broadcast_to(np.asarray(t, dtype=float), (len(self),))
+        dot_product = np.clip(np.einsum('ij,ij->i', self.data, other), -1.0, 1.0)
+
+        theta = np.arccos(np.abs(dot_product))
+        sin_theta = np.sin(theta)
+        near = np.abs(dot_product) > 0.9995
+        safe = np.where(near, 1.0, sin_theta)
+        a = np.sin((1 - t) * theta) / safe
+        b = np.sin(t * theta) / safe
+        result = a[:, None] * self.data + b[:, None] * other
+
+        if near.any():
+            lerped = self._wrap(self.data[near] + (other[near] - self.data[near]) * t[near][:, None])
+            result[near] = lerped.normalize().data
+        return self._wrap(result)
+
+    def reflect(self, normal: Any) -> 'Vector3DArray':
+        """Reflect vectors across surface normals."""
+        normal = _as_components(normal, self.dtype)
+        return self._wrap(self.data - normal * (2 * self.dot(normal))[:, None])
+
+    def project_onto(self, other: Any) -> 'Vector3DArray':
+        """Project vectors onto other vectors."""
+        other = _as_components(other, self.dtype)
+        scale = self.dot(other) / np.einsum('...i,...i->...', other, other)
+        return self._wrap(other * _as_column(scale))
+
+    def angle_between(self, other: Any) -> np.ndarray:
+        """Calculate angles between vectors in radians (0 where either is zero)."""
+        other = _as_components(other, self.dtype)
+        mags = self.magnitude() * np.sqrt(np.einsum('...i,...i->...', other, other))
+        safe = np.where(mags == 0, 1, mags)
+        cos_angle = np.clip(self.dot(other) / safe, -1.0, 1.0)
+        return np.where(mags == 0, 0.0, np.arccos(cos_angle))
+
+    # Matrix4x4 interop
+
+    def transform(self, matrix: Any) -> 'Vector3DArray':
+        """Transform points by a Matrix4x4, with perspective division like Matrix4x4.transform_point."""
+        from .matrix4x4 import transform_points_array
+        return self._wrap(transform_points_array(getattr(matrix, 'matrix', matrix), self.data))
+
+    def transform_direction(self, matrix: Any) -> 'Vector3DArray':
+        """Transform directions by a Matrix4x4 (ignores translation)."""
+        from .matrix4x4 import transform_points_array
+        return self._wrap(transform_points_array(getattr(matrix, 'matrix', matrix), self.data, directions=True))
+
+    # Arithmetic
+
+    def __add__(self, other: Any) -> 'Vector3DArray':
+        return self._wrap(self.data + _as_components(other, self.dtype))
+
+    def __radd__(self, other: Any) -> 'Vector3DArray':
+        return self.__add__(other)
+
+    def __sub__(self, other: Any) -> 'Vector3DArray':
+        return self._wrap(self.data - _as_components(other, self.dtype))
+
+    def __rsub__(self, other: Any) -> 'Vector3DArray':
+        return self._wrap(_as_components(other, self.dtype) - self.data)
+
+    def __mul__(self, scalar: Any) -> 'Vector3DArray':
+        return self._wrap(self.data * _as_column(scalar))
+
+    def __rmul__(self, scalar: Any) -> 'Vector3DArray':
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: Any) -> 'Vector3DArray':
+        return self._wrap(self.data / _as_column(scalar))
+
+    def __neg__(self) -> 'Vector3DArray':
+        return self._wrap(-self.data)
+
+    def allclose(self, other: Any, rtol: float = 1e-5, atol: float = 1e-8) -> bool:
+        """Check whether all vectors match other within tolerance."""
+        return bool(np.allclose(self.data, _as_components(other, self.dtype), rtol=rtol, atol=atol))
+
+    def __repr__(self) -> str:
+        return f"Vector3DArray({len(self)} vectors, dtype={self.dtype})"
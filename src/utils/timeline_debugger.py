@@ -2,7 +2,6 @@
 
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
-from datetime import datetime
 import json
 import time
 from pathlib import Path
@@ -12,6 +11,8 @@ from core.timeline.composer_timeline import (
     ComposerTimeline, TimelineEvent, TimelineLayer, 
     TimelineTrack, Keyframe, InterpolationType
 )
+from .timeline_profiler import TimelineProfiler
+from .timeline_snapshot import TimelineSnapshot, TimelineSnapshotter, diff_snapshots
 
 @dataclass
 class TimelineBreakpoint:
@@ -66,7 +67,34 @@ class TimelineDebugger:
         self.skipped_events: List[TimelineEvent] = []
         
         # State snapshots
-        self.snapshots: Dict[float, Dict[str, Any]] = {}
+        self.snapshots: Dict[float, TimelineSnapshot] = {}
+        self.snapshotter = TimelineSnapshotter(timeline)
+        
+        # Opt-in cost attribution, see enable_profiling
+        self.profiler: Optional[TimelineProfiler] = None
+    
+    def enable_profiling(self, scene=None, effects: Optional[List[Any]] = None,
+                         track_allocations: bool = False) -> TimelineProfiler:
+        """Start profiling timeline events, scene playback and effects.
+        
+        Events added after this call are not timed until it is called again.
+        """
+        if self.profiler is None:
+            self.profiler = TimelineProfiler(self.timeline, track_allocations)
+        self.profiler.wrap_timeline()
+        if scene is not None:
+            self.profiler.wrap_scene(scene)
+        for effect in effects or []:
+            self.profiler.wrap_effect(effect)
+        self.profiler.start()
+        self.log_event("profiling_enabled", {"track_allocations": track_allocations})
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Stop profiling and restore wrapped callbacks; records are kept."""
+        if self.profiler is not None:
+            self.profiler.stop()
+            self.profiler.unwrap()
     
     def add_breakpoint(self, time: float, condition: Optional[Callable] = None, 
                       label: str = "") -> TimelineBreakpoint:
@@ -267,86 +295,32 @@ class TimelineDebugger:
         avg_frame_time = sum(frame_times) / len(frame_times)
         return 1.0 / avg_frame_time if avg_frame_time > 0 else 0.0
     
-    def take_snapshot(self, label: Optional[str] = None):
-        """Take a snapshot of current timeline state."""
-        snapshot_time = self.timeline.current_time
-        
-        snapshot = {
-            "time": snapshot_time,
-            "label": label or f"snapshot_{len(self.snapshots)}",
-            "timestamp": datetime.now().isoformat(),
-            "layers": {},
-            "events": [],
-            "performance": dict(self.performance_metrics)
-        }
+    def take_snapshot(self, label: Optional[str] = None) -> TimelineSnapshot:
+        """Take a snapshot of current timeline state.
+        
+        Tracks and layers that cannot have changed since the previous
+        snapshot are shared with it, so snapshots can be taken every frame.
+        """
+        snapshot = self.snapshotter.take(
+            label=label or f"snapshot_{len(self.snapshots)}",
+            performance=self.performance_metrics
+        )
         
-        # Capture layer states
-        for layer in self.timeline.layers:
-            layer_data = {
-                "visible": layer.visible,
-                "locked": layer.locked,
-                "solo": layer.solo,
-                "tracks": {}
-            }
-            
-            for track in layer.tracks:
-                track_data = {
-                    "enabled": track.enabled,
-                    "keyframe_values": {}
-                }
-                
-                # Capture current keyframe values
-                for prop_name in track.keyframes:
-                    value = track.get_value_at_time(prop_name, snapshot_time)
-                    track_data["keyframe_values"][prop_name] = value
-                
-                layer_data["tracks"][track.name] = track_data
-            
-            snapshot["layers"][layer.name] = layer_data
-        
-        # Capture pending events
-        for event in self.timeline.event_queue:
-            if event.time >= snapshot_time:
-                snapshot["events"].append({
-                    "name": event.name,
-                    "time": event.time,
-                    "enabled": event.enabled,
-                    "tags": event.tags
-                })
-        
-        self.snapshots[snapshot_time] = snapshot
-        self.log_event("snapshot_taken", {"label": snapshot["label"]})
+        self.snapshots[snapshot.time] = snapshot
+        self.log_event("snapshot_taken", {"label": snapshot.label})
         
         return snapshot
     
     def compare_snapshots(self, time1: float, time2: float) -> Dict[str, Any]:
-        """Compare two timeline snapshots."""
+        """Compare two timeline snapshots.
+        
+        Layers and tracks shared between the snapshots are skipped, so the
+        cost grows with the number of changed tracks.
+        """
         if time1 not in self.snapshots or time2 not in self.snapshots:
             raise ValueError("Snapshot times not found")
         
-        snap1 = self.snapshots[time1]
-        snap2 = self.snapshots[time2]
-        
-        differences = {
-            "time_diff": time2 - time1,
-            "layer_changes": {},
-            "event_changes": {},
-            "performance_changes": {}
-        }
-        
-        # Compare layers
-        for layer_name in snap1["layers"]:
-            if layer_name in snap2["layers"]:
-                layer1 = snap1["layers"][layer_name]
-                layer2 = snap2["layers"][layer_name]
-                
-                if layer1 != layer2:
-                    differences["layer_changes"][layer_name] = {
-                        "before": layer1,
-                        "after": layer2
-                    }
-        
-        return differences
+        return diff_snapshots(self.snapshots[time1], self.snapshots[time2])
     
     def export_debug_report(self, filepath: Path):
         """Export comprehensive debug report."""
@@ -385,9 +359,24 @@ class TimelineDebugger:
                 }
                 for bp in self.breakpoints
             ],
-            "snapshots": list(self.snapshots.values())
+            "snapshots": [snapshot.to_dict() for snapshot in self.snapshots.values()]
         }
         
+        if self.profiler is not None:
+            report["profile"] = {
+                by: {
+                    key: {
+                        "calls": stats.count,
+                        "total": stats.total,
+                        "mean": stats.mean,
+                        "max": stats.max,
+                        "allocated": stats.allocated
+                    }
+                    for key, stats in self.profiler.summary(by).items()
+                }
+                for by in ("layer", "track", "tag", "category")
+            }
+        
         with open(filepath, 'w') as f:
             json.dump(report, f, indent=2)
         
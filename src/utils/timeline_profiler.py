@@ -0,0 +1,302 @@
+"""Opt-in profiling of timeline events, scene playback and effects.
+
+TimelineProfiler wraps TimelineEvent callbacks, Scene.play and effect
+animate methods with high-resolution timers (and, optionally, tracemalloc
+allocation counters). Records are aggregated by layer, track, tag, name or
+category and can be exported as a Chrome trace (open in chrome://tracing
+or Perfetto) or a flat text report.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterable
+from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# Attribute set on wrapped callables so they are not wrapped twice
+_WRAPPED_ATTR = '__timeline_profiler_original__'
+
+
+@dataclass
+class ProfileRecord:
+    """One timed call."""
+    name: str
+    category: str  # "event", "play", "effect" or a custom span category
+    start: float  # Seconds since the profiler started
+    duration: float
+    allocated: int = 0  # Net bytes allocated, if allocations are tracked
+    layer: Optional[str] = None
+    track: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    timeline_time: Optional[float] = None
+    thread_id: int = 0
+
+
+@dataclass
+class ProfileStats:
+    """Aggregated timings for one group of records."""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    allocated: int = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, record: ProfileRecord):
+        self.count += 1
+        self.total += record.duration
+        self.max = max(self.max, record.duration)
+        self.allocated += record.allocated
+
+
+class TimelineProfiler:
+    """Attributes render time to timeline events, tracks, effects and animations.
+
+    Nothing is timed until the profiler is started and objects are wrapped:
+
+        profiler = TimelineProfiler(timeline)
+        with profiler:
+            profiler.wrap_timeline()
+            profiler.wrap_scene(scene)
+            ...
+        print(profiler.report(by="track"))
+        profiler.export_chrome_trace("trace.json")
+
+    Timings include nested calls, so an event that plays an animation counts
+    the animation's time too. Allocation tracking uses tracemalloc, which
+    slows Python code down noticeably, so it is off by default.
+    """
+
+    def __init__(self, timeline: Optional[Any] = None, track_allocations: bool = False):
+        """
+        Initialize the profiler.
+
+        Args:
+            timeline: ComposerTimeline whose events are profiled and whose
+                current time is recorded with each call
+            track_allocations: Record net bytes allocated per call with tracemalloc
+        """
+        self.timeline = timeline
+        self.track_allocations = track_allocations
+        self.records: List[ProfileRecord] = []
+        self.enabled = False
+
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+        # (object, attribute, had instance attribute, original value) for unwrap()
+        self._wrapped: List[tuple] = []
+
+    def __enter__(self) -> 'TimelineProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        self.unwrap()
+
+    def start(self):
+        """Start recording calls to wrapped objects."""
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def stop(self):
+        """Stop recording; wrapped objects keep working untimed."""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def clear(self):
+        """Drop all records."""
+        self.records.clear()
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "span", layer: Optional[str] = None,
+             track: Optional[str] = None, tags: Optional[Iterable[str]] = None):
+        """Time a block of code as one record."""
+        if not self.enabled:
+            yield
+            return
+
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if tracing:
+                allocated = tracemalloc.get_traced_memory()[0] - allocated
+            self.records.append(ProfileRecord(
+                name=name,
+                category=category,
+                start=start - self._origin,
+                duration=end - start,
+                allocated=allocated,
+                layer=layer,
+                track=track,
+                tags=list(tags or []),
+                timeline_time=getattr(self.timeline, 'current_time', None),
+                thread_id=threading.get_ident()
+            ))
+
+    def wrap_timeline(self, timeline: Optional[Any] = None) -> int:
+        """Time the callbacks of every event in a timeline.
+
+        Events added later are not wrapped; calling this again wraps them
+        and leaves the others alone.
+
+        Returns:
+            Number of newly wrapped events
+        """
+        timeline = timeline or self.timeline
+        if self.timeline is None:
+            self.timeline = timeline
+
+        count = 0
+        for event in timeline.events:
+            if hasattr(event.callback, _WRAPPED_ATTR):
+                continue
+            self._replace(event, 'callback', self._wrap(
+                event.callback, event.name or getattr(event.callback, '__name__', 'event'), 'event',
+                layer=event.layer_name, track=event.track_name, tags=event.tags
+            ))
+            count += 1
+        return count
+
+    def wrap_scene(self, scene: Any):
+        """Time every Scene.play call, named after the animation types."""
+        original = scene.play
+        if hasattr(original, _WRAPPED_ATTR):
+            return
+
+        @wraps(original)
+        def play(*animations, **kwargs):
+            names = ", ".join(type(animation).__name__ for animation in animations)
+            with self.span(f"play({names})", "play"):
+                return original(*animations, **kwargs)
+
+        setattr(play, _WRAPPED_ATTR, original)
+        self._replace(scene, 'play', play)
+
+    def wrap_effect(self, effect: Any, layer: Optional[str] = None, track: Optional[str] = None,
+                    tags: Optional[Iterable[str]] = None):
+        """Time an effect's animate method."""
+        if hasattr(effect.animate, _WRAPPED_ATTR):
+            return
+        self._replace(effect, 'animate', self._wrap(
+            effect.animate, type(effect).__name__, 'effect', layer=layer, track=track, tags=tags
+        ))
+
+    def unwrap(self):
+        """Restore every wrapped callable."""
+        for obj, attribute, had_attribute, original in reversed(self._wrapped):
+            if had_attribute:
+                setattr(obj, attribute, original)
+            else:
+                # Methods wrapped on an instance are restored by dropping the override
+                delattr(obj, attribute)
+        self._wrapped.clear()
+
+    def _replace(self, obj: Any, attribute: str, wrapper: Callable):
+        instance_attributes = vars(obj)
+        self._wrapped.append((obj, attribute, attribute in instance_attributes,
+                              instance_attributes.get(attribute)))
+        setattr(obj, attribute, wrapper)
+
+    def _wrap(self, func: Callable, name: str, category: str, layer: Optional[str] = None,
+              track: Optional[str] = None, tags: Optional[Iterable[str]] = None) -> Callable:
+        tags = list(tags or [])
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.span(name, category, layer, track, tags):
+                return func(*args, **kwargs)
+
+        setattr(wrapper, _WRAPPED_ATTR, func)
+        return wrapper
+
+    def summary(self, by: str = "name") -> Dict[str, ProfileStats]:
+        """Aggregate records.
+
+        Args:
+            by: "name", "category", "layer", "track" or "tag". Records with
+                several tags count once per tag; records without a layer,
+                track or tag are grouped under "(none)".
+
+        Returns:
+            Stats per group, slowest total first
+        """
+        if by not in ("name", "category", "layer", "track", "tag"):
+            raise ValueError(f"Unknown grouping: {by}")
+
+        groups: Dict[str, ProfileStats] = {}
+        for record in self.records:
+            if by == "tag":
+                keys = record.tags or ["(none)"]
+            elif by == "track" and record.track:
+                keys = [f"{record.layer}/{record.track}" if record.layer else record.track]
+            else:
+                keys = [getattr(record, by) or "(none)"]
+            for key in keys:
+                groups.setdefault(key, ProfileStats()).add(record)
+
+        return dict(sorted(groups.items(), key=lambda item: item[1].total, reverse=True))
+
+    def report(self, by: str = "name", frame_budget: Optional[float] = None) -> str:
+        """Format a flat text report of summary(by).
+
+        Args:
+            by: Grouping passed to summary()
+            frame_budget: Seconds per frame; groups whose slowest call
+                exceeds it are flagged (defaults to 1 / timeline fps)
+        """
+        if frame_budget is None and self.timeline is not None:
+            frame_budget = 1.0 / self.timeline.fps
+
+        lines = [f"{by:<40}{'calls':>8}{'total ms':>12}{'mean ms':>12}{'max ms':>12}{'alloc KB':>12}"]
+        for key, stats in self.summary(by).items():
+            flag = "  over budget" if frame_budget and stats.max > frame_budget else ""
+            lines.append(
+                f"{key[:39]:<40}{stats.count:>8}{stats.total * 1000:>12.3f}{stats.mean * 1000:>12.3f}"
+                f"{stats.max * 1000:>12.3f}{stats.allocated / 1024:>12.1f}{flag}"
+            )
+        return "\n".join(lines)
+
+    def export_report(self, filepath: Path, by: str = "name"):
+        """Write report(by) to a text file."""
+        Path(filepath).write_text(self.report(by) + "\n")
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Get the records as Chrome trace_event JSON data."""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {key: value for key, value in asdict(record).items()
+                    if key not in ("name", "category", "start", "duration", "thread_id") and value not in (None, [])}
+            events.append({
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.duration * 1e6,
+                "pid": pid,
+                "tid": record.thread_id,
+                "args": args
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, filepath: Path):
+        """Write the records as a Chrome trace_event JSON file."""
+        with open(filepath, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -0,0 +1,262 @@
+"""Structurally shared timeline snapshots for debugging.
+
+A TimelineSnapshotter reuses parts of its previous snapshot that cannot
+have changed. A track snapshot is shared when the track object, its
+version and enabled flag are unchanged and the new time falls inside the
+span over which every one of its properties is constant (holds, step
+segments). A layer snapshot is shared when all of its tracks are, and the
+whole layer map is shared when every layer is. Snapshotting every frame of
+a mostly static timeline therefore evaluates only the animated tracks and
+stores little beyond the snapshot itself, and diffing skips shared parts
+by identity so its cost grows with what changed.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from bisect import bisect_left
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TrackSnapshot:
+    """Property values of one track, valid for times in [valid_from, valid_until)."""
+    track: Any
+    version: int
+    enabled: bool
+    values: Dict[str, Any]
+    valid_from: float
+    valid_until: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "keyframe_values": dict(self.values)}
+
+
+@dataclass(frozen=True)
+class LayerSnapshot:
+    """Flags of one layer and the snapshots of its tracks."""
+    visible: bool
+    locked: bool
+    solo: bool
+    tracks: Dict[str, TrackSnapshot]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "visible": self.visible,
+            "locked": self.locked,
+            "solo": self.solo,
+            "tracks": {name: track.to_dict() for name, track in self.tracks.items()}
+        }
+
+
+@dataclass(frozen=True)
+class TimelineSnapshot:
+    """Timeline state at one time.
+
+    Pending events are kept as a shared, time-sorted tuple of the indexed
+    events plus the offset of the first one at or after the snapshot time;
+    their names, flags and tags are read when converted with to_dict.
+    """
+    time: float
+    label: str
+    timestamp: str
+    layers: Dict[str, LayerSnapshot]
+    events: Tuple[Any, ...] = ()
+    first_pending: int = 0
+    performance: Dict[str, Tuple[float, ...]] = field(default_factory=dict)
+
+    @property
+    def pending_events(self) -> Tuple[Any, ...]:
+        return self.events[self.first_pending:]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain nested dict used in debug reports."""
+        return {
+            "time": self.time,
+            "label": self.label,
+            "timestamp": self.timestamp,
+            "layers": {name: layer.to_dict() for name, layer in self.layers.items()},
+            "events": [
+                {"name": event.name, "time": event.time, "enabled": event.enabled, "tags": event.tags}
+                for event in self.pending_events
+            ],
+            "performance": {metric: list(values) for metric, values in self.performance.items()}
+        }
+
+
+def _values_differ(a: Any, b: Any) -> bool:
+    if a is b:
+        return False
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return not np.array_equal(a, b)
+    try:
+        return bool(a != b)
+    except ValueError:
+        # Containers holding arrays
+        return repr(a) != repr(b)
+
+
+class TimelineSnapshotter:
+    """Takes snapshots of a ComposerTimeline, sharing unchanged parts with the previous one."""
+
+    def __init__(self, timeline: Any):
+        self.timeline = timeline
+        self.last: Optional[TimelineSnapshot] = None
+
+        # Sorted events shared by snapshots until the event index changes
+        self._events: Tuple[Any, ...] = ()
+        self._event_times: List[float] = []
+        self._events_version: Optional[int] = None
+
+    def take(self, label: str = "", time: Optional[float] = None,
+             performance: Optional[Dict[str, List[float]]] = None) -> TimelineSnapshot:
+        """Snapshot the timeline.
+
+        Args:
+            label: Snapshot label
+            time: Time to evaluate properties at (defaults to the current time)
+            performance: Metric samples to copy into the snapshot
+        """
+        timeline = self.timeline
+        if time is None:
+            time = timeline.current_time
+
+        previous_layers = self.last.layers if self.last is not None else {}
+        layers = {}
+        shared = len(previous_layers) == len(timeline.layers)
+        for layer in timeline.layers:
+            previous = previous_layers.get(layer.name)
+            layer_snapshot = self._snapshot_layer(layer, time, previous)
+            layers[layer.name] = layer_snapshot
+            shared = shared and layer_snapshot is previous
+        if shared:
+            layers = previous_layers
+
+        index = timeline.events
+        if index.version != self._events_version:
+            self._events = tuple(index)
+            self._event_times = [event.time for event in self._events]
+            self._events_version = index.version
+
+        snapshot = TimelineSnapshot(
+            time=time,
+            label=label,
+            timestamp=datetime.now().isoformat(),
+            layers=layers,
+            events=self._events,
+            first_pending=bisect_left(self._event_times, time),
+            performance={metric: tuple(values) for metric, values in (performance or {}).items()}
+        )
+        self.last = snapshot
+        return snapshot
+
+    def _snapshot_layer(self, layer: Any, time: float,
+                        previous: Optional[LayerSnapshot]) -> LayerSnapshot:
+        previous_tracks = previous.tracks if previous is not None else {}
+        tracks = {}
+        shared = previous is not None and len(previous_tracks) == len(layer.tracks)
+        for track in layer.tracks:
+            track_previous = previous_tracks.get(track.name)
+            track_snapshot = self._snapshot_track(track, time, track_previous)
+            tracks[track.name] = track_snapshot
+            shared = shared and track_snapshot is track_previous
+
+        flags = (layer.visible, layer.locked, layer.solo)
+        if shared and (previous.visible, previous.locked, previous.solo) == flags:
+            return previous
+        return LayerSnapshot(layer.visible, layer.locked, layer.solo, tracks)
+
+    def _snapshot_track(self, track: Any, time: float,
+                        previous: Optional[TrackSnapshot]) -> TrackSnapshot:
+        if (previous is not None and previous.track is track and previous.version == track.version
+                and previous.enabled == track.enabled
+                and previous.valid_from <= time < previous.valid_until):
+            return previous
+
+        values = {}
+        valid_from, valid_until = float('-inf'), float('inf')
+        for property_name in track.keyframes:
+            curve = track.get_curve(property_name)
+            if curve is None:
+                values[property_name] = None
+                continue
+            values[property_name] = curve.value_at(time)
+            start, end = curve.constant_span(time)
+            valid_from, valid_until = max(valid_from, start), min(valid_until, end)
+
+        return TrackSnapshot(track, track.version, track.enabled, values, valid_from, valid_until)
+
+
+def diff_snapshots(before: TimelineSnapshot, after: TimelineSnapshot) -> Dict[str, Any]:
+    """Compare two snapshots, skipping layers and tracks they share.
+
+    Returns:
+        Dict with time_diff, layer_changes (layer name -> before/after layer
+        dicts), property_changes ("layer/track" -> property -> (before,
+        after)), event_changes (added/removed pending event names) and
+        performance_changes (metric -> change in mean)
+    """
+    differences = {
+        "time_diff": after.time - before.time,
+        "layer_changes": {},
+        "property_changes": {},
+        "event_changes": {},
+        "performance_changes": {}
+    }
+
+    if before.layers is not after.layers:
+        for name, layer_before in before.layers.items():
+            layer_after = after.layers.get(name)
+            if layer_after is None or layer_after is layer_before:
+                continue
+
+            changed = (layer_before.visible, layer_before.locked, layer_before.solo) != \
+                (layer_after.visible, layer_after.locked, layer_after.solo)
+            for track_name, track_before in layer_before.tracks.items():
+                track_after = layer_after.tracks.get(track_name)
+                if track_after is None or track_after is track_before:
+                    continue
+                changed = changed or track_before.enabled != track_after.enabled
+                properties = {
+                    prop: (value, track_after.values.get(prop))
+                    for prop, value in track_before.values.items()
+                    if _values_differ(value, track_after.values.get(prop))
+                }
+                properties.update({
+                    prop: (None, value) for prop, value in track_after.values.items()
+                    if prop not in track_before.values
+                })
+                if properties:
+                    differences["property_changes"][f"{name}/{track_name}"] = properties
+                    changed = True
+            changed = changed or layer_before.tracks.keys() != layer_after.tracks.keys()
+
+            if changed:
+                differences["layer_changes"][name] = {
+                    "before": layer_before.to_dict(),
+                    "after": layer_after.to_dict()
+                }
+
+    if before.events is after.events:
+        # Same event set: only the events between the two offsets changed
+        if after.first_pending > before.first_pending:
+            removed = before.events[before.first_pending:after.first_pending]
+            differences["event_changes"] = {"added": [], "removed": [event.name for event in removed]}
+        elif after.first_pending < before.first_pending:
+            added = after.events[after.first_pending:before.first_pending]
+            differences["event_changes"] = {"added": [event.name for event in added], "removed": []}
+    else:
+        before_events = set(map(id, before.pending_events))
+        after_events = set(map(id, after.pending_events))
+        differences["event_changes"] = {
+            "added": [event.name for event in after.pending_events if id(event) not in before_events],
+            "removed": [event.name for event in before.pending_events if id(event) not in after_events]
+        }
+
+    for metric, values in after.performance.items():
+        previous = before.performance.get(metric)
+        if previous and values:
+            differences["performance_changes"][metric] = sum(values) / len(values) - sum(previous) / len(previous)
+
+    return differences